@@ -0,0 +1,53 @@
+"""
+Measures the import time of osu.py using ``python -X importtime``.
+
+Usage:
+    python benchmarks/importtime.py [--runs N] [--top N] [--statement STATEMENT]
+
+Each run is a fresh interpreter. The total time of the imports done by the statement is
+reported (median of all runs), along with the slowest modules of the last run.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def run(statement):
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    ).stderr
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--statement", default="import osu")
+    args = parser.parse_args()
+
+    totals = []
+    for _ in range(args.runs):
+        modules = run(args.statement)
+        # top level imports made after interpreter startup (which ends with site) are from the statement
+        startup_end = next(i for i, (name, _, _) in enumerate(modules) if name == " site")
+        totals.append(
+            sum(cumulative for name, _, cumulative in modules[startup_end + 1 :] if not name.startswith("  "))
+        )
+
+    print(f"{args.statement!r}: median {statistics.median(totals) / 1000:.1f} ms over {args.runs} runs")
+    print(f"\n{'module':<50}{'self (ms)':>12}{'cumulative (ms)':>18}")
+    for name, self_us, cumulative_us in sorted(modules, key=lambda module: module[1], reverse=True)[: args.top]:
+        print(f"{name.strip():<50}{self_us / 1000:>12.1f}{cumulative_us / 1000:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
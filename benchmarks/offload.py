@@ -0,0 +1,58 @@
+"""
+Measures how long the event loop is blocked by large responses, with and without offloading
+decoding and parsing to an executor (AsynchronousHTTPHandler.set_offload).
+
+Usage:
+    python benchmarks/offload.py [--threshold BYTES] [--repeat N]
+
+Requires the osu_client_id and osu_client_secret environment variables and the async extra.
+"""
+
+from osu import AsynchronousClient, LoopLagMonitor
+from os import getenv
+import argparse
+import asyncio
+import time
+
+
+REQUESTS = {
+    "beatmapset discussions": lambda client: client.get_beatmapset_discussions(limit=50),
+    "ranking": lambda client: client.get_ranking("osu", "performance"),
+    "user best scores": lambda client: client.get_user_scores(14895608, "best", limit=100),
+}
+
+
+async def measure(client, request, repeat):
+    async with LoopLagMonitor(interval=0.001) as monitor:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await request(client)
+        elapsed = time.perf_counter() - start
+    return elapsed / repeat, monitor.stats()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threshold", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = AsynchronousClient.from_credentials(
+        int(getenv("osu_client_id")), getenv("osu_client_secret"), None, request_wait_time=0
+    )
+    modes = [("inline", None), ("offloaded", args.threshold)]
+
+    print(f"{'request':<24}{'mode':<12}{'time (ms)':>10}{'lag p50':>10}{'lag p99':>10}{'lag max':>10}")
+    for name, request in REQUESTS.items():
+        await request(client)  # warm up the connection and token
+        for mode, threshold in modes:
+            client.http.set_offload(threshold)
+            seconds, lag = await measure(client, request, args.repeat)
+            print(
+                f"{name:<24}{mode:<12}{seconds * 1e3:>10.1f}"
+                f"{lag['p50'] * 1e3:>10.1f}{lag['p99'] * 1e3:>10.1f}{lag['max'] * 1e3:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,393 @@
+"""
+Large payloads for the benchmarks, shaped like the api's responses.
+
+Recorded responses in benchmarks/data are used when they exist, otherwise payloads are generated
+with the same shape and size, so the benchmarks can run without credentials.
+
+Usage:
+    python benchmarks/payloads.py [--user USER_ID] [--beatmap BEATMAP_ID] [--match MATCH_ID]
+                                  [--beatmapset BEATMAPSET_ID]
+
+Records the payloads to benchmarks/data. Requires the osu_client_id and osu_client_secret environment variables.
+"""
+
+from osu.testing import make_user, make_beatmap
+from os import getenv
+import argparse
+import gzip
+import json
+import os
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_TIMESTAMP = "2024-01-02T03:04:05+00:00"
+
+
+def _user_compact(user_id):
+    user = make_user(user_id)
+    user["country"] = {"code": "US", "name": "United States"}
+    user["cover"] = {"custom_url": None, "url": f"https://assets.ppy.sh/user-profile-covers/{user_id}.jpg"}
+    return user
+
+
+def _statistics(pp):
+    return {
+        "accuracy": 0.98,
+        "count_100": 1_000_000,
+        "count_300": 20_000_000,
+        "count_50": 100_000,
+        "count_miss": 200_000,
+        "country_rank": 100,
+        "global_rank": 1000,
+        "global_rank_exp": 1000,
+        "grade_counts": {"ssh": 10, "ss": 20, "sh": 300, "s": 400, "a": 500},
+        "level": {"current": 100, "progress": 50},
+        "hit_accuracy": 98.5,
+        "is_ranked": True,
+        "maximum_combo": 3000,
+        "play_count": 100_000,
+        "play_time": 5_000_000,
+        "pp": pp,
+        "pp_exp": pp,
+        "ranked_score": 100_000_000_000,
+        "replays_watched_by_others": 1000,
+        "total_hits": 21_000_000,
+        "total_score": 500_000_000_000,
+        "variants": [
+            {"country_rank": 100, "global_rank": 1000, "mode": "mania", "pp": pp, "variant": variant}
+            for variant in ("4k", "7k")
+        ],
+        "rank_change_since_30_days": -5,
+    }
+
+
+def _dated_counts(months, key="start_date"):
+    return [{key: f"{2010 + i // 12}-{i % 12 + 1:02}-01", "count": i * 10} for i in range(months)]
+
+
+def make_full_user(user_id=2):
+    """
+    users/{user}/{mode} with every attribute of a long-standing player's profile.
+    """
+    user = _user_compact(user_id)
+    user.update(
+        {
+            "account_history": [],
+            "active_tournament_banners": [],
+            "badges": [
+                {
+                    "awarded_at": _TIMESTAMP,
+                    "description": f"badge {i}",
+                    "image_url": f"https://assets.ppy.sh/profile-badges/{i}.png",
+                    "image@2x_url": f"https://assets.ppy.sh/profile-badges/{i}@2x.png",
+                    "url": "",
+                }
+                for i in range(30)
+            ],
+            "beatmap_playcounts_count": 5000,
+            "comments_count": 100,
+            "daily_challenge_user_stats": {
+                "daily_streak_best": 30,
+                "daily_streak_current": 10,
+                "last_update": _TIMESTAMP,
+                "last_weekly_streak": _TIMESTAMP,
+                "playcount": 200,
+                "top_10p_placements": 50,
+                "top_50p_placements": 150,
+                "user_id": user_id,
+                "weekly_streak_best": 10,
+                "weekly_streak_current": 5,
+            },
+            "favourite_beatmapset_count": 200,
+            "follower_count": 10000,
+            "graveyard_beatmapset_count": 10,
+            "groups": [],
+            "guest_beatmapset_count": 5,
+            "loved_beatmapset_count": 2,
+            "mapping_follower_count": 100,
+            "monthly_playcounts": _dated_counts(150),
+            "page": {"html": "<div>" + "profile " * 500 + "</div>", "raw": "profile " * 500},
+            "pending_beatmapset_count": 1,
+            "previous_usernames": ["old name"],
+            "rank_highest": {"rank": 100, "updated_at": _TIMESTAMP},
+            "rank_history": {"mode": "osu", "data": list(range(1000, 1090))},
+            "ranked_beatmapset_count": 20,
+            "replays_watched_counts": _dated_counts(150),
+            "scores_best_count": 200,
+            "scores_first_count": 50,
+            "scores_pinned_count": 10,
+            "scores_recent_count": 30,
+            "statistics": _statistics(10000),
+            "statistics_rulesets": {mode: _statistics(5000) for mode in ("osu", "taiko", "fruits", "mania")},
+            "support_level": 3,
+            "user_achievements": [{"achieved_at": _TIMESTAMP, "achievement_id": i} for i in range(300)],
+        }
+    )
+    return user
+
+
+def make_score(score_id, user_id, beatmap_id, with_user=False):
+    score = {
+        "accuracy": 0.98,
+        "beatmap_id": beatmap_id,
+        "best_id": None,
+        "build_id": 7000,
+        "classic_total_score": 50_000_000,
+        "ended_at": _TIMESTAMP,
+        "has_replay": True,
+        "id": score_id,
+        "is_perfect_combo": False,
+        "legacy_perfect": False,
+        "legacy_score_id": None,
+        "legacy_total_score": 0,
+        "max_combo": 1000,
+        "maximum_statistics": {"great": 800, "legacy_combo_increase": 200},
+        "mods": [{"acronym": "HD"}, {"acronym": "DT", "settings": {"speed_change": 1.5}}],
+        "passed": True,
+        "pp": 500.0,
+        "preserve": True,
+        "processed": True,
+        "rank": "S",
+        "ranked": True,
+        "replay": True,
+        "ruleset_id": 0,
+        "started_at": _TIMESTAMP,
+        "statistics": {"great": 780, "ok": 15, "meh": 2, "miss": 3},
+        "total_score": 1_000_000 - score_id % 1000,
+        "type": "solo_score",
+        "user_id": user_id,
+    }
+    if with_user:
+        score["user"] = _user_compact(user_id)
+    return score
+
+
+def make_beatmap_scores(count=100):
+    """
+    beatmaps/{beatmap}/scores with the maximum number of scores, each including its user.
+    """
+    scores = [make_score(i, 1000 + i, 1, with_user=True) for i in range(count)]
+    return {"scores": scores, "user_score": {"position": 1, "score": scores[0]}}
+
+
+def make_match(events=100, scores_per_game=16):
+    """
+    matches/{match} of a tournament match, where most events are games.
+    """
+    users = [_user_compact(1000 + i) for i in range(scores_per_game)]
+    match_events = []
+    for i in range(events):
+        event = {"id": i + 1, "timestamp": _TIMESTAMP, "user_id": None, "detail": {"type": "other"}}
+        if i % 5 == 0:
+            event["user_id"] = users[i % len(users)]["id"]
+            event["detail"] = {"type": "player-joined"}
+        else:
+            event["game"] = {
+                "beatmap_id": i,
+                "id": i,
+                "start_time": _TIMESTAMP,
+                "end_time": _TIMESTAMP,
+                "mode": "osu",
+                "mode_int": 0,
+                "scoring_type": "scorev2",
+                "team_type": "team-vs",
+                "mods": ["NF"],
+                "beatmap": {key: value for key, value in make_beatmap(i).items() if key != "beatmapset"},
+                "scores": [
+                    dict(
+                        make_score(i * 100 + slot, user["id"], i),
+                        match={"slot": slot, "team": "red" if slot % 2 else "blue", "pass": True},
+                    )
+                    for slot, user in enumerate(users)
+                ],
+            }
+        match_events.append(event)
+
+    return {
+        "match": {"id": 1, "name": "OWC: (red) vs (blue)", "start_time": _TIMESTAMP, "end_time": _TIMESTAMP},
+        "events": match_events,
+        "users": users,
+        "first_event_id": 1,
+        "latest_event_id": events,
+        "current_game_id": None,
+    }
+
+
+def _discussion_post(post_id, discussion_id, user_id):
+    return {
+        "beatmapset_discussion_id": discussion_id,
+        "created_at": _TIMESTAMP,
+        "deleted_at": None,
+        "deleted_by_id": None,
+        "id": post_id,
+        "last_editor_id": None,
+        "message": "00:12:345 (1,2,3) - this section could use some work " * 3,
+        "system": False,
+        "updated_at": _TIMESTAMP,
+        "user_id": user_id,
+    }
+
+
+def make_beatmapset_discussions(count=50, posts=5):
+    """
+    beatmapsets/discussions with the maximum number of discussions.
+    """
+    discussions = []
+    for i in range(count):
+        user_id = 1000 + i % 20
+        discussions.append(
+            {
+                "beatmap_id": i % 5,
+                "beatmapset_id": 1,
+                "can_be_resolved": True,
+                "can_grant_kudosu": True,
+                "created_at": _TIMESTAMP,
+                "deleted_at": None,
+                "deleted_by_id": None,
+                "id": i,
+                "kudosu_denied": False,
+                "last_post_at": _TIMESTAMP,
+                "message_type": ("problem", "suggestion", "praise")[i % 3],
+                "parent_id": None,
+                "resolved": i % 2 == 0,
+                "timestamp": 12345,
+                "updated_at": _TIMESTAMP,
+                "user_id": user_id,
+                "posts": [_discussion_post(i * posts + j, i, user_id) for j in range(posts)],
+                "starting_post": _discussion_post(i * posts, i, user_id),
+                "votes": {"down": 0, "up": 3, "voters": {"down": [], "up": [1, 2, 3]}},
+            }
+        )
+    return {
+        "beatmaps": [make_beatmap(i) for i in range(5)],
+        "discussions": discussions,
+        "included_discussions": [],
+        "users": [_user_compact(1000 + i) for i in range(20)],
+        "reviews_config": {"max_blocks": 50},
+        "cursor": {"page": 2, "limit": count},
+    }
+
+
+def _comment(comment_id, parent_id, user_id):
+    return {
+        "commentable_id": 1,
+        "commentable_type": "beatmapset",
+        "created_at": _TIMESTAMP,
+        "deleted_at": None,
+        "deleted_by_id": None,
+        "edited_at": None,
+        "edited_by_id": None,
+        "id": comment_id,
+        "legacy_name": None,
+        "message": "nice map " * 10,
+        "message_html": "<div class='osu-md'><p>" + "nice map " * 10 + "</p></div>",
+        "parent_id": parent_id,
+        "pinned": False,
+        "replies_count": 0 if parent_id else 3,
+        "updated_at": _TIMESTAMP,
+        "user_id": user_id,
+        "votes_count": comment_id % 50,
+    }
+
+
+def make_comment_bundle(count=50, replies=3):
+    """
+    comments of a beatmapset, with the top level comments and their replies.
+    """
+    return {
+        "commentable_meta": [
+            {
+                "id": 1,
+                "owner_id": 2,
+                "owner_title": "MAPPER",
+                "title": "artist - title",
+                "type": "beatmapset",
+                "url": "https://osu.ppy.sh/beatmapsets/1",
+            }
+        ],
+        "comments": [_comment(i, None, 1000 + i % 20) for i in range(count)],
+        "has_more": True,
+        "has_more_id": None,
+        "included_comments": [
+            _comment(count + i * replies + j, i, 1000 + j) for i in range(count) for j in range(replies)
+        ],
+        "pinned_comments": [],
+        "sort": "new",
+        "cursor": {"created_at": _TIMESTAMP, "id": count},
+        "top_level_count": count * 4,
+        "total": count * 4 * (replies + 1),
+        "user_follow": False,
+        "user_votes": [],
+        "users": [_user_compact(1000 + i) for i in range(20)],
+    }
+
+
+def make_all_scores(count=1000):
+    """
+    scores, which returns the most recent scores of every player.
+    """
+    return {"scores": [make_score(i, 1000 + i % 200, i % 300) for i in range(count)], "cursor_string": "abc"}
+
+
+GENERATORS = {
+    "user": make_full_user,
+    "beatmap_scores": make_beatmap_scores,
+    "match": make_match,
+    "beatmapset_discussions": make_beatmapset_discussions,
+    "comment_bundle": make_comment_bundle,
+    "all_scores": make_all_scores,
+}
+
+
+def load_payloads(data_dir=DATA_DIR):
+    """
+    Returns the payloads by name, and for each whether it was recorded or generated.
+    """
+    payloads = {}
+    for name, generate in GENERATORS.items():
+        path = os.path.join(data_dir, f"{name}.json.gz")
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payloads[name] = (json.load(f), "recorded")
+        else:
+            payloads[name] = (generate(), "generated")
+    return payloads
+
+
+def record(client, args):
+    from osu import Path
+
+    requests = {
+        "user": (Path.get_user(args.user, "osu"), {}),
+        "beatmap_scores": (Path.beatmap_scores(args.beatmap), {"limit": 100}),
+        "match": (Path.get_match(args.match), {}),
+        "beatmapset_discussions": (Path.beatmapset_discussions(), {"beatmapset_id": args.beatmapset, "limit": 50}),
+        "comment_bundle": (Path.get_comments(), {"commentable_type": "beatmapset", "commentable_id": args.beatmapset}),
+        "all_scores": (Path.get_all_scores(), {}),
+    }
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    for name, (path, params) in requests.items():
+        data = client.http.make_request(path, **params)
+        with gzip.open(os.path.join(DATA_DIR, f"{name}.json.gz"), "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+        print(f"recorded {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user", type=int, default=14895608)
+    parser.add_argument("--beatmap", type=int, default=2113309)
+    parser.add_argument("--match", type=int, default=111534249)
+    parser.add_argument("--beatmapset", type=int, default=1001507)
+    args = parser.parse_args()
+
+    from osu import Client
+
+    client = Client.from_credentials(int(getenv("osu_client_id")), getenv("osu_client_secret"), None)
+    record(client, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares loading parsed models from a snapshot (pickle / msgpack) against re-parsing the api's json.
+
+Usage:
+    python benchmarks/snapshot.py [--user USER_ID] [--beatmapset BEATMAPSET_ID] [--number N]
+
+Requires the osu_client_id and osu_client_secret environment variables and the snapshot extra.
+"""
+
+from osu import Client, Path, User, Beatmapset, SoloScore, dump_snapshot, load_snapshot
+from os import getenv
+import argparse
+import json
+import pickle
+import timeit
+
+
+def fetch_payloads(client, user_id, beatmapset_id):
+    return {
+        "User": (User, client.http.make_request(Path.get_user(user_id))),
+        "Beatmapset": (Beatmapset, client.http.make_request(Path.get_beatmapset(beatmapset_id))),
+        "SoloScore x100": (
+            lambda data: list(map(SoloScore, data)),
+            client.http.make_request(Path.get_user_scores(user_id, "best"), limit=100),
+        ),
+    }
+
+
+def bench(name, func, number):
+    return name, min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user", type=int, default=14895608)
+    parser.add_argument("--beatmapset", type=int, default=1001507)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    client = Client.from_credentials(int(getenv("osu_client_id")), getenv("osu_client_secret"), None)
+    payloads = fetch_payloads(client, args.user, args.beatmapset)
+
+    print(f"{'payload':<16}{'method':<16}{'size (bytes)':>14}{'load (us)':>12}{'speedup':>10}")
+    for payload_name, (constructor, data) in payloads.items():
+        raw_json = json.dumps(data)
+        obj = constructor(data)
+        pickled = pickle.dumps(obj, protocol=5)
+        snapshot = dump_snapshot(obj)
+
+        results = [
+            (bench("json re-parse", lambda: constructor(json.loads(raw_json)), args.number), len(raw_json)),
+            (bench("pickle (5)", lambda: pickle.loads(pickled), args.number), len(pickled)),
+            (bench("msgpack", lambda: load_snapshot(snapshot), args.number), len(snapshot)),
+        ]
+        baseline = results[0][0][1]
+        for (method, seconds), size in results:
+            print(f"{payload_name:<16}{method:<16}{size:>14}{seconds * 1e6:>12.1f}{baseline / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Benchmark suite for model parsing, rate limiting, and end-to-end throughput.
+
+- models: construction time and memory allocated (tracemalloc) for each payload in benchmarks/payloads.py
+- ratelimit: overhead of RateLimitHandler.wait() when it doesn't have to wait, sync and async
+- throughput: requests per second of Client and AsynchronousClient against osu.testing.StandInServer
+
+Usage:
+    python benchmarks/suite.py [--only {models,ratelimit,throughput} ...] [--number N] [--requests N]
+                               [--concurrency N] [--output FILE] [--compare FILE] [--threshold PERCENT]
+
+Results are written as json with --output. Passing a previous run to --compare prints the change of every
+measurement, and exits with 1 if any got slower (or used more memory) by more than --threshold percent.
+Throughput requires the async extra.
+"""
+
+from osu import (
+    Client,
+    User,
+    BeatmapScores,
+    MatchExtended,
+    CommentBundle,
+    Beatmap,
+    BeatmapsetDiscussion,
+    BeatmapsetDiscussionsResult,
+    GetAllScoresResult,
+    ReviewsConfig,
+    UserCompact,
+    get_score_object,
+)
+from osu.http import RateLimitHandler
+from payloads import load_payloads
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+
+API_VERSION = "20240529"
+
+
+# the same parsing the clients do for each endpoint
+PARSERS = {
+    "user": User,
+    "beatmap_scores": lambda data: BeatmapScores(data, API_VERSION),
+    "match": lambda data: MatchExtended(data, API_VERSION),
+    "beatmapset_discussions": lambda resp: BeatmapsetDiscussionsResult(
+        list(map(Beatmap, resp["beatmaps"])),
+        list(map(BeatmapsetDiscussion, resp["discussions"])),
+        list(map(BeatmapsetDiscussion, resp["included_discussions"])),
+        list(map(UserCompact, resp["users"])),
+        ReviewsConfig(resp["reviews_config"]),
+        resp["cursor"],
+    ),
+    "comment_bundle": CommentBundle,
+    "all_scores": lambda ret: GetAllScoresResult(
+        [get_score_object(score, API_VERSION) for score in ret["scores"]], ret["cursor_string"]
+    ),
+}
+
+
+def measure_allocations(func):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def bench_models(number):
+    results = {}
+    for name, (data, source) in load_payloads().items():
+        parse = PARSERS[name]
+        seconds = min(timeit.repeat(lambda: parse(data), number=number, repeat=5)) / number
+        retained, peak = measure_allocations(lambda: parse(data))
+        results[name] = {
+            "source": source,
+            "payload_bytes": len(json.dumps(data)),
+            "seconds": seconds,
+            "retained_bytes": retained,
+            "peak_bytes": peak,
+        }
+        print(
+            f"{name:<24}{source:<11}{seconds * 1e3:>10.3f} ms{retained / 1024:>12.1f} KiB{peak / 1024:>12.1f} KiB peak"
+        )
+    return results
+
+
+def bench_ratelimit(number):
+    # a limit that's never reached, so only the bookkeeping is measured
+    limit = number * 10
+
+    handler = RateLimitHandler(0, limit)
+    sync_seconds = min(timeit.repeat(handler.wait, number=number, repeat=3)) / number
+
+    async def run_async():
+        from osu.asyncio.http import RateLimitHandler as AsyncRateLimitHandler
+
+        handler = AsyncRateLimitHandler(0, limit)
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(number):
+                await handler.wait()
+            elapsed = (time.perf_counter() - start) / number
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    async_seconds = asyncio.run(run_async())
+    print(f"{'sync wait()':<24}{sync_seconds * 1e6:>10.2f} us")
+    print(f"{'async wait()':<24}{async_seconds * 1e6:>10.2f} us")
+    return {"sync_wait_seconds": sync_seconds, "async_wait_seconds": async_seconds}
+
+
+def bench_sync_throughput(domain, requests):
+    client = Client.from_credentials(1, "secret", None, request_wait_time=0, limit_per_minute=requests * 10)
+    client.set_domain(domain)
+    client.get_user(2)  # authenticate and open the connection first
+
+    start = time.perf_counter()
+    for i in range(requests):
+        client.get_user(i + 1)
+    return requests / (time.perf_counter() - start)
+
+
+async def bench_async_throughput(domain, requests, concurrency):
+    from osu import AsynchronousClient
+
+    client = AsynchronousClient.from_credentials(1, "secret", None, request_wait_time=0, limit_per_minute=requests * 10)
+    client.set_domain(domain)
+    await client.get_user(2)
+
+    ids = iter(range(1, requests + 1))
+
+    async def worker():
+        for user_id in ids:
+            await client.get_user(user_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    session = getattr(client.http, "session", None)
+    if session is not None:
+        await session.close()
+    return requests / elapsed
+
+
+def bench_throughput(requests, concurrency):
+    from osu.testing import StandInServer
+
+    with StandInServer() as server:
+        domain = server.domain
+        sync_rps = bench_sync_throughput(domain, requests)
+        async_rps = asyncio.run(bench_async_throughput(domain, requests, concurrency))
+
+    print(f"{'Client':<24}{sync_rps:>10.1f} req/s")
+    print(f"{'AsynchronousClient':<24}{async_rps:>10.1f} req/s (concurrency {concurrency})")
+    return {"sync_requests_per_second": sync_rps, "async_requests_per_second": async_rps, "concurrency": concurrency}
+
+
+# measurements that are better when higher; the rest are better when lower
+_HIGHER_IS_BETTER = ("requests_per_second",)
+_COMPARED = ("seconds", "bytes", "requests_per_second")
+
+
+def _flatten(results, prefix=""):
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, name + ".")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and name.endswith(_COMPARED):
+            yield name, value
+
+
+def compare(baseline, current, threshold):
+    """
+    Prints the change of every measurement in both runs, and returns the names of those that regressed.
+    """
+    old = dict(_flatten(baseline["results"]))
+    regressions = []
+    for name, value in _flatten(current["results"]):
+        if name not in old or not old[name] or name.endswith("payload_bytes"):
+            continue
+
+        change = (value - old[name]) / old[name] * 100
+        worse = -change if name.endswith(_HIGHER_IS_BETTER) else change
+        flag = ""
+        if worse > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<48}{old[name]:>14.6g}{value:>14.6g}{change:>+9.1f}%{flag}")
+    return regressions
+
+
+def main():
+    sections = ("models", "ratelimit", "throughput")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--only", nargs="+", choices=sections, default=sections)
+    parser.add_argument("--number", type=int, default=20, help="times each payload is parsed per repeat")
+    parser.add_argument("--waits", type=int, default=100_000, help="calls to wait() per repeat")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--output", help="write the results as json to this file")
+    parser.add_argument("--compare", help="json results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    results = {}
+    if "models" in args.only:
+        results["models"] = bench_models(args.number)
+    if "ratelimit" in args.only:
+        results["ratelimit"] = bench_ratelimit(args.waits)
+    if "throughput" in args.only:
+        results["throughput"] = bench_throughput(args.requests, args.concurrency)
+
+    import osu
+
+    run = {
+        "osu.py": osu.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        print(f"{'measurement':<48}{'baseline':>14}{'current':>14}{'change':>10}")
+        if compare(baseline, run, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
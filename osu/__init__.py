@@ -1,14 +1,96 @@
+from typing import TYPE_CHECKING
+
 from .auth import *
 from .client import *
 from .exceptions import *
-from .notification import NotificationWebsocket
-from .asyncio import *
 from .enums import *
 from .objects import *
 from .util import *
 from .results import *
+from .series import *
 from .path import *
 from .scope import *
 
+# Modules that pull in heavy or optional dependencies (aiohttp, websockets, numpy, msgpack),
+# or that most programs don't use, are imported on first attribute access (PEP 562) to keep "import osu" fast.
+_lazy_names = {
+    "JSONStreamParser": ".streaming",
+    "RequestTrace": ".tracing",
+    "RequestHook": ".tracing",
+    "OpenTelemetryHook": ".tracing",
+    "PrometheusHook": ".tracing",
+    "Cassette": ".cassette",
+    "BaseTokenStore": ".token_store",
+    "JSONTokenStore": ".token_store",
+    "SQLiteTokenStore": ".token_store",
+    "AuthPool": ".auth_pool",
+    "BatchLoader": ".loader",
+    "USER_ENDPOINT_FIELDS": ".planner",
+    "UserFetchPlan": ".planner",
+    "plan_user_fetch": ".planner",
+    "NotificationWebsocket": ".notification",
+    "AsynchronousClient": ".asyncio",
+    "AsynchronousAuthHandler": ".asyncio",
+    "BaseAsynchronousAuthHandler": ".asyncio",
+    "AsynchronousHTTPHandler": ".asyncio",
+    "BaseAsynchronousHTTPHandler": ".asyncio",
+    "BlockingClient": ".asyncio",
+    "BlockingClientBatch": ".asyncio",
+    "LoopLagMonitor": ".asyncio",
+    "AsynchronousBatchLoader": ".asyncio",
+    "ProxyServer": ".proxy",
+    "ScoreTable": ".score_table",
+    "ScoreRow": ".score_table",
+    "OsuPerformanceCalculator": ".performance",
+    "TaikoPerformanceCalculator": ".performance",
+    "PerformanceResult": ".performance",
+    "ProfilePerformance": ".performance",
+    "estimate_osu_star_rating": ".performance",
+    "to_state": ".snapshot",
+    "from_state": ".snapshot",
+    "dump_snapshot": ".snapshot",
+    "load_snapshot": ".snapshot",
+}
+
+if TYPE_CHECKING:
+    from .streaming import *
+    from .tracing import *
+    from .cassette import *
+    from .token_store import *
+    from .auth_pool import *
+    from .loader import *
+    from .planner import *
+    from .notification import NotificationWebsocket
+    from .asyncio import *
+    from .score_table import *
+    from .performance import *
+    from .snapshot import *
+    from .proxy import *
+
+
+def __getattr__(name):
+    import importlib
+
+    module_name = _lazy_names.get(name)
+    if module_name is None:
+        # a submodule that hasn't been imported yet, such as osu.asyncio
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
+__all__ = [name for name in globals() if not name.startswith("_") and name != "TYPE_CHECKING"] + list(_lazy_names)
+
 
 __version__ = "4.2.0"
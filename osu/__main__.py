@@ -0,0 +1,25 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from . import export
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m osu", description="Command line tools of osu.py.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="write users, beatmaps, or scores to jsonl or parquet",
+        description="Write users, beatmaps, or scores to jsonl or parquet, with checkpoints to resume from.",
+    )
+    export._add_arguments(export_parser)
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        export._run(args, export_parser)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,3 +1,6 @@
 from .client import *
 from .auth import *
 from .http import *
+from .blocking import *
+from .monitor import *
+from .loader import *
@@ -1,5 +1,6 @@
 from typing import Optional
 import asyncio
+import contextlib
 
 from .http import AsynchronousHTTPHandler, BaseAsynchronousHTTPHandler
 from ..auth import BaseAuthHandler, AuthUtil, AuthHandler
@@ -17,7 +18,7 @@ class BaseAsynchronousAuthHandler(BaseAuthHandler):
 
 
 class AsynchronousAuthHandler(BaseAsynchronousAuthHandler, AuthUtil):
-    __slots__ = ("http", "_lock")
+    __slots__ = ("http", "_lock", "_refresh_lock", "_refresh_task")
 
     def __init__(
         self,
@@ -30,6 +31,9 @@ class AsynchronousAuthHandler(BaseAsynchronousAuthHandler, AuthUtil):
 
         self.http: AsynchronousHTTPHandler = AsynchronousHTTPHandler(self)
         self._lock: asyncio.Lock = asyncio.Lock()
+        # held while a token request is in flight, so a foreground and background refresh can't overlap
+        self._refresh_lock: asyncio.Lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
 
     def has_user(self) -> bool:
         return AuthUtil.has_user(self)
@@ -47,7 +51,43 @@ class AsynchronousAuthHandler(BaseAsynchronousAuthHandler, AuthUtil):
 
     async def _request(self, data):
         json = await self.http.make_auth_request(data)
-        self._handle_response(json)
+        self._set_token_data(json)
+        if self._token_store is not None:
+            # the store does blocking io, so it's used in an executor
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._token_store.save, self._token_store_key, self._stored_token()
+            )
+
+    async def _load_stored_token_async(self) -> bool:
+        if self._token_store is None:
+            return False
+        token = await asyncio.get_running_loop().run_in_executor(None, self._token_store.load, self._token_store_key)
+        return self._use_stored_token(token)
+
+    @contextlib.asynccontextmanager
+    async def _lock_token_store_async(self):
+        if self._token_store is None:
+            yield
+            return
+
+        # the store's lock blocks, so wait for it in an executor
+        lock = self._lock_token_store()
+        acquiring = asyncio.get_running_loop().run_in_executor(None, lock.__enter__)
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # the executor acquires the lock regardless, so release it once it does
+            def release(future):
+                if future.exception() is None:
+                    lock.__exit__(None, None, None)
+
+            acquiring.add_done_callback(release)
+            raise
+
+        try:
+            yield
+        finally:
+            lock.__exit__(None, None, None)
 
     async def get_auth_token(self, code: Optional[str] = None):
         """
@@ -70,7 +110,12 @@ class AsynchronousAuthHandler(BaseAsynchronousAuthHandler, AuthUtil):
             code from user authorizing at a specific url
         """
         data = self._get_data("client_credentials" if code is None else "authorization_code", code)
-        await self._request(data)
+        if code is not None:
+            return await self._request(data)
+
+        async with self._lock_token_store_async():
+            if not await self._load_stored_token_async():
+                await self._request(data)
 
     async def refresh_access_token(self, refresh_token: Optional[str] = None):
         """
@@ -86,8 +131,11 @@ class AsynchronousAuthHandler(BaseAsynchronousAuthHandler, AuthUtil):
         if refresh_token:
             self._data.refresh_token = refresh_token
 
-        data = self._get_data("client_credentials" if self._data.refresh_token is None else "refresh_token")
-        await self._request(data)
+        async with self._refresh_lock, self._lock_token_store_async():
+            # another process may have refreshed the token already
+            if refresh_token is not None or not await self._load_stored_token_async():
+                data = self._get_data("client_credentials" if self._data.refresh_token is None else "refresh_token")
+                await self._request(data)
 
         if self._refresh_callback:
             self._refresh_callback(self)
@@ -95,14 +143,70 @@ class AsynchronousAuthHandler(BaseAsynchronousAuthHandler, AuthUtil):
     async def get_token(self) -> Optional[str]:
         async with self._lock:
             if self._data.has_expired:
-                await self.refresh_access_token()
+                # a background refresh may have finished while waiting for the lock
+                async with self._refresh_lock:
+                    expired = self._data.has_expired
+                if expired:
+                    await self.refresh_access_token()
             return self._data.token
 
+    def start_background_refresh(self, fraction: float = 0.75, jitter: float = 0.1) -> None:
+        """
+        Start renewing the access token in a background task before it expires,
+        so requests never wait on a token refresh. Does nothing if already started.
+        Must be called while the event loop is running.
+
+        The current token keeps being used until the new one is received.
+        Failures are passed to the error callback set with :func:`set_refresh_callback`
+        and retried after :attr:`REFRESH_RETRY_DELAY` seconds.
+
+        **Parameters**
+
+        fraction: float
+            Fraction of the token's lifetime (`expires_in`) after which it's renewed. Defaults to 0.75.
+
+        jitter: float
+            Renew up to this fraction earlier, picked randomly, so that many processes
+            don't refresh at the same time. Defaults to 0.1.
+        """
+        self._validate_refresh_args(fraction, jitter)
+        if self._refresh_task is not None:
+            return
+
+        self._refresh_task = asyncio.get_running_loop().create_task(self._background_refresh(fraction, jitter))
+
+    def stop_background_refresh(self) -> None:
+        """
+        Stop the background refresh started with :func:`start_background_refresh`.
+        """
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        self._refresh_task = None
+
+    async def _background_refresh(self, fraction: float, jitter: float):
+        delay = self._get_refresh_delay(fraction, jitter)
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh_access_token()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._handle_refresh_error(exc)
+                delay = self.REFRESH_RETRY_DELAY
+            else:
+                delay = self._get_refresh_delay(fraction, jitter)
+
     @classmethod
     def from_sync(cls, auth: AuthHandler):
         new_auth = cls(auth.client_id, auth.client_secret, auth.redirect_url, auth.scope)
         new_auth._data = auth._data
         new_auth._refresh_callback = auth._refresh_callback
+        new_auth._refresh_error_callback = auth._refresh_error_callback
+        new_auth._token_store = auth._token_store
+        new_auth._token_store_key = auth._token_store_key
         new_auth.http = auth.http.as_async(new_auth)
         return new_auth
 
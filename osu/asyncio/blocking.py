@@ -0,0 +1,365 @@
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar, Union
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .auth import AsynchronousAuthHandler, BaseAsynchronousAuthHandler
+from .client import AsynchronousClient
+from .http import BaseAsynchronousHTTPHandler
+from ..client import Client, ClientBatch
+from ..scope import Scope
+from ..tracing import RequestHook
+
+
+__all__ = ("BlockingClient", "BlockingClientBatch")
+
+
+_T = TypeVar("_T")
+
+
+class BlockingClientBatch(ClientBatch):
+    """
+    Runs client methods concurrently on a :class:`BlockingClient`'s event loop.
+    Returned by :func:`BlockingClient.batch` and works the same as :class:`ClientBatch`.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, client: "BlockingClient", max_workers: Optional[int] = None):
+        self.client: BlockingClient = client
+        self.futures: List[Future] = []
+        # calls run on the client's event loop, limited by a semaphore instead of a thread pool
+        self._executor = client._get_semaphore(max_workers)
+
+    def submit(self, method: Union[str, Callable], *args, **kwargs) -> Future:
+        future = self.client.submit(method, *args, _semaphore=self._executor, **kwargs)
+        self.futures.append(future)
+        return future
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        wait(self.futures)
+
+
+class BlockingClient:
+    """
+    Synchronous client which runs an :class:`AsynchronousClient` on an event loop in a background thread.
+    It has the same methods as :class:`Client`, but requests reuse one :class:`aiohttp.ClientSession`,
+    and every method also has a ``submit_`` variant which returns a :class:`concurrent.futures.Future`
+    instead of waiting for the result. This makes it easy for synchronous code to fan out many calls.
+    The ``stream_`` methods are regular generators.
+
+    .. code:: py
+
+        with BlockingClient.from_credentials(client_id, client_secret, None, request_wait_time=0) as client:
+            user = client.get_user(2)
+
+            futures = [client.submit_get_beatmap(beatmap_id) for beatmap_id in beatmap_ids]
+            beatmaps = [future.result() for future in futures]
+
+    Call :func:`close` (or use it as a context manager) to close the session and stop the thread.
+    The methods are safe to call from any thread except the event loop's own.
+
+    Init parameters are the same as :class:`Client`, except `auth` must be an asynchronous auth handler.
+
+    **Attributes**
+
+    client: :class:`AsynchronousClient`
+        The client run on the event loop.
+
+    loop: :class:`asyncio.AbstractEventLoop`
+        The event loop running in the background thread.
+    """
+
+    __slots__ = ("client", "loop", "_thread")
+
+    def __init__(
+        self,
+        auth: Optional[BaseAsynchronousAuthHandler] = None,
+        request_wait_time: float = 1.0,
+        limit_per_minute: int = 60,
+        api_version: Optional[str] = None,
+    ):
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: threading.Thread = threading.Thread(
+            target=self.loop.run_forever, name="osu.py blocking client", daemon=True
+        )
+        self._thread.start()
+
+        try:
+            self.client: AsynchronousClient = self.run(
+                self._create_client(auth, request_wait_time, limit_per_minute, api_version)
+            )
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    @staticmethod
+    async def _create_client(auth, request_wait_time, limit_per_minute, api_version) -> AsynchronousClient:
+        client = AsynchronousClient(auth, request_wait_time, limit_per_minute, api_version)
+        if hasattr(client.http, "session"):
+            client.http.session = aiohttp.ClientSession()
+        return client
+
+    @classmethod
+    def from_credentials(
+        cls,
+        client_id: int,
+        client_secret: str,
+        redirect_url: Optional[str],
+        scope: Optional[Scope] = None,
+        code: Optional[str] = None,
+        request_wait_time: float = 1.0,
+        limit_per_minute: int = 60,
+        lazily_authenticate: bool = True,
+    ) -> "BlockingClient":
+        """
+        Creates a :class:`BlockingClient` object from client id, client secret, redirect uri, and scope.
+        Read :func:`Client.from_credentials` for details on the parameters.
+
+        **Returns**
+
+        :class:`BlockingClient`
+        """
+        auth = AsynchronousAuthHandler(client_id, client_secret, redirect_url, scope)
+        client = cls(auth, request_wait_time, limit_per_minute)
+        if not lazily_authenticate:
+            client.run(auth.get_auth_token(code))
+        return client
+
+    @property
+    def auth(self) -> BaseAsynchronousAuthHandler:
+        return self.client.auth
+
+    @property
+    def http(self) -> BaseAsynchronousHTTPHandler:
+        return self.client.http
+
+    def set_api_version(self, version: str) -> None:
+        """
+        Read :func:`Client.set_api_version`.
+        """
+        self.client.set_api_version(version)
+
+    def set_domain(self, domain: str) -> None:
+        """
+        Read :func:`Client.set_domain`.
+        """
+        self.client.set_domain(domain)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Read :func:`Client.add_hook`. Hooks are called in the event loop's thread.
+        """
+        self.client.add_hook(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Read :func:`Client.remove_hook`.
+        """
+        self.client.remove_hook(hook)
+
+    def _check_thread(self):
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Cannot wait on the blocking client from its own event loop")
+
+    def run(self, awaitable: Awaitable[_T]) -> _T:
+        """
+        Run an awaitable on the event loop and wait for its result. Useful for calling things
+        the client doesn't wrap, such as ``client.run(client.http.make_request(path))``.
+
+        **Parameters**
+
+        awaitable: Awaitable
+
+        **Returns**
+
+        The result of the awaitable
+        """
+        self._check_thread()
+        return asyncio.run_coroutine_threadsafe(self._await(awaitable), self.loop).result()
+
+    @staticmethod
+    async def _await(awaitable, semaphore=None):
+        if semaphore is None:
+            return await awaitable
+        async with semaphore:
+            return await awaitable
+
+    def _get_method_name(self, method: Union[str, Callable]) -> str:
+        if isinstance(method, str):
+            name = method
+        elif getattr(method, "__self__", None) in (self, self.client):
+            name = method.__name__
+        else:
+            raise TypeError("method must be the name or a bound method of the client")
+
+        if name.startswith("submit_"):
+            name = name[7:]
+        if name not in _async_methods:
+            raise AttributeError(f"{type(self).__name__!r} object has no request method {name!r}")
+        return name
+
+    def _get_semaphore(self, max_workers: Optional[int]) -> Optional[asyncio.Semaphore]:
+        if max_workers is None:
+            return None
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        return asyncio.run_coroutine_threadsafe(_create_semaphore(max_workers), self.loop).result()
+
+    def submit(self, method: Union[str, Callable], *args, _semaphore=None, **kwargs) -> Future:
+        """
+        Schedule a call of a client method on the event loop without waiting for it.
+        The ``submit_`` methods are shortcuts for this.
+
+        **Parameters**
+
+        method: Union[str, Callable]
+            Client method, either its name or the bound method.
+
+        args, kwargs:
+            Passed to the method.
+
+        **Returns**
+
+        :class:`concurrent.futures.Future`
+        """
+        coro = getattr(self.client, self._get_method_name(method))(*args, **kwargs)
+        return asyncio.run_coroutine_threadsafe(self._await(coro, _semaphore), self.loop)
+
+    def map(
+        self,
+        method: Union[str, Callable],
+        iterable: Iterable[Any],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Call a client method with each item of `iterable` concurrently on the event loop.
+        Works the same as :func:`Client.map`, where `max_workers` limits the number of calls running at once.
+
+        **Returns**
+
+        List[Any]
+            Results in the same order as `iterable`.
+        """
+        with self.batch(max_workers) as batch:
+            for item in iterable:
+                batch.submit(method, item, **kwargs)
+
+        if not return_exceptions:
+            return batch.results()
+        return [future.exception() or future.result() for future in batch.futures]
+
+    def batch(self, max_workers: Optional[int] = None) -> BlockingClientBatch:
+        """
+        Returns a context manager for running many calls concurrently. Works the same as :func:`Client.batch`.
+
+        **Returns**
+
+        :class:`BlockingClientBatch`
+        """
+        self._check_thread()
+        return BlockingClientBatch(self, max_workers)
+
+    async def _close(self):
+        stop_refresh = getattr(self.auth, "stop_background_refresh", None)
+        if stop_refresh is not None:
+            stop_refresh()
+
+        session = getattr(self.http, "session", None)
+        if session is not None:
+            self.http.session = None
+            await session.close()
+
+    def _stop_loop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def close(self) -> None:
+        """
+        Close the session and stop the event loop. The client can't be used afterwards.
+        """
+        if self.loop.is_closed():
+            return
+
+        try:
+            self.run(self._close())
+        finally:
+            self._stop_loop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+async def _create_semaphore(value: int) -> asyncio.Semaphore:
+    # created on the event loop, since it binds to the running loop on older python versions
+    return asyncio.Semaphore(value)
+
+
+def _make_methods(name: str):
+    def method(self, *args, **kwargs):
+        self._check_thread()
+        return self.submit(name, *args, **kwargs).result()
+
+    def submit_method(self, *args, **kwargs):
+        return self.submit(name, *args, **kwargs)
+
+    sync_method = getattr(Client, name)
+    functools.update_wrapper(method, sync_method)
+    method.__qualname__ = f"BlockingClient.{name}"
+
+    submit_method.__name__ = f"submit_{name}"
+    submit_method.__qualname__ = f"BlockingClient.submit_{name}"
+    submit_method.__doc__ = (
+        f"Same as :func:`{name}`, but returns a :class:`concurrent.futures.Future` of the result without waiting."
+    )
+    submit_method.__wrapped__ = sync_method
+    return method, submit_method
+
+
+def _make_generator_method(name: str):
+    def method(self, *args, **kwargs):
+        self._check_thread()
+        generator = getattr(self.client, name)(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    yield self.run(generator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self.loop.is_closed():
+                self.run(generator.aclose())
+
+    functools.update_wrapper(method, getattr(Client, name))
+    method.__qualname__ = f"BlockingClient.{name}"
+    return method
+
+
+# every request method of the asynchronous client, wrapped with the documentation of the synchronous one
+_async_methods = frozenset(
+    name
+    for name, value in vars(AsynchronousClient).items()
+    if not name.startswith("_") and inspect.iscoroutinefunction(value) and name != "from_client_credentials"
+)
+for _name in sorted(_async_methods):
+    _method, _submit_method = _make_methods(_name)
+    setattr(BlockingClient, _name, _method)
+    setattr(BlockingClient, _submit_method.__name__, _submit_method)
+# async generators (the stream_ methods) are iterated one item at a time
+for _name, _value in vars(AsynchronousClient).items():
+    if not _name.startswith("_") and inspect.isasyncgenfunction(_value):
+        setattr(BlockingClient, _name, _make_generator_method(_name))
+del _name, _value, _method, _submit_method
@@ -11,11 +11,17 @@ from ..util import (
 )
 from ..results import *
 from ..scope import Scope
+from ..tracing import RequestHook
+from ..planner import plan_user_fetch
+from ..pagination import PagePlan, check_page_args
 from .auth import AsynchronousAuthHandler, BaseAsynchronousAuthHandler
 from .http import BaseAsynchronousHTTPHandler
+from .pagination import fetch_pages, read_pages_ahead
 
-from typing import Union, Optional, Sequence, Dict, List, Awaitable
+import asyncio
+from typing import Union, Optional, Sequence, Dict, List, Awaitable, AsyncIterator, Tuple, Any, Iterable, Callable
 from datetime import datetime
+from functools import partial
 
 try:
     import osrparse
@@ -55,6 +61,24 @@ class AsynchronousClient:
     def http(self) -> BaseAsynchronousHTTPHandler:
         return self.auth.http
 
+    @classmethod
+    def bind(cls, auth: BaseAsynchronousAuthHandler) -> "AsynchronousClient":
+        """
+        Creates a lightweight :class:`AsynchronousClient` that uses the auth handler and its http handler as they are,
+        without changing the rate limit or api version.
+
+        **Parameters**
+
+        auth: :class:`osu.asyncio.auth.BaseAsynchronousAuthHandler`
+
+        **Returns**
+
+        :class:`AsynchronousClient`
+        """
+        client = cls.__new__(cls)
+        client.auth = auth
+        return client
+
     @classmethod
     async def from_client_credentials(
         cls,
@@ -148,9 +172,133 @@ class AsynchronousClient:
         **Parameters**
 
         domain: str
+            Can include a scheme, such as "http://127.0.0.1:8080" for a local server like
+            :class:`osu.testing.StandInServer`. Otherwise https is used.
         """
         self.http.set_domain(domain)
 
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Add a hook which is called before and after every request with a :class:`osu.RequestTrace`
+        of how long it spent in each phase, from getting a token to constructing the returned objects.
+
+        **Parameters**
+
+        hook: :class:`osu.RequestHook`
+        """
+        self.http.add_hook(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Remove a hook added with :func:`add_hook`.
+
+        **Parameters**
+
+        hook: :class:`osu.RequestHook`
+        """
+        self.http.remove_hook(hook)
+
+    async def iter_pages(
+        self,
+        method: Union[str, Callable],
+        *args,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Call a client method that takes a cursor over and over, passing each result's cursor to the next call,
+        and yield each result. The next page is requested in a task while the current one is being processed.
+        Read :func:`Client.iter_pages` for details on the parameters.
+
+        .. code:: py
+
+            async for page in client.iter_pages(client.get_all_scores, "osu", prefetch=2, max_pages=10):
+                await process(page.scores)
+
+        Stopping early (e.g. with ``break``, once the generator is closed) cancels the request in progress.
+
+        **Returns**
+
+        AsyncIterator[Any]
+            The result of each call.
+        """
+        check_page_args(prefetch, max_pages)
+        if isinstance(method, str) or getattr(method, "__self__", self) is not self:
+            # by name, so bound methods of a BlockingClient wrapping this client work too
+            method = getattr(self, getattr(method, "__name__", method))
+        cursor = kwargs.pop("cursor", None)
+
+        def fetch(page_cursor):
+            return method(*args, cursor=page_cursor, **kwargs)
+
+        async for page in read_pages_ahead(fetch, cursor, prefetch, max_pages):
+            yield page
+
+    async def fetch_all_pages(
+        self,
+        method: Union[str, Callable],
+        *args,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> Any:
+        """
+        Get every page of an endpoint paginated by offset or page number, requesting up to `max_concurrency`
+        pages at once, and combine them in order. Pages are requested until the first one with fewer than
+        `page_size` results; the requests for pages after it are cancelled.
+
+        .. code:: py
+
+            # all of a user's first place scores
+            scores = await client.fetch_all_pages(client.get_user_scores, 2, "firsts", mode="osu")
+            # the top 10,000 of the performance ranking, as one Rankings object
+            ranking = await client.fetch_all_pages("get_ranking", "osu", "performance")
+
+        The methods this works with are :func:`get_user_scores`, :func:`get_user_beatmaps`, :func:`get_user_kudosu`,
+        :func:`get_user_recent_activity`, :func:`get_ranking`, and :func:`get_beatmapset_discussion_posts`.
+        The requests still wait in the rate limiter, so set ``request_wait_time`` lower (or to 0)
+        for concurrency to help.
+
+        **Parameters**
+
+        method: Union[str, Callable]
+            Client method, either its name or the bound method.
+
+        args, kwargs:
+            Passed to every call, except the parameters choosing the page (offset, limit, page, and cursor).
+
+        page_size: Optional[int]
+            Results per request. Defaults to the most the endpoint allows.
+            The ranking is always requested 50 at a time.
+
+        max_results: Optional[int]
+            Stop after this many results.
+
+        max_concurrency: int
+            Most requests running at once. Defaults to 8.
+
+        **Returns**
+
+        Any
+            The same type the method returns, with the results of every page.
+            A list for the user methods, or a result object whose list (e.g. `ranking` or `posts`) has every page.
+
+        **Raises**
+
+        ValueError
+            If the method isn't one of the above.
+        """
+        name = method if isinstance(method, str) else method.__name__
+        plan = PagePlan(name, kwargs, page_size, max_results)
+        method = getattr(self, name)
+
+        def fetch(page_kwargs):
+            return method(*args, **kwargs, **page_kwargs)
+
+        return plan.merge(await fetch_pages(fetch, plan, max_concurrency))
+
     async def lookup_beatmap(
         self,
         checksum: Optional[str] = None,
@@ -295,15 +443,13 @@ class AsynchronousClient:
         """
         mode = parse_enum_args(mode)
         mods = self._parse_mods_list(mods)
-        return BeatmapScores(
-            await self.http.make_request(
-                Path.beatmap_scores(beatmap),
-                mode=mode,
-                **{"mods[]": mods},
-                type=ranking_type,
-                legacy_only=1 if legacy_only else 0,
-            ),
-            self.http.api_version,
+        return await self.http.make_request_and_parse(
+            lambda data: BeatmapScores(data, self.http.api_version),
+            Path.beatmap_scores(beatmap),
+            mode=mode,
+            **{"mods[]": mods},
+            type=ranking_type,
+            legacy_only=1 if legacy_only else 0,
         )
 
     async def get_beatmap(self, beatmap: int) -> Beatmap:
@@ -341,8 +487,11 @@ class AsynchronousClient:
         List[:class:`Beatmap`]
             Includes attributes `beatmapset`, `beatmapset.ratings`, `failtimes`, `max_combo`.
         """
-        results = await self.http.make_request(Path.beatmaps(), **{"ids[]": list(ids)})
-        return list(map(Beatmap, results["beatmaps"])) if results else []
+        return await self.http.make_request_and_parse(
+            lambda results: list(map(Beatmap, results["beatmaps"])) if results else [],
+            Path.beatmaps(),
+            **{"ids[]": list(ids)},
+        )
 
     async def get_beatmap_attributes(
         self,
@@ -407,7 +556,7 @@ class AsynchronousClient:
 
         :class:`Beatmapset`
         """
-        return Beatmapset(await self.http.make_request(Path.get_beatmapset(beatmapset_id)))
+        return await self.http.make_request_and_parse(Beatmapset, Path.get_beatmapset(beatmapset_id))
 
     async def get_beatmapset_discussion_posts(
         self,
@@ -418,7 +567,7 @@ class AsynchronousClient:
         types: Optional[Sequence[str]] = None,
         user: Optional[int] = None,
         with_deleted: Optional[str] = None,
-        cursor: Optional[Dict[str, int]] = None,
+        cursor: Optional[Union[Dict[str, int], str]] = None,
     ) -> BeatmapsetDiscussionPostsResult:
         """
         Returns the posts of the beatmapset discussions
@@ -448,21 +597,30 @@ class AsynchronousClient:
         with_deleted: Optional[str]
             This param has no effect as api calls do not currently receive group permissions.
 
-        cursor: Optional[Dict[str, int]]
-            A cursor object received from a previous call to get_beatmapset_discussion_posts
-            (:class:`BeatmapsetDiscussionPostsResult`.cursor)
+        cursor: Optional[Union[Dict[str, int], str]]
+            The cursor string received from a previous call to get_beatmapset_discussion_posts
+            (:class:`BeatmapsetDiscussionPostsResult`.cursor), or a dict of page and limit
 
         **Returns**
 
         :class:`BeatmapsetDiscussionsPostsResult`
         """
+        cursor_string = None
+        if isinstance(cursor, str):
+            cursor_string, cursor = cursor, {}
         if cursor is None:
             cursor = {}
         if "page" in cursor:
             page = cursor["page"]
         if "limit" in cursor:
             limit = cursor["limit"]
-        resp = await self.http.make_request(
+        return await self.http.make_request_and_parse(
+            lambda resp: BeatmapsetDiscussionPostsResult(
+                list(map(BeatmapsetCompact, resp["beatmapsets"])),
+                list(map(BeatmapsetDiscussionPost, resp["posts"])),
+                list(map(UserCompact, resp["users"])),
+                resp["cursor_string"],
+            ),
             Path.beatmapset_discussion_posts(),
             beatmapset_discussion_id=beatmapset_discussion_id,
             limit=limit,
@@ -470,14 +628,9 @@ class AsynchronousClient:
             sort=sort,
             user=user,
             with_deleted=with_deleted,
+            cursor_string=cursor_string,
             **{"types[]": types},
         )
-        return BeatmapsetDiscussionPostsResult(
-            list(map(BeatmapsetCompact, resp["beatmapsets"])),
-            list(map(BeatmapsetDiscussionPost, resp["posts"])),
-            list(map(UserCompact, resp["users"])),
-            resp["cursor_string"],
-        )
 
     async def get_beatmapset_discussion_votes(
         self,
@@ -536,7 +689,13 @@ class AsynchronousClient:
             page = cursor["page"]
         if "limit" in cursor:
             limit = cursor["limit"]
-        resp = await self.http.make_request(
+        return await self.http.make_request_and_parse(
+            lambda resp: BeatmapsetDiscussionVotesResult(
+                list(map(BeatmapsetDiscussion, resp["discussions"])),
+                list(map(BeatmapsetDiscussionVote, resp["votes"])),
+                list(map(UserCompact, resp["users"])),
+                resp["cursor"],
+            ),
             Path.beatmapset_discussion_votes(),
             beatmapset_discussion_id=beatmapset_discussion_id,
             limit=limit,
@@ -547,12 +706,6 @@ class AsynchronousClient:
             user=user,
             with_deleted=with_deleted,
         )
-        return BeatmapsetDiscussionVotesResult(
-            list(map(BeatmapsetDiscussion, resp["discussions"])),
-            list(map(BeatmapsetDiscussionVote, resp["votes"])),
-            list(map(UserCompact, resp["users"])),
-            resp["cursor"],
-        )
 
     async def get_beatmapset_discussions(
         self,
@@ -623,7 +776,15 @@ class AsynchronousClient:
         if message_types is not None:
             message_types = list(map(lambda t: t.value if isinstance(t, MessageType) else t, message_types))
             params = {"message_types[]": message_types}
-        resp = await self.http.make_request(
+        return await self.http.make_request_and_parse(
+            lambda resp: BeatmapsetDiscussionsResult(
+                list(map(Beatmap, resp["beatmaps"])),
+                list(map(BeatmapsetDiscussion, resp["discussions"])),
+                list(map(BeatmapsetDiscussion, resp["included_discussions"])),
+                list(map(UserCompact, resp["users"])),
+                ReviewsConfig(resp["reviews_config"]),
+                resp["cursor"],
+            ),
             Path.beatmapset_discussions(),
             beatmap_id=beatmap_id,
             beatmapset_id=beatmapset_id,
@@ -636,14 +797,70 @@ class AsynchronousClient:
             with_deleted=with_deleted,
             **params,
         )
-        return BeatmapsetDiscussionsResult(
-            list(map(Beatmap, resp["beatmaps"])),
-            list(map(BeatmapsetDiscussion, resp["discussions"])),
-            list(map(BeatmapsetDiscussion, resp["included_discussions"])),
-            list(map(UserCompact, resp["users"])),
-            ReviewsConfig(resp["reviews_config"]),
-            resp["cursor"],
-        )
+
+    async def stream_beatmapset_discussions(
+        self,
+        beatmap_id: Optional[int] = None,
+        beatmapset_id: Optional[int] = None,
+        beatmapset_status: Optional[str] = None,
+        limit: Optional[int] = None,
+        message_types: Optional[Sequence[Union[str, MessageType]]] = None,
+        only_unresolved: Optional[bool] = None,
+        page: Optional[int] = None,
+        sort: Optional[str] = None,
+        user: Optional[int] = None,
+        with_deleted: Optional[str] = None,
+        cursor: Optional[Dict[str, int]] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_beatmapset_discussions`, but the response is parsed as it's received
+        and each object is yielded as soon as it's complete, with the name of the attribute it
+        belongs to in :class:`BeatmapsetDiscussionsResult`.
+
+        .. code:: py
+
+            async for key, obj in client.stream_beatmapset_discussions(beatmapset_id=1001507):
+                if key == "discussions":
+                    ...
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("beatmaps", :class:`Beatmap`), ("discussions", :class:`BeatmapsetDiscussion`),
+            ("included_discussions", :class:`BeatmapsetDiscussion`), ("users", :class:`UserCompact`),
+            ("reviews_config", :class:`ReviewsConfig`), and ("cursor", Dict)
+        """
+        if cursor is None:
+            cursor = {}
+        if "page" in cursor:
+            page = cursor["page"]
+        if "limit" in cursor:
+            limit = cursor["limit"]
+        params = {}
+        if message_types is not None:
+            message_types = list(map(lambda t: t.value if isinstance(t, MessageType) else t, message_types))
+            params = {"message_types[]": message_types}
+        async for item in self.http.stream_request(
+            Path.beatmapset_discussions(),
+            {
+                "beatmaps": Beatmap,
+                "discussions": BeatmapsetDiscussion,
+                "included_discussions": BeatmapsetDiscussion,
+                "users": UserCompact,
+                "reviews_config": ReviewsConfig,
+            },
+            beatmap_id=beatmap_id,
+            beatmapset_id=beatmapset_id,
+            beatmapset_status=beatmapset_status,
+            limit=limit,
+            only_unresolved=only_unresolved,
+            page=page,
+            sort=sort,
+            user=user,
+            with_deleted=with_deleted,
+            **params,
+        ):
+            yield item
 
     async def get_changelog_build(self, stream: str, build: str) -> Build:
         """
@@ -789,15 +1006,14 @@ class AsynchronousClient:
             "news_post",
         ):
             raise ValueError("commentable_type, if not null, must be of the following: beatmapset, build, new_post")
-        return CommentBundle(
-            await self.http.make_request(
-                Path.get_comments(),
-                commentable_type=commentable_type,
-                commentable_id=commentable_id,
-                parent_id=parent_id,
-                sort=sort,
-                **(cursor if cursor else {}),
-            )
+        return await self.http.make_request_and_parse(
+            CommentBundle,
+            Path.get_comments(),
+            commentable_type=commentable_type,
+            commentable_id=commentable_id,
+            parent_id=parent_id,
+            sort=sort,
+            **(cursor if cursor else {}),
         )
 
     async def get_comment(self, comment: int) -> CommentBundle:
@@ -957,7 +1173,13 @@ class AsynchronousClient:
 
         :class:`GetTopicAndPostsResult`
         """
-        resp = await self.http.make_request(
+        return await self.http.make_request_and_parse(
+            lambda resp: GetTopicAndPostsResult(
+                resp["cursor_string"],
+                resp["search"],
+                ForumTopic(resp["topic"]),
+                list(map(ForumPost, resp["posts"])),
+            ),
             Path.get_topic_and_posts(topic),
             **(cursor if cursor else {}),
             sort=sort,
@@ -965,12 +1187,6 @@ class AsynchronousClient:
             start=start,
             end=end,
         )
-        return GetTopicAndPostsResult(
-            resp["cursor_string"],
-            resp["search"],
-            ForumTopic(resp["topic"]),
-            list(map(ForumPost, resp["posts"])),
-        )
 
     async def edit_topic(self, topic: int, topic_title: str) -> ForumTopic:
         """
@@ -1192,7 +1408,14 @@ class AsynchronousClient:
             Ranking type that depends on `type` argument
         """
         mode, type = parse_enum_args(mode, type)
-        data = await self.http.make_request(
+        return await self.http.make_request_and_parse(
+            lambda data: (
+                SpotlightRankings(data)
+                if type == "charts"
+                else Rankings(
+                    data, {"team": UserTeamStatistics, "country": CountryStatistics}.get(type, UserStatistics)
+                )
+            ),
             Path.get_ranking(mode, type),
             country=country,
             **(cursor if cursor else {}),
@@ -1200,11 +1423,43 @@ class AsynchronousClient:
             spotlight=spotlight,
             variant=variant,
         )
-        return (
-            SpotlightRankings(data)
-            if type == "charts"
-            else Rankings(data, {"team": UserTeamStatistics, "country": CountryStatistics}.get(type, UserStatistics))
-        )
+
+    async def stream_ranking(
+        self,
+        mode: Union[str, GameModeStr],
+        type: Union[str, RankingType],
+        country: Optional[str] = None,
+        cursor: Optional[dict] = None,
+        filter: Optional[str] = None,
+        spotlight: Optional[int] = None,
+        variant: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_ranking`, but the response is parsed as it's received and each object
+        is yielded as soon as it's complete, with the name of the attribute it belongs to.
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("ranking", statistics object), ("cursor", Dict), and ("total", int).
+            If `type` is charts: ("beatmapsets", :class:`Beatmapset`), ("ranking", :class:`UserStatistics`),
+            and ("spotlight", :class:`Spotlight`).
+        """
+        mode, type = parse_enum_args(mode, type)
+        if type == "charts":
+            parsers = {"beatmapsets": Beatmapset, "ranking": UserStatistics, "spotlight": Spotlight}
+        else:
+            parsers = {"ranking": {"team": UserTeamStatistics, "country": CountryStatistics}.get(type, UserStatistics)}
+        async for item in self.http.stream_request(
+            Path.get_ranking(mode, type),
+            parsers,
+            country=country,
+            **(cursor if cursor else {}),
+            filter=filter,
+            spotlight=spotlight,
+            variant=variant,
+        ):
+            yield item
 
     async def get_spotlights(self) -> Spotlights:
         """
@@ -1304,16 +1559,14 @@ class AsynchronousClient:
             Includes attributes `beatmap`, `beatmapset`. Additionally includes `weight` if `type` is `best`.
         """
         mode, type = parse_enum_args(mode, type)
-        return [
-            get_score_object(score, self.http.api_version)
-            for score in await self.http.make_request(
-                Path.get_user_scores(user, type),
-                include_fails=int(include_fails),
-                mode=mode,
-                limit=limit,
-                offset=offset,
-            )
-        ]
+        return await self.http.make_request_and_parse(
+            lambda scores: [get_score_object(score, self.http.api_version) for score in scores],
+            Path.get_user_scores(user, type),
+            include_fails=int(include_fails),
+            mode=mode,
+            limit=limit,
+            offset=offset,
+        )
 
     async def get_user_beatmaps(
         self,
@@ -1347,11 +1600,11 @@ class AsynchronousClient:
             :class:`BeatmapPlaycount` for `type` `most_played` and :class:`Beatmapset` for any other type.
         """
         type = parse_enum_args(type)
-        return list(
-            map(
-                BeatmapPlaycount if type == "most_played" else Beatmapset,
-                await self.http.make_request(Path.get_user_beatmaps(user, type), limit=limit, offset=offset),
-            )
+        return await self.http.make_request_and_parse(
+            lambda beatmaps: list(map(BeatmapPlaycount if type == "most_played" else Beatmapset, beatmaps)),
+            Path.get_user_beatmaps(user, type),
+            limit=limit,
+            offset=offset,
         )
 
     async def get_user_recent_activity(
@@ -1431,7 +1684,7 @@ class AsynchronousClient:
         """
         mode = parse_enum_args(mode)
         user = f"@{user}" if key is not None and key.lower() == "username" else user
-        return User(await self.http.make_request(Path.get_user(user, mode)))
+        return await self.http.make_request_and_parse(User, Path.get_user(user, mode))
 
     async def get_users(
         self, ids: Sequence[int], include_variant_statistics: Optional[bool] = None
@@ -1455,10 +1708,12 @@ class AsynchronousClient:
         Sequence[:class:`UserCompact`]
             Includes attributes: country, cover, groups, statistics_rulesets.
         """
-        res = await self.http.make_request(
-            Path.get_users(), **{"ids[]": ids}, include_variant_statistics=include_variant_statistics
+        return await self.http.make_request_and_parse(
+            lambda res: list(map(UserCompact, res["users"])),
+            Path.get_users(),
+            **{"ids[]": ids},
+            include_variant_statistics=include_variant_statistics,
         )
-        return list(map(UserCompact, res["users"]))
 
     async def lookup_users(self, users: List[Union[int, str]], mode: Optional[GameModeInt] = None):
         """
@@ -1482,6 +1737,65 @@ class AsynchronousClient:
         res = await self.http.make_request(Path.lookup_users(), ruleset_id=mode, **{"ids[]": users})
         return list(map(UserCompact, res["users"]))
 
+    async def fetch_users(
+        self,
+        users: Sequence[Union[int, str]],
+        fields: Iterable[str],
+        mode: Optional[Union[str, GameModeStr]] = None,
+    ) -> List[Optional[Union[User, UserCompact]]]:
+        """
+        Get users with the attributes in `fields`, using whichever of :func:`get_users`, :func:`lookup_users`,
+        and :func:`get_user` return them with the fewest requests. The bulk endpoints are used where possible,
+        and :func:`get_user` only for attributes they don't have. Read :func:`osu.plan_user_fetch` for details.
+
+        .. code:: py
+
+            # one get_users request per 50 users
+            users = client.fetch_users(ids, fields=["statistics_rulesets", "country"])
+            # one lookup_users request per 50 users
+            users = client.fetch_users(["@peppy", 2], fields=["global_rank"], mode="osu")
+
+        Requires OAuth and scope public
+
+        **Parameters**
+
+        users: Sequence[Union[int, str]]
+            Ids and usernames. Usernames should be prefixed with "@".
+
+        fields: Iterable[str]
+            Attributes of :class:`User` that are needed.
+
+        mode: Optional[Union[str, :class:`GameModeStr`]]
+            Game mode of the statistics and global_rank. Required for global_rank.
+
+        **Returns**
+
+        List[Optional[Union[:class:`User`, :class:`UserCompact`]]]
+            In the same order as `users`, with None for users that weren't found by the bulk endpoints.
+            A :class:`User` when :func:`get_user` was used.
+
+        **Raises**
+
+        ValueError
+            If the attributes can't be fetched, such as global_rank without a mode.
+        """
+        mode = parse_enum_args(mode)
+        plan = plan_user_fetch(users, fields, mode)
+        ruleset_id = GameModeStr(mode).get_int_equivalent() if mode is not None else None
+
+        results = {}
+        for endpoint in plan.endpoints:
+            chunks = plan.chunks(endpoint)
+            if endpoint == "get_users":
+                responses = await asyncio.gather(*map(self.get_users, chunks))
+            elif endpoint == "lookup_users":
+                responses = await asyncio.gather(*(self.lookup_users(chunk, ruleset_id) for chunk in chunks))
+            else:
+                responses = await asyncio.gather(*(self.get_user(user, mode or "") for (user,) in chunks))
+                responses = [[user] for user in responses]
+            results[endpoint] = [user for response in responses for user in response]
+        return plan.merge(results)
+
     async def get_wiki_page(self, locale: str, path: str) -> WikiPage:
         """
         The wiki article or image data.
@@ -1537,7 +1851,12 @@ class AsynchronousClient:
             min_date = min_date.isoformat()
         if isinstance(max_date, datetime):
             max_date = max_date.isoformat()
-        resp = await self.http.make_request(
+        return await self.http.make_request_and_parse(
+            lambda resp: GetBeatmapsetEventsResult(
+                list(map(BeatmapsetEvent, resp["events"])),
+                Review(resp["reviewsConfig"]),
+                list(map(UserCompact, resp["users"])),
+            ),
             Path.get_beatmapset_events(),
             page=page,
             limit=limit,
@@ -1546,11 +1865,6 @@ class AsynchronousClient:
             min_date=min_date,
             max_date=max_date,
         )
-        return GetBeatmapsetEventsResult(
-            list(map(BeatmapsetEvent, resp["events"])),
-            Review(resp["reviewsConfig"]),
-            list(map(UserCompact, resp["users"])),
-        )
 
     async def get_matches(
         self,
@@ -1614,11 +1928,40 @@ class AsynchronousClient:
 
         :class:`Match`
         """
-        return MatchExtended(
-            await self.http.make_request(Path.get_match(match_id), before=before, after=after, limit=limit),
-            self.http.api_version,
+        return await self.http.make_request_and_parse(
+            lambda data: MatchExtended(data, self.http.api_version),
+            Path.get_match(match_id),
+            before=before,
+            after=after,
+            limit=limit,
         )
 
+    async def stream_match(
+        self, match_id: int, before: Optional[int] = None, after: Optional[int] = None, limit: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_match`, but the response is parsed as it's received and each object
+        is yielded as soon as it's complete, with the name of the attribute it belongs to in :class:`MatchExtended`.
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("match", :class:`Match`), ("events", :class:`MatchEvent`), ("users", :class:`UserCompact`),
+            ("first_event_id", int), ("latest_event_id", int), and ("current_game_id", int)
+        """
+        async for item in self.http.stream_request(
+            Path.get_match(match_id),
+            {
+                "match": Match,
+                "events": partial(MatchEvent, api_version=self.http.api_version),
+                "users": UserCompact,
+            },
+            before=before,
+            after=after,
+            limit=limit,
+        ):
+            yield item
+
     async def get_rooms(
         self,
         mode: Union[str, GameModeStr] = "",
@@ -1653,18 +1996,14 @@ class AsynchronousClient:
         filter_mode: Optional[Union[:class:`RoomFilterMode`, str]]
         """
         mode, sort, room_type, category, filter_mode = parse_enum_args(mode, sort, room_type, category, filter_mode)
-        return list(
-            map(
-                Room,
-                await self.http.make_request(
-                    Path.get_rooms(mode),
-                    sort=sort,
-                    limit=limit,
-                    type_group=room_type,
-                    category=category,
-                    mode=filter_mode,
-                ),
-            )
+        return await self.http.make_request_and_parse(
+            lambda rooms: list(map(Room, rooms)),
+            Path.get_rooms(mode),
+            sort=sort,
+            limit=limit,
+            type_group=room_type,
+            category=category,
+            mode=filter_mode,
         )
 
     async def get_seasonal_backgrounds(self) -> SeasonalBackgrounds:
@@ -1759,14 +2098,18 @@ class AsynchronousClient:
             filters = {}
         if isinstance(filters, BeatmapsetSearchFilter):
             filters = filters.filters
-        resp = await self.http.make_request(Path.beatmapset_search(), page=page, **filters)
-        return BeatmapsetSearchResult(
-            list(map(Beatmapset, resp["beatmapsets"])),
-            resp["cursor"],
-            resp["search"],
-            resp["recommended_difficulty"],
-            resp["error"],
-            resp["total"],
+        return await self.http.make_request_and_parse(
+            lambda resp: BeatmapsetSearchResult(
+                list(map(Beatmapset, resp["beatmapsets"])),
+                resp["cursor"],
+                resp["search"],
+                resp["recommended_difficulty"],
+                resp["error"],
+                resp["total"],
+            ),
+            Path.beatmapset_search(),
+            page=page,
+            **filters,
         )
 
     async def get_room_leaderboard(self, room_id: int) -> GetRoomLeaderboardResult:
@@ -2165,11 +2508,36 @@ class AsynchronousClient:
         """
         ruleset = parse_enum_args(ruleset)
 
-        ret = await self.http.make_request(Path.get_all_scores(), ruleset=ruleset, cursor_string=cursor)
-        return GetAllScoresResult(
-            [get_score_object(score, self.http.api_version) for score in ret["scores"]], ret["cursor_string"]
+        return await self.http.make_request_and_parse(
+            lambda ret: GetAllScoresResult(
+                [get_score_object(score, self.http.api_version) for score in ret["scores"]], ret["cursor_string"]
+            ),
+            Path.get_all_scores(),
+            ruleset=ruleset,
+            cursor_string=cursor,
         )
 
+    async def stream_all_scores(
+        self, ruleset: Optional[Union[GameModeStr, str]] = None, cursor: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_all_scores`, but the response is parsed as it's received and each score
+        is yielded as soon as it's complete.
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("scores", :class:`SoloScore`) and ("cursor_string", str)
+        """
+        ruleset = parse_enum_args(ruleset)
+        async for item in self.http.stream_request(
+            Path.get_all_scores(),
+            {"scores": partial(get_score_object, api_version=self.http.api_version)},
+            ruleset=ruleset,
+            cursor_string=cursor,
+        ):
+            yield item
+
     async def get_forums(self) -> GetForumsResult:
         """
         Returns top-level forums and their sub-forums (max 2 deep).
@@ -2229,10 +2597,14 @@ class AsynchronousClient:
 
         :class:`GetForumTopicsResult`
         """
-        ret = await self.http.make_request(
-            Path.get_forum_topics(), forum_id=forum_id, cursor_string=cursor, sort=sort, limit=limit
-        )
-        return GetForumTopicsResult(
-            list(map(ForumTopic, ret["topics"])),
-            ret["cursor_string"],
+        return await self.http.make_request_and_parse(
+            lambda ret: GetForumTopicsResult(
+                list(map(ForumTopic, ret["topics"])),
+                ret["cursor_string"],
+            ),
+            Path.get_forum_topics(),
+            forum_id=forum_id,
+            cursor_string=cursor,
+            sort=sort,
+            limit=limit,
         )
@@ -1,15 +1,23 @@
 import time
+import json
 import asyncio
-from typing import Optional, List, AsyncGenerator, TYPE_CHECKING
+import contextlib
+from concurrent.futures import Executor
+from typing import Optional, List, Dict, Tuple, AsyncGenerator, AsyncIterator, Callable, Any, TypeVar, TYPE_CHECKING
 from inspect import iscoroutinefunction
 
 try:
     import aiohttp
+    from multidict import CIMultiDict, CIMultiDictProxy
+    from yarl import URL
 except ImportError:
     aiohttp = None
 
-from ..http import BaseHTTPHandler, HTTPHandler, _convert_param_value
+from ..http import BaseHTTPHandler, HTTPHandler, WaitTimeHistogram, _convert_param_value, _forecast, _in_window
 from ..exceptions import RequestException
+from ..streaming import JSONStreamParser
+from ..tracing import RequestTrace, _collect_traces
+from ..cassette import Cassette
 
 if TYPE_CHECKING:
     from .auth import BaseAsynchronousAuthHandler
@@ -19,6 +27,56 @@ if TYPE_CHECKING:
 __all__ = ("AsynchronousHTTPHandler", "BaseAsynchronousHTTPHandler")
 
 
+_T = TypeVar("_T")
+
+
+def _identity(data):
+    return data
+
+
+class _CassetteResponse:
+    """the parts of :class:`aiohttp.ClientResponse` used by the handler, for responses from a cassette"""
+
+    __slots__ = ("method", "url", "status", "reason", "headers", "content_type", "content_length", "_body")
+
+    def __init__(self, interaction: Dict[str, Any], method: str, url: str):
+        self.method: str = method.upper()
+        self.url = URL(url)
+        self.status: int = interaction["status"]
+        self.reason: str = Cassette.get_reason(interaction)
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction["headers"]))
+        self.content_type: str = self.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip()
+        self._body: bytes = Cassette.get_body(interaction)
+        self.content_length: int = len(self._body)
+
+    @property
+    def content(self):
+        return self
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, len(self._body), n):
+            yield self._body[i : i + n]
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def json(self):
+        if self.content_type != "application/json" and not self.content_type.endswith("+json"):
+            return None
+        return json.loads(self._body) if self._body.strip() else None
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            request_info = aiohttp.RequestInfo(self.url, self.method, CIMultiDictProxy(CIMultiDict()), self.url)
+            raise aiohttp.ClientResponseError(
+                request_info, (), status=self.status, message=self.reason, headers=self.headers
+            )
+
+
+def _decode_and_parse(body: bytes, parse: Callable[[Any], _T]) -> _T:
+    return parse(json.loads(body) if body.strip() else None)
+
+
 class BaseAsynchronousHTTPHandler(BaseHTTPHandler):
     auth: "BaseAsynchronousAuthHandler"
 
@@ -40,10 +98,29 @@ class BaseAsynchronousHTTPHandler(BaseHTTPHandler):
     async def make_request(self, path, *args, **kwargs):
         raise NotImplementedError()
 
+    async def make_request_and_parse(self, parse: Callable[[Any], _T], path, *args, **kwargs) -> _T:
+        """
+        Make a request and return the result of passing its json to `parse`.
+        The time `parse` takes is the construct phase of the request's trace.
+        Handlers may decode and parse large responses off the event loop.
+        """
+        with _collect_traces():
+            return parse(await self.make_request(path, *args, **kwargs))
+
+    def stream_request(self, path, parsers=None, *args, **kwargs) -> AsyncIterator:
+        raise NotImplementedError()
+
 
 class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
     """
     Handles making asynchronous requests. Used by :class:`osu.AsynchronousClient`.
+
+    By default, a new :class:`aiohttp.ClientSession` is made for each request. Set the ``session``
+    attribute to reuse one session (and its connection pool) for all requests; its lifetime is
+    then managed by whoever set it.
+
+    Decoding and parsing large responses can block the event loop for a noticeable amount of time.
+    Use :func:`set_offload` to do it in an executor instead.
     """
 
     def __init__(
@@ -56,6 +133,31 @@ class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
         super().__init__(auth, api_version)
 
         self.rate_limit: RateLimitHandler = RateLimitHandler(request_wait_time, limit_per_minute)
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self.offload_threshold: Optional[int] = None
+        self.offload_executor: Optional[Executor] = None
+
+    def set_offload(self, threshold: Optional[int], executor: Optional[Executor] = None) -> None:
+        """
+        Decode and parse responses of at least `threshold` bytes in an executor, so they don't block
+        the event loop. Smaller responses are still handled on the event loop, which is faster for them.
+
+        The event loop still waits on the GIL, but for short stretches instead of the whole parse,
+        except while the json itself is decoded. The executor has to be a thread pool, since the client
+        methods parse with closures, which can't be pickled for a process pool.
+
+        **Parameters**
+
+        threshold: Optional[int]
+            Size of the response body in bytes. None disables offloading, which is the default.
+
+        executor: Optional[:class:`concurrent.futures.Executor`]
+            A thread pool. Defaults to the event loop's default executor.
+        """
+        if threshold is not None and threshold < 0:
+            raise ValueError("threshold cannot be negative")
+        self.offload_threshold = threshold
+        self.offload_executor = executor
 
     def set_ratelimit(self, request_wait_time: float = 1.0, limit_per_minute: int = 60):
         self.rate_limit.wait_time = request_wait_time
@@ -83,7 +185,9 @@ class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
 
         return headers
 
-    async def make_request_to_endpoint(self, endpoint, path, data=None, headers=None, files=None, **kwargs):
+    async def make_request_to_endpoint(
+        self, endpoint, path, data=None, headers=None, files=None, _trace: Optional[RequestTrace] = None, **kwargs
+    ):
         if headers is None:
             headers = {}
         json = data
@@ -95,22 +199,66 @@ class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
         params = {str(key): _convert_param_value(value) for key, value in kwargs.items() if value is not None}
         if files is not None:
             file_data = dict(map(lambda item: (item[0], item[1][1]), files.items()))
+        if _trace is not None:
+            _trace.mark("auth")
 
+        rate_limit_start = time.monotonic()
         await self.rate_limit.wait()
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                path.method,
-                endpoint + path.path,
-                headers=headers,
-                data=file_data,
-                json=json,
-                params=params,
-            ) as resp:
-                await self._raise_for_status(resp)
+        if _trace is not None:
+            _trace.mark("rate_limit")
+
+        async with self._send(
+            path, endpoint + path.path, headers, file_data, json, params, time.monotonic() - rate_limit_start
+        ) as resp:
+            if _trace is not None:
+                _trace.status = resp.status
+            await self._raise_for_status(resp)
+
+            if resp.content_length == 0:
+                return
+            yield resp
+
+    @contextlib.asynccontextmanager
+    async def _send(self, path, url, headers, data, json, params, rate_limit_wait):
+        cassette = self.cassette
+        if cassette is not None and not cassette.recording:
+            interaction = cassette.replay(path.method, path.path, params, json, rate_limit_wait)
+            if delay := cassette.replay_delay(interaction):
+                await asyncio.sleep(delay)
+            yield _CassetteResponse(interaction, path.method, url)
+            return
 
-                if resp.content_length == 0:
+        async with self._get_session() as session:
+            start = time.monotonic()
+            async with session.request(path.method, url, headers=headers, data=data, json=json, params=params) as resp:
+                if cassette is None:
+                    yield resp
                     return
-                yield resp
+
+                body = await resp.read()
+                interaction = cassette.record(
+                    path.method,
+                    path.path,
+                    path.template,
+                    params,
+                    json,
+                    resp.status,
+                    resp.headers,
+                    body,
+                    time.monotonic() - start,
+                    rate_limit_wait,
+                )
+                # the body was read, so respond from the recording
+                yield _CassetteResponse(interaction, path.method, url)
+
+    @contextlib.asynccontextmanager
+    async def _get_session(self):
+        if self.session is not None:
+            yield self.session
+            return
+
+        async with aiohttp.ClientSession() as session:
+            yield session
 
     async def _raise_for_status(self, resp):
         try:
@@ -154,16 +302,103 @@ class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
             All kwargs will be interpreted as query parameters for the request.
         :type kwargs: Dict[str, str]
         """
-        gen = self.get_req_gen(path, *args, **kwargs)
+        return await self.make_request_and_parse(_identity, path, *args, **kwargs)
+
+    async def make_request_and_parse(self, parse: Callable[[Any], _T], path, *args, **kwargs) -> _T:
+        """
+        Same as :func:`make_request`, but returns the result of passing the json to `parse`.
+        If the response is at least :attr:`offload_threshold` bytes, decoding and parsing happen in
+        :attr:`offload_executor` (read :func:`set_offload`).
+        """
+        trace = self._start_trace(path)
+        try:
+            result = await self._make_request_and_parse(trace, parse, path, *args, **kwargs)
+        except BaseException as exc:
+            if trace is not None:
+                trace.finish(exc)
+            raise
+
+        if trace is not None:
+            if parse is _identity:
+                trace.finish_or_defer()
+            else:
+                trace.mark("construct")
+                trace.finish()
+        return result
+
+    async def _make_request_and_parse(self, trace, parse, path, *args, **kwargs):
+        gen = self.get_req_gen(path, *args, _trace=trace, **kwargs)
         async for resp in gen:
+            return await self._parse_response(resp, parse, trace)
+        if trace is not None:
+            trace.mark("network")
+        return parse(None)
+
+    async def stream_request(
+        self,
+        path,
+        parsers: Optional[Dict[Optional[str], Callable[[Any], Any]]] = None,
+        *args,
+        chunk_size: int = 65536,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[Optional[str], Any]]:
+        """
+        Make a request to the api and parse the json response as it's received, yielding the
+        elements of its top-level arrays one at a time. Read :func:`osu.http.HTTPHandler.stream_request`.
+        """
+        parser = JSONStreamParser(parsers)
+        trace = self._start_trace(path)
+        try:
+            async for resp in self.get_req_gen(path, *args, _trace=trace, **kwargs):
+                received = False
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    received = True
+                    for item in parser.feed(chunk):
+                        yield item
+                if received:
+                    for item in parser.close():
+                        yield item
+        except BaseException as exc:
+            if trace is not None:
+                trace.finish(None if isinstance(exc, GeneratorExit) else exc)
+            raise
+
+        if trace is not None:
+            # decoding and constructing overlap with receiving the body, so it all counts as network
+            trace.mark("network")
+            trace.finish()
+
+    async def _parse_response(self, resp, parse, trace: Optional[RequestTrace] = None):
+        if self.offload_threshold is None and trace is None:
             try:
-                return await resp.json()
+                return parse(await resp.json())
             except aiohttp.client_exceptions.ContentTypeError:
-                return
+                return parse(None)
+
+        body = await resp.read()
+        if trace is not None:
+            trace.mark("network")
+        mimetype = resp.content_type
+        if mimetype != "application/json" and not mimetype.endswith("+json"):
+            return parse(None)
+        if self.offload_threshold is None or len(body) < self.offload_threshold:
+            data = json.loads(body) if body.strip() else None
+            if trace is not None:
+                trace.mark("decode")
+            return parse(data)
+
+        loop = asyncio.get_running_loop()
+        # decoding and parsing are done together in the executor, so they're recorded as one decode phase
+        result = await loop.run_in_executor(self.offload_executor, _decode_and_parse, body, parse)
+        if trace is not None:
+            trace.mark("decode")
+        return result
 
     async def make_auth_request(self, data):
         await self.rate_limit.wait()
-        async with aiohttp.ClientSession() as session:
+        if self.cassette is not None and not self.cassette.recording:
+            return json.loads(Cassette.get_body(self.cassette.replay_token()))
+        async with self._get_session() as session:
             async with session.request("POST", self.token_url, json=data) as resp:
                 await self._raise_for_status(resp)
                 return await resp.json()
@@ -171,6 +406,8 @@ class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
     @classmethod
     def from_sync(cls, http: HTTPHandler, auth: Optional["BaseAsynchronousAuthHandler"] = None):
         new_http = cls(auth, http.rate_limit.wait_time, http.rate_limit.limit, http.api_version)
+        new_http.hooks = http.hooks
+        new_http.cassette = http.cassette
         new_http.rate_limit._requests_sent = http.rate_limit._requests_sent
         new_http.base_url = http.base_url
         new_http.auth_url = http.auth_url
@@ -182,9 +419,18 @@ class AsynchronousHTTPHandler(BaseAsynchronousHTTPHandler):
 
 
 class RateLimitHandler:
+    """
+    Asynchronous version of :class:`osu.http.RateLimitHandler`, with the same statistics.
+    Unlike the other methods, :func:`wait` is a coroutine, and the slow wait callback is called in the event loop.
+    """
+
     __slots__ = (
         "wait_time",
         "limit",
+        "waiters",
+        "histogram",
+        "slow_wait_threshold",
+        "_slow_wait_callback",
         "_lock",
         "_waiting_lock",
         "_requests_sent",
@@ -193,6 +439,10 @@ class RateLimitHandler:
     def __init__(self, request_wait_time: float, limit_per_minute: int):
         self.wait_time: float = request_wait_time
         self.limit: int = limit_per_minute
+        self.waiters: int = 0
+        self.histogram: WaitTimeHistogram = WaitTimeHistogram()
+        self.slow_wait_threshold: Optional[float] = None
+        self._slow_wait_callback: Optional[Callable[[float, RateLimitHandler], None]] = None
         # for accessing non-thread-safe variables
         # intended to be used for short durations
         self._lock: asyncio.Lock = asyncio.Lock()
@@ -201,36 +451,100 @@ class RateLimitHandler:
         self._waiting_lock: asyncio.Lock = asyncio.Lock()
         self._requests_sent: List[float] = []
 
+    def set_slow_wait_callback(
+        self, callback: Optional[Callable[[float, "RateLimitHandler"], None]], threshold: float = 5.0
+    ) -> None:
+        """
+        Read :func:`osu.http.RateLimitHandler.set_slow_wait_callback`.
+        """
+        self._slow_wait_callback = callback
+        self.slow_wait_threshold = None if callback is None else threshold
+
     async def wait(self):
+        start = time.monotonic()
         await self._lock.acquire()
 
-        if self.wait_time > 0:
-            await self._wait_with_wait_time()
-        else:
-            await self._wait_without_wait_time()
+        try:
+            self.waiters += 1
+            # the wait functions hold _lock again when they return or raise, even if cancelled
+            if self.wait_time > 0:
+                await self._wait_with_wait_time()
+            else:
+                await self._wait_without_wait_time()
+
+            now = time.monotonic()
+            self._get_requests_sent().append(now)
+            self.histogram.observe(now - start)
+        finally:
+            self.waiters -= 1
+            self._lock.release()
+
+        callback = self._slow_wait_callback
+        if callback is not None and now - start > self.slow_wait_threshold:
+            callback(now - start, self)
+
+    # the statistics don't await anything, so they don't need the lock
+
+    @property
+    def used(self) -> int:
+        """
+        Number of requests sent in the last minute.
+        """
+        return len(_in_window(self._requests_sent, time.monotonic()))
 
-        self._get_requests_sent().append(time.monotonic())
+    @property
+    def remaining(self) -> int:
+        """
+        Number of requests that can still be sent in the current minute before reaching `limit`.
+        """
+        return max(0, self.limit - self.used)
 
-        self._lock.release()
+    def forecast(self, count: int = 1, include_waiters: bool = True) -> float:
+        """
+        Read :func:`osu.http.RateLimitHandler.forecast`.
+        """
+        if include_waiters:
+            count += self.waiters
+        return _forecast(self._requests_sent, time.monotonic(), self.wait_time, self.limit, count)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Read :func:`osu.http.RateLimitHandler.stats`.
+        """
+        now = time.monotonic()
+        used = len(_in_window(self._requests_sent, now))
+        waiters = self.waiters
+        return {
+            "used": used,
+            "remaining": max(0, self.limit - used),
+            "limit": self.limit,
+            "waiters": waiters,
+            "next_request_in": _forecast(self._requests_sent, now, self.wait_time, self.limit, waiters + 1),
+            "count": self.histogram.count,
+            "mean": self.histogram.mean,
+            "p50": self.histogram.percentile(50),
+            "p99": self.histogram.percentile(99),
+            "max": self.histogram.max,
+        }
 
     async def _wait_with_wait_time(self):
         # acquiring _waiting_lock could take a bit
         # so let's release this one
         self._lock.release()
-        # once acquired, we can choose the appropriate way to wait
-        # without worry about race conditions. waiting one at a time
-        # is okay since wait time between requests is > 0
-        await self._waiting_lock.acquire()
-
-        await self._lock.acquire()
-        if len(requests_sent := self._get_requests_sent()) > 0:
-            wait_time = max(0.0, self.wait_time - (time.monotonic() - requests_sent[-1]))
-            if wait_time > 0:
-                self._lock.release()
-                await asyncio.sleep(wait_time)
+        try:
+            # once acquired, we can choose the appropriate way to wait
+            # without worry about race conditions. waiting one at a time
+            # is okay since wait time between requests is > 0
+            async with self._waiting_lock:
+                if len(requests_sent := self._get_requests_sent()) > 0:
+                    wait_time = max(0.0, self.wait_time - (time.monotonic() - requests_sent[-1]))
+                    if wait_time > 0:
+                        await asyncio.sleep(wait_time)
+                # acquired before releasing _waiting_lock, so the next waiter sees this request
                 await self._lock.acquire()
-
-        self._waiting_lock.release()
+        except BaseException:
+            await self._lock.acquire()
+            raise
 
     async def _wait_without_wait_time(self):
         # under rate limit still, good to send
@@ -240,21 +554,20 @@ class RateLimitHandler:
         # acquiring _waiting_lock could take a bit
         # so let's release this one
         self._lock.release()
-        await self._waiting_lock.acquire()
-        await self._lock.acquire()
-
-        # check again, then wait till oldest request expires past 1 minute
-        if len(requests_sent := self._get_requests_sent()) >= self.limit:
-            wait_time = max(0.0, 60.0 - (time.monotonic() - requests_sent[0]))
-            if wait_time > 0:
-                self._lock.release()
-                await asyncio.sleep(wait_time)
+        try:
+            async with self._waiting_lock:
+                # check again, then wait till oldest request expires past 1 minute
+                if len(requests_sent := self._get_requests_sent()) >= self.limit:
+                    wait_time = max(0.0, 60.0 - (time.monotonic() - requests_sent[0]))
+                    if wait_time > 0:
+                        await asyncio.sleep(wait_time)
                 await self._lock.acquire()
-
-        self._waiting_lock.release()
+        except BaseException:
+            await self._lock.acquire()
+            raise
 
     def _get_requests_sent(self):
-        """expects self._lock is acquired when calling this function"""
+        """expects self._lock or self._waiting_lock is acquired when calling this function"""
         # update list
         while len(self._requests_sent) > 0 and time.monotonic() - self._requests_sent[0] >= 60:
             self._requests_sent.pop(0)
@@ -0,0 +1,149 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Set, Tuple, Union, TYPE_CHECKING
+
+from ..loader import MAX_BATCH_SIZE, _check_batch_args, _split_batch
+from ..objects import Beatmap, User, UserCompact
+
+if TYPE_CHECKING:
+    from .client import AsynchronousClient
+
+
+__all__ = ("AsynchronousBatchLoader",)
+
+
+class AsynchronousBatchLoader:
+    """
+    Asynchronous version of :class:`osu.BatchLoader`, which combines single user and beatmap lookups made
+    around the same time into :func:`AsynchronousClient.get_users` and :func:`AsynchronousClient.get_beatmaps`
+    requests of up to 50 ids.
+
+    .. code:: py
+
+        loader = AsynchronousBatchLoader(client)
+
+        # each handler looks up what it needs, and the lookups share requests
+        user = await loader.get_user(2)
+        beatmaps = await asyncio.gather(*map(loader.get_beatmap, beatmap_ids))
+
+    Must be used on one event loop. Cancelling a lookup doesn't cancel the request,
+    since other lookups may be waiting on it.
+
+    **Init Parameters**
+
+    client: :class:`AsynchronousClient`
+
+    window: float
+        Seconds to collect lookups for before sending them. Defaults to 0.01.
+
+    max_batch_size: int
+        Send the lookups as soon as this many ids were collected. Defaults to 50, which is the most allowed.
+
+    **Attributes**
+
+    batches: int
+        Number of bulk requests sent.
+
+    fallbacks: int
+        Number of ids that were missing from a bulk response and looked up on their own.
+    """
+
+    __slots__ = ("client", "window", "max_batch_size", "batches", "fallbacks", "_pending", "_handles", "_tasks")
+
+    def __init__(self, client: "AsynchronousClient", window: float = 0.01, max_batch_size: int = MAX_BATCH_SIZE):
+        _check_batch_args(window, max_batch_size)
+
+        self.client: "AsynchronousClient" = client
+        self.window: float = window
+        self.max_batch_size: int = max_batch_size
+        self.batches: int = 0
+        self.fallbacks: int = 0
+        self._pending: Dict[str, Dict[int, asyncio.Future]] = {"users": {}, "beatmaps": {}}
+        self._handles: Dict[str, asyncio.TimerHandle] = {}
+        # running batches, so they aren't garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _get_methods(self, kind: str) -> Tuple[Callable[..., Awaitable], Callable[..., Awaitable]]:
+        if kind == "users":
+            return self.client.get_users, self.client.get_user
+        return self.client.get_beatmaps, self.client.get_beatmap
+
+    async def get_user(self, user_id: int, compact: bool = True) -> Union[User, UserCompact]:
+        """
+        Read :func:`osu.BatchLoader.get_user`.
+        """
+        if not compact:
+            return await self.client.get_user(user_id)
+        return await self._load("users", user_id)
+
+    async def get_beatmap(self, beatmap_id: int) -> Beatmap:
+        """
+        Read :func:`osu.BatchLoader.get_beatmap`.
+        """
+        return await self._load("beatmaps", beatmap_id)
+
+    def flush(self) -> None:
+        """
+        Send the collected lookups now rather than at the end of the window.
+        """
+        for kind in self._pending:
+            self._dispatch(kind)
+
+    def _load(self, kind: str, obj_id: int) -> Awaitable:
+        pending = self._pending[kind]
+        future = pending.get(obj_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = pending[obj_id] = loop.create_future()
+            if len(pending) >= self.max_batch_size:
+                self._dispatch(kind)
+            elif kind not in self._handles:
+                self._handles[kind] = loop.call_later(self.window, self._dispatch, kind)
+        # shielded, so a cancelled lookup doesn't cancel the others waiting on the same id
+        return asyncio.shield(future)
+
+    def _dispatch(self, kind: str):
+        handle = self._handles.pop(kind, None)
+        if handle is not None:
+            handle.cancel()
+
+        batch = self._pending[kind]
+        if not batch:
+            return
+        self._pending[kind] = {}
+        self.batches += 1
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(kind, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, kind: str, batch: Dict[int, asyncio.Future]):
+        bulk, single = self._get_methods(kind)
+        try:
+            found, missing = _split_batch(list(batch), await bulk(list(batch)))
+        except Exception as exc:
+            for future in batch.values():
+                _set_exception(future, exc)
+            return
+
+        for obj_id, obj in found.items():
+            if obj_id in batch:
+                _set_result(batch[obj_id], obj)
+
+        if missing:
+            self.fallbacks += len(missing)
+            results = await asyncio.gather(*map(single, missing), return_exceptions=True)
+            for obj_id, result in zip(missing, results):
+                if isinstance(result, BaseException):
+                    _set_exception(batch[obj_id], result)
+                else:
+                    _set_result(batch[obj_id], result)
+
+
+def _set_result(future: asyncio.Future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException):
+    if not future.done():
+        future.set_exception(exc)
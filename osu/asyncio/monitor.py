@@ -0,0 +1,120 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+__all__ = ("LoopLagMonitor",)
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs a callback scheduled every `interval` seconds.
+    The lag is the time something else held the event loop, such as decoding and parsing a large response.
+    Useful for checking the effect of :func:`osu.asyncio.http.AsynchronousHTTPHandler.set_offload`.
+
+    .. code:: py
+
+        async with LoopLagMonitor() as monitor:
+            await client.get_beatmapset_discussions(limit=50)
+        print(monitor.stats())
+
+    **Init Parameters**
+
+    interval: float
+        Seconds between measurements. Defaults to 0.01.
+
+    max_samples: int
+        Number of the most recent measurements kept. Defaults to 10000.
+
+    **Attributes**
+
+    samples: Deque[float]
+        Measured lag in seconds, oldest first.
+
+    max_lag: float
+        Largest lag measured since the monitor was created or reset, including samples no longer kept.
+    """
+
+    __slots__ = ("interval", "samples", "max_lag", "_task")
+
+    def __init__(self, interval: float = 0.01, max_samples: int = 10000):
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        self.interval: float = interval
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self.max_lag: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """
+        Start measuring. Must be called while the event loop is running. Does nothing if already started.
+        """
+        if self._task is not None:
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        """
+        Stop measuring. The samples are kept.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        self._task = None
+
+    def reset(self) -> None:
+        """
+        Clear the samples and max lag.
+        """
+        self.samples.clear()
+        self.max_lag = 0.0
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.samples.append(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the lag at a percentile (0-100) of the kept samples, or 0 if there are none.
+        """
+        if not self.samples:
+            return 0.0
+
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns a summary of the kept samples in seconds: count, mean, p50, p99, and max.
+        """
+        count = len(self.samples)
+        return {
+            "count": count,
+            "mean": sum(self.samples) / count if count else 0.0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max_lag,
+        }
+
+    async def __aenter__(self):
+        self.start()
+        # let the first measurement begin before the monitored code runs
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
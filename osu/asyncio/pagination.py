@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from ..pagination import PagePlan, is_last_page, next_cursor
+
+
+__all__ = ()
+
+
+async def read_pages(fetch: Callable[[Any], Awaitable], cursor: Any, max_pages: Optional[int]) -> AsyncIterator[Any]:
+    """
+    Asynchronous version of :func:`osu.pagination.read_pages`.
+    """
+    count = 0
+    while max_pages is None or count < max_pages:
+        page = await fetch(cursor)
+        count += 1
+        yield page
+
+        previous, cursor = cursor, next_cursor(page)
+        if is_last_page(cursor, previous):
+            return
+
+
+async def read_pages_ahead(
+    fetch: Callable[[Any], Awaitable], cursor: Any, prefetch: int, max_pages: Optional[int]
+) -> AsyncIterator[Any]:
+    """
+    Same as :func:`read_pages`, but a task requests up to `prefetch` pages ahead of the one being processed.
+    Closing the generator cancels the task, along with its current request.
+    """
+    if prefetch == 0:
+        async for page in read_pages(fetch, cursor, max_pages):
+            yield page
+        return
+
+    pages = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def read_ahead():
+        generator = read_pages(fetch, cursor, max_pages)
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    pages.put_nowait(("page", await generator.__anext__()))
+                except StopAsyncIteration:
+                    break
+            pages.put_nowait(("end", None))
+        except Exception as exc:
+            pages.put_nowait(("error", exc))
+        finally:
+            await generator.aclose()
+
+    task = asyncio.get_running_loop().create_task(read_ahead())
+    try:
+        while True:
+            kind, value = await pages.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            slots.release()
+            yield value
+    finally:
+        task.cancel()
+
+
+async def fetch_pages(fetch: Callable[[Dict[str, Any]], Awaitable], plan: PagePlan, max_concurrency: int) -> List[Any]:
+    """
+    Asynchronous version of :func:`osu.pagination.fetch_pages`, which requests the pages in tasks
+    and cancels the requests for pages past the first short one. The cancelled tasks are waited for
+    before returning, so they've left the rate limiter.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than 0")
+
+    loop = asyncio.get_running_loop()
+    pages: Dict[int, Any] = {}
+    running: Dict[asyncio.Task, int] = {}
+    cancelled: List[asyncio.Task] = []
+    try:
+        index = 0
+        while True:
+            while len(running) < (max_concurrency if pages else 1) and plan.has_page(index):
+                running[loop.create_task(fetch(plan.page_kwargs(index)))] = index
+                index += 1
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                page_index = running.pop(task)
+                pages[page_index] = task.result()
+                plan.received(page_index, pages[page_index])
+            for task, page_index in list(running.items()):
+                if not plan.has_page(page_index):
+                    task.cancel()
+                    cancelled.append(task)
+                    del running[task]
+    finally:
+        for task in running:
+            task.cancel()
+            cancelled.append(task)
+        if cancelled:
+            await asyncio.wait(cancelled)
+
+    return [pages[i] for i in range(plan.pages)]
@@ -1,17 +1,24 @@
-from time import monotonic
+from time import monotonic, time
 from typing import Callable, Optional, TYPE_CHECKING
+import contextlib
 import threading
+import logging
+import random
 
 from .scope import Scope
 from .http import HTTPHandler, BaseHTTPHandler
 
 if TYPE_CHECKING:
     from .asyncio.auth import AsynchronousAuthHandler
+    from .token_store import BaseTokenStore
 
 
 __all__ = ("BaseAuthHandler", "NoAuth", "FunctionalAuthHandler", "AuthUtil", "AuthHandler")
 
 
+_log = logging.getLogger(__name__)
+
+
 class BaseAuthHandler:
     """
     An abstract class for implementing authentication logic.
@@ -48,12 +55,19 @@ class AuthData:
     def __init__(self):
         self.refresh_token: Optional[str] = None
         self.token: Optional[str] = None
-        self.expire_time: float = monotonic()
+        self.expires_in: float = 0
+        self.issued_time: float = monotonic()
+        self.expire_time: float = self.issued_time
+        # wall clock time, for sharing the token with other processes
+        self.expires_at: float = time()
 
     def set_data(self, token: Optional[str], refresh_token: Optional[str], expires_in: float) -> None:
         self.token = token
         self.refresh_token = refresh_token
-        self.expire_time = monotonic() + expires_in
+        self.expires_in = expires_in
+        self.issued_time = monotonic()
+        self.expire_time = self.issued_time + expires_in
+        self.expires_at = time() + expires_in
 
     @property
     def has_expired(self):
@@ -97,8 +111,13 @@ class AuthUtil:
     http: BaseHTTPHandler
     _data: AuthData
     _refresh_callback: Optional[Callable[["AuthUtil"], None]]
+    _refresh_error_callback: Optional[Callable[["AuthUtil", Exception], None]]
+    _token_store: Optional["BaseTokenStore"]
+    _token_store_key: Optional[str]
 
     SAVE_VERSION = 2
+    # seconds to wait before retrying a failed background refresh
+    REFRESH_RETRY_DELAY = 10
 
     def __init__(
         self,
@@ -117,6 +136,9 @@ class AuthUtil:
 
         self._data = AuthData()
         self._refresh_callback = None
+        self._refresh_error_callback = None
+        self._token_store = None
+        self._token_store_key = None
 
     def _get_data(self, grant_type, code=None):
         data = {
@@ -136,8 +158,56 @@ class AuthUtil:
         return data
 
     def _handle_response(self, data):
+        self._set_token_data(data)
+        if self._token_store is not None:
+            self._token_store.save(self._token_store_key, self._stored_token())
+
+    def _set_token_data(self, data):
         self._data.set_data(data["access_token"], data.get("refresh_token"), data["expires_in"])
 
+    def _stored_token(self) -> dict:
+        return {
+            "access_token": self._data.token,
+            "refresh_token": self._data.refresh_token,
+            "expires_at": self._data.expires_at,
+        }
+
+    def set_token_store(self, store: Optional["BaseTokenStore"], key: Optional[str] = None):
+        """
+        Share access tokens through a token store, such as :class:`JSONTokenStore` or :class:`SQLiteTokenStore`.
+        A valid token in the store is used instead of requesting a new one, new tokens are saved to the store,
+        and only one process refreshes an expired token while the others wait and then reuse it.
+
+        **Parameters**
+
+        store: Optional[:class:`BaseTokenStore`]
+            The store to use, or None to stop using a store.
+
+        key: Optional[str]
+            Key the token is stored under. Defaults to the client id and scopes, which is
+            fine for client credentials. Tokens of authorized users need a unique key for each user.
+        """
+        self._token_store = store
+        self._token_store_key = key if key is not None else f"{self.client_id}:{self.scope.scopes}"
+
+    def _lock_token_store(self):
+        if self._token_store is None:
+            return contextlib.nullcontext()
+        return self._token_store.lock(self._token_store_key)
+
+    def _load_stored_token(self) -> bool:
+        if self._token_store is None:
+            return False
+        return self._use_stored_token(self._token_store.load(self._token_store_key))
+
+    def _use_stored_token(self, token: Optional[dict]) -> bool:
+        # use a valid token from the store if it's newer than the current one
+        if token is None or token["expires_at"] <= self._data.expires_at or token["expires_at"] - 5 <= time():
+            return False
+
+        self._data.set_data(token["access_token"], token.get("refresh_token"), token["expires_at"] - time())
+        return True
+
     def get_auth_url(self, state: Optional[str] = ""):
         """
         Returns a url that a user can authorize their account at. They'll then be returned to
@@ -165,15 +235,44 @@ class AuthUtil:
         """
         return self.scope.has_user
 
-    def set_refresh_callback(self, callback: Callable[["FunctionalAuthHandler"], None]):
+    def set_refresh_callback(
+        self,
+        callback: Optional[Callable[["FunctionalAuthHandler"], None]],
+        error_callback: Optional[Callable[["FunctionalAuthHandler", Exception], None]] = None,
+    ):
         """
         Set a callback to be called everytime the access token is refreshed.
 
         **Parameters**
 
         callback: :class:`Callable[['AuthHandler'], None]`
+
+        error_callback: Optional[:class:`Callable[['AuthHandler', Exception], None]`]
+            Called with the exception when a background refresh fails (see `start_background_refresh`).
+            The failure is logged if this is not set.
         """
         self._refresh_callback = callback
+        self._refresh_error_callback = error_callback
+
+    def _get_refresh_delay(self, fraction: float, jitter: float) -> float:
+        # seconds until the token should be renewed in the background
+        if self._data.token is None:
+            return 0
+        lifetime = self._data.expires_in * fraction * (1 - random.uniform(0, jitter))
+        return max(0.0, self._data.issued_time + lifetime - monotonic())
+
+    def _handle_refresh_error(self, exc: Exception):
+        if self._refresh_error_callback is not None:
+            self._refresh_error_callback(self, exc)
+        else:
+            _log.error("Background refresh of the access token failed", exc_info=exc)
+
+    @staticmethod
+    def _validate_refresh_args(fraction: float, jitter: float):
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction must be in the range (0, 1]")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in the range [0, 1)")
 
     def get_save_data(self):
         """
@@ -244,7 +343,18 @@ FunctionalAuthHandler = AuthUtil
 
 
 class AuthHandler(BaseAuthHandler, AuthUtil):
-    __slots__ = ("http", "_lock")
+    """
+    Handles authentication for :class:`osu.Client`. Read :class:`AuthUtil` for the init parameters,
+    plus the following.
+
+    **Init Parameters**
+
+    http: Optional[:class:`osu.http.HTTPHandler`]
+        If given, the auth handler uses a handler bound from this one (see :func:`osu.http.HTTPHandler.bind`),
+        sharing its rate limit and session.
+    """
+
+    __slots__ = ("http", "_lock", "_refresh_lock", "_refresh_thread", "_refresh_stop")
 
     def __init__(
         self,
@@ -252,11 +362,16 @@ class AuthHandler(BaseAuthHandler, AuthUtil):
         client_secret: str,
         redirect_url: Optional[str],
         scope: Optional[Scope] = None,
+        http: Optional[HTTPHandler] = None,
     ):
         AuthUtil.__init__(self, client_id, client_secret, redirect_url, scope)
 
-        self.http: HTTPHandler = HTTPHandler(self)
+        self.http: HTTPHandler = HTTPHandler(self) if http is None else http.bind(self)
         self._lock: threading.Lock = threading.Lock()
+        # held while a token request is in flight, so a foreground and background refresh can't overlap
+        self._refresh_lock: threading.Lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop: Optional[threading.Event] = None
 
     def has_user(self) -> bool:
         return AuthUtil.has_user(self)
@@ -294,11 +409,15 @@ class AuthHandler(BaseAuthHandler, AuthUtil):
         """
         data = self._get_data("client_credentials" if code is None else "authorization_code", code)
 
-        response = self.http.get_auth_token(data)
-        self._raise_for_status(response)
-        response = response.json()
+        with self._lock_token_store() if code is None else contextlib.nullcontext():
+            if code is None and self._load_stored_token():
+                return
+
+            response = self.http.get_auth_token(data)
+            self._raise_for_status(response)
+            response = response.json()
 
-        self._handle_response(response)
+            self._handle_response(response)
 
     def refresh_access_token(self, refresh_token: Optional[str] = None) -> None:
         """
@@ -314,13 +433,15 @@ class AuthHandler(BaseAuthHandler, AuthUtil):
         if refresh_token:
             self._data.refresh_token = refresh_token
 
-        data = self._get_data("client_credentials" if self._data.refresh_token is None else "refresh_token")
+        with self._refresh_lock, self._lock_token_store():
+            # another process may have refreshed the token already
+            if refresh_token is not None or not self._load_stored_token():
+                data = self._get_data("client_credentials" if self._data.refresh_token is None else "refresh_token")
+                response = self.http.get_auth_token(data)
+                self._raise_for_status(response)
+                response = response.json()
 
-        response = self.http.get_auth_token(data)
-        self._raise_for_status(response)
-        response = response.json()
-
-        self._handle_response(response)
+                self._handle_response(response)
 
         if self._refresh_callback:
             self._refresh_callback(self)
@@ -328,14 +449,74 @@ class AuthHandler(BaseAuthHandler, AuthUtil):
     def get_token(self) -> Optional[str]:
         with self._lock:
             if self._data.has_expired:
-                self.refresh_access_token()
+                # a background refresh may have finished while waiting for the lock
+                with self._refresh_lock:
+                    expired = self._data.has_expired
+                if expired:
+                    self.refresh_access_token()
             return self._data.token
 
+    def start_background_refresh(self, fraction: float = 0.75, jitter: float = 0.1) -> None:
+        """
+        Start renewing the access token in a background thread before it expires,
+        so requests never wait on a token refresh. Does nothing if already started.
+
+        The current token keeps being used until the new one is received.
+        Failures are passed to the error callback set with :func:`set_refresh_callback`
+        and retried after :attr:`REFRESH_RETRY_DELAY` seconds.
+
+        **Parameters**
+
+        fraction: float
+            Fraction of the token's lifetime (`expires_in`) after which it's renewed. Defaults to 0.75.
+
+        jitter: float
+            Renew up to this fraction earlier, picked randomly, so that many processes
+            don't refresh at the same time. Defaults to 0.1.
+        """
+        self._validate_refresh_args(fraction, jitter)
+        if self._refresh_thread is not None:
+            return
+
+        self._refresh_stop = threading.Event()
+        self._refresh_thread = threading.Thread(
+            target=self._background_refresh,
+            args=(fraction, jitter, self._refresh_stop),
+            name="osu.py token refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """
+        Stop the background refresh started with :func:`start_background_refresh`.
+        """
+        if self._refresh_thread is None:
+            return
+
+        self._refresh_stop.set()
+        self._refresh_thread = None
+        self._refresh_stop = None
+
+    def _background_refresh(self, fraction: float, jitter: float, stop: threading.Event):
+        delay = self._get_refresh_delay(fraction, jitter)
+        while not stop.wait(delay):
+            try:
+                self.refresh_access_token()
+            except Exception as exc:
+                self._handle_refresh_error(exc)
+                delay = self.REFRESH_RETRY_DELAY
+            else:
+                delay = self._get_refresh_delay(fraction, jitter)
+
     @classmethod
     def from_async(cls, auth: "AsynchronousAuthHandler"):
         new_auth = cls(auth.client_id, auth.client_secret, auth.redirect_url, auth.scope)
         new_auth._data = auth._data
         new_auth._refresh_callback = auth._refresh_callback
+        new_auth._refresh_error_callback = auth._refresh_error_callback
+        new_auth._token_store = auth._token_store
+        new_auth._token_store_key = auth._token_store_key
         new_auth.http = auth.http.as_sync(new_auth)
         return new_auth
 
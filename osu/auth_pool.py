@@ -0,0 +1,301 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, time
+from typing import Dict, Optional, List
+import threading
+
+from .auth import AuthHandler
+from .client import Client
+from .http import HTTPHandler
+from .scope import Scope
+from .token_store import BaseTokenStore
+
+
+__all__ = ("AuthPool",)
+
+
+class AuthPool:
+    """
+    Manages the tokens of many users who authorized the same application, for services
+    that make requests on behalf of their users.
+
+    Auth handlers are loaded lazily from a token store the first time they're requested and kept
+    in memory up to `max_size`, evicting the least recently used ones. All of them share one
+    :class:`osu.http.HTTPHandler`, meaning they share the rate limit and the sessions
+    (and their connection pools). Tokens can be refreshed in batches ahead of time with :func:`refresh_expiring`
+    or on a schedule with :func:`start_scheduled_refresh`.
+
+    .. code:: py
+
+        store = SQLiteTokenStore("tokens.db")
+        pool = AuthPool(client_id, client_secret, redirect_url, store, Scope("public", "identify"))
+
+        # when a user authorizes
+        pool.authorize(f"user:{user_id}", code)
+
+        # when handling a request
+        client = pool.client(f"user:{user_id}")
+        me = client.get_own_data()
+
+    **Init Parameters**
+
+    client_id: int
+
+    client_secret: str
+
+    redirect_url: Optional[str]
+
+    store: :class:`BaseTokenStore`
+        Where tokens are loaded from and saved to, by key.
+
+    scope: Optional[:class:`Scope`]
+        Scopes users authorize under. Defaults to :func:`Scope.default`.
+
+    max_size: int
+        Maximum number of auth handlers kept in memory. Defaults to 1024.
+
+    max_idle: Optional[float]
+        Seconds an auth handler can go unused before it's evicted. Defaults to no limit.
+
+    request_wait_time: float
+        Read :class:`Client` for details.
+
+    limit_per_minute: int
+        Read :class:`Client` for details.
+
+    **Attributes**
+
+    http: :class:`osu.http.HTTPHandler`
+        Handler shared by all the auth handlers.
+    """
+
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "redirect_url",
+        "store",
+        "scope",
+        "max_size",
+        "max_idle",
+        "http",
+        "_handlers",
+        "_last_used",
+        "_lock",
+        "_refresh_thread",
+        "_refresh_stop",
+    )
+
+    def __init__(
+        self,
+        client_id: int,
+        client_secret: str,
+        redirect_url: Optional[str],
+        store: BaseTokenStore,
+        scope: Optional[Scope] = None,
+        max_size: int = 1024,
+        max_idle: Optional[float] = None,
+        request_wait_time: float = 1.0,
+        limit_per_minute: int = 60,
+    ):
+        self.client_id: int = client_id
+        self.client_secret: str = client_secret
+        self.redirect_url: Optional[str] = redirect_url
+        self.store: BaseTokenStore = store
+        self.scope: Scope = Scope.default() if scope is None else scope
+        self.max_size: int = max_size
+        self.max_idle: Optional[float] = max_idle
+
+        self.http: HTTPHandler = HTTPHandler(None, request_wait_time, limit_per_minute)
+
+        self._handlers: "OrderedDict[str, AuthHandler]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop: Optional[threading.Event] = None
+
+    def _create_handler(self, key: str) -> AuthHandler:
+        auth = AuthHandler(self.client_id, self.client_secret, self.redirect_url, self.scope, http=self.http)
+        auth.set_token_store(self.store, key)
+        return auth
+
+    def _add(self, key: str, auth: AuthHandler) -> AuthHandler:
+        with self._lock:
+            auth = self._handlers.setdefault(key, auth)
+            self._handlers.move_to_end(key)
+            self._last_used[key] = monotonic()
+            self._evict()
+        return auth
+
+    def _evict(self):
+        """expects self._lock is acquired when calling this function"""
+        while len(self._handlers) > self.max_size:
+            key, _ = self._handlers.popitem(last=False)
+            del self._last_used[key]
+
+        if self.max_idle is None:
+            return
+        now = monotonic()
+        # oldest entries are first
+        while self._handlers:
+            key = next(iter(self._handlers))
+            if now - self._last_used[key] < self.max_idle:
+                break
+            del self._handlers[key]
+            del self._last_used[key]
+
+    def get(self, key: str) -> AuthHandler:
+        """
+        Returns the auth handler of a user, loading it from the store if it isn't in memory.
+
+        **Parameters**
+
+        key: str
+            Key of the user's token in the store.
+
+        **Returns**
+
+        :class:`AuthHandler`
+
+        **Raises**
+
+        KeyError
+            If the store doesn't have a token for the key.
+        """
+        with self._lock:
+            auth = self._handlers.get(key)
+            if auth is not None:
+                self._handlers.move_to_end(key)
+                self._last_used[key] = monotonic()
+                return auth
+
+        token = self.store.load(key)
+        if token is None:
+            raise KeyError(key)
+
+        auth = self._create_handler(key)
+        # the token may be expired, in which case it's refreshed with the refresh token when used
+        auth._data.set_data(token["access_token"], token.get("refresh_token"), token["expires_at"] - time())
+        return self._add(key, auth)
+
+    def authorize(self, key: str, code: str) -> AuthHandler:
+        """
+        Get a token for a user who authorized with a code (see :func:`get_auth_url`)
+        and save it to the store under key.
+
+        **Returns**
+
+        :class:`AuthHandler`
+        """
+        auth = self._create_handler(key)
+        auth.get_auth_token(code)
+        with self._lock:
+            self._handlers.pop(key, None)
+        return self._add(key, auth)
+
+    def get_auth_url(self, state: Optional[str] = "") -> str:
+        """
+        Returns a url for users to authorize the application. Read :func:`AuthUtil.get_auth_url`.
+        """
+        return self._create_handler("").get_auth_url(state)
+
+    def client(self, key: str) -> Client:
+        """
+        Returns a :class:`Client` which makes requests on behalf of a user. Creating one is cheap,
+        so it's fine to create one per request.
+
+        **Parameters**
+
+        key: str
+
+        **Returns**
+
+        :class:`Client`
+        """
+        return Client.bind(self.get(key))
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a user's auth handler from memory. The token stays in the store.
+        """
+        with self._lock:
+            self._handlers.pop(key, None)
+            self._last_used.pop(key, None)
+
+    def refresh_expiring(self, within: float = 300.0, max_workers: int = 4) -> List[str]:
+        """
+        Refresh the tokens of the loaded auth handlers which expire within a number of seconds.
+        Tokens are refreshed concurrently, limited by the shared rate limit.
+        Failures are passed to the auth handler's refresh error callback (or logged).
+
+        **Parameters**
+
+        within: float
+            Defaults to 5 minutes.
+
+        max_workers: int
+            Number of tokens refreshed at a time.
+
+        **Returns**
+
+        List[str]
+            Keys of the tokens that were refreshed successfully.
+        """
+        with self._lock:
+            self._evict()
+            deadline = monotonic() + within
+            expiring = [(key, auth) for key, auth in self._handlers.items() if auth._data.expire_time <= deadline]
+
+        def refresh(item):
+            key, auth = item
+            try:
+                auth.refresh_access_token()
+                return key
+            except Exception as exc:
+                auth._handle_refresh_error(exc)
+
+        if not expiring:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(expiring))) as executor:
+            return [key for key in executor.map(refresh, expiring) if key is not None]
+
+    def start_scheduled_refresh(self, interval: float = 60.0, within: float = 300.0, max_workers: int = 4) -> None:
+        """
+        Call :func:`refresh_expiring` every `interval` seconds in a background thread.
+        `within` should be larger than `interval` so tokens are refreshed before they expire.
+        Does nothing if already started.
+        """
+        if self._refresh_thread is not None:
+            return
+
+        self._refresh_stop = stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.refresh_expiring(within, max_workers)
+
+        self._refresh_thread = threading.Thread(target=run, name="osu.py auth pool refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop_scheduled_refresh(self) -> None:
+        """
+        Stop the background refresh started with :func:`start_scheduled_refresh`.
+        """
+        if self._refresh_thread is None:
+            return
+
+        self._refresh_stop.set()
+        self._refresh_thread = None
+        self._refresh_stop = None
+
+    def close(self) -> None:
+        """
+        Stop the scheduled refresh and close the shared sessions.
+        """
+        self.stop_scheduled_refresh()
+        self.http.close()
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def __contains__(self, key: str):
+        return key in self._handlers
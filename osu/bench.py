@@ -0,0 +1,456 @@
+import argparse
+import ast
+import asyncio
+import cProfile
+import gzip
+import importlib
+import inspect
+import io
+import json
+import os
+import pstats
+import runpy
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .http import BaseHTTPHandler
+from .tracing import PHASES, RequestHook, RequestTrace
+
+
+__all__ = ("ProfileReport", "profile_response", "profile_script")
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_OBJECTS_DIR = os.path.join(_PACKAGE_DIR, "objects")
+# modules whose classes are constructed from responses
+_MODEL_FILES = [
+    os.path.join(_OBJECTS_DIR, name) for name in sorted(os.listdir(_OBJECTS_DIR)) if name.endswith(".py")
+] + [os.path.join(_PACKAGE_DIR, name) for name in ("results.py", "series.py")]
+
+_class_ranges: Optional[Dict[str, List[Tuple[int, int, str]]]] = None
+
+
+def _get_class_ranges() -> Dict[str, List[Tuple[int, int, str]]]:
+    # line ranges of the model classes, for attributing allocations to the class that made them
+    global _class_ranges
+    if _class_ranges is not None:
+        return _class_ranges
+
+    _class_ranges = {}
+    for filename in _MODEL_FILES:
+        with open(filename, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename)
+        _class_ranges[filename] = [
+            (node.lineno, node.end_lineno, node.name) for node in tree.body if isinstance(node, ast.ClassDef)
+        ]
+    return _class_ranges
+
+
+def _find_class(filename: str, lineno: int) -> Optional[str]:
+    for start, end, name in _get_class_ranges().get(os.path.abspath(filename), ()):
+        if start <= lineno <= end:
+            return name
+
+
+class _TraceCollector(RequestHook):
+    __slots__ = ("traces",)
+
+    def __init__(self):
+        self.traces: List[RequestTrace] = []
+
+    def after_request(self, trace: RequestTrace) -> None:
+        self.traces.append(trace)
+
+
+class ProfileReport:
+    """
+    Result of :func:`profile_response` and :func:`profile_script`.
+
+    **Attributes**
+
+    phases: Dict[str, float]
+        Total seconds spent in each phase of the requests (auth, rate_limit, network, decode, construct).
+
+    requests: int
+        Number of requests, or how many times the response was parsed.
+
+    elapsed: float
+        Seconds from start to end, including time spent outside of requests.
+
+    allocations: List[Tuple[str, int, int]]
+        Name, bytes, and number of the memory blocks allocated by each model class and still held at the end,
+        largest first. Empty if memory wasn't traced.
+
+    stats: Optional[:class:`pstats.Stats`]
+        cProfile statistics, or None if it wasn't profiled.
+    """
+
+    __slots__ = ("phases", "requests", "elapsed", "allocations", "stats")
+
+    def __init__(
+        self,
+        phases: Dict[str, float],
+        requests: int,
+        elapsed: float,
+        allocations: List[Tuple[str, int, int]],
+        stats: Optional[pstats.Stats],
+    ):
+        self.phases: Dict[str, float] = phases
+        self.requests: int = requests
+        self.elapsed: float = elapsed
+        self.allocations: List[Tuple[str, int, int]] = allocations
+        self.stats: Optional[pstats.Stats] = stats
+
+    def format(self, limit: int = 15, sort: str = "tottime") -> str:
+        """
+        Returns the report as text: the phase breakdown, the top allocating model classes,
+        and the cProfile output of the hottest constructors in :mod:`osu.objects`.
+
+        **Parameters**
+
+        limit: int
+            Number of model classes and constructors to show. Defaults to 15.
+
+        sort: str
+            A :meth:`pstats.Stats.sort_stats` key. Defaults to ``tottime``.
+        """
+        lines = [f"{self.requests} requests in {self.elapsed:.3f}s", "", f"{'phase':<14}{'total (s)':>12}{'%':>8}"]
+        phases_total = sum(self.phases.values())
+        for phase in PHASES:
+            seconds = self.phases.get(phase, 0.0)
+            share = seconds / phases_total * 100 if phases_total else 0.0
+            lines.append(f"{phase:<14}{seconds:>12.4f}{share:>7.1f}%")
+        other = max(0.0, self.elapsed - phases_total)
+        lines.append(f"{'outside':<14}{other:>12.4f}")
+
+        if self.allocations:
+            lines += ["", f"{'model class':<36}{'KiB':>12}{'blocks':>10}"]
+            for name, size, count in self.allocations[:limit]:
+                lines.append(f"{name:<36}{size / 1024:>12.1f}{count:>10}")
+
+        if self.stats is not None:
+            stream = io.StringIO()
+            self.stats.stream = stream
+            # only the constructors of the models, matched against "file:line(function)"
+            self.stats.sort_stats(sort).print_stats(r"osu[/\\]objects[/\\].*\(__init__\)", limit)
+            lines += ["", stream.getvalue().strip()]
+
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"ProfileReport(requests={self.requests}, elapsed={self.elapsed:.3f})"
+
+
+def _group_allocations(snapshot: tracemalloc.Snapshot) -> List[Tuple[str, int, int]]:
+    by_class = defaultdict(lambda: [0, 0])
+    for stat in snapshot.statistics("lineno"):
+        frame = stat.traceback[0]
+        name = _find_class(frame.filename, frame.lineno)
+        if name is not None:
+            by_class[name][0] += stat.size
+            by_class[name][1] += stat.count
+    return sorted(((name, size, count) for name, (size, count) in by_class.items()), key=lambda item: -item[1])
+
+
+class _Profiler:
+    # traces memory and cpu time for the duration of a with block
+    __slots__ = ("memory", "snapshot", "_profile", "_start", "elapsed")
+
+    def __init__(self, memory: bool, profile: bool):
+        self.memory: bool = memory
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._profile: Optional[cProfile.Profile] = cProfile.Profile() if profile else None
+        self.elapsed: float = 0.0
+
+    def __enter__(self):
+        if self.memory:
+            tracemalloc.start()
+        if self._profile is not None:
+            self._profile.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.elapsed = time.perf_counter() - self._start
+        if self._profile is not None:
+            self._profile.disable()
+        if self.memory:
+            self.snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+    def report(self, phases: Dict[str, float], requests: int) -> ProfileReport:
+        return ProfileReport(
+            phases,
+            requests,
+            self.elapsed,
+            _group_allocations(self.snapshot) if self.snapshot is not None else [],
+            pstats.Stats(self._profile) if self._profile is not None else None,
+        )
+
+
+def _read_bodies(path: str, template: Optional[str]) -> List[bytes]:
+    with open(path, "rb") as f:
+        data = f.read()
+    # gzip magic number
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+
+    first_line = data.split(b"\n", 1)[0]
+    try:
+        first = json.loads(first_line)
+    except ValueError:
+        first = None
+    if not isinstance(first, dict) or "body_encoding" not in first:
+        return [data]
+
+    # a cassette, where each line is an interaction
+    from .cassette import Cassette
+
+    if template is None:
+        raise ValueError("template is required to pick the responses of a cassette")
+    bodies = [
+        Cassette.get_body(interaction)
+        for interaction in map(json.loads, filter(None, data.splitlines()))
+        if interaction["template"] == template and interaction["status"] == 200
+    ]
+    if not bodies:
+        raise ValueError(f"The cassette has no successful responses for {template}")
+    return bodies
+
+
+def _resolve_model(name: str, api_version: str) -> Callable[[Any], Any]:
+    # a class of osu (e.g. User) or a callable as module:name (e.g. mypackage.parsers:parse_users)
+    if ":" in name:
+        module_name, attr = name.split(":", 1)
+        model = getattr(importlib.import_module(module_name), attr)
+    else:
+        import osu
+
+        model = getattr(osu, name)
+
+    try:
+        parameters = inspect.signature(model).parameters
+    except (TypeError, ValueError):
+        return model
+    return partial(model, api_version=api_version) if "api_version" in parameters else model
+
+
+def profile_response(
+    path: str,
+    model: str,
+    template: Optional[str] = None,
+    api_version: Optional[str] = None,
+    repeat: int = 10,
+    memory: bool = True,
+    profile: bool = True,
+) -> ProfileReport:
+    """
+    Profile decoding and constructing a saved response, or the responses to an endpoint in a cassette.
+
+    **Parameters**
+
+    path: str
+        File with the json body of a response, or a :class:`osu.Cassette` recording. It can be gzip-compressed.
+
+    model: str
+        What to construct from the response: the name of a class in :mod:`osu` (e.g. ``User``), or
+        ``module:name`` for any other callable. Classes taking an api version are given `api_version`.
+
+    template: Optional[str]
+        Path template of the endpoint whose responses to use from a cassette (e.g. ``users/{user}/{mode}``).
+        Required for cassettes.
+
+    api_version: Optional[str]
+        Defaults to :attr:`osu.http.BaseHTTPHandler.DEFAULT_API_VERSION`.
+
+    repeat: int
+        How many times to decode and construct each response. Defaults to 10.
+
+    memory: bool
+        Whether to trace the memory allocated by the model classes. Defaults to true.
+
+    profile: bool
+        Whether to run it under cProfile. Defaults to true.
+
+    **Returns**
+
+    :class:`ProfileReport`
+        Only the decode and construct phases are measured.
+    """
+    bodies = _read_bodies(path, template)
+    construct = _resolve_model(model, api_version or BaseHTTPHandler.DEFAULT_API_VERSION)
+    phases = {"decode": 0.0, "construct": 0.0}
+    results = []
+
+    with _Profiler(memory, profile) as profiler:
+        for body in bodies * repeat:
+            start = time.perf_counter()
+            data = json.loads(body)
+            decoded = time.perf_counter()
+            # keep the results, so their memory is still held when it's measured
+            results.append(construct(data))
+            end = time.perf_counter()
+            phases["decode"] += decoded - start
+            phases["construct"] += end - decoded
+
+    return profiler.report(phases, len(bodies) * repeat)
+
+
+def _load_run(script: str) -> Callable:
+    run = runpy.run_path(script).get("run")
+    if not callable(run):
+        raise ValueError(f"{script} must define a run(client) function")
+    return run
+
+
+def profile_script(
+    script: str,
+    cassette: Optional[str] = None,
+    client_id: Optional[int] = None,
+    client_secret: Optional[str] = None,
+    request_wait_time: float = 1.0,
+    limit_per_minute: int = 60,
+    memory: bool = True,
+    profile: bool = True,
+) -> ProfileReport:
+    """
+    Profile a workflow script, which defines a ``run(client)`` function that makes requests with the client.
+    If it's a coroutine function, it's given an :class:`osu.AsynchronousClient`, otherwise an :class:`osu.Client`.
+
+    **Parameters**
+
+    script: str
+        Path of the script.
+
+    cassette: Optional[str]
+        Answer the requests from a :class:`osu.Cassette` recording rather than the api. Responses to identical
+        requests are reused if the script makes them more times than they were recorded.
+
+    client_id: Optional[int]
+        Required without a cassette.
+
+    client_secret: Optional[str]
+        Required without a cassette.
+
+    request_wait_time: float
+
+    limit_per_minute: int
+        Passed to the client. Same defaults as :class:`osu.Client`.
+
+    memory: bool
+        Whether to trace the memory allocated by the model classes. Defaults to true.
+
+    profile: bool
+        Whether to run it under cProfile. Defaults to true. Profiling slows the script down,
+        so the phase timings are higher than without it.
+
+    **Returns**
+
+    :class:`ProfileReport`
+    """
+    from .cassette import Cassette
+
+    run = _load_run(script)
+    if cassette is None and (client_id is None or client_secret is None):
+        raise ValueError("client_id and client_secret are required without a cassette")
+    if cassette is not None:
+        # the placeholder credentials are answered by the cassette
+        client_id, client_secret = 1, "replayed"
+
+    collector = _TraceCollector()
+    is_async = inspect.iscoroutinefunction(run)
+
+    if is_async:
+        from .asyncio import AsynchronousClient as client_cls
+    else:
+        from .client import Client as client_cls
+
+    client = client_cls.from_credentials(
+        client_id, client_secret, None, request_wait_time=request_wait_time, limit_per_minute=limit_per_minute
+    )
+    client.add_hook(collector)
+    if cassette is not None:
+        client.http.set_cassette(Cassette(cassette, "replay", repeat=True))
+
+    with _Profiler(memory, profile) as profiler:
+        if is_async:
+            asyncio.run(_run_async(run, client))
+        else:
+            run(client)
+
+    phases = defaultdict(float)
+    for trace in collector.traces:
+        for phase in PHASES:
+            phases[phase] += trace.duration(phase) or 0.0
+    return profiler.report(dict(phases), len(collector.traces))
+
+
+async def _run_async(run, client):
+    try:
+        await run(client)
+    finally:
+        session = getattr(client.http, "session", None)
+        if session is not None:
+            await session.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m osu.bench",
+        description="Profile osu.py on saved responses, cassettes, or a workflow script.",
+    )
+    parser.add_argument("--limit", type=int, default=15, help="rows of the allocation and profile tables")
+    parser.add_argument("--sort", default="tottime", help="pstats sort key of the profile table")
+    parser.add_argument("--no-memory", action="store_true", help="don't trace memory allocations")
+    parser.add_argument("--no-profile", action="store_true", help="don't run under cProfile")
+    parser.add_argument("--pstats", help="also write the full cProfile stats to this file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    response = subparsers.add_parser("response", help="decode and construct a saved response")
+    response.add_argument("file", help="json body of a response or a cassette, optionally gzip-compressed")
+    response.add_argument("--model", required=True, help="class in osu (e.g. User), or module:name of a callable")
+    response.add_argument("--template", help="path template of the responses to use from a cassette")
+    response.add_argument("--api-version")
+    response.add_argument("--repeat", type=int, default=10)
+
+    script = subparsers.add_parser("script", help="run a script defining run(client)")
+    script.add_argument("file")
+    script.add_argument("--cassette", help="answer requests from this cassette instead of the api")
+    script.add_argument("--client-id", type=int, default=os.getenv("osu_client_id"))
+    script.add_argument("--client-secret", default=os.getenv("osu_client_secret"))
+    script.add_argument("--request-wait-time", type=float, default=1.0)
+    script.add_argument("--limit-per-minute", type=int, default=60)
+
+    args = parser.parse_args(argv)
+    memory, profile = not args.no_memory, not args.no_profile
+
+    try:
+        if args.command == "response":
+            report = profile_response(
+                args.file, args.model, args.template, args.api_version, args.repeat, memory, profile
+            )
+        else:
+            report = profile_script(
+                args.file,
+                args.cassette,
+                args.client_id,
+                args.client_secret,
+                args.request_wait_time,
+                args.limit_per_minute,
+                memory,
+                profile,
+            )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    print(report.format(args.limit, args.sort))
+    if args.pstats and report.stats is not None:
+        report.stats.dump_stats(args.pstats)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,246 @@
+import base64
+import gzip
+import http.client
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .exceptions import RequestException
+
+
+__all__ = ("Cassette",)
+
+
+# headers kept in a recording, since they affect how responses are handled
+_KEPT_HEADERS = ("Content-Type", "Retry-After")
+
+# answer to token requests while replaying
+_TOKEN_INTERACTION = {
+    "method": "POST",
+    "path": "oauth/token",
+    "template": None,
+    "params": {},
+    "data": None,
+    "status": 200,
+    "headers": {"Content-Type": "application/json"},
+    "body": json.dumps({"token_type": "Bearer", "expires_in": 86400, "access_token": "replayed"}),
+    "body_encoding": "utf-8",
+    "time": 0.0,
+    "duration": 0.0,
+    "rate_limit_wait": 0.0,
+}
+
+
+def _normalize(value) -> str:
+    return json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def _key(method: str, path: str, params: Optional[dict], data: Any) -> Tuple[str, str, str, str]:
+    return method.upper(), path, _normalize(params or {}), _normalize(data)
+
+
+class Cassette:
+    """
+    Records requests to the api and their responses to a gzip-compressed file, and replays them later
+    without a network connection. Set it on a client's http handler with
+    :func:`osu.http.BaseHTTPHandler.set_cassette`. Works with both :class:`osu.Client` and
+    :class:`osu.AsynchronousClient`.
+
+    .. code:: py
+
+        with Cassette("traffic.jsonl.gz", "record") as cassette:
+            client.http.set_cassette(cassette)
+            ...  # make requests as usual
+
+        # later, the same requests are answered from the file
+        client.http.set_cassette(Cassette("traffic.jsonl.gz", "replay"))
+
+    Requests still go through the rate limiter while replaying, so changes to it can be evaluated with
+    real traffic. The time each request waited in it is recorded, and :func:`rate_limit_stats` compares
+    the recorded and replayed waits. Responses are matched to requests by method, path, query parameters,
+    and body, and responses to identical requests are replayed in the order they were recorded.
+
+    Token requests aren't recorded, so neither are tokens nor client secrets. When replaying, they're answered
+    with a placeholder token.
+
+    **Init Parameters**
+
+    path: str
+        Path of the cassette file.
+
+    mode: str
+        ``record`` or ``replay``. Defaults to ``replay``. Recording overwrites the file.
+
+    speed: Optional[float]
+        When replaying, wait for the recorded duration of each response divided by `speed`,
+        so 1 replays with the original timing. Defaults to None, which doesn't wait.
+
+    repeat: bool
+        When replaying, reuse the responses to a request once they were all replayed, rather than failing.
+        Useful for running a workload repeatedly. Defaults to false.
+
+    **Attributes**
+
+    interactions: List[Dict[str, Any]]
+        The recorded interactions, in order. Recordings are written to the file as they're made,
+        so they aren't kept here.
+    """
+
+    __slots__ = ("path", "mode", "speed", "repeat", "interactions", "_queues", "_waits", "_lock", "_start", "_file")
+
+    def __init__(self, path: str, mode: str = "replay", speed: Optional[float] = None, repeat: bool = False):
+        if mode not in ("record", "replay"):
+            raise ValueError("mode must be record or replay")
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be greater than 0")
+
+        self.path: str = path
+        self.mode: str = mode
+        self.speed: Optional[float] = speed
+        self.repeat: bool = repeat
+        self.interactions: List[Dict[str, Any]] = []
+        self._queues: Dict[tuple, Deque[Dict[str, Any]]] = {}
+        # pairs of recorded and replayed rate limit waits
+        self._waits: List[Tuple[float, float]] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._start: float = time.monotonic()
+        self._file = None
+
+        if mode == "record":
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                self.interactions.append(interaction)
+                key = _key(interaction["method"], interaction["path"], interaction["params"], interaction["data"])
+                self._queues.setdefault(key, deque()).append(interaction)
+
+    def close(self) -> None:
+        """
+        Finish writing the file when recording. Does nothing when replaying.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        template: Optional[str],
+        params: Optional[dict],
+        data: Any,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        duration: float,
+        rate_limit_wait: float,
+    ) -> Dict[str, Any]:
+        """
+        Record an interaction and return it. Used by the http handlers.
+        """
+        try:
+            text, encoding = body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(body).decode("ascii"), "base64"
+
+        interaction = {
+            "method": method.upper(),
+            "path": path,
+            "template": template,
+            "params": params or {},
+            "data": data,
+            "status": status,
+            "headers": {name: headers[name] for name in _KEPT_HEADERS if name in headers},
+            "body": text,
+            "body_encoding": encoding,
+            "time": time.monotonic() - self._start - duration,
+            "duration": duration,
+            "rate_limit_wait": rate_limit_wait,
+        }
+        # round trip through json, so recording and replaying return the same values
+        line = _normalize(interaction)
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("The cassette was closed")
+            self._file.write(line + "\n")
+        return json.loads(line)
+
+    def replay(self, method: str, path: str, params: Optional[dict], data: Any, rate_limit_wait: float):
+        """
+        Returns the recorded interaction for a request. Used by the http handlers.
+
+        **Raises**
+
+        :class:`osu.RequestException`
+            If there's no recorded response left for the request.
+        """
+        with self._lock:
+            queue = self._queues.get(_key(method, path, params, data))
+            if not queue:
+                raise RequestException(f"No recorded response for {method.upper()} {path} with params {params}")
+
+            interaction = queue.popleft()
+            if self.repeat:
+                queue.append(interaction)
+            self._waits.append((interaction["rate_limit_wait"], rate_limit_wait))
+        return interaction
+
+    @staticmethod
+    def replay_token() -> Dict[str, Any]:
+        """
+        Returns the interaction answering token requests while replaying. Used by the http handlers.
+        """
+        return _TOKEN_INTERACTION
+
+    def replay_delay(self, interaction: Dict[str, Any]) -> float:
+        """
+        Seconds to wait before replaying a response, depending on :attr:`speed`.
+        """
+        return 0.0 if self.speed is None else interaction["duration"] / self.speed
+
+    @staticmethod
+    def get_body(interaction: Dict[str, Any]) -> bytes:
+        if interaction["body_encoding"] == "base64":
+            return base64.b64decode(interaction["body"])
+        return interaction["body"].encode("utf-8")
+
+    @staticmethod
+    def get_reason(interaction: Dict[str, Any]) -> str:
+        return http.client.responses.get(interaction["status"], "")
+
+    def rate_limit_stats(self) -> Dict[str, float]:
+        """
+        Returns the count, total, mean, and max of the recorded rate limit waits of the replayed requests
+        (``recorded_total``, etc.), and the same for how long they waited while being replayed
+        (``replayed_total``, etc.).
+        """
+        with self._lock:
+            waits = list(self._waits)
+
+        stats = {"count": len(waits)}
+        for i, name in enumerate(("recorded", "replayed")):
+            values = [pair[i] for pair in waits]
+            stats[f"{name}_total"] = sum(values)
+            stats[f"{name}_mean"] = sum(values) / len(values) if values else 0.0
+            stats[f"{name}_max"] = max(values, default=0.0)
+        return stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
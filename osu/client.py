@@ -13,9 +13,13 @@ from .util import (
 )
 from .results import *
 from .scope import Scope
+from .tracing import RequestHook
+from .pagination import PagePlan, check_page_args, fetch_pages, read_pages_ahead
 
-from typing import Union, Optional, Sequence, Dict, List
+from typing import Union, Optional, Sequence, Dict, List, Callable, Iterable, Iterator, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
+from functools import partial
 
 try:
     import osrparse
@@ -25,7 +29,65 @@ except ImportError:
     has_osrparse = False
 
 
-__all__ = ("Client",)
+__all__ = ("Client", "ClientBatch")
+
+
+class ClientBatch:
+    """
+    Runs client methods concurrently in a thread pool. Returned by :func:`Client.batch`.
+
+    Calling a client method on the batch submits the call and returns a :class:`concurrent.futures.Future`.
+    Leaving the ``with`` block waits for every call to finish.
+
+    **Attributes**
+
+    futures: List[:class:`concurrent.futures.Future`]
+        Futures of every submitted call, in the order they were submitted.
+    """
+
+    __slots__ = ("client", "futures", "_executor")
+
+    def __init__(self, client: "Client", max_workers: Optional[int] = None):
+        self.client: Client = client
+        self.futures: List[Future] = []
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers, thread_name_prefix="osu.py batch")
+
+    def submit(self, method: Union[str, Callable], *args, **kwargs) -> Future:
+        """
+        Submit a call of a client method, given by name or as a bound method.
+
+        **Returns**
+
+        :class:`concurrent.futures.Future`
+        """
+        if isinstance(method, str):
+            method = getattr(self.client, method)
+        future = self._executor.submit(method, *args, **kwargs)
+        self.futures.append(future)
+        return future
+
+    def __getattr__(self, item):
+        method = getattr(self.client, item)
+        if not callable(method):
+            return method
+
+        def submit(*args, **kwargs):
+            return self.submit(method, *args, **kwargs)
+
+        return submit
+
+    def results(self) -> List[Any]:
+        """
+        Wait for every call and return their results in the order they were submitted.
+        Raises the exception of the first call that failed.
+        """
+        return [future.result() for future in self.futures]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._executor.shutdown(wait=True)
 
 
 class Client:
@@ -33,9 +95,10 @@ class Client:
     Main object for interacting with osu!api, which uses synchronous requests.
     If you're looking for asynchronous requests, use :class:`AsynchronousClient`.
 
-    .. WARNING::
-        This class is not thread-safe. If you wish to use with threading,
-        use a threading lock when making requests.
+    The client can be used from many threads at once; each thread uses its own http session
+    and the rate limit is shared. :func:`map` and :func:`batch` run calls in a thread pool.
+    Note that with the default ``request_wait_time``, requests are still spaced one second apart,
+    so concurrency mostly helps when it's lowered or set to 0.
 
     .. WARNING::
         Regarding the ``limit_per_minute`` attribute below: do not change it unless you know what you are doing.
@@ -129,6 +192,25 @@ class Client:
             auth.get_auth_token(code)
         return cls(auth, request_wait_time, limit_per_minute)
 
+    @classmethod
+    def bind(cls, auth: BaseAuthHandler) -> "Client":
+        """
+        Creates a lightweight :class:`Client` that uses the auth handler and its http handler as they are,
+        without changing the rate limit or api version. Useful for making a client for each request
+        from pooled auth handlers (see :class:`AuthPool`).
+
+        **Parameters**
+
+        auth: :class:`osu.auth.BaseAuthHandler`
+
+        **Returns**
+
+        :class:`Client`
+        """
+        client = cls.__new__(cls)
+        client.auth = auth
+        return client
+
     @classmethod
     def from_client_credentials(cls, *args, **kwargs):
         """
@@ -157,9 +239,217 @@ class Client:
         **Parameters**
 
         domain: str
+            Can include a scheme, such as "http://127.0.0.1:8080" for a local server like
+            :class:`osu.testing.StandInServer`. Otherwise https is used.
         """
         self.http.set_domain(domain)
 
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Add a hook which is called before and after every request with a :class:`osu.RequestTrace`
+        of how long it spent in each phase, from getting a token to constructing the returned objects.
+
+        **Parameters**
+
+        hook: :class:`osu.RequestHook`
+        """
+        self.http.add_hook(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Remove a hook added with :func:`add_hook`.
+
+        **Parameters**
+
+        hook: :class:`osu.RequestHook`
+        """
+        self.http.remove_hook(hook)
+
+    def map(
+        self,
+        method: Union[str, Callable],
+        iterable: Iterable[Any],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Call a client method with each item of `iterable` concurrently in a thread pool.
+
+        .. code:: py
+
+            users = client.map(client.get_user, [2, 124493, 7562902], max_workers=3, mode="osu")
+
+        **Parameters**
+
+        method: Union[str, Callable]
+            Client method, either its name or the bound method.
+
+        iterable: Iterable[Any]
+            Each item is passed as the first argument.
+
+        max_workers: Optional[int]
+            Maximum number of concurrent calls. Defaults to :class:`concurrent.futures.ThreadPoolExecutor`'s default.
+
+        return_exceptions: bool
+            If true, exceptions are returned in place of the result instead of being raised.
+
+        kwargs:
+            Passed to each call.
+
+        **Returns**
+
+        List[Any]
+            Results in the same order as `iterable`.
+        """
+        with self.batch(max_workers) as batch:
+            for item in iterable:
+                batch.submit(method, item, **kwargs)
+
+        if not return_exceptions:
+            return batch.results()
+        return [future.exception() or future.result() for future in batch.futures]
+
+    def batch(self, max_workers: Optional[int] = None) -> ClientBatch:
+        """
+        Returns a context manager for running many calls concurrently in a thread pool.
+
+        .. code:: py
+
+            with client.batch(max_workers=4) as batch:
+                user = batch.get_user(2)
+                beatmap = batch.get_beatmap(1031991)
+            print(user.result(), beatmap.result())
+            # or batch.results() for every result in order
+
+        **Parameters**
+
+        max_workers: Optional[int]
+            Maximum number of concurrent calls.
+
+        **Returns**
+
+        :class:`ClientBatch`
+        """
+        return ClientBatch(self, max_workers)
+
+    def iter_pages(
+        self,
+        method: Union[str, Callable],
+        *args,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Call a client method that takes a cursor over and over, passing each result's cursor to the next call,
+        and yield each result. The next page is requested in a background thread while the current one
+        is being processed, so a consumer that takes about as long as a request doesn't wait between pages.
+        Requests still go through the client's rate limit.
+
+        .. code:: py
+
+            for page in client.iter_pages(client.get_all_scores, "osu", prefetch=2, max_pages=10):
+                process(page.scores)
+
+        Iteration stops when a result has no cursor or the same cursor as before. Stopping early
+        (e.g. with ``break``) stops reading ahead; a request already in progress finishes, but its page is discarded.
+
+        **Parameters**
+
+        method: Union[str, Callable]
+            Client method with a `cursor` parameter, such as :func:`get_all_scores`
+            or :func:`get_beatmapset_discussion_posts`, either its name or the bound method.
+
+        args, kwargs:
+            Passed to every call. A `cursor` keyword argument is only passed to the first call.
+
+        prefetch: int
+            Most pages to request ahead of the one being processed. 0 requests each page only once
+            the previous one was processed. Defaults to 1.
+
+        max_pages: Optional[int]
+            Stop after this many pages.
+
+        **Returns**
+
+        Iterator[Any]
+            The result of each call.
+        """
+        check_page_args(prefetch, max_pages)
+        if isinstance(method, str):
+            method = getattr(self, method)
+        cursor = kwargs.pop("cursor", None)
+
+        def fetch(page_cursor):
+            return method(*args, cursor=page_cursor, **kwargs)
+
+        yield from read_pages_ahead(fetch, cursor, prefetch, max_pages)
+
+    def fetch_all_pages(
+        self,
+        method: Union[str, Callable],
+        *args,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> Any:
+        """
+        Get every page of an endpoint paginated by offset or page number, requesting up to `max_concurrency`
+        pages at once in a thread pool, and combine them in order. Pages are requested until the first one
+        with fewer than `page_size` results; pages after it that were already being requested are discarded.
+
+        .. code:: py
+
+            # all of a user's first place scores
+            scores = client.fetch_all_pages(client.get_user_scores, 2, "firsts", mode="osu")
+            # the top 10,000 of the performance ranking, as one Rankings object
+            ranking = client.fetch_all_pages("get_ranking", "osu", "performance")
+
+        The methods this works with are :func:`get_user_scores`, :func:`get_user_beatmaps`, :func:`get_user_kudosu`,
+        :func:`get_user_recent_activity`, :func:`get_ranking`, and :func:`get_beatmapset_discussion_posts`.
+        The requests still wait in the rate limiter, so set ``request_wait_time`` lower (or to 0)
+        for concurrency to help.
+
+        **Parameters**
+
+        method: Union[str, Callable]
+            Client method, either its name or the bound method.
+
+        args, kwargs:
+            Passed to every call, except the parameters choosing the page (offset, limit, page, and cursor).
+
+        page_size: Optional[int]
+            Results per request. Defaults to the most the endpoint allows.
+            The ranking is always requested 50 at a time.
+
+        max_results: Optional[int]
+            Stop after this many results.
+
+        max_concurrency: int
+            Most requests running at once. Defaults to 8.
+
+        **Returns**
+
+        Any
+            The same type the method returns, with the results of every page.
+            A list for the user methods, or a result object whose list (e.g. `ranking` or `posts`) has every page.
+
+        **Raises**
+
+        ValueError
+            If the method isn't one of the above.
+        """
+        name = method if isinstance(method, str) else method.__name__
+        plan = PagePlan(name, kwargs, page_size, max_results)
+        method = getattr(self, name)
+
+        def fetch(page_kwargs):
+            return method(*args, **kwargs, **page_kwargs)
+
+        return plan.merge(fetch_pages(fetch, plan, max_concurrency))
+
     def lookup_beatmap(
         self,
         checksum: Optional[str] = None,
@@ -305,15 +595,13 @@ class Client:
         """
         mode = parse_enum_args(mode)
         mods = self._parse_mods_list(mods)
-        return BeatmapScores(
-            self.http.make_request(
-                Path.beatmap_scores(beatmap),
-                mode=mode,
-                **{"mods[]": mods},
-                type=ranking_type,
-                legacy_only=1 if legacy_only else 0,
-            ),
-            self.http.api_version,
+        return self.http.make_request_and_parse(
+            lambda data: BeatmapScores(data, self.http.api_version),
+            Path.beatmap_scores(beatmap),
+            mode=mode,
+            **{"mods[]": mods},
+            type=ranking_type,
+            legacy_only=1 if legacy_only else 0,
         )
 
     def get_beatmap(self, beatmap: int) -> Beatmap:
@@ -351,8 +639,11 @@ class Client:
         List[:class:`Beatmap`]
             Includes attributes `beatmapset`, `beatmapset.ratings`, `failtimes`, `max_combo`.
         """
-        results = self.http.make_request(Path.beatmaps(), **{"ids[]": list(ids)})
-        return list(map(Beatmap, results["beatmaps"])) if results else []
+        return self.http.make_request_and_parse(
+            lambda results: list(map(Beatmap, results["beatmaps"])) if results else [],
+            Path.beatmaps(),
+            **{"ids[]": list(ids)},
+        )
 
     def get_beatmap_attributes(
         self,
@@ -417,7 +708,7 @@ class Client:
 
         :class:`Beatmapset`
         """
-        return Beatmapset(self.http.make_request(Path.get_beatmapset(beatmapset_id)))
+        return self.http.make_request_and_parse(Beatmapset, Path.get_beatmapset(beatmapset_id))
 
     def get_beatmapset_discussion_posts(
         self,
@@ -428,7 +719,7 @@ class Client:
         types: Optional[Sequence[str]] = None,
         user: Optional[int] = None,
         with_deleted: Optional[str] = None,
-        cursor: Optional[Dict[str, int]] = None,
+        cursor: Optional[Union[Dict[str, int], str]] = None,
     ) -> BeatmapsetDiscussionPostsResult:
         """
         Returns the posts of the beatmapset discussions
@@ -458,21 +749,30 @@ class Client:
         with_deleted: Optional[str]
             This param has no effect as api calls do not currently receive group permissions.
 
-        cursor: Optional[Dict[str, int]]
-            A cursor object received from a previous call to get_beatmapset_discussion_posts
-            (:class:`BeatmapsetDiscussionPostsResult`.cursor)
+        cursor: Optional[Union[Dict[str, int], str]]
+            The cursor string received from a previous call to get_beatmapset_discussion_posts
+            (:class:`BeatmapsetDiscussionPostsResult`.cursor), or a dict of page and limit
 
         **Returns**
 
         :class:`BeatmapsetDiscussionsPostsResult`
         """
+        cursor_string = None
+        if isinstance(cursor, str):
+            cursor_string, cursor = cursor, {}
         if cursor is None:
             cursor = {}
         if "page" in cursor:
             page = cursor["page"]
         if "limit" in cursor:
             limit = cursor["limit"]
-        resp = self.http.make_request(
+        return self.http.make_request_and_parse(
+            lambda resp: BeatmapsetDiscussionPostsResult(
+                list(map(BeatmapsetCompact, resp["beatmapsets"])),
+                list(map(BeatmapsetDiscussionPost, resp["posts"])),
+                list(map(UserCompact, resp["users"])),
+                resp["cursor_string"],
+            ),
             Path.beatmapset_discussion_posts(),
             beatmapset_discussion_id=beatmapset_discussion_id,
             limit=limit,
@@ -480,14 +780,9 @@ class Client:
             sort=sort,
             user=user,
             with_deleted=with_deleted,
+            cursor_string=cursor_string,
             **{"types[]": types},
         )
-        return BeatmapsetDiscussionPostsResult(
-            list(map(BeatmapsetCompact, resp["beatmapsets"])),
-            list(map(BeatmapsetDiscussionPost, resp["posts"])),
-            list(map(UserCompact, resp["users"])),
-            resp["cursor_string"],
-        )
 
     def get_beatmapset_discussion_votes(
         self,
@@ -546,7 +841,13 @@ class Client:
             page = cursor["page"]
         if "limit" in cursor:
             limit = cursor["limit"]
-        resp = self.http.make_request(
+        return self.http.make_request_and_parse(
+            lambda resp: BeatmapsetDiscussionVotesResult(
+                list(map(BeatmapsetDiscussion, resp["discussions"])),
+                list(map(BeatmapsetDiscussionVote, resp["votes"])),
+                list(map(UserCompact, resp["users"])),
+                resp["cursor"],
+            ),
             Path.beatmapset_discussion_votes(),
             beatmapset_discussion_id=beatmapset_discussion_id,
             limit=limit,
@@ -557,12 +858,6 @@ class Client:
             user=user,
             with_deleted=with_deleted,
         )
-        return BeatmapsetDiscussionVotesResult(
-            list(map(BeatmapsetDiscussion, resp["discussions"])),
-            list(map(BeatmapsetDiscussionVote, resp["votes"])),
-            list(map(UserCompact, resp["users"])),
-            resp["cursor"],
-        )
 
     def get_beatmapset_discussions(
         self,
@@ -633,7 +928,15 @@ class Client:
         if message_types is not None:
             message_types = list(map(lambda t: t.value if isinstance(t, MessageType) else t, message_types))
             params = {"message_types[]": message_types}
-        resp = self.http.make_request(
+        return self.http.make_request_and_parse(
+            lambda resp: BeatmapsetDiscussionsResult(
+                list(map(Beatmap, resp["beatmaps"])),
+                list(map(BeatmapsetDiscussion, resp["discussions"])),
+                list(map(BeatmapsetDiscussion, resp["included_discussions"])),
+                list(map(UserCompact, resp["users"])),
+                ReviewsConfig(resp["reviews_config"]),
+                resp["cursor"],
+            ),
             Path.beatmapset_discussions(),
             beatmap_id=beatmap_id,
             beatmapset_id=beatmapset_id,
@@ -646,13 +949,68 @@ class Client:
             with_deleted=with_deleted,
             **params,
         )
-        return BeatmapsetDiscussionsResult(
-            list(map(Beatmap, resp["beatmaps"])),
-            list(map(BeatmapsetDiscussion, resp["discussions"])),
-            list(map(BeatmapsetDiscussion, resp["included_discussions"])),
-            list(map(UserCompact, resp["users"])),
-            ReviewsConfig(resp["reviews_config"]),
-            resp["cursor"],
+
+    def stream_beatmapset_discussions(
+        self,
+        beatmap_id: Optional[int] = None,
+        beatmapset_id: Optional[int] = None,
+        beatmapset_status: Optional[str] = None,
+        limit: Optional[int] = None,
+        message_types: Optional[Sequence[Union[str, MessageType]]] = None,
+        only_unresolved: Optional[bool] = None,
+        page: Optional[int] = None,
+        sort: Optional[str] = None,
+        user: Optional[int] = None,
+        with_deleted: Optional[str] = None,
+        cursor: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_beatmapset_discussions`, but the response is parsed as it's received
+        and each object is yielded as soon as it's complete, with the name of the attribute it
+        belongs to in :class:`BeatmapsetDiscussionsResult`.
+
+        .. code:: py
+
+            for key, obj in client.stream_beatmapset_discussions(beatmapset_id=1001507):
+                if key == "discussions":
+                    ...
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("beatmaps", :class:`Beatmap`), ("discussions", :class:`BeatmapsetDiscussion`),
+            ("included_discussions", :class:`BeatmapsetDiscussion`), ("users", :class:`UserCompact`),
+            ("reviews_config", :class:`ReviewsConfig`), and ("cursor", Dict)
+        """
+        if cursor is None:
+            cursor = {}
+        if "page" in cursor:
+            page = cursor["page"]
+        if "limit" in cursor:
+            limit = cursor["limit"]
+        params = {}
+        if message_types is not None:
+            message_types = list(map(lambda t: t.value if isinstance(t, MessageType) else t, message_types))
+            params = {"message_types[]": message_types}
+        yield from self.http.stream_request(
+            Path.beatmapset_discussions(),
+            {
+                "beatmaps": Beatmap,
+                "discussions": BeatmapsetDiscussion,
+                "included_discussions": BeatmapsetDiscussion,
+                "users": UserCompact,
+                "reviews_config": ReviewsConfig,
+            },
+            beatmap_id=beatmap_id,
+            beatmapset_id=beatmapset_id,
+            beatmapset_status=beatmapset_status,
+            limit=limit,
+            only_unresolved=only_unresolved,
+            page=page,
+            sort=sort,
+            user=user,
+            with_deleted=with_deleted,
+            **params,
         )
 
     def get_changelog_build(self, stream: str, build: str) -> Build:
@@ -792,15 +1150,14 @@ class Client:
             pinned_comments is only included when commentable_type and commentable_id are specified.
         """
         commentable_type, sort = parse_enum_args(commentable_type, sort)
-        return CommentBundle(
-            self.http.make_request(
-                Path.get_comments(),
-                commentable_type=commentable_type,
-                commentable_id=commentable_id,
-                parent_id=parent_id,
-                sort=sort,
-                **(cursor if cursor else {}),
-            )
+        return self.http.make_request_and_parse(
+            CommentBundle,
+            Path.get_comments(),
+            commentable_type=commentable_type,
+            commentable_id=commentable_id,
+            parent_id=parent_id,
+            sort=sort,
+            **(cursor if cursor else {}),
         )
 
     def get_comment(self, comment: int) -> CommentBundle:
@@ -960,7 +1317,13 @@ class Client:
 
         :class:`GetTopicAndPostsResult`
         """
-        resp = self.http.make_request(
+        return self.http.make_request_and_parse(
+            lambda resp: GetTopicAndPostsResult(
+                resp["cursor_string"],
+                resp["search"],
+                ForumTopic(resp["topic"]),
+                list(map(ForumPost, resp["posts"])),
+            ),
             Path.get_topic_and_posts(topic),
             **(cursor if cursor else {}),
             sort=sort,
@@ -968,12 +1331,6 @@ class Client:
             start=start,
             end=end,
         )
-        return GetTopicAndPostsResult(
-            resp["cursor_string"],
-            resp["search"],
-            ForumTopic(resp["topic"]),
-            list(map(ForumPost, resp["posts"])),
-        )
 
     def edit_topic(self, topic: int, topic_title: str) -> ForumTopic:
         """
@@ -1199,7 +1556,14 @@ class Client:
             Ranking type that depends on `type` argument
         """
         mode, type = parse_enum_args(mode, type)
-        data = self.http.make_request(
+        return self.http.make_request_and_parse(
+            lambda data: (
+                SpotlightRankings(data)
+                if type == "charts"
+                else Rankings(
+                    data, {"team": UserTeamStatistics, "country": CountryStatistics}.get(type, UserStatistics)
+                )
+            ),
             Path.get_ranking(mode, type),
             country=country,
             **(cursor if cursor else {}),
@@ -1207,10 +1571,41 @@ class Client:
             spotlight=spotlight,
             variant=variant,
         )
-        return (
-            SpotlightRankings(data)
-            if type == "charts"
-            else Rankings(data, {"team": UserTeamStatistics, "country": CountryStatistics}.get(type, UserStatistics))
+
+    def stream_ranking(
+        self,
+        mode: Union[str, GameModeStr],
+        type: Union[str, RankingType],
+        country: Optional[str] = None,
+        cursor: Optional[dict] = None,
+        filter: Optional[str] = None,
+        spotlight: Optional[int] = None,
+        variant: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_ranking`, but the response is parsed as it's received and each object
+        is yielded as soon as it's complete, with the name of the attribute it belongs to.
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("ranking", statistics object), ("cursor", Dict), and ("total", int).
+            If `type` is charts: ("beatmapsets", :class:`Beatmapset`), ("ranking", :class:`UserStatistics`),
+            and ("spotlight", :class:`Spotlight`).
+        """
+        mode, type = parse_enum_args(mode, type)
+        if type == "charts":
+            parsers = {"beatmapsets": Beatmapset, "ranking": UserStatistics, "spotlight": Spotlight}
+        else:
+            parsers = {"ranking": {"team": UserTeamStatistics, "country": CountryStatistics}.get(type, UserStatistics)}
+        yield from self.http.stream_request(
+            Path.get_ranking(mode, type),
+            parsers,
+            country=country,
+            **(cursor if cursor else {}),
+            filter=filter,
+            spotlight=spotlight,
+            variant=variant,
         )
 
     def get_spotlights(self) -> Spotlights:
@@ -1311,16 +1706,14 @@ class Client:
             Includes attributes `beatmap`, `beatmapset`. Additionally includes `weight` if `type` is `best`.
         """
         mode, type = parse_enum_args(mode, type)
-        return [
-            get_score_object(score, self.http.api_version)
-            for score in self.http.make_request(
-                Path.get_user_scores(user, type),
-                include_fails=int(include_fails),
-                mode=mode,
-                limit=limit,
-                offset=offset,
-            )
-        ]
+        return self.http.make_request_and_parse(
+            lambda scores: [get_score_object(score, self.http.api_version) for score in scores],
+            Path.get_user_scores(user, type),
+            include_fails=int(include_fails),
+            mode=mode,
+            limit=limit,
+            offset=offset,
+        )
 
     def get_user_beatmaps(
         self,
@@ -1354,11 +1747,11 @@ class Client:
             :class:`BeatmapPlaycount` for `type` `most_played` and :class:`Beatmapset` for any other type.
         """
         type = parse_enum_args(type)
-        return list(
-            map(
-                BeatmapPlaycount if type == "most_played" else Beatmapset,
-                self.http.make_request(Path.get_user_beatmaps(user, type), limit=limit, offset=offset),
-            )
+        return self.http.make_request_and_parse(
+            lambda beatmaps: list(map(BeatmapPlaycount if type == "most_played" else Beatmapset, beatmaps)),
+            Path.get_user_beatmaps(user, type),
+            limit=limit,
+            offset=offset,
         )
 
     def get_user_recent_activity(
@@ -1438,7 +1831,7 @@ class Client:
         """
         mode = parse_enum_args(mode)
         user = f"@{user}" if key is not None and key.lower() == "username" else user
-        return User(self.http.make_request(Path.get_user(user, mode)))
+        return self.http.make_request_and_parse(User, Path.get_user(user, mode))
 
     def get_users(self, ids: Sequence[int], include_variant_statistics: Optional[bool] = None) -> List[UserCompact]:
         """
@@ -1461,10 +1854,12 @@ class Client:
         Sequence[:class:`UserCompact`]
             Includes attributes: country, cover, groups, statistics_rulesets.
         """
-        res = self.http.make_request(
-            Path.get_users(), **{"ids[]": ids}, include_variant_statistics=include_variant_statistics
+        return self.http.make_request_and_parse(
+            lambda res: list(map(UserCompact, res["users"])),
+            Path.get_users(),
+            **{"ids[]": ids},
+            include_variant_statistics=include_variant_statistics,
         )
-        return list(map(UserCompact, res["users"]))
 
     def lookup_users(self, users: List[Union[int, str]], mode: Optional[GameModeInt] = None):
         """
@@ -1488,6 +1883,65 @@ class Client:
         res = self.http.make_request(Path.lookup_users(), ruleset_id=mode, **{"ids[]": users})
         return list(map(UserCompact, res["users"]))
 
+    def fetch_users(
+        self,
+        users: Sequence[Union[int, str]],
+        fields: Iterable[str],
+        mode: Optional[Union[str, GameModeStr]] = None,
+    ) -> List[Optional[Union[User, UserCompact]]]:
+        """
+        Get users with the attributes in `fields`, using whichever of :func:`get_users`, :func:`lookup_users`,
+        and :func:`get_user` return them with the fewest requests. The bulk endpoints are used where possible,
+        and :func:`get_user` only for attributes they don't have. Read :func:`osu.plan_user_fetch` for details.
+
+        .. code:: py
+
+            # one get_users request per 50 users
+            users = client.fetch_users(ids, fields=["statistics_rulesets", "country"])
+            # one lookup_users request per 50 users
+            users = client.fetch_users(["@peppy", 2], fields=["global_rank"], mode="osu")
+
+        Requires OAuth and scope public
+
+        **Parameters**
+
+        users: Sequence[Union[int, str]]
+            Ids and usernames. Usernames should be prefixed with "@".
+
+        fields: Iterable[str]
+            Attributes of :class:`User` that are needed.
+
+        mode: Optional[Union[str, :class:`GameModeStr`]]
+            Game mode of the statistics and global_rank. Required for global_rank.
+
+        **Returns**
+
+        List[Optional[Union[:class:`User`, :class:`UserCompact`]]]
+            In the same order as `users`, with None for users that weren't found by the bulk endpoints.
+            A :class:`User` when :func:`get_user` was used.
+
+        **Raises**
+
+        ValueError
+            If the attributes can't be fetched, such as global_rank without a mode.
+        """
+        mode = parse_enum_args(mode)
+        from .planner import plan_user_fetch
+
+        plan = plan_user_fetch(users, fields, mode)
+        ruleset_id = GameModeStr(mode).get_int_equivalent() if mode is not None else None
+
+        results = {}
+        for endpoint in plan.endpoints:
+            chunks = plan.chunks(endpoint)
+            if endpoint == "get_users":
+                results[endpoint] = [user for chunk in chunks for user in self.get_users(chunk)]
+            elif endpoint == "lookup_users":
+                results[endpoint] = [user for chunk in chunks for user in self.lookup_users(chunk, ruleset_id)]
+            else:
+                results[endpoint] = [self.get_user(user, mode or "") for (user,) in chunks]
+        return plan.merge(results)
+
     def get_wiki_page(self, locale: str, path: str) -> WikiPage:
         """
         The wiki article or image data.
@@ -1543,7 +1997,12 @@ class Client:
             min_date = min_date.isoformat()
         if isinstance(max_date, datetime):
             max_date = max_date.isoformat()
-        resp = self.http.make_request(
+        return self.http.make_request_and_parse(
+            lambda resp: GetBeatmapsetEventsResult(
+                list(map(BeatmapsetEvent, resp["events"])),
+                Review(resp["reviewsConfig"]),
+                list(map(UserCompact, resp["users"])),
+            ),
             Path.get_beatmapset_events(),
             page=page,
             limit=limit,
@@ -1552,11 +2011,6 @@ class Client:
             min_date=min_date,
             max_date=max_date,
         )
-        return GetBeatmapsetEventsResult(
-            list(map(BeatmapsetEvent, resp["events"])),
-            Review(resp["reviewsConfig"]),
-            list(map(UserCompact, resp["users"])),
-        )
 
     def get_matches(
         self,
@@ -1620,9 +2074,37 @@ class Client:
 
         :class:`Match`
         """
-        return MatchExtended(
-            self.http.make_request(Path.get_match(match_id), before=before, after=after, limit=limit),
-            self.http.api_version,
+        return self.http.make_request_and_parse(
+            lambda data: MatchExtended(data, self.http.api_version),
+            Path.get_match(match_id),
+            before=before,
+            after=after,
+            limit=limit,
+        )
+
+    def stream_match(
+        self, match_id: int, before: Optional[int] = None, after: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_match`, but the response is parsed as it's received and each object
+        is yielded as soon as it's complete, with the name of the attribute it belongs to in :class:`MatchExtended`.
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("match", :class:`Match`), ("events", :class:`MatchEvent`), ("users", :class:`UserCompact`),
+            ("first_event_id", int), ("latest_event_id", int), and ("current_game_id", int)
+        """
+        yield from self.http.stream_request(
+            Path.get_match(match_id),
+            {
+                "match": Match,
+                "events": partial(MatchEvent, api_version=self.http.api_version),
+                "users": UserCompact,
+            },
+            before=before,
+            after=after,
+            limit=limit,
         )
 
     def get_rooms(
@@ -1659,18 +2141,14 @@ class Client:
         filter_mode: Optional[Union[:class:`RoomFilterMode`, str]]
         """
         mode, sort, room_type, category, filter_mode = parse_enum_args(mode, sort, room_type, category, filter_mode)
-        return list(
-            map(
-                Room,
-                self.http.make_request(
-                    Path.get_rooms(mode),
-                    sort=sort,
-                    limit=limit,
-                    type_group=room_type,
-                    category=category,
-                    mode=filter_mode,
-                ),
-            )
+        return self.http.make_request_and_parse(
+            lambda rooms: list(map(Room, rooms)),
+            Path.get_rooms(mode),
+            sort=sort,
+            limit=limit,
+            type_group=room_type,
+            category=category,
+            mode=filter_mode,
         )
 
     def get_seasonal_backgrounds(self) -> SeasonalBackgrounds:
@@ -1761,14 +2239,18 @@ class Client:
             filters = {}
         if isinstance(filters, BeatmapsetSearchFilter):
             filters = filters.filters
-        resp = self.http.make_request(Path.beatmapset_search(), page=page, **filters)
-        return BeatmapsetSearchResult(
-            list(map(Beatmapset, resp["beatmapsets"])),
-            resp["cursor"],
-            resp["search"],
-            resp["recommended_difficulty"],
-            resp["error"],
-            resp["total"],
+        return self.http.make_request_and_parse(
+            lambda resp: BeatmapsetSearchResult(
+                list(map(Beatmapset, resp["beatmapsets"])),
+                resp["cursor"],
+                resp["search"],
+                resp["recommended_difficulty"],
+                resp["error"],
+                resp["total"],
+            ),
+            Path.beatmapset_search(),
+            page=page,
+            **filters,
         )
 
     def get_room_leaderboard(self, room_id: int) -> GetRoomLeaderboardResult:
@@ -2156,9 +2638,33 @@ class Client:
         """
         ruleset = parse_enum_args(ruleset)
 
-        ret = self.http.make_request(Path.get_all_scores(), ruleset=ruleset, cursor_string=cursor)
-        return GetAllScoresResult(
-            [get_score_object(score, self.http.api_version) for score in ret["scores"]], ret["cursor_string"]
+        return self.http.make_request_and_parse(
+            lambda ret: GetAllScoresResult(
+                [get_score_object(score, self.http.api_version) for score in ret["scores"]], ret["cursor_string"]
+            ),
+            Path.get_all_scores(),
+            ruleset=ruleset,
+            cursor_string=cursor,
+        )
+
+    def stream_all_scores(
+        self, ruleset: Optional[Union[GameModeStr, str]] = None, cursor: Optional[str] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Same as :func:`get_all_scores`, but the response is parsed as it's received and each score
+        is yielded as soon as it's complete.
+
+        **Yields**
+
+        Tuple[str, Any]
+            ("scores", :class:`SoloScore`) and ("cursor_string", str)
+        """
+        ruleset = parse_enum_args(ruleset)
+        yield from self.http.stream_request(
+            Path.get_all_scores(),
+            {"scores": partial(get_score_object, api_version=self.http.api_version)},
+            ruleset=ruleset,
+            cursor_string=cursor,
         )
 
     def get_forums(self) -> GetForumsResult:
@@ -2220,10 +2726,14 @@ class Client:
 
         :class:`GetForumTopicsResult`
         """
-        ret = self.http.make_request(
-            Path.get_forum_topics(), forum_id=forum_id, cursor_string=cursor, sort=sort, limit=limit
-        )
-        return GetForumTopicsResult(
-            list(map(ForumTopic, ret["topics"])),
-            ret["cursor_string"],
+        return self.http.make_request_and_parse(
+            lambda ret: GetForumTopicsResult(
+                list(map(ForumTopic, ret["topics"])),
+                ret["cursor_string"],
+            ),
+            Path.get_forum_topics(),
+            forum_id=forum_id,
+            cursor_string=cursor,
+            sort=sort,
+            limit=limit,
         )
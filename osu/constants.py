@@ -1,8 +1,10 @@
 import os
 
-base_url = lambda domain: f"https://{domain}/api/v2/"
-auth_url = lambda domain: f"https://{domain}/oauth/authorize/"
-token_url = lambda domain: f"https://{domain}/oauth/token/"
+# the domain can include a scheme (e.g. http://127.0.0.1:8080), otherwise https is used
+_origin = lambda domain: domain.rstrip("/") if "://" in domain else f"https://{domain}"
+base_url = lambda domain: f"{_origin(domain)}/api/v2/"
+auth_url = lambda domain: f"{_origin(domain)}/oauth/authorize/"
+token_url = lambda domain: f"{_origin(domain)}/oauth/token/"
 
 DEFAULT_DOMAIN = os.getenv("OSUPY_DEFAULT_DOMAIN") or "osu.ppy.sh"
 DEFAULT_BASE_URL = base_url(DEFAULT_DOMAIN)
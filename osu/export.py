@@ -0,0 +1,516 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .client import Client
+from .enums import GameModeStr
+from .pagination import read_pages_ahead
+from .path import Path
+from .results import GetAllScoresResult
+from .util import parse_enum_args
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+__all__ = ("ExportStats", "export", "read_ids")
+
+
+KINDS = ("users", "beatmaps", "scores")
+FORMATS = ("jsonl", "parquet")
+# the most ids get_users and get_beatmaps accept at once
+_CHUNK_SIZE = 50
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise RuntimeError(
+            "Missing pyarrow package, which is required to export to parquet. "
+            'Install osu.py with the parquet feature: "pip install osu.py[parquet]"'
+        )
+
+
+class ExportStats:
+    """
+    Progress of :func:`export`, passed to its `progress` callback and returned at the end.
+
+    **Attributes**
+
+    records: int
+        Number of records written, including those written before resuming.
+
+    requests: int
+        Number of requests made since starting or resuming.
+
+    elapsed: float
+        Seconds since starting or resuming.
+
+    position: Union[int, str, None]
+        Number of ids exported, or the cursor of the next page of scores.
+    """
+
+    __slots__ = ("records", "requests", "elapsed", "position", "_start", "_start_records")
+
+    def __init__(self, records: int = 0, position: Union[int, str, None] = None):
+        self.records: int = records
+        self.requests: int = 0
+        self.elapsed: float = 0.0
+        self.position: Union[int, str, None] = position
+        self._start: float = time.monotonic()
+        self._start_records: int = records
+
+    def _update(self):
+        self.elapsed = time.monotonic() - self._start
+
+    @property
+    def records_per_second(self) -> float:
+        """
+        Records written per second since starting or resuming.
+        """
+        return (self.records - self._start_records) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        """
+        Requests made per second since starting or resuming.
+        """
+        return self.requests / self.elapsed if self.elapsed > 0 else 0.0
+
+    def format(self) -> str:
+        """
+        One line summary, like the one ``python -m osu export`` prints after each checkpoint.
+        """
+        return (
+            f"{self.records} records, {self.requests} requests in {self.elapsed:.1f}s "
+            f"({self.records_per_second:.1f} records/s, {self.requests_per_second:.2f} requests/s)"
+        )
+
+    def __repr__(self):
+        return f"ExportStats(records={self.records}, requests={self.requests}, elapsed={self.elapsed:.1f})"
+
+
+class _JSONLWriter:
+    # one json object per line, gzip-compressed if the path ends with .gz
+
+    __slots__ = ("_file", "_gzip", "_compress")
+
+    def __init__(self, path: str, checkpoint: Optional[Dict[str, Any]]):
+        self._compress: bool = path.endswith(".gz")
+        if checkpoint is not None:
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if checkpoint["offset"] > size:
+                # truncating would pad the file with null bytes
+                raise ValueError(f"{path} is shorter than its checkpoint, so the export can't be resumed")
+        if checkpoint is not None and os.path.exists(path):
+            self._file = open(path, "r+b")
+            # anything after the checkpoint is written again
+            self._file.truncate(checkpoint["offset"])
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, "wb")
+        self._gzip: Optional[gzip.GzipFile] = None
+
+    def write(self, records: List[Dict[str, Any]]):
+        out = self._file
+        if self._compress:
+            if self._gzip is None:
+                self._gzip = gzip.GzipFile(fileobj=self._file, mode="wb")
+            out = self._gzip
+        out.write(b"".join(json.dumps(record, separators=(",", ":")).encode() + b"\n" for record in records))
+
+    def checkpoint(self) -> Dict[str, Any]:
+        if self._gzip is not None:
+            # each checkpoint ends a gzip member, so the file can be cut there and appended to
+            self._gzip.close()
+            self._gzip = None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"offset": self._file.tell()}
+
+    def close(self):
+        self.checkpoint()
+        self._file.close()
+
+
+def _column_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "double"
+    return "string"
+
+
+class _ParquetWriter:
+    # a directory with a part file per checkpoint. Columns are the top-level keys of the first records, where
+    # numbers are float64 (so ints and floats can share a column) and nested values are json strings. Keys that
+    # aren't columns, and values that don't fit their column, are kept as a json object in the _extra column.
+    # The columns are saved in the checkpoint, so every part has the same schema.
+
+    __slots__ = ("_path", "_parts", "_writer", "_columns", "_schema")
+
+    def __init__(self, path: str, checkpoint: Optional[Dict[str, Any]]):
+        _require_pyarrow()
+        os.makedirs(path, exist_ok=True)
+        self._path: str = path
+        self._parts: int = 0 if checkpoint is None else checkpoint["parts"]
+        for name in os.listdir(path):
+            # parts written after the checkpoint, or by a previous export
+            if name.startswith("part-") and name.endswith(".parquet") and int(name[5:-8]) >= self._parts:
+                os.remove(os.path.join(path, name))
+        self._writer: Optional["pyarrow.parquet.ParquetWriter"] = None
+        self._columns: Optional[Dict[str, str]] = None
+        self._schema: Optional["pyarrow.Schema"] = None
+        if checkpoint is not None and checkpoint.get("columns") is not None:
+            self._set_columns(dict(checkpoint["columns"]))
+
+    def _set_columns(self, columns: Dict[str, str]):
+        types = {"bool": pyarrow.bool_(), "double": pyarrow.float64(), "string": pyarrow.string()}
+        self._columns = columns
+        self._schema = pyarrow.schema(
+            [pyarrow.field(name, types[column_type]) for name, column_type in columns.items()]
+            + [pyarrow.field("_extra", pyarrow.string())]
+        )
+
+    def _infer_columns(self, records: List[Dict[str, Any]]):
+        columns = {}
+        for record in records:
+            for key, value in record.items():
+                if columns.get(key) is None:
+                    columns[key] = None if value is None else _column_type(value)
+        # columns that were null in every record could have any type later, so they're kept as json
+        self._set_columns(
+            {key: "string" if column_type is None else column_type for key, column_type in columns.items()}
+        )
+
+    def _row(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        row = {}
+        extra = {}
+        for key, value in record.items():
+            column_type = self._columns.get(key)
+            if column_type is None:
+                extra[key] = value
+            elif value is None or (column_type == "string" and isinstance(value, str)):
+                row[key] = value
+            elif column_type == "string":
+                row[key] = json.dumps(value, separators=(",", ":"))
+            elif _column_type(value) == column_type:
+                row[key] = float(value) if column_type == "double" else value
+            else:
+                extra[key] = value
+        row["_extra"] = json.dumps(extra, separators=(",", ":")) if extra else None
+        return row
+
+    def write(self, records: List[Dict[str, Any]]):
+        if not records:
+            return
+        if self._columns is None:
+            self._infer_columns(records)
+        if self._writer is None:
+            part = os.path.join(self._path, f"part-{self._parts:05d}.parquet")
+            self._writer = pyarrow.parquet.ParquetWriter(part, self._schema)
+        self._writer.write_table(pyarrow.Table.from_pylist(list(map(self._row, records)), schema=self._schema))
+
+    def checkpoint(self) -> Dict[str, Any]:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._parts += 1
+        columns = None if self._columns is None else list(self._columns.items())
+        return {"parts": self._parts, "columns": columns}
+
+    def close(self):
+        self.checkpoint()
+
+
+def read_ids(path: str) -> Iterator[int]:
+    """
+    Read ids from a file with one per line, or from stdin if `path` is "-". Blank lines are skipped.
+
+    **Parameters**
+
+    path: str
+
+    **Returns**
+
+    Iterator[int]
+    """
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield int(line)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _chunks(ids: Iterable[int]) -> Iterator[List[int]]:
+    ids = iter(ids)
+    while chunk := list(islice(ids, _CHUNK_SIZE)):
+        yield chunk
+
+
+def _fetch_chunks(
+    client: Client, kind: str, ids: Iterable[int], max_concurrency: int
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    # (number of ids, records) of each chunk in order, with up to max_concurrency chunks being requested
+    if kind == "users":
+        path, key = Path.get_users(), "users"
+    else:
+        path, key = Path.beatmaps(), "beatmaps"
+
+    def fetch(chunk):
+        return (client.http.make_request(path, **{"ids[]": chunk}) or {}).get(key, [])
+
+    with ThreadPoolExecutor(max_concurrency, thread_name_prefix="osu.py export") as executor:
+        running = deque()
+        try:
+            for chunk in _chunks(ids):
+                running.append((len(chunk), executor.submit(fetch, chunk)))
+                if len(running) >= max_concurrency:
+                    count, future = running.popleft()
+                    yield count, future.result()
+            while running:
+                count, future = running.popleft()
+                yield count, future.result()
+        finally:
+            for _, future in running:
+                future.cancel()
+
+
+def _fetch_scores(
+    client: Client, ruleset: Optional[str], cursor: Optional[str], max_pages: Optional[int]
+) -> Iterator[Tuple[Optional[str], List[Dict[str, Any]]]]:
+    # (cursor of the next page, records) of each page, with the next page requested while one is written
+    def fetch(page_cursor):
+        ret = client.http.make_request(Path.get_all_scores(), ruleset=ruleset, cursor_string=page_cursor)
+        return GetAllScoresResult(ret["scores"], ret["cursor_string"])
+
+    for page in read_pages_ahead(fetch, cursor, 1, max_pages):
+        yield page.cursor, page.scores
+
+
+def _load_checkpoint(path: str, kind: str, format: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint["kind"] != kind or checkpoint["format"] != format:
+        raise ValueError(
+            f"The checkpoint is for exporting {checkpoint['kind']} as {checkpoint['format']}, not {kind} as {format}"
+        )
+    return checkpoint
+
+
+def _save_checkpoint(path: str, checkpoint: Dict[str, Any]):
+    # replaced in one step, so a crash while writing it leaves the previous one
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def export(
+    client: Client,
+    kind: str,
+    output: str,
+    ids: Optional[Iterable[int]] = None,
+    cursor: Optional[str] = None,
+    ruleset: Optional[Union[str, GameModeStr]] = None,
+    format: Optional[str] = None,
+    resume: bool = False,
+    max_concurrency: int = 4,
+    max_pages: Optional[int] = None,
+    checkpoint_interval: float = 10.0,
+    progress: Optional[Callable[[ExportStats], None]] = None,
+) -> ExportStats:
+    """
+    Write users, beatmaps, or scores to a file as they're received, without holding more than a few
+    responses in memory. Records are the json objects returned by the api.
+
+    - users and beatmaps are requested 50 ids at a time from :func:`osu.Client.get_users`
+      and :func:`osu.Client.get_beatmaps`, with up to `max_concurrency` requests at once.
+      Ids that don't exist (or restricted users) are left out.
+    - scores are requested from :func:`osu.Client.get_all_scores` starting at `cursor`, and the next page
+      is requested while one is being written. It stops once there are no new scores, or after `max_pages`.
+
+    Progress is saved to ``<output>.checkpoint`` every `checkpoint_interval` seconds. With `resume`,
+    an export continues from its checkpoint, and anything written after it is written again. Resuming
+    a finished scores export gets the scores made since.
+
+    **Parameters**
+
+    client: :class:`osu.Client`
+        Its rate limit applies to the requests.
+
+    kind: str
+        users, beatmaps, or scores
+
+    output: str
+        jsonl file, which is gzip-compressed if it ends with ``.gz``, or a directory of parquet part files.
+
+    ids: Optional[Iterable[int]]
+        Ids of the users or beatmaps, such as a range or :func:`read_ids`. It's iterated lazily, and
+        when resuming the ids before the checkpoint are skipped, so it should give the same ids each time.
+
+    cursor: Optional[str]
+        Cursor of the first page of scores. Defaults to the oldest available scores.
+
+    ruleset: Optional[Union[str, :class:`osu.GameModeStr`]]
+        Ruleset of the scores.
+
+    format: Optional[str]
+        jsonl or parquet. Defaults to parquet if `output` ends with ``.parquet``, otherwise jsonl.
+        Parquet requires pyarrow.
+
+    resume: bool
+        Continue from the checkpoint if there is one. Otherwise, the output is replaced.
+
+    max_concurrency: int
+        Most requests running at once for users and beatmaps. Defaults to 4.
+
+    max_pages: Optional[int]
+        Most pages of scores to request.
+
+    checkpoint_interval: float
+        Seconds between checkpoints. Defaults to 10.
+
+    progress: Optional[Callable[[:class:`ExportStats`], None]]
+        Called after each checkpoint.
+
+    **Returns**
+
+    :class:`ExportStats`
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of: {', '.join(KINDS)}")
+    if format is None:
+        format = "parquet" if output.rstrip("/\\").endswith(".parquet") else "jsonl"
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(FORMATS)}")
+    if kind != "scores" and ids is None:
+        raise ValueError(f"ids are required to export {kind}")
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than 0")
+
+    checkpoint_path = f"{output.rstrip('/')}.checkpoint"
+    checkpoint = _load_checkpoint(checkpoint_path, kind, format) if resume else None
+    if checkpoint is None:
+        checkpoint = {"kind": kind, "format": format, "records": 0, "position": 0 if kind != "scores" else cursor}
+        writer_state = None
+        # a previous export's checkpoint no longer describes the output once it's replaced
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+    else:
+        writer_state = checkpoint
+
+    stats = ExportStats(checkpoint["records"], checkpoint["position"])
+    writer = (_ParquetWriter if format == "parquet" else _JSONLWriter)(output, writer_state)
+
+    if kind == "scores":
+        pages = _fetch_scores(client, parse_enum_args(ruleset), stats.position, max_pages)
+    else:
+        pages = _fetch_chunks(client, kind, islice(ids, stats.position, None), max_concurrency)
+
+    def save():
+        checkpoint.update(writer.checkpoint(), records=stats.records, position=stats.position)
+        _save_checkpoint(checkpoint_path, checkpoint)
+        stats._update()
+        if progress is not None:
+            progress(stats)
+
+    try:
+        last_checkpoint = time.monotonic()
+        for position, records in pages:
+            writer.write(records)
+            stats.records += len(records)
+            stats.requests += 1
+            # the next cursor for scores, and the number of ids in the chunk otherwise
+            stats.position = position if kind == "scores" else stats.position + position
+            if time.monotonic() - last_checkpoint >= checkpoint_interval:
+                save()
+                last_checkpoint = time.monotonic()
+        save()
+    finally:
+        writer.close()
+    return stats
+
+
+def _add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("kind", choices=KINDS)
+    parser.add_argument("-o", "--output", required=True, help="jsonl file (.gz to compress) or parquet directory")
+    parser.add_argument("--format", choices=FORMATS, help="defaults to parquet for a .parquet output, else jsonl")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--ids-file", help="file with an id per line, or - for stdin")
+    source.add_argument("--range", help="ids from START to END, excluding END, like 1:1000")
+    source.add_argument("--cursor", help="cursor_string of the first page of scores")
+    parser.add_argument("--ruleset", help="ruleset of the scores")
+    parser.add_argument("--max-pages", type=int, help="most pages of scores to request")
+    parser.add_argument("--resume", action="store_true", help="continue from the output's checkpoint")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--checkpoint-interval", type=float, default=10.0, help="seconds between checkpoints")
+    parser.add_argument("--client-id", type=int, default=os.getenv("osu_client_id"))
+    parser.add_argument("--client-secret", default=os.getenv("osu_client_secret"))
+    parser.add_argument("--request-wait-time", type=float, default=1.0)
+    parser.add_argument("--limit-per-minute", type=int, default=60)
+    parser.add_argument("--domain", help="domain of the api, such as a stand-in server")
+
+
+def _parse_range(value: str) -> range:
+    try:
+        start, end = map(int, value.split(":"))
+    except ValueError:
+        raise ValueError(f"--range must be START:END, not {value!r}") from None
+    return range(start, end)
+
+
+def _run(args: argparse.Namespace, parser: argparse.ArgumentParser):
+    if args.client_id is None or args.client_secret is None:
+        parser.error("--client-id and --client-secret (or osu_client_id and osu_client_secret) are required")
+
+    client = Client.from_credentials(
+        args.client_id,
+        args.client_secret,
+        None,
+        request_wait_time=args.request_wait_time,
+        limit_per_minute=args.limit_per_minute,
+    )
+    if args.domain is not None:
+        client.set_domain(args.domain)
+
+    def report(stats: ExportStats):
+        print(stats.format(), file=sys.stderr, flush=True)
+
+    try:
+        ids = read_ids(args.ids_file) if args.ids_file else _parse_range(args.range) if args.range else None
+        stats = export(
+            client,
+            args.kind,
+            args.output,
+            ids,
+            args.cursor,
+            args.ruleset,
+            args.format,
+            args.resume,
+            args.max_concurrency,
+            args.max_pages,
+            args.checkpoint_interval,
+            report,
+        )
+    except (ValueError, RuntimeError) as exc:
+        parser.error(str(exc))
+
+    print(f"Exported {stats.format()} to {args.output}", file=sys.stderr)
@@ -1,8 +1,12 @@
 import requests
+import copy
 import time
 import threading
 import logging
-from typing import Optional, List, TYPE_CHECKING
+import weakref
+from bisect import bisect_left
+from operator import attrgetter
+from typing import Optional, List, Dict, Callable, Any, Iterator, Tuple, Sequence, TypeVar, TYPE_CHECKING
 
 from .exceptions import ScopeException, RequestException
 from .constants import (
@@ -15,17 +19,20 @@ from .constants import (
     base_url,
 )
 from .path import Path
+from .tracing import RequestTrace, RequestHook, _collect_traces
 
 if TYPE_CHECKING:
+    from .cassette import Cassette
     from .auth import BaseAuthHandler
     from .asyncio.http import AsynchronousHTTPHandler
     from .asyncio.auth import BaseAsynchronousAuthHandler
 
 
-__all__ = ("BaseHTTPHandler", "HTTPHandler")
+__all__ = ("BaseHTTPHandler", "HTTPHandler", "RateLimitHandler", "WaitTimeHistogram")
 
 
 _log = logging.getLogger(__name__)
+_T = TypeVar("_T")
 
 
 def _convert_param_value(value):
@@ -34,26 +41,105 @@ def _convert_param_value(value):
     return value
 
 
+class _ThreadSession:
+    # only referenced by a thread's local storage, so it's collected when the thread exits
+    __slots__ = ("session", "__weakref__")
+
+    def __init__(self, session: requests.Session):
+        self.session: requests.Session = session
+
+
+class _HTTPSettings:
+    # shared by a handler and the handlers made from it with HTTPHandler.bind
+    __slots__ = ("api_version", "domain", "base_url", "auth_url", "token_url", "hooks", "cassette", "session")
+
+    def __init__(self):
+        self.api_version: str = BaseHTTPHandler.DEFAULT_API_VERSION
+        self.domain: str = DEFAULT_DOMAIN
+        self.auth_url: str = DEFAULT_AUTH_URL
+        self.token_url: str = DEFAULT_TOKEN_URL
+        self.base_url: str = DEFAULT_BASE_URL
+        self.hooks: List[RequestHook] = []
+        self.cassette: Optional["Cassette"] = None
+        self.session: Optional[requests.Session] = None
+
+
+def _shared_setting(name: str) -> property:
+    return property(attrgetter(f"_settings.{name}"), lambda self, value: setattr(self._settings, name, value))
+
+
+def _close_thread_session(sessions: List[requests.Session], lock: threading.Lock, session: requests.Session):
+    with lock:
+        if session not in sessions:
+            # already closed by HTTPHandler.close
+            return
+        sessions.remove(session)
+    session.close()
+
+
+def _cassette_response(interaction: Dict[str, Any], url: str) -> requests.Response:
+    from .cassette import Cassette
+
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = Cassette.get_reason(interaction)
+    response.headers.update(interaction["headers"])
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = Cassette.get_body(interaction)
+    response._content_consumed = True
+    return response
+
+
 class BaseHTTPHandler:
     """
     Abstract class for handling http requests.
     """
 
-    __slots__ = ("auth", "api_version", "domain", "base_url", "auth_url", "token_url")
+    __slots__ = ("auth", "_settings")
 
     DEFAULT_API_VERSION = "20260123"
 
+    api_version = _shared_setting("api_version")
+    domain = _shared_setting("domain")
+    base_url = _shared_setting("base_url")
+    auth_url = _shared_setting("auth_url")
+    token_url = _shared_setting("token_url")
+    hooks = _shared_setting("hooks")
+    cassette = _shared_setting("cassette")
+
     def __init__(self, auth: Optional["BaseAuthHandler"], api_version: Optional[str] = None):
         self.auth: Optional[BaseAuthHandler] = auth
+        self._settings: _HTTPSettings = _HTTPSettings()
         self.set_api_version(api_version)
 
-        self.domain = DEFAULT_DOMAIN
-        self.auth_url = DEFAULT_AUTH_URL
-        self.token_url = DEFAULT_TOKEN_URL
-        self.base_url = DEFAULT_BASE_URL
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Add a hook which is called before and after every request with its :class:`osu.RequestTrace`.
+        Without hooks, requests aren't traced at all.
+        """
+        self.hooks = self.hooks + [hook]
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Remove a hook added with :func:`add_hook`."""
+        self.hooks = [h for h in self.hooks if h is not hook]
+
+    def set_cassette(self, cassette: Optional["Cassette"]) -> None:
+        """
+        Record requests to a :class:`osu.Cassette`, or answer them from it, depending on its mode.
+        None goes back to making requests normally.
+        """
+        self.cassette = cassette
+
+    def _start_trace(self, path: Path) -> Optional[RequestTrace]:
+        hooks = self.hooks
+        return RequestTrace(path, hooks) if hooks else None
 
     def set_domain(self, domain: str) -> None:
-        """Set the domain to use for requests."""
+        """
+        Set the domain to use for requests. It can include a scheme, such as ``http://127.0.0.1:8080``
+        for a local server, otherwise https is used.
+        """
         self.domain = domain
         self.auth_url = auth_url(domain)
         self.token_url = token_url(domain)
@@ -82,13 +168,35 @@ class BaseHTTPHandler:
     def make_request(self, path, *args, **kwargs):
         raise NotImplementedError()
 
+    def make_request_and_parse(self, parse: Callable[[Any], _T], path, *args, **kwargs) -> _T:
+        """
+        Make a request and return the result of passing its json to `parse`.
+        The time `parse` takes is the construct phase of the request's trace.
+        """
+        with _collect_traces():
+            return parse(self.make_request(path, *args, **kwargs))
+
+    def stream_request(self, path, parsers=None, *args, **kwargs):
+        raise NotImplementedError()
+
 
 class HTTPHandler(BaseHTTPHandler):
     """
     Handles making requests. Used by :class:`osu.Client`.
+
+    **Attributes**
+
+    rate_limit: :class:`RateLimitHandler`
+
+    session: Optional[:class:`requests.Session`]
+        Session to use for every request. If None (the default), each thread uses its own session,
+        which keeps connections alive between requests while being safe to use from many threads.
+        A thread's session is closed when the thread exits.
     """
 
-    __slots__ = ("rate_limit",)
+    __slots__ = ("rate_limit", "_sessions", "_all_sessions", "_sessions_lock")
+
+    session = _shared_setting("session")
 
     def __init__(
         self,
@@ -100,6 +208,47 @@ class HTTPHandler(BaseHTTPHandler):
         super().__init__(auth, api_version)
 
         self.rate_limit: RateLimitHandler = RateLimitHandler(request_wait_time, limit_per_minute)
+        self._sessions: threading.local = threading.local()
+        self._all_sessions: List[requests.Session] = []
+        self._sessions_lock: threading.Lock = threading.Lock()
+
+    def get_session(self) -> requests.Session:
+        """
+        Returns the session used for requests made from the current thread.
+        """
+        if self.session is not None:
+            return self.session
+
+        thread_session = getattr(self._sessions, "session", None)
+        if thread_session is None:
+            session = requests.Session()
+            with self._sessions_lock:
+                self._all_sessions.append(session)
+            thread_session = self._sessions.session = _ThreadSession(session)
+            # threads like those of Client.map come and go, so their sessions are closed when they exit
+            weakref.finalize(thread_session, _close_thread_session, self._all_sessions, self._sessions_lock, session)
+        return thread_session.session
+
+    def close(self) -> None:
+        """
+        Close the sessions of all threads (and the `session` attribute if set).
+        """
+        with self._sessions_lock:
+            sessions, self._all_sessions[:] = list(self._all_sessions), []
+        if self.session is not None:
+            sessions.append(self.session)
+        for session in sessions:
+            session.close()
+
+    def bind(self, auth: Optional["BaseAuthHandler"]) -> "HTTPHandler":
+        """
+        Returns a handler for another auth handler which shares this handler's
+        settings, rate limit, and sessions. Settings changed later on either handler, such as
+        with :func:`set_domain`, :func:`set_api_version` or :func:`add_hook`, apply to both.
+        """
+        new_http = copy.copy(self)
+        new_http.auth = auth
+        return new_http
 
     def set_ratelimit(self, request_wait_time: float = 1.0, limit_per_minute: int = 60):
         self.rate_limit.wait_time = request_wait_time
@@ -127,22 +276,52 @@ class HTTPHandler(BaseHTTPHandler):
         return headers
 
     def make_request_to_endpoint(
-        self, endpoint, path, data=None, headers=None, is_download=False, files=None, **kwargs
+        self, endpoint, path, data=None, headers=None, is_download=False, files=None, stream=False, **kwargs
     ):
         if headers is None:
             headers = {}
         if data is None:
             data = {}
 
+        trace = self._start_trace(path)
+        try:
+            result = self._make_request_to_endpoint(
+                trace, endpoint, path, data, headers, is_download, files, stream, **kwargs
+            )
+        except BaseException as exc:
+            if trace is not None:
+                trace.finish(exc)
+            raise
+
+        if trace is not None:
+            trace.finish_or_defer()
+        return result
+
+    def _make_request_to_endpoint(self, trace, endpoint, path, data, headers, is_download, files, stream, **kwargs):
         self.check_path_validity(path)
 
         headers = self.get_headers(path, files is not None, **headers)
         params = {str(key): _convert_param_value(value) for key, value in kwargs.items() if value is not None}
+        if trace is not None:
+            trace.mark("auth")
 
+        rate_limit_start = time.monotonic()
         self.rate_limit.wait()
-        response = getattr(requests, path.method)(
-            endpoint + path.path, headers=headers, data=data, params=params, files=files
-        )
+        if trace is not None:
+            trace.mark("rate_limit")
+
+        if self.cassette is None:
+            response = getattr(self.get_session(), path.method)(
+                endpoint + path.path, headers=headers, data=data, params=params, files=files, stream=stream
+            )
+        else:
+            response = self._use_cassette(
+                path, endpoint + path.path, headers, data, params, files, time.monotonic() - rate_limit_start
+            )
+        if trace is not None:
+            trace.status = response.status_code
+            trace.mark("network")
+
         try:
             response.raise_for_status()
         except Exception as e:
@@ -156,21 +335,95 @@ class HTTPHandler(BaseHTTPHandler):
 
             raise e
 
+        if stream:
+            return response
+
         if len(response.content) == 0:
             return
 
-        return response.json() if not is_download else response
+        if is_download:
+            return response
+
+        result = response.json()
+        if trace is not None:
+            trace.mark("decode")
+        return result
+
+    def _use_cassette(self, path, url, headers, data, params, files, rate_limit_wait) -> requests.Response:
+        cassette = self.cassette
+        if not cassette.recording:
+            interaction = cassette.replay(path.method, path.path, params, data or None, rate_limit_wait)
+            if delay := cassette.replay_delay(interaction):
+                time.sleep(delay)
+            return _cassette_response(interaction, url)
+
+        start = time.monotonic()
+        response = getattr(self.get_session(), path.method)(url, headers=headers, data=data, params=params, files=files)
+        cassette.record(
+            path.method,
+            path.path,
+            path.template,
+            params,
+            data or None,
+            response.status_code,
+            response.headers,
+            response.content,
+            time.monotonic() - start,
+            rate_limit_wait,
+        )
+        return response
 
     def make_request(self, path, *args, **kwargs):
         return self.make_request_to_endpoint(self.base_url, path, *args, **kwargs)
 
+    def stream_request(
+        self,
+        path,
+        parsers: Optional[Dict[Optional[str], Callable[[Any], Any]]] = None,
+        *args,
+        chunk_size: int = 65536,
+        **kwargs,
+    ) -> Iterator[Tuple[Optional[str], Any]]:
+        """
+        Make a request to the api and parse the json response as it's received, yielding the
+        elements of its top-level arrays one at a time. Read :class:`osu.JSONStreamParser`.
+
+        :param path:
+        :type path: :class:`osu.Path`
+
+        :param parsers:
+            Functions applied to the values of each top-level key.
+        :type parsers: Optional[Dict[Optional[str], Callable]]
+
+        :param chunk_size: (Default 65536)
+            Number of bytes read at a time.
+        :type chunk_size: int
+
+        Other arguments are the same as :func:`make_request`.
+        """
+        from .streaming import JSONStreamParser
+
+        parser = JSONStreamParser(parsers)
+        received = False
+        with self.make_request_to_endpoint(self.base_url, path, *args, stream=True, **kwargs) as response:
+            for chunk in response.iter_content(chunk_size):
+                received = True
+                yield from parser.feed(chunk)
+        # an empty body yields nothing, like make_request returning None
+        if received:
+            yield from parser.close()
+
     def get_auth_token(self, data):
         self.rate_limit.wait()
-        return requests.post(self.token_url, data=data)
+        if self.cassette is not None and not self.cassette.recording:
+            return _cassette_response(self.cassette.replay_token(), self.token_url)
+        return self.get_session().post(self.token_url, data=data)
 
     @classmethod
     def from_async(cls, http: "AsynchronousHTTPHandler", auth: Optional["BaseAuthHandler"] = None):
         new_http = cls(auth, http.rate_limit.wait_time, http.rate_limit.limit, http.api_version)
+        new_http.hooks = http.hooks
+        new_http.cassette = http.cassette
         new_http.rate_limit._requests_sent = http.rate_limit._requests_sent
         new_http.base_url = http.base_url
         new_http.auth_url = http.auth_url
@@ -183,10 +436,127 @@ class HTTPHandler(BaseHTTPHandler):
         return AsynchronousHTTPHandler.from_sync(self, auth)
 
 
+class WaitTimeHistogram:
+    """
+    Distribution of how long callers waited in a rate limiter. Used by :class:`RateLimitHandler`.
+
+    **Init Parameters**
+
+    buckets: Optional[Sequence[float]]
+        Upper bounds of the buckets in seconds. Waits longer than the last one are counted in an extra bucket.
+
+    **Attributes**
+
+    buckets: Tuple[float, ...]
+
+    counts: List[int]
+        Number of waits in each bucket, with one more element than `buckets` for longer waits.
+
+    count: int
+        Total number of waits.
+
+    sum: float
+        Total seconds waited.
+
+    max: float
+        Longest wait in seconds.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    DEFAULT_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None):
+        self.buckets: Tuple[float, ...] = tuple(sorted(self.DEFAULT_BUCKETS if buckets is None else buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns an estimate of the wait at a percentile (0-100): the upper bound of the bucket it falls in,
+        or the longest wait if that's lower. Returns 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+
+        target = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target and seen > 0:
+                return min(bound, self.max)
+        return self.max
+
+    def __repr__(self):
+        return f"WaitTimeHistogram(count={self.count}, mean={self.mean:.3f}, max={self.max:.3f})"
+
+
+def _in_window(requests_sent: List[float], now: float) -> List[float]:
+    return [sent for sent in requests_sent if now - sent < 60]
+
+
+def _forecast(requests_sent: List[float], now: float, wait_time: float, limit: int, count: int) -> float:
+    """seconds until `count` more requests can be sent, following the same rules as RateLimitHandler.wait"""
+    sent = _in_window(requests_sent, now)
+    send_at = now
+    for _ in range(count):
+        send_at = now
+        if wait_time > 0:
+            if sent:
+                send_at = max(now, sent[-1] + wait_time)
+        elif len(sent) >= limit:
+            send_at = max(now, sent[-limit] + 60.0)
+        sent.append(send_at)
+    return send_at - now
+
+
 class RateLimitHandler:
+    """
+    Spaces requests `wait_time` seconds apart, or if it's 0, keeps them under `limit` per minute.
+    Also keeps statistics about how it's being used, to tell whether slowness comes from the api or from waiting here.
+
+    **Attributes**
+
+    wait_time: float
+
+    limit: int
+
+    waiters: int
+        Number of callers currently waiting to send a request.
+
+    histogram: :class:`WaitTimeHistogram`
+        How long callers waited.
+
+    slow_wait_threshold: Optional[float]
+        Read :func:`set_slow_wait_callback`.
+    """
+
     __slots__ = (
         "wait_time",
         "limit",
+        "waiters",
+        "histogram",
+        "slow_wait_threshold",
+        "_slow_wait_callback",
         "_lock",
         "_waiting_lock",
         "_requests_sent",
@@ -195,6 +565,10 @@ class RateLimitHandler:
     def __init__(self, request_wait_time: float, limit_per_minute: int):
         self.wait_time: float = request_wait_time
         self.limit: int = limit_per_minute
+        self.waiters: int = 0
+        self.histogram: WaitTimeHistogram = WaitTimeHistogram()
+        self.slow_wait_threshold: Optional[float] = None
+        self._slow_wait_callback: Optional[Callable[[float, RateLimitHandler], None]] = None
         # for accessing non-thread-safe variables
         # intended to be used for short durations
         self._lock: threading.Lock = threading.Lock()
@@ -203,18 +577,106 @@ class RateLimitHandler:
         self._waiting_lock: threading.Lock = threading.Lock()
         self._requests_sent: List[float] = []
 
+    def set_slow_wait_callback(
+        self, callback: Optional[Callable[[float, "RateLimitHandler"], None]], threshold: float = 5.0
+    ) -> None:
+        """
+        Set a function to call whenever a caller waited longer than `threshold` seconds,
+        with the seconds waited and this rate limiter. It's called in the thread that waited,
+        right before the request is sent.
+
+        **Parameters**
+
+        callback: Optional[Callable[[float, :class:`RateLimitHandler`], None]]
+            None removes the callback.
+
+        threshold: float
+            Defaults to 5 seconds.
+        """
+        self._slow_wait_callback = callback
+        self.slow_wait_threshold = None if callback is None else threshold
+
     def wait(self):
+        start = time.monotonic()
         self._lock.acquire()
+        self.waiters += 1
 
-        if self.wait_time > 0:
-            self._wait_with_wait_time()
-        else:
-            self._wait_without_wait_time()
+        try:
+            if self.wait_time > 0:
+                self._wait_with_wait_time()
+            else:
+                self._wait_without_wait_time()
+        finally:
+            self.waiters -= 1
 
-        self._get_requests_sent().append(time.monotonic())
+        now = time.monotonic()
+        self._get_requests_sent().append(now)
+        self.histogram.observe(now - start)
 
         self._lock.release()
 
+        self._check_slow_wait(now - start)
+
+    def _check_slow_wait(self, waited: float):
+        callback = self._slow_wait_callback
+        if callback is not None and waited > self.slow_wait_threshold:
+            callback(waited, self)
+
+    @property
+    def used(self) -> int:
+        """
+        Number of requests sent in the last minute.
+        """
+        with self._lock:
+            return len(_in_window(self._requests_sent, time.monotonic()))
+
+    @property
+    def remaining(self) -> int:
+        """
+        Number of requests that can still be sent in the current minute before reaching `limit`.
+        """
+        return max(0, self.limit - self.used)
+
+    def forecast(self, count: int = 1, include_waiters: bool = True) -> float:
+        """
+        Returns the seconds until `count` more requests could be sent, assuming no one else sends any first.
+
+        **Parameters**
+
+        count: int
+            Defaults to 1, which is the time until the next request can be sent.
+
+        include_waiters: bool
+            Whether callers already waiting go first. Defaults to true.
+        """
+        with self._lock:
+            if include_waiters:
+                count += self.waiters
+            return _forecast(self._requests_sent, time.monotonic(), self.wait_time, self.limit, count)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns a snapshot of the rate limiter: used, remaining, limit, waiters, next_request_in (seconds),
+        and the count, mean, p50, p99, and max of the waits in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            used = len(_in_window(self._requests_sent, now))
+            waiters = self.waiters
+            next_request_in = _forecast(self._requests_sent, now, self.wait_time, self.limit, waiters + 1)
+        return {
+            "used": used,
+            "remaining": max(0, self.limit - used),
+            "limit": self.limit,
+            "waiters": waiters,
+            "next_request_in": next_request_in,
+            "count": self.histogram.count,
+            "mean": self.histogram.mean,
+            "p50": self.histogram.percentile(50),
+            "p99": self.histogram.percentile(99),
+            "max": self.histogram.max,
+        }
+
     def _wait_with_wait_time(self):
         # acquiring _waiting_lock could take a bit
         # so let's release this one
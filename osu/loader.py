@@ -0,0 +1,238 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence, Tuple, Union, TYPE_CHECKING
+
+from .objects import Beatmap, User, UserCompact
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+__all__ = ("BatchLoader",)
+
+
+# the most ids get_users and get_beatmaps accept at once
+MAX_BATCH_SIZE = 50
+
+
+def _split_batch(ids: Sequence[int], objects: Sequence) -> Tuple[Dict[int, object], List[int]]:
+    # objects of a bulk response by id, and the ids missing from it
+    found = {obj.id: obj for obj in objects}
+    return found, [obj_id for obj_id in ids if obj_id not in found]
+
+
+def _check_batch_args(window: float, max_batch_size: int):
+    if window < 0:
+        raise ValueError("window must be at least 0")
+    if not 0 < max_batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_SIZE}")
+
+
+class BatchLoader:
+    """
+    Combines single user and beatmap lookups made around the same time into :func:`Client.get_users`
+    and :func:`Client.get_beatmaps` requests of up to 50 ids, so each lookup doesn't spend a request.
+    Lookups are collected for `window` seconds after the first one, or until `max_batch_size` ids were collected,
+    and then sent as one request by one of the loader's threads. Looking up the same id more than once in a window
+    only requests it once.
+
+    .. code:: py
+
+        loader = BatchLoader(client)
+
+        # from many threads, each waits for its own result
+        user = loader.get_user(2)
+
+        # or from one thread, without waiting
+        futures = [loader.submit_get_beatmap(beatmap_id) for beatmap_id in beatmap_ids]
+        beatmaps = [future.result() for future in futures]
+
+    Ids missing from a bulk response (e.g. restricted users, which :func:`Client.get_users` leaves out)
+    are looked up on their own with :func:`Client.get_user` or :func:`Client.get_beatmap`, so they get
+    the same result or exception as without the loader.
+
+    :class:`osu.asyncio.AsynchronousBatchLoader` is the asynchronous version.
+
+    **Init Parameters**
+
+    client: :class:`Client`
+
+    window: float
+        Seconds to collect lookups for before sending them. Defaults to 0.01.
+
+    max_batch_size: int
+        Send the lookups as soon as this many ids were collected. Defaults to 50, which is the most allowed.
+
+    max_workers: int
+        Number of threads sending requests, which are kept for the life of the loader. Defaults to 4.
+
+    **Attributes**
+
+    batches: int
+        Number of bulk requests sent.
+
+    fallbacks: int
+        Number of ids that were missing from a bulk response and looked up on their own.
+    """
+
+    __slots__ = (
+        "client",
+        "window",
+        "max_batch_size",
+        "batches",
+        "fallbacks",
+        "_pending",
+        "_windows",
+        "_lock",
+        "_executor",
+    )
+
+    def __init__(
+        self, client: "Client", window: float = 0.01, max_batch_size: int = MAX_BATCH_SIZE, max_workers: int = 4
+    ):
+        _check_batch_args(window, max_batch_size)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.client: "Client" = client
+        self.window: float = window
+        self.max_batch_size: int = max_batch_size
+        self.batches: int = 0
+        self.fallbacks: int = 0
+        self._pending: Dict[str, Dict[int, Future]] = {"users": {}, "beatmaps": {}}
+        # incremented when a batch is taken, so a window that ended early doesn't take the next batch
+        self._windows: Dict[str, int] = {"users": 0, "beatmaps": 0}
+        self._lock: threading.Lock = threading.Lock()
+        # long-lived threads, rather than one per batch, so each has one session for the life of the loader
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers, thread_name_prefix="osu.py loader")
+
+    def _get_methods(self, kind: str) -> Tuple[Callable, Callable]:
+        if kind == "users":
+            return self.client.get_users, self.client.get_user
+        return self.client.get_beatmaps, self.client.get_beatmap
+
+    def submit_get_user(self, user_id: int, compact: bool = True) -> Future:
+        """
+        Same as :func:`get_user`, but returns a :class:`concurrent.futures.Future` of the result without waiting.
+        """
+        if not compact:
+            return self._executor.submit(self.client.get_user, user_id)
+        return self._load("users", user_id)
+
+    def get_user(self, user_id: int, compact: bool = True) -> Union[User, UserCompact]:
+        """
+        Get a user by id, batched with other lookups.
+
+        **Parameters**
+
+        user_id: int
+
+        compact: bool
+            Whether a :class:`UserCompact` is acceptable, which is what :func:`Client.get_users` returns.
+            Otherwise, the user is requested on its own with :func:`Client.get_user`. Defaults to true.
+
+        **Returns**
+
+        Union[:class:`User`, :class:`UserCompact`]
+        """
+        if not compact:
+            return self.client.get_user(user_id)
+        return self._load("users", user_id).result()
+
+    def submit_get_beatmap(self, beatmap_id: int) -> Future:
+        """
+        Same as :func:`get_beatmap`, but returns a :class:`concurrent.futures.Future` of the result without waiting.
+        """
+        return self._load("beatmaps", beatmap_id)
+
+    def get_beatmap(self, beatmap_id: int) -> Beatmap:
+        """
+        Get a beatmap by id, batched with other lookups.
+
+        **Parameters**
+
+        beatmap_id: int
+
+        **Returns**
+
+        :class:`Beatmap`
+        """
+        return self._load("beatmaps", beatmap_id).result()
+
+    def flush(self) -> None:
+        """
+        Send the collected lookups now rather than at the end of the window, and wait for them to finish.
+        """
+        for kind in self._pending:
+            with self._lock:
+                batch = self._take(kind)
+            if batch:
+                self._run_batch(kind, batch)
+
+    def close(self) -> None:
+        """
+        Send the collected lookups, and stop the loader's threads once they're done.
+        """
+        self.flush()
+        self._executor.shutdown()
+
+    def _load(self, kind: str, obj_id: int) -> Future:
+        with self._lock:
+            pending = self._pending[kind]
+            future = pending.get(obj_id)
+            if future is not None and not future.cancelled():
+                return future
+
+            future = pending[obj_id] = Future()
+            if len(pending) >= self.max_batch_size:
+                self._executor.submit(self._run_batch, kind, self._take(kind))
+            elif len(pending) == 1:
+                self._executor.submit(self._dispatch_after_window, kind, self._windows[kind])
+        return future
+
+    def _take(self, kind: str) -> Dict[int, Future]:
+        # must hold the lock
+        batch = self._pending[kind]
+        self._pending[kind] = {}
+        if batch:
+            self.batches += 1
+        self._windows[kind] += 1
+        return batch
+
+    def _dispatch_after_window(self, kind: str, window: int):
+        time.sleep(self.window)
+        with self._lock:
+            if self._windows[kind] != window:
+                # already sent because it was full or flushed
+                return
+            batch = self._take(kind)
+        self._run_batch(kind, batch)
+
+    def _run_batch(self, kind: str, batch: Dict[int, Future]):
+        # futures can't be cancelled once running, and those cancelled already aren't requested
+        batch = {obj_id: future for obj_id, future in batch.items() if future.set_running_or_notify_cancel()}
+        if not batch:
+            return
+
+        bulk, single = self._get_methods(kind)
+        try:
+            found, missing = _split_batch(list(batch), bulk(list(batch)))
+        except BaseException as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+            return
+
+        for obj_id, obj in found.items():
+            if obj_id in batch:
+                batch[obj_id].set_result(obj)
+
+        if missing:
+            with self._lock:
+                self.fallbacks += len(missing)
+            results = self.client.map(single, missing, return_exceptions=True)
+            for obj_id, result in zip(missing, results):
+                if isinstance(result, BaseException):
+                    batch[obj_id].set_exception(result)
+                else:
+                    batch[obj_id].set_result(result)
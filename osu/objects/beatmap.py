@@ -2,6 +2,7 @@ from typing import Dict, Optional, List, Union, TYPE_CHECKING
 
 from ..enums import RankStatus, GameModeStr, GameModeInt
 from ..util import prettify, get_optional, get_optional_list, get_required, fromisoformat
+from ..series import IntSeries
 from .user import UserCompact
 from .current_user_attributes import BeatmapsetPermissions
 
@@ -599,18 +600,18 @@ class Failtimes:
     """
     **Attributes**
 
-    exit: Optional[List[int]]
-        List of 100 integers.
+    exit: Optional[:class:`IntSeries`]
+        Series of 100 integers.
 
-    fail: Optional[List[int]]
-        List of 100 integers.
+    fail: Optional[:class:`IntSeries`]
+        Series of 100 integers.
     """
 
     __slots__ = ("exit", "fail")
 
     def __init__(self, data):
-        self.exit: Optional[List[int]] = data.get("exit")
-        self.fail: Optional[List[int]] = data.get("fail")
+        self.exit: Optional[IntSeries] = get_optional(data, "exit", IntSeries.from_list)
+        self.fail: Optional[IntSeries] = get_optional(data, "fail", IntSeries.from_list)
 
     def __repr__(self):
         return prettify(self, "exit" if self.exit is not None else "fail")
@@ -44,7 +44,9 @@ class BeatmapScores:
         ]
         # supposedly will be switched to 'user_score' in the future
         var_name = "userScore" if "userScore" in data else "user_score"
-        self.user_score: Optional[BeatmapUserScore] = get_optional(data, var_name, BeatmapUserScore)
+        self.user_score: Optional[BeatmapUserScore] = get_optional(
+            data, var_name, lambda score: BeatmapUserScore(score, api_version)
+        )
 
     def __repr__(self):
         return prettify(self, "user_score", "scores")
@@ -5,6 +5,7 @@ from collections import namedtuple
 from .group import UserGroup
 from .forum import TextFormat
 from ..util import prettify, get_optional, get_optional_list, get_required, fromisoformat
+from ..series import IntSeries, DatedCountSeries
 from ..enums import GameModeStr, GameModeInt, UserAccountHistoryType, UserRelationType
 
 
@@ -38,6 +39,11 @@ __all__ = (
 )
 
 
+# defined at module level so statistics can be pickled
+GradeCounts = namedtuple("GradeCounts", ("ssh", "ss", "sh", "s", "a"))
+Level = namedtuple("Level", ("current", "progress"))
+
+
 class UserCompact:
     """
     Mainly used for embedding in certain responses to save additional api lookups.
@@ -139,7 +145,8 @@ class UserCompact:
 
     mapping_follower_count: Optional[int]
 
-    monthly_playcounts: Optional[List[:class:`UserMonthlyPlaycount`]]
+    monthly_playcounts: Optional[:class:`DatedCountSeries`]
+        Sequence of :class:`UserMonthlyPlaycount`
 
     nominated_beatmapset_count: Optional[int]
 
@@ -155,7 +162,8 @@ class UserCompact:
 
     ranked_beatmapset_count: Optional[int]
 
-    replays_watched_counts: Optional[List[:class:`UserReplaysWatchedCount`]]
+    replays_watched_counts: Optional[:class:`DatedCountSeries`]
+        Sequence of :class:`UserReplaysWatchedCount`
 
     scores_best_count: Optional[int]
 
@@ -298,8 +306,8 @@ class UserCompact:
         self.is_silenced: Optional[bool] = data.get("is_silenced")
         self.loved_beatmapset_count: Optional[int] = data.get("loved_beatmapset_count")
         self.mapping_follower_count: Optional[int] = data.get("mapping_follower_count")
-        self.monthly_playcounts: Optional[List[UserMonthlyPlaycount]] = get_optional_list(
-            data, "monthly_playcounts", UserMonthlyPlaycount
+        self.monthly_playcounts: Optional[DatedCountSeries] = get_optional(
+            data, "monthly_playcounts", lambda value: DatedCountSeries.from_data(value, UserMonthlyPlaycount)
         )
         self.nominated_beatmapset_count: Optional[int] = data.get("nominated_beatmapset_count")
         self.page: Optional[TextFormat] = get_optional(data, "page", TextFormat)
@@ -308,8 +316,10 @@ class UserCompact:
         self.rank_highest: Optional[RankHighest] = get_optional(data, "rank_highest", RankHighest)
         self.rank_history: Optional[RankHistory] = get_optional(data, "rank_history", RankHistory)
         self.ranked_beatmapset_count: Optional[int] = data.get("ranked_beatmapset_count")
-        self.replays_watched_counts: Optional[List[UserReplaysWatchedCount]] = get_optional_list(
-            data, "replays_watched_counts", UserReplaysWatchedCount
+        self.replays_watched_counts: Optional[DatedCountSeries] = get_optional(
+            data,
+            "replays_watched_counts",
+            lambda value: DatedCountSeries.from_data(value, UserReplaysWatchedCount, as_datetime=True),
         )
         self.scores_best_count: Optional[int] = data.get("scores_best_count")
         self.scores_first_count: Optional[int] = data.get("scores_first_count")
@@ -812,10 +822,8 @@ class UserStatistics:
         self.country_rank: Optional[int] = data.get("country_rank")
         self.global_rank: Optional[int] = get_required(data, "global_rank")
         self.global_rank_exp: Optional[int] = data.get("global_rank_exp")
-        self.grade_counts: NamedTuple = namedtuple("GradeCounts", ("ssh", "ss", "sh", "s", "a"))(
-            **get_required(data, "grade_counts")
-        )
-        self.level: NamedTuple = namedtuple("Level", ("current", "progress"))(**get_required(data, "level"))
+        self.grade_counts: NamedTuple = GradeCounts(**get_required(data, "grade_counts"))
+        self.level: NamedTuple = Level(**get_required(data, "level"))
         self.hit_accuracy: float = get_required(data, "hit_accuracy")
         self.is_ranked: bool = get_required(data, "is_ranked")
         self.maximum_combo: int = get_required(data, "maximum_combo")
@@ -972,15 +980,15 @@ class RankHistory:
 
     mode: :class:`GameModeStr`
 
-    data: List[int]
-        List of ranks from oldest to newest
+    data: :class:`IntSeries`
+        Ranks from oldest to newest
     """
 
     __slots__ = ("mode", "data")
 
     def __init__(self, data):
         self.mode: GameModeStr = GameModeStr(get_required(data, "mode"))
-        self.data: List[int] = get_required(data, "data")
+        self.data: IntSeries = IntSeries.from_list(get_required(data, "data"))
 
     def __repr__(self):
         return prettify(self, "mode", "data")
@@ -0,0 +1,245 @@
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from math import ceil
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+__all__ = ()
+
+
+def next_cursor(page: Any) -> Any:
+    # results name the cursor for the next page either cursor_string or cursor
+    for attr in ("cursor_string", "cursor"):
+        if hasattr(page, attr):
+            return getattr(page, attr)
+    raise TypeError(f"{type(page).__name__} has no cursor to request the next page with")
+
+
+def is_last_page(cursor: Any, previous: Any) -> bool:
+    # an unchanged cursor would request the same page again (e.g. get_all_scores without new scores)
+    return not cursor or cursor == previous
+
+
+def check_page_args(prefetch: int, max_pages: Optional[int]):
+    if prefetch < 0:
+        raise ValueError("prefetch must be at least 0")
+    if max_pages is not None and max_pages <= 0:
+        raise ValueError("max_pages must be greater than 0")
+
+
+def read_pages(fetch: Callable[[Any], Any], cursor: Any, max_pages: Optional[int]) -> Iterator[Any]:
+    """
+    Request pages one after another, each with the cursor of the one before.
+    """
+    count = 0
+    while max_pages is None or count < max_pages:
+        page = fetch(cursor)
+        count += 1
+        yield page
+
+        previous, cursor = cursor, next_cursor(page)
+        if is_last_page(cursor, previous):
+            return
+
+
+def read_pages_ahead(
+    fetch: Callable[[Any], Any], cursor: Any, prefetch: int, max_pages: Optional[int]
+) -> Iterator[Any]:
+    """
+    Same as :func:`read_pages`, but a background thread requests up to `prefetch` pages
+    ahead of the one being processed. Closing the generator stops the thread after its current request.
+    """
+    if prefetch == 0:
+        yield from read_pages(fetch, cursor, max_pages)
+        return
+
+    pages = queue.Queue()
+    # a slot is taken for each page requested and given back once the consumer takes it
+    slots = threading.Semaphore(prefetch)
+    stop = threading.Event()
+
+    def read_ahead():
+        try:
+            generator = read_pages(fetch, cursor, max_pages)
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                try:
+                    pages.put(("page", next(generator)))
+                except StopIteration:
+                    break
+            pages.put(("end", None))
+        except BaseException as exc:
+            pages.put(("error", exc))
+
+    threading.Thread(target=read_ahead, name="osu.py read-ahead", daemon=True).start()
+    try:
+        while True:
+            kind, value = pages.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            slots.release()
+            yield value
+    finally:
+        stop.set()
+        # wakes the thread if it's waiting for a slot
+        slots.release()
+
+
+class _PagedMethod:
+    __slots__ = ("style", "max_size", "items", "extras", "max_pages")
+
+    def __init__(self, style, max_size, items=None, extras=(), max_pages=None):
+        # "offset" for offset and limit parameters, "page" for a page parameter, "cursor" for a page in the cursor
+        self.style: str = style
+        self.max_size: int = max_size
+        # attribute of the result holding the page's entries, or None if the result is a list of them
+        self.items: Optional[str] = items
+        # other list attributes of the result that are combined across pages, without repeating ids
+        self.extras: Tuple[str, ...] = extras
+        self.max_pages: Optional[int] = max_pages
+
+
+# client methods paginated by offset or page number, rather than a cursor from the previous page
+PAGED_METHODS: Dict[str, _PagedMethod] = {
+    "get_user_scores": _PagedMethod("offset", 100),
+    "get_user_beatmaps": _PagedMethod("offset", 100),
+    "get_user_kudosu": _PagedMethod("offset", 100),
+    "get_user_recent_activity": _PagedMethod("offset", 100),
+    # the api only serves the first 200 pages of 50
+    "get_ranking": _PagedMethod("cursor", 50, "ranking", max_pages=200),
+    "get_beatmapset_discussion_posts": _PagedMethod("page", 50, "posts", ("beatmapsets", "users")),
+}
+
+_PAGE_PARAMETERS = {"offset": ("offset", "limit"), "page": ("page", "limit", "cursor"), "cursor": ("cursor",)}
+
+
+class PagePlan:
+    """
+    Which pages :func:`osu.Client.fetch_all_pages` requests, and how they're combined.
+    """
+
+    __slots__ = ("method", "page_size", "max_results", "pages", "_paged")
+
+    def __init__(self, method: str, kwargs: Dict[str, Any], page_size: Optional[int], max_results: Optional[int]):
+        paged = PAGED_METHODS.get(method)
+        if paged is None:
+            raise ValueError(
+                f"{method} isn't paginated by offset or page number. It must be one of: {', '.join(PAGED_METHODS)}"
+            )
+        given = [name for name in _PAGE_PARAMETERS[paged.style] if name in kwargs]
+        if given:
+            raise TypeError(f"{', '.join(given)} can't be given, since every page is requested")
+        if page_size is None or paged.style == "cursor":
+            page_size = paged.max_size
+        if not 0 < page_size <= paged.max_size:
+            raise ValueError(f"page_size must be between 1 and {paged.max_size}")
+        if max_results is not None and max_results <= 0:
+            raise ValueError("max_results must be greater than 0")
+
+        self.method: str = method
+        self.page_size: int = page_size
+        self.max_results: Optional[int] = max_results
+        # most pages to request, or None while it isn't known where the results end
+        self.pages: Optional[int] = paged.max_pages
+        self._paged: _PagedMethod = paged
+        if max_results is not None:
+            self._limit_pages(ceil(max_results / page_size))
+
+    def page_kwargs(self, index: int) -> Dict[str, Any]:
+        """
+        Parameters requesting the page at `index`, starting from 0.
+        """
+        style = self._paged.style
+        if style == "offset":
+            return {"offset": index * self.page_size, "limit": self.page_size}
+        if style == "page":
+            return {"page": index + 1, "limit": self.page_size}
+        return {"cursor": {"page": index + 1}}
+
+    def has_page(self, index: int) -> bool:
+        return self.pages is None or index < self.pages
+
+    def received(self, index: int, page: Any) -> bool:
+        """
+        Update the plan with a received page. Returns whether it's the last one, which is the first short page.
+        """
+        total = getattr(page, "total", None)
+        if isinstance(total, int):
+            self._limit_pages(ceil(total / self.page_size))
+        if len(self._items(page)) < self.page_size:
+            self._limit_pages(index + 1)
+            return True
+        return False
+
+    def _limit_pages(self, pages: int):
+        # the first page is always requested, even when there are no results
+        pages = max(pages, 1)
+        self.pages = pages if self.pages is None else min(self.pages, pages)
+
+    def _items(self, page: Any) -> list:
+        if self._paged.items is None:
+            return page
+        return getattr(page, self._paged.items)
+
+    def merge(self, pages: List[Any]) -> Any:
+        """
+        Combine the pages, in order, into one result of the same type as a single page.
+        """
+        items = [item for page in pages for item in self._items(page)][: self.max_results]
+        if self._paged.items is None:
+            return items
+
+        merged = pages[0]
+        setattr(merged, self._paged.items, items)
+        for attr in self._paged.extras:
+            found = {}
+            for page in pages:
+                for obj in getattr(page, attr):
+                    found.setdefault(obj.id, obj)
+            setattr(merged, attr, list(found.values()))
+        if hasattr(merged, "cursor"):
+            merged.cursor = pages[-1].cursor
+        return merged
+
+
+def fetch_pages(fetch: Callable[[Dict[str, Any]], Any], plan: PagePlan, max_concurrency: int) -> List[Any]:
+    """
+    Request the pages of `plan` in a thread pool, up to `max_concurrency` at once, and return them in order.
+    The first page is requested on its own, since it may be the only one or tell how many there are.
+    Pages past the first short one are no longer requested, and those already being requested are discarded.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than 0")
+
+    pages: Dict[int, Any] = {}
+    running: Dict[Future, int] = {}
+    with ThreadPoolExecutor(max_concurrency, thread_name_prefix="osu.py pages") as executor:
+        try:
+            index = 0
+            while True:
+                while len(running) < (max_concurrency if pages else 1) and plan.has_page(index):
+                    running[executor.submit(fetch, plan.page_kwargs(index))] = index
+                    index += 1
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_index = running.pop(future)
+                    pages[page_index] = future.result()
+                    plan.received(page_index, pages[page_index])
+                for future, page_index in list(running.items()):
+                    if not plan.has_page(page_index):
+                        future.cancel()
+                        del running[future]
+        finally:
+            # requests that already started are waited for when leaving the executor
+            for future in running:
+                future.cancel()
+
+    return [pages[i] for i in range(plan.pages)]
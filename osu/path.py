@@ -33,9 +33,14 @@ class Path:
 
     accept: str
         Accept header to use in the request. Defaults to ``application/json``.
+
+    template: str
+        The path with placeholders instead of the values (e.g. beatmaps/{beatmap}/scores).
+        Used to group requests to the same endpoint, such as in :mod:`osu.tracing`.
+        Paths made with the class methods have it set automatically, otherwise it defaults to `path`.
     """
 
-    __slots__ = ("method", "path", "scope", "requires_user", "content_type", "accept")
+    __slots__ = ("method", "path", "scope", "requires_user", "content_type", "accept", "template")
 
     def __init__(
         self,
@@ -45,6 +50,7 @@ class Path:
         requires_user=False,
         content_type="application/json",
         accept="application/json",
+        template: Optional[str] = None,
     ):
         self.method = method
         self.path = path
@@ -52,6 +58,7 @@ class Path:
         self.requires_user = requires_user
         self.content_type = content_type
         self.accept = accept
+        self.template = path if template is None else template
 
     @property
     def requires_auth(self):
@@ -63,23 +70,33 @@ class Path:
 
     @classmethod
     def user_beatmap_score(cls, beatmap, user):
-        return cls("get", f"beatmaps/{beatmap}/scores/users/{user}", "public")
+        return cls(
+            "get",
+            f"beatmaps/{beatmap}/scores/users/{user}",
+            "public",
+            template="beatmaps/{beatmap}/scores/users/{user}",
+        )
 
     @classmethod
     def user_beatmap_scores(cls, beatmap, user):
-        return cls("get", f"beatmaps/{beatmap}/scores/users/{user}/all", "public")
+        return cls(
+            "get",
+            f"beatmaps/{beatmap}/scores/users/{user}/all",
+            "public",
+            template="beatmaps/{beatmap}/scores/users/{user}/all",
+        )
 
     @classmethod
     def beatmap_scores(cls, beatmap):
-        return cls("get", f"beatmaps/{beatmap}/scores", "public")
+        return cls("get", f"beatmaps/{beatmap}/scores", "public", template="beatmaps/{beatmap}/scores")
 
     @classmethod
     def lazer_beatmap_scores(cls, beatmap):
-        return cls("get", f"beatmaps/{beatmap}/solo-scores", "public")
+        return cls("get", f"beatmaps/{beatmap}/solo-scores", "public", template="beatmaps/{beatmap}/solo-scores")
 
     @classmethod
     def beatmap(cls, beatmap):
-        return cls("get", f"beatmaps/{beatmap}", "public")
+        return cls("get", f"beatmaps/{beatmap}", "public", template="beatmaps/{beatmap}")
 
     @classmethod
     def beatmaps(cls):
@@ -87,11 +104,11 @@ class Path:
 
     @classmethod
     def get_beatmap_attributes(cls, beatmap):
-        return cls("post", f"beatmaps/{beatmap}/attributes", "public")
+        return cls("post", f"beatmaps/{beatmap}/attributes", "public", template="beatmaps/{beatmap}/attributes")
 
     @classmethod
     def get_beatmapset(cls, beatmapset):
-        return cls("get", f"beatmapsets/{beatmapset}", "public")
+        return cls("get", f"beatmapsets/{beatmapset}", "public", template="beatmapsets/{beatmapset}")
 
     @classmethod
     def beatmapset_discussion_posts(cls):
@@ -107,7 +124,7 @@ class Path:
 
     @classmethod
     def get_changelog_build(cls, stream, build):
-        return cls("get", f"changelog/{stream}/{build}", None)
+        return cls("get", f"changelog/{stream}/{build}", None, template="changelog/{stream}/{build}")
 
     @classmethod
     def get_changelog_listing(cls):
@@ -115,7 +132,7 @@ class Path:
 
     @classmethod
     def lookup_changelog_build(cls, changelog):
-        return cls("get", f"changelog/{changelog}", None)
+        return cls("get", f"changelog/{changelog}", None, template="changelog/{changelog}")
 
     @classmethod
     def get_comments(cls):
@@ -123,11 +140,11 @@ class Path:
 
     @classmethod
     def get_comment(cls, comment):
-        return cls("get", f"comments/{comment}", None)
+        return cls("get", f"comments/{comment}", None, template="comments/{comment}")
 
     @classmethod
     def reply_topic(cls, topic):
-        return cls("post", f"forums/topics/{topic}/reply", "forum.write", True)
+        return cls("post", f"forums/topics/{topic}/reply", "forum.write", True, template="forums/topics/{topic}/reply")
 
     @classmethod
     def create_topic(cls):
@@ -135,15 +152,15 @@ class Path:
 
     @classmethod
     def get_topic_and_posts(cls, topic):
-        return cls("get", f"forums/topics/{topic}", "public")
+        return cls("get", f"forums/topics/{topic}", "public", template="forums/topics/{topic}")
 
     @classmethod
     def edit_topic(cls, topic):
-        return cls("patch", f"forums/topics/{topic}", "forum.write")
+        return cls("patch", f"forums/topics/{topic}", "forum.write", template="forums/topics/{topic}")
 
     @classmethod
     def edit_post(cls, post):
-        return cls("patch", f"forums/posts/{post}", "forum.write")
+        return cls("patch", f"forums/posts/{post}", "forum.write", template="forums/posts/{post}")
 
     @classmethod
     def search(cls):
@@ -151,7 +168,13 @@ class Path:
 
     @classmethod
     def get_scores(cls, room, playlist):
-        return cls("get", f"rooms/{room}/playlist/{playlist}/scores", "public", True)
+        return cls(
+            "get",
+            f"rooms/{room}/playlist/{playlist}/scores",
+            "public",
+            True,
+            template="rooms/{room}/playlist/{playlist}/scores",
+        )
 
     @classmethod
     def get_news_listing(cls):
@@ -159,7 +182,7 @@ class Path:
 
     @classmethod
     def get_news_post(cls, news):
-        return cls("get", f"news/{news}", None)
+        return cls("get", f"news/{news}", None, template="news/{news}")
 
     @classmethod
     def revoke_current_token(cls):
@@ -167,7 +190,7 @@ class Path:
 
     @classmethod
     def get_ranking(cls, mode, type):
-        return cls("get", f"rankings/{mode}/{type}", "public")
+        return cls("get", f"rankings/{mode}/{type}", "public", template="rankings/{mode}/{type}")
 
     @classmethod
     def get_spotlights(cls):
@@ -175,27 +198,27 @@ class Path:
 
     @classmethod
     def get_own_data(cls, mode=""):
-        return cls("get", f"me/{mode}", "identify")
+        return cls("get", f"me/{mode}", "identify", template="me/{mode}")
 
     @classmethod
     def get_user_kudosu(cls, user):
-        return cls("get", f"users/{user}/kudosu", "public")
+        return cls("get", f"users/{user}/kudosu", "public", template="users/{user}/kudosu")
 
     @classmethod
     def get_user_scores(cls, user, type):
-        return cls("get", f"users/{user}/scores/{type}", "public")
+        return cls("get", f"users/{user}/scores/{type}", "public", template="users/{user}/scores/{type}")
 
     @classmethod
     def get_user_beatmaps(cls, user, type):
-        return cls("get", f"users/{user}/beatmapsets/{type}", "public")
+        return cls("get", f"users/{user}/beatmapsets/{type}", "public", template="users/{user}/beatmapsets/{type}")
 
     @classmethod
     def get_user_recent_activity(cls, user):
-        return cls("get", f"users/{user}/recent_activity", "public")
+        return cls("get", f"users/{user}/recent_activity", "public", template="users/{user}/recent_activity")
 
     @classmethod
     def get_user(cls, user, mode=""):
-        return cls("get", f"users/{user}/{mode}", "public")
+        return cls("get", f"users/{user}/{mode}", "public", template="users/{user}/{mode}")
 
     @classmethod
     def get_users(cls):
@@ -207,15 +230,15 @@ class Path:
 
     @classmethod
     def get_wiki_page(cls, locale, path):
-        return cls("get", f"wiki/{locale}/{path}", None)
+        return cls("get", f"wiki/{locale}/{path}", None, template="wiki/{locale}/{path}")
 
     @classmethod
     def get_score_by_id(cls, mode, score):
-        return cls("get", f"scores/{mode}/{score}", "public")
+        return cls("get", f"scores/{mode}/{score}", "public", template="scores/{mode}/{score}")
 
     @classmethod
     def get_score_by_id_only(cls, score):
-        return cls("get", f"scores/{score}", "public")
+        return cls("get", f"scores/{score}", "public", template="scores/{score}")
 
     @classmethod
     def get_beatmapset_events(cls):
@@ -227,19 +250,19 @@ class Path:
 
     @classmethod
     def get_match(cls, match):
-        return cls("get", f"matches/{match}", "public")
+        return cls("get", f"matches/{match}", "public", template="matches/{match}")
 
     @classmethod
     def get_rooms(cls, mode=""):
-        return cls("get", f"rooms/{mode}", "public", True)
+        return cls("get", f"rooms/{mode}", "public", True, template="rooms/{mode}")
 
     @classmethod
     def get_room(cls, room):
-        return cls("get", f"rooms/{room}", "public")
+        return cls("get", f"rooms/{room}", "public", template="rooms/{room}")
 
     @classmethod
     def get_room_leaderboard(cls, room):
-        return cls("get", f"rooms/{room}/leaderboard", "public", True)
+        return cls("get", f"rooms/{room}/leaderboard", "public", True, template="rooms/{room}/leaderboard")
 
     @classmethod
     def get_seasonal_backgrounds(cls):
@@ -247,11 +270,11 @@ class Path:
 
     @classmethod
     def get_replay_data(cls, mode, score):
-        return cls("get", f"scores/{mode}/{score}/download", "public", False)
+        return cls("get", f"scores/{mode}/{score}/download", "public", False, template="scores/{mode}/{score}/download")
 
     @classmethod
     def get_replay_data_by_id_only(cls, score):
-        return cls("get", f"scores/{score}/download", "public", False)
+        return cls("get", f"scores/{score}/download", "public", False, template="scores/{score}/download")
 
     @classmethod
     def get_friends(cls):
@@ -271,23 +294,53 @@ class Path:
 
     @classmethod
     def get_channel_messages(cls, channel_id):
-        return cls("get", f"chat/channels/{channel_id}/messages", "chat.read", True)
+        return cls(
+            "get",
+            f"chat/channels/{channel_id}/messages",
+            "chat.read",
+            True,
+            template="chat/channels/{channel_id}/messages",
+        )
 
     @classmethod
     def send_message_to_channel(cls, channel_id):
-        return cls("post", f"chat/channels/{channel_id}/messages", "chat.write", True)
+        return cls(
+            "post",
+            f"chat/channels/{channel_id}/messages",
+            "chat.write",
+            True,
+            template="chat/channels/{channel_id}/messages",
+        )
 
     @classmethod
     def join_channel(cls, channel_id, user_id):
-        return cls("put", f"chat/channels/{channel_id}/users/{user_id}", "chat.write_manage", True)
+        return cls(
+            "put",
+            f"chat/channels/{channel_id}/users/{user_id}",
+            "chat.write_manage",
+            True,
+            template="chat/channels/{channel_id}/users/{user_id}",
+        )
 
     @classmethod
     def leave_channel(cls, channel_id, user_id):
-        return cls("delete", f"chat/channels/{channel_id}/users/{user_id}", "chat.write_manage", True)
+        return cls(
+            "delete",
+            f"chat/channels/{channel_id}/users/{user_id}",
+            "chat.write_manage",
+            True,
+            template="chat/channels/{channel_id}/users/{user_id}",
+        )
 
     @classmethod
     def mark_channel_read(cls, channel_id, message_id):
-        return cls("put", f"chat/channels/{channel_id}/mark-as-read/{message_id}", "chat.read", True)
+        return cls(
+            "put",
+            f"chat/channels/{channel_id}/mark-as-read/{message_id}",
+            "chat.read",
+            True,
+            template="chat/channels/{channel_id}/mark-as-read/{message_id}",
+        )
 
     @classmethod
     def get_channel_list(cls):
@@ -299,7 +352,7 @@ class Path:
 
     @classmethod
     def get_channel(cls, channel_id):
-        return cls("get", f"chat/channels/{channel_id}", "chat.read", True)
+        return cls("get", f"chat/channels/{channel_id}", "chat.read", True, template="chat/channels/{channel_id}")
 
     @classmethod
     def get_all_scores(cls):
@@ -311,7 +364,7 @@ class Path:
 
     @classmethod
     def get_forum(cls, forum_id):
-        return cls("get", f"forums/{forum_id}", "public")
+        return cls("get", f"forums/{forum_id}", "public", template="forums/{forum_id}")
 
     @classmethod
     def get_forum_topics(cls):
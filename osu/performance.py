@@ -0,0 +1,997 @@
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from .enums import GameModeStr, Mod, Mods
+from .util import prettify
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = (
+    "OsuPerformanceCalculator",
+    "TaikoPerformanceCalculator",
+    "PerformanceResult",
+    "ProfilePerformance",
+    "estimate_osu_star_rating",
+)
+
+
+PERFORMANCE_BASE_MULTIPLIER = 1.15
+# 99% critical value for the normal distribution (one-tailed)
+Z_99 = 2.32634787404
+
+
+def _require_numpy():
+    if numpy is None:
+        raise RuntimeError(
+            "Missing numpy package, which is required for performance calculation. "
+            'Install osu.py with the numpy feature: "pip install osu.py[numpy]"'
+        )
+
+
+def _erf(x):
+    # Abramowitz and Stegun 7.1.26, max error 1.5e-7
+    sign = numpy.sign(x)
+    x = numpy.abs(x)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    y = 1.0 - (
+        ((((1.061405429 * t - 1.453152027) * t) + 1.421413741) * t - 0.284496736) * t + 0.254829592
+    ) * t * numpy.exp(-x * x)
+    return sign * y
+
+
+def _erfinv(y):
+    # Giles' single precision approximation refined with newton's method
+    y = numpy.clip(y, -1 + 1e-15, 1 - 1e-15)
+    w = -numpy.log((1.0 - y) * (1.0 + y))
+    small = w < 5.0
+    ws = w - 2.5
+    wl = numpy.sqrt(numpy.maximum(w, 5.0)) - 3.0
+    ps = 2.81022636e-08
+    for c in (
+        3.43273939e-07,
+        -3.5233877e-06,
+        -4.39150654e-06,
+        0.00021858087,
+        -0.00125372503,
+        -0.00417768164,
+        0.246640727,
+        1.50140941,
+    ):
+        ps = c + ps * ws
+    pl = -0.000200214257
+    for c in (
+        0.000100950558,
+        0.00134934322,
+        -0.00367342844,
+        0.00573950773,
+        -0.0076224613,
+        0.00943887047,
+        1.00167406,
+        2.83297682,
+    ):
+        pl = c + pl * wl
+    x = numpy.where(small, ps, pl) * y
+    for _ in range(2):
+        x = x - (_erf(x) - y) / (2.0 / numpy.sqrt(numpy.pi) * numpy.exp(-x * x))
+    return x
+
+
+def _difficulty_range(difficulty, low, mid, high):
+    # value at difficulty 0, 5, and 10 respectively
+    return numpy.where(
+        difficulty > 5,
+        mid + (high - mid) * (difficulty - 5) / 5,
+        mid - (mid - low) * (5 - difficulty) / 5,
+    )
+
+
+def _difficulty_to_performance(difficulty):
+    return numpy.power(5.0 * numpy.maximum(1.0, difficulty / 0.0675) - 4.0, 3.0) / 100000.0
+
+
+def _parse_mods(mods) -> Dict[str, dict]:
+    """mods of any supported format -> {acronym: settings}"""
+    if mods is None:
+        return {}
+    if isinstance(mods, (int, Mods)):
+        mods = list(Mods(mods)) if mods else []
+
+    parsed = {}
+    for mod in mods:
+        settings = {}
+        if isinstance(mod, Mods):
+            acronym = Mod[mod.name if mod is not Mods.AutoPilot else "Autopilot"].value
+        elif isinstance(mod, Mod):
+            acronym = mod.value
+        elif isinstance(mod, str):
+            acronym = mod.upper()
+        elif isinstance(mod, dict):
+            acronym = mod["acronym"]
+            settings = mod.get("settings") or {}
+        else:
+            # LazerMod
+            acronym = mod.mod.value
+            settings = mod.settings or {}
+        parsed[acronym] = settings
+    return parsed
+
+
+def _clock_rate(mods: Dict[str, dict]) -> float:
+    for acronym, default in (("DT", 1.5), ("NC", 1.5), ("HT", 0.75), ("DC", 0.75)):
+        if acronym in mods:
+            return mods[acronym].get("speed_change", default)
+    return 1.0
+
+
+def _apply_difficulty_mods(mods: Dict[str, dict], **values: float) -> Dict[str, float]:
+    if "EZ" in mods:
+        values = {name: value * 0.5 for name, value in values.items()}
+    if "HR" in mods:
+        values = {name: min(value * (1.3 if name == "circle_size" else 1.4), 10.0) for name, value in values.items()}
+    if "DA" in mods:
+        for name in values:
+            if mods["DA"].get(name) is not None:
+                values[name] = mods["DA"][name]
+    return values
+
+
+class PerformanceResult:
+    """
+    Result of a performance calculation. Every attribute is a numpy array
+    with one value per calculated score (or a 0d array for a single score).
+
+    **Attributes**
+
+    pp: :class:`numpy.ndarray`
+
+    aim: Optional[:class:`numpy.ndarray`]
+        osu!standard only
+
+    speed: Optional[:class:`numpy.ndarray`]
+        osu!standard only
+
+    accuracy: :class:`numpy.ndarray`
+
+    flashlight: Optional[:class:`numpy.ndarray`]
+        osu!standard only
+
+    difficulty: Optional[:class:`numpy.ndarray`]
+        osu!taiko only
+
+    effective_miss_count: :class:`numpy.ndarray`
+    """
+
+    __slots__ = ("pp", "aim", "speed", "accuracy", "flashlight", "difficulty", "effective_miss_count")
+
+    def __init__(
+        self,
+        pp,
+        accuracy,
+        effective_miss_count,
+        aim=None,
+        speed=None,
+        flashlight=None,
+        difficulty=None,
+    ):
+        self.pp: numpy.ndarray = pp
+        self.aim: Optional[numpy.ndarray] = aim
+        self.speed: Optional[numpy.ndarray] = speed
+        self.accuracy: numpy.ndarray = accuracy
+        self.flashlight: Optional[numpy.ndarray] = flashlight
+        self.difficulty: Optional[numpy.ndarray] = difficulty
+        self.effective_miss_count: numpy.ndarray = effective_miss_count
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(pp={self.pp!r})"
+
+
+class _PerformanceCalculator:
+    __slots__ = ("attributes", "mods", "clock_rate", "object_count")
+
+    def __init__(self, attributes, mods):
+        _require_numpy()
+
+        self.attributes = attributes
+        self.mods: Dict[str, dict] = _parse_mods(mods)
+        self.clock_rate: float = _clock_rate(self.mods)
+
+    @staticmethod
+    def _counts(statistics: Iterable[Any]) -> Tuple[int, ...]:
+        names = ("great", "ok", "meh", "miss", "slider_tail_hit", "large_tick_miss")
+        return tuple(getattr(statistics, name, None) or 0 for name in names)
+
+    def accuracy_sweep(self, accuracies: Sequence[float], misses: Union[int, Sequence[int]] = 0) -> Dict[str, Any]:
+        """
+        Generate hit counts for the given accuracies and miss counts,
+        which can be passed straight to :func:`calculate` (e.g. ``calculator.calculate(**sweep)``).
+        Accuracies and misses are broadcast against each other.
+
+        **Parameters**
+
+        accuracies: Sequence[float]
+            Accuracies in the range [0, 1].
+
+        misses: Union[int, Sequence[int]]
+
+        **Returns**
+
+        Dict[str, :class:`numpy.ndarray`]
+            Has keys `great`, `ok`, `meh`, `miss`, and `max_combo`.
+        """
+        accuracies, misses = numpy.broadcast_arrays(
+            numpy.asarray(accuracies, dtype=numpy.float64), numpy.asarray(misses, dtype=numpy.int64)
+        )
+        total = self.object_count
+        misses = numpy.minimum(misses, total)
+        # every hit starts as a meh; each great adds 5 and each ok adds 1 (in 1/6ths of a great)
+        target = numpy.round(accuracies * total * 6)
+        delta = numpy.clip(target - (total - misses), 0, (total - misses) * 5)
+        great = numpy.floor(delta / 5).astype(numpy.int64)
+        ok = (delta - great * 5).astype(numpy.int64)
+        meh = total - great - ok - misses
+        return {
+            "great": great,
+            "ok": ok,
+            "meh": meh,
+            "miss": misses,
+            "max_combo": numpy.where(misses == 0, self.attributes.max_combo, self.attributes.max_combo // (misses + 1)),
+        }
+
+
+class OsuPerformanceCalculator(_PerformanceCalculator):
+    """
+    Local osu!standard performance (pp) calculator. All inputs describing a score can be
+    arrays, so pp for many hypothetical scores (accuracy sweeps, miss counts, ...) is calculated at once.
+
+    Requires numpy, which can be installed with ``pip install osu.py[numpy]``.
+
+    This follows the reference implementation of osu!lazer's performance calculator, so results
+    may drift when osu! updates its algorithm. Because the api does not expose the
+    flashlight difficulty, the flashlight portion of the pp is 0 unless the attributes have
+    a `flashlight_difficulty` attribute.
+
+    .. code:: py
+
+        beatmap = client.get_beatmap(beatmap_id)
+        attributes = client.get_beatmap_attributes(beatmap_id, mods=["HD", "DT"])
+        calculator = OsuPerformanceCalculator(attributes, beatmap, mods=["HD", "DT"])
+        sweep = calculator.accuracy_sweep(numpy.linspace(0.95, 1, 6), misses=[[0], [1], [5]])
+        pp = calculator.calculate(**sweep).pp  # shape (3, 6)
+
+    **Init Parameters**
+
+    attributes: :class:`BeatmapDifficultyAttributes`
+        Difficulty attributes of the beatmap calculated with the same mods.
+
+    beatmap: :class:`Beatmap`
+        Used for the object counts and the base difficulty settings.
+
+    mods: Optional[Union[Sequence[Union[:class:`LazerMod`, :class:`Mod`, str]], :class:`Mods`, int]]
+        Mods of the scores.
+    """
+
+    __slots__ = (
+        "circle_count",
+        "slider_count",
+        "spinner_count",
+        "overall_difficulty",
+        "approach_rate",
+        "drain_rate",
+        "great_hit_window",
+        "ok_hit_window",
+        "meh_hit_window",
+        "classic_slider_accuracy",
+    )
+
+    def __init__(self, attributes, beatmap, mods=None):
+        super().__init__(attributes, mods)
+
+        self.circle_count: int = beatmap.count_circles
+        self.slider_count: int = beatmap.count_sliders
+        self.spinner_count: int = beatmap.count_spinners
+        self.object_count: int = self.circle_count + self.slider_count + self.spinner_count
+
+        difficulty = _apply_difficulty_mods(
+            self.mods, overall_difficulty=beatmap.accuracy, approach_rate=beatmap.ar, drain_rate=beatmap.drain
+        )
+        self.great_hit_window: float = float(_difficulty_range(difficulty["overall_difficulty"], 80, 50, 20))
+        self.ok_hit_window: float = float(_difficulty_range(difficulty["overall_difficulty"], 140, 100, 60))
+        self.meh_hit_window: float = float(_difficulty_range(difficulty["overall_difficulty"], 200, 150, 100))
+        self.great_hit_window /= self.clock_rate
+        self.ok_hit_window /= self.clock_rate
+        self.meh_hit_window /= self.clock_rate
+        preempt = float(_difficulty_range(difficulty["approach_rate"], 1800, 1200, 450)) / self.clock_rate
+
+        self.overall_difficulty: float = (80 - self.great_hit_window) / 6
+        self.approach_rate: float = (1800 - preempt) / 120 if preempt > 1200 else (1200 - preempt) / 150 + 5
+        self.drain_rate: float = difficulty["drain_rate"]
+        self.classic_slider_accuracy: bool = "CL" in self.mods and self.mods["CL"].get("no_slider_head_accuracy", True)
+
+    def calculate_score(self, score) -> PerformanceResult:
+        """
+        Calculate the pp of a :class:`SoloScore`, e.g. to compare with the pp given by the api.
+        """
+        great, ok, meh, miss, slider_tail_hit, large_tick_miss = self._counts(score.statistics)
+        return self.calculate(
+            great,
+            ok,
+            meh,
+            miss,
+            score.max_combo,
+            accuracy=score.accuracy,
+            slider_tail_hit=slider_tail_hit,
+            large_tick_miss=large_tick_miss,
+        )
+
+    def calculate(
+        self,
+        great,
+        ok,
+        meh,
+        miss,
+        max_combo,
+        accuracy=None,
+        slider_tail_hit=None,
+        large_tick_miss=0,
+    ) -> PerformanceResult:
+        """
+        Calculate pp. Every parameter can be a scalar or an array, and they're broadcast against each other.
+
+        **Parameters**
+
+        great, ok, meh, miss: Union[int, :class:`numpy.ndarray`]
+            Hit counts.
+
+        max_combo: Union[int, :class:`numpy.ndarray`]
+            Max combo of the score.
+
+        accuracy: Optional[Union[float, :class:`numpy.ndarray`]]
+            Accuracy of the score in the range [0, 1]. Calculated from the hit counts if not given.
+
+        slider_tail_hit: Optional[Union[int, :class:`numpy.ndarray`]]
+            Slider tails hit. Defaults to every slider. Not used with the classic mod.
+
+        large_tick_miss: Union[int, :class:`numpy.ndarray`]
+            Missed slider ticks. Not used with the classic mod.
+
+        **Returns**
+
+        :class:`PerformanceResult`
+        """
+        great, ok, meh, miss, max_combo = (
+            numpy.asarray(value, dtype=numpy.float64) for value in (great, ok, meh, miss, max_combo)
+        )
+        total_hits = great + ok + meh + miss
+        if accuracy is None:
+            accuracy = numpy.where(total_hits > 0, (great * 6 + ok * 2 + meh) / numpy.maximum(total_hits, 1) / 6, 0.0)
+        accuracy = numpy.asarray(accuracy, dtype=numpy.float64)
+        if slider_tail_hit is None:
+            slider_tail_hit = self.slider_count
+        slider_ends_dropped = self.slider_count - numpy.asarray(slider_tail_hit, dtype=numpy.float64)
+        large_tick_miss = numpy.asarray(large_tick_miss, dtype=numpy.float64)
+
+        effective_miss_count = self._effective_miss_count(
+            great, ok, meh, miss, max_combo, total_hits, slider_ends_dropped, large_tick_miss
+        )
+
+        multiplier = numpy.full_like(effective_miss_count, PERFORMANCE_BASE_MULTIPLIER)
+        if "NF" in self.mods:
+            multiplier *= numpy.maximum(0.9, 1.0 - 0.02 * effective_miss_count)
+        if "SO" in self.mods:
+            multiplier *= numpy.where(
+                total_hits > 0, 1.0 - numpy.power(self.spinner_count / numpy.maximum(total_hits, 1), 0.85), 1.0
+            )
+        if "RX" in self.mods:
+            od = self.overall_difficulty
+            ok_multiplier = max(0.0, 1 - (od / 13.33) ** 1.8 if od > 0 else 1.0)
+            meh_multiplier = max(0.0, 1 - (od / 13.33) ** 5 if od > 0 else 1.0)
+            effective_miss_count = numpy.minimum(
+                effective_miss_count + ok * ok_multiplier + meh * meh_multiplier, total_hits
+            )
+
+        speed_deviation = self._speed_deviation(great, ok, meh, miss, total_hits)
+
+        aim = self._aim_value(
+            accuracy, total_hits, effective_miss_count, max_combo, ok + meh + miss, slider_ends_dropped, large_tick_miss
+        )
+        speed = self._speed_value(accuracy, great, ok, meh, total_hits, effective_miss_count, speed_deviation)
+        acc = self._accuracy_value(great, ok, meh, total_hits)
+        flashlight = self._flashlight_value(accuracy, total_hits, effective_miss_count)
+
+        pp = (
+            numpy.power(
+                numpy.power(aim, 1.1) + numpy.power(speed, 1.1) + numpy.power(acc, 1.1) + numpy.power(flashlight, 1.1),
+                1.0 / 1.1,
+            )
+            * multiplier
+        )
+        return PerformanceResult(
+            pp,
+            acc,
+            effective_miss_count,
+            aim=aim,
+            speed=speed,
+            flashlight=flashlight,
+        )
+
+    def _effective_miss_count(self, great, ok, meh, miss, max_combo, total_hits, slider_ends_dropped, large_tick_miss):
+        effective_miss_count = miss
+        if self.slider_count > 0:
+            if self.classic_slider_accuracy:
+                # estimate dropped slider ends as 10% of the sliders
+                full_combo_threshold = self.attributes.max_combo - 0.1 * self.slider_count
+                cap = ok + meh + miss
+            else:
+                full_combo_threshold = self.attributes.max_combo - slider_ends_dropped
+                cap = large_tick_miss + miss
+            effective_miss_count = numpy.where(
+                max_combo < full_combo_threshold,
+                full_combo_threshold / numpy.maximum(1.0, max_combo),
+                effective_miss_count,
+            )
+            effective_miss_count = numpy.minimum(effective_miss_count, cap)
+
+        effective_miss_count = numpy.maximum(miss, effective_miss_count)
+        return numpy.minimum(total_hits, effective_miss_count)
+
+    @staticmethod
+    def _length_bonus(total_hits):
+        return (
+            0.95
+            + 0.4 * numpy.minimum(1.0, total_hits / 2000.0)
+            + numpy.where(total_hits > 2000, numpy.log10(numpy.maximum(total_hits, 2000) / 2000.0) * 0.5, 0.0)
+        )
+
+    @staticmethod
+    def _miss_penalty(miss_count, difficult_strain_count):
+        return 0.96 / ((miss_count / (4 * numpy.power(numpy.log(difficult_strain_count), 0.94))) + 1)
+
+    def _aim_value(
+        self,
+        accuracy,
+        total_hits,
+        effective_miss_count,
+        max_combo,
+        imperfect_hits,
+        slider_ends_dropped,
+        large_tick_miss,
+    ):
+        if "AP" in self.mods:
+            return numpy.zeros_like(total_hits)
+
+        attributes = self.attributes
+        aim_difficulty = numpy.full_like(total_hits, attributes.aim_difficulty)
+        if self.slider_count > 0 and attributes.aim_difficult_slider_count > 0:
+            if self.classic_slider_accuracy:
+                estimate = numpy.minimum(imperfect_hits, attributes.max_combo - max_combo)
+            else:
+                estimate = slider_ends_dropped + large_tick_miss
+            estimate = numpy.clip(estimate, 0, attributes.aim_difficult_slider_count)
+            slider_nerf_factor = (1 - attributes.slider_factor) * numpy.power(
+                1 - estimate / attributes.aim_difficult_slider_count, 3
+            ) + attributes.slider_factor
+            aim_difficulty = aim_difficulty * slider_nerf_factor
+
+        aim = _difficulty_to_performance(aim_difficulty)
+        length_bonus = self._length_bonus(total_hits)
+        aim *= length_bonus
+        aim *= numpy.where(
+            effective_miss_count > 0,
+            self._miss_penalty(effective_miss_count, attributes.aim_difficult_strain_count),
+            1.0,
+        )
+
+        approach_rate_factor = 0.0
+        if self.approach_rate > 10.33:
+            approach_rate_factor = 0.3 * (self.approach_rate - 10.33)
+        elif self.approach_rate < 8.0:
+            approach_rate_factor = 0.05 * (8.0 - self.approach_rate)
+        if "RX" in self.mods:
+            approach_rate_factor = 0.0
+        aim *= 1.0 + approach_rate_factor * length_bonus
+
+        if "BL" in self.mods:
+            aim *= 1.3 + (total_hits * (0.0016 / (1 + 2 * effective_miss_count)) * numpy.power(accuracy, 16)) * (
+                1 - 0.003 * self.drain_rate * self.drain_rate
+            )
+        elif "HD" in self.mods or "TC" in self.mods:
+            aim *= 1.0 + 0.04 * (12.0 - self.approach_rate)
+
+        aim *= accuracy
+        aim *= 0.98 + max(0.0, self.overall_difficulty) ** 2 / 2500
+        return aim
+
+    def _speed_value(self, accuracy, great, ok, meh, total_hits, effective_miss_count, speed_deviation):
+        if "RX" in self.mods:
+            return numpy.zeros_like(total_hits)
+
+        attributes = self.attributes
+        base = _difficulty_to_performance(attributes.speed_difficulty)
+        speed = numpy.full_like(total_hits, base)
+        length_bonus = self._length_bonus(total_hits)
+        speed *= length_bonus
+        speed *= numpy.where(
+            effective_miss_count > 0,
+            self._miss_penalty(effective_miss_count, attributes.speed_difficult_strain_count),
+            1.0,
+        )
+
+        approach_rate_factor = 0.3 * (self.approach_rate - 10.33) if self.approach_rate > 10.33 else 0.0
+        if "AP" in self.mods:
+            approach_rate_factor = 0.0
+        speed *= 1.0 + approach_rate_factor * length_bonus
+
+        if "BL" in self.mods:
+            speed *= 1.12
+        elif "HD" in self.mods or "TC" in self.mods:
+            speed *= 1.0 + 0.04 * (12.0 - self.approach_rate)
+
+        # nerf excess speed difficulty of scores that seem to be tapped improperly
+        deviation = numpy.nan_to_num(speed_deviation, nan=numpy.inf)
+        cutoff = 100 + 220 * numpy.power(22 / deviation, 6.5)
+        adjusted = 50 * (numpy.log(numpy.maximum(base - cutoff, 0) / 50 + 1) + cutoff / 50)
+        lerp = 1 - numpy.clip((deviation - 22.0) / 5.0, 0.0, 1.0)
+        adjusted = adjusted + (base - adjusted) * lerp
+        speed *= numpy.where(base <= cutoff, 1.0, adjusted / base)
+
+        # accuracy assuming the worst case scenario
+        speed_note_count = attributes.speed_note_count
+        relevant_total_diff = numpy.maximum(0, total_hits - speed_note_count)
+        relevant_great = numpy.maximum(0, great - relevant_total_diff)
+        relevant_ok = numpy.maximum(0, ok - numpy.maximum(0, relevant_total_diff - great))
+        relevant_meh = numpy.maximum(0, meh - numpy.maximum(0, relevant_total_diff - great - ok))
+        relevant_accuracy = (
+            0.0
+            if speed_note_count == 0
+            else (relevant_great * 6.0 + relevant_ok * 2.0 + relevant_meh) / (speed_note_count * 6.0)
+        )
+
+        od = self.overall_difficulty
+        speed *= (0.95 + max(0.0, od) ** 2 / 750) * numpy.power((accuracy + relevant_accuracy) / 2.0, (14.5 - od) / 2)
+        return numpy.where(numpy.isnan(speed_deviation), 0.0, speed)
+
+    def _speed_deviation(self, great, ok, meh, miss, total_hits):
+        speed_note_count = self.attributes.speed_note_count + (total_hits - self.attributes.speed_note_count) * 0.1
+        # assume worst case: all mistakes were on speed notes
+        relevant_miss = numpy.minimum(miss, speed_note_count)
+        relevant_meh = numpy.minimum(meh, speed_note_count - relevant_miss)
+        relevant_ok = numpy.minimum(ok, speed_note_count - relevant_miss - relevant_meh)
+        relevant_great = numpy.maximum(0, speed_note_count - relevant_miss - relevant_meh - relevant_ok)
+        deviation = self._deviation(relevant_great, relevant_ok, relevant_meh, relevant_miss)
+        return numpy.where(great + ok + meh > 0, deviation, numpy.nan)
+
+    def _deviation(self, great, ok, meh, miss):
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            n = numpy.maximum(1, great + ok + meh + miss - miss - meh)
+            p = great / n
+            p_lower_bound = (n * p + Z_99 * Z_99 / 2) / (n + Z_99 * Z_99) - Z_99 / (n + Z_99 * Z_99) * numpy.sqrt(
+                numpy.maximum(n * p * (1 - p) + Z_99 * Z_99 / 4, 0)
+            )
+            deviation = self.great_hit_window / (numpy.sqrt(2) * _erfinv(p_lower_bound))
+            ok_window = self.ok_hit_window
+            random_value = (
+                numpy.sqrt(2 / numpy.pi)
+                * ok_window
+                * numpy.exp(-0.5 * numpy.power(ok_window / deviation, 2))
+                / (deviation * _erf(ok_window / (numpy.sqrt(2) * deviation)))
+            )
+            deviation = deviation * numpy.sqrt(1 - random_value)
+            limit_value = ok_window / numpy.sqrt(3)
+            deviation = numpy.where(
+                (p_lower_bound <= 0) | (random_value >= 1) | ~(deviation <= limit_value), limit_value, deviation
+            )
+
+            meh_window = self.meh_hit_window
+            meh_variance = (meh_window * meh_window + ok_window * meh_window + ok_window * ok_window) / 3
+            deviation = numpy.sqrt(((great + ok) * numpy.power(deviation, 2) + meh * meh_variance) / (great + ok + meh))
+        return numpy.where(great + ok + meh > 0, deviation, numpy.nan)
+
+    def _accuracy_value(self, great, ok, meh, total_hits):
+        if "RX" in self.mods:
+            return numpy.zeros_like(total_hits)
+
+        object_count = self.circle_count
+        if not self.classic_slider_accuracy:
+            object_count += self.slider_count
+        if object_count > 0:
+            better_accuracy = ((great - (total_hits - object_count)) * 6 + ok * 2 + meh) / (object_count * 6)
+        else:
+            better_accuracy = numpy.zeros_like(total_hits)
+        better_accuracy = numpy.maximum(better_accuracy, 0)
+
+        acc = numpy.power(1.52163, self.overall_difficulty) * numpy.power(better_accuracy, 24) * 2.83
+        acc *= min(1.15, (object_count / 1000.0) ** 0.3)
+
+        if "BL" in self.mods:
+            acc *= 1.14
+        elif "HD" in self.mods or "TC" in self.mods:
+            acc *= 1.08
+        if "FL" in self.mods:
+            acc *= 1.02
+        return acc
+
+    def _flashlight_value(self, accuracy, total_hits, effective_miss_count):
+        flashlight_difficulty = getattr(self.attributes, "flashlight_difficulty", None)
+        if "FL" not in self.mods or not flashlight_difficulty:
+            return numpy.zeros_like(total_hits)
+
+        flashlight = numpy.full_like(total_hits, 25 * flashlight_difficulty**2)
+        flashlight *= numpy.where(
+            effective_miss_count > 0,
+            0.97
+            * numpy.power(
+                1 - numpy.power(effective_miss_count / total_hits, 0.775), numpy.power(effective_miss_count, 0.875)
+            ),
+            1.0,
+        )
+        flashlight *= (
+            0.7
+            + 0.1 * numpy.minimum(1.0, total_hits / 200.0)
+            + numpy.where(total_hits > 200, 0.2 * numpy.minimum(1.0, (total_hits - 200) / 200.0), 0.0)
+        )
+        flashlight *= 0.5 + accuracy / 2.0
+        flashlight *= 0.98 + max(0.0, self.overall_difficulty) ** 2 / 2500
+        return flashlight
+
+
+class TaikoPerformanceCalculator(_PerformanceCalculator):
+    """
+    Local osu!taiko performance (pp) calculator. Works the same way as :class:`OsuPerformanceCalculator`.
+
+    Requires numpy, which can be installed with ``pip install osu.py[numpy]``.
+
+    **Init Parameters**
+
+    attributes: :class:`BeatmapDifficultyAttributes`
+        Difficulty attributes of the beatmap calculated with the same mods.
+
+    beatmap: :class:`Beatmap`
+        Used for the object count, the overall difficulty, and whether the beatmap is a convert.
+
+    mods: Optional[Union[Sequence[Union[:class:`LazerMod`, :class:`Mod`, str]], :class:`Mods`, int]]
+        Mods of the scores.
+    """
+
+    __slots__ = ("great_hit_window", "is_convert")
+
+    def __init__(self, attributes, beatmap, mods=None):
+        super().__init__(attributes, mods)
+
+        self.object_count: int = beatmap.count_circles
+        difficulty = _apply_difficulty_mods(self.mods, overall_difficulty=beatmap.accuracy)
+        self.great_hit_window: float = (
+            float(_difficulty_range(difficulty["overall_difficulty"], 50, 35, 20)) / self.clock_rate
+        )
+        self.is_convert: bool = beatmap.mode != GameModeStr.TAIKO
+
+    def calculate_score(self, score) -> PerformanceResult:
+        """
+        Calculate the pp of a :class:`SoloScore`, e.g. to compare with the pp given by the api.
+        """
+        great, ok, meh, miss, _, _ = self._counts(score.statistics)
+        return self.calculate(great, ok, meh, miss)
+
+    def calculate(self, great, ok, meh, miss, max_combo=None) -> PerformanceResult:
+        """
+        Calculate pp. Every parameter can be a scalar or an array, and they're broadcast against each other.
+
+        **Parameters**
+
+        great, ok, meh, miss: Union[int, :class:`numpy.ndarray`]
+            Hit counts.
+
+        max_combo: Optional[Union[int, :class:`numpy.ndarray`]]
+            Unused. Exists so the output of :func:`accuracy_sweep` can be passed directly.
+
+        **Returns**
+
+        :class:`PerformanceResult`
+        """
+        great, ok, meh, miss = (numpy.asarray(value, dtype=numpy.float64) for value in (great, ok, meh, miss))
+        total_hits = great + ok + meh + miss
+        successful_hits = great + ok + meh
+        effective_miss_count = numpy.where(
+            successful_hits > 0, numpy.maximum(1.0, 1000.0 / numpy.maximum(successful_hits, 1)) * miss, 0.0
+        )
+        unstable_rate = self._deviation_upper_bound(great, total_hits) * 10
+
+        multiplier = 1.13
+        if "HD" in self.mods and not self.is_convert:
+            multiplier *= 1.075
+        if "EZ" in self.mods:
+            multiplier *= 0.95
+
+        difficulty = self._difficulty_value(total_hits, effective_miss_count, unstable_rate)
+        acc = self._accuracy_value(total_hits, unstable_rate)
+        pp = numpy.power(numpy.power(difficulty, 1.1) + numpy.power(acc, 1.1), 1.0 / 1.1) * multiplier
+        return PerformanceResult(pp, acc, effective_miss_count, difficulty=difficulty)
+
+    def _deviation_upper_bound(self, great, total_hits):
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            n = total_hits
+            p = great / n
+            p_lower_bound = (n * p + Z_99 * Z_99 / 2) / (n + Z_99 * Z_99) - Z_99 / (n + Z_99 * Z_99) * numpy.sqrt(
+                numpy.maximum(n * p * (1 - p) + Z_99 * Z_99 / 4, 0)
+            )
+            deviation = self.great_hit_window / (numpy.sqrt(2) * _erfinv(p_lower_bound))
+        return numpy.where((great > 0) & (self.great_hit_window > 0), deviation, numpy.nan)
+
+    def _difficulty_value(self, total_hits, effective_miss_count, unstable_rate):
+        star_rating = self.attributes.star_rating
+        mono_stamina_factor = self.attributes.mono_stamina_factor
+
+        base_difficulty = 5 * max(1.0, star_rating / 0.115) - 4.0
+        difficulty = min(base_difficulty**3 / 69052.51, base_difficulty**2.25 / 1250.0)
+        difficulty *= 1 + 0.10 * max(0.0, star_rating - 10)
+
+        length_bonus = 1 + 0.1 * numpy.minimum(1.0, total_hits / 1500.0)
+        difficulty = difficulty * length_bonus
+        difficulty *= numpy.power(0.986, effective_miss_count)
+
+        if "EZ" in self.mods:
+            difficulty *= 0.9
+        if "HD" in self.mods:
+            difficulty *= 1.025
+        if "FL" in self.mods:
+            difficulty *= numpy.maximum(1, 1.05 - min(mono_stamina_factor / 50, 1) * length_bonus)
+
+        # scale accuracy more harshly on nearly-completely mono speed maps
+        exponent = 2 + mono_stamina_factor
+        shift = 500 - 100 * (mono_stamina_factor * 3)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            difficulty *= numpy.power(_erf(shift / (numpy.sqrt(2) * unstable_rate)), exponent)
+        return numpy.where(numpy.isnan(unstable_rate), 0.0, difficulty)
+
+    def _accuracy_value(self, total_hits, unstable_rate):
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            acc = numpy.power(70 / unstable_rate, 1.1) * self.attributes.star_rating**0.4 * 100.0
+        length_bonus = numpy.minimum(1.15, numpy.power(total_hits / 1500.0, 0.3))
+        if "FL" in self.mods and "HD" in self.mods and not self.is_convert:
+            acc *= numpy.maximum(1.0, 1.05 * length_bonus)
+        return numpy.where(numpy.isnan(unstable_rate), 0.0, acc)
+
+
+class ProfilePerformance:
+    """
+    Weighted pp of a profile calculated from its best scores, which answers
+    "what if" questions (what would my pp be if I got x pp on this beatmap?) without
+    re-sorting or re-summing the scores.
+
+    Scores are weighted by 0.95^i, where i is the index of the score sorted by pp, and only the
+    top `limit` scores count. Bonus pp is calculated from `score_count` the same way osu! does.
+
+    Requires numpy.
+
+    .. code:: py
+
+        scores = client.get_user_scores(user_id, "best", limit=100)
+        profile = ProfilePerformance.from_scores(scores)
+        # pp the user would have with a 400pp score on beatmap 1001 (replaces their current score on it)
+        profile.what_if(400, beatmap_id=1001)
+        # many hypothetical scores at once
+        profile.what_if([300, 350, 400, 450])
+
+    **Init Parameters**
+
+    pp: Sequence[float]
+        pp of each best score, in any order.
+
+    beatmap_ids: Optional[Sequence[int]]
+        Beatmap id of each score, used for replacing scores on the same beatmap.
+
+    score_count: Optional[int]
+        Number of ranked scores the user has, used for bonus pp. The sum of the user's
+        grade counts is a good estimate. Defaults to the number of scores given.
+
+    limit: int
+        Number of top scores that count towards the weighted pp. Defaults to 100.
+
+    **Attributes**
+
+    pp: :class:`numpy.ndarray`
+        pp of each score, sorted in descending order.
+
+    beatmap_ids: Optional[:class:`numpy.ndarray`]
+        Beatmap id of each score, in the same order as `pp`.
+
+    score_count: int
+
+    limit: int
+    """
+
+    __slots__ = ("pp", "beatmap_ids", "score_count", "limit", "_negated_pp", "_weighted_sums", "_beatmap_index")
+
+    def __init__(
+        self,
+        pp: Sequence[float],
+        beatmap_ids: Optional[Sequence[int]] = None,
+        score_count: Optional[int] = None,
+        limit: int = 100,
+    ):
+        _require_numpy()
+
+        pp = numpy.asarray(pp, dtype=numpy.float64)
+        order = numpy.argsort(-pp, kind="stable")
+        self.pp: numpy.ndarray = pp[order]
+        self.beatmap_ids: Optional[numpy.ndarray] = (
+            numpy.asarray(beatmap_ids, dtype=numpy.int64)[order] if beatmap_ids is not None else None
+        )
+        self.score_count: int = len(pp) if score_count is None else score_count
+        self.limit: int = limit
+        self._build()
+
+    @classmethod
+    def from_scores(cls, scores: Sequence[Any], score_count: Optional[int] = None, limit: int = 100):
+        """
+        Create from :class:`SoloScore` or :class:`LegacyScore` objects, such as the result of
+        :func:`Client.get_user_scores` with type `best`. Scores without pp are ignored.
+        """
+        scores = [score for score in scores if score.pp is not None]
+        beatmap_ids = [
+            score.beatmap_id if getattr(score, "beatmap_id", None) is not None else score.beatmap.id for score in scores
+        ]
+        return cls([score.pp for score in scores], beatmap_ids, score_count, limit)
+
+    def _build(self):
+        self._negated_pp: numpy.ndarray = -self.pp
+        weighted = self.pp[: self.limit] * numpy.power(0.95, numpy.arange(min(len(self.pp), self.limit)))
+        self._weighted_sums: numpy.ndarray = numpy.concatenate(([0.0], numpy.cumsum(weighted)))
+        self._beatmap_index: Dict[int, int] = {}
+        if self.beatmap_ids is not None:
+            self._beatmap_index = {beatmap_id: i for i, beatmap_id in enumerate(self.beatmap_ids.tolist())}
+
+    @staticmethod
+    def calculate_bonus_pp(score_count: int) -> float:
+        """Bonus pp given for a number of ranked scores."""
+        return (417 - 1 / 3) * (1 - 0.995 ** min(score_count, 1000))
+
+    @property
+    def weighted_pp(self) -> float:
+        """Sum of the weighted pp of the top scores."""
+        return float(self._weighted_sums[-1])
+
+    @property
+    def bonus_pp(self) -> float:
+        return self.calculate_bonus_pp(self.score_count)
+
+    @property
+    def total_pp(self) -> float:
+        """Weighted pp plus bonus pp."""
+        return self.weighted_pp + self.bonus_pp
+
+    def _replaced_indices(self, beatmap_id, shape) -> "numpy.ndarray":
+        if beatmap_id is None:
+            return numpy.full(shape, -1, dtype=numpy.int64)
+        if self.beatmap_ids is None:
+            raise ValueError("beatmap_ids are required for replacing scores")
+        beatmap_id = numpy.broadcast_to(numpy.asarray(beatmap_id, dtype=numpy.int64), shape)
+        return numpy.fromiter(
+            (self._beatmap_index.get(i, -1) for i in beatmap_id.flat), dtype=numpy.int64, count=beatmap_id.size
+        ).reshape(shape)
+
+    def what_if(self, pp, beatmap_id=None) -> Union[float, "numpy.ndarray"]:
+        """
+        Total pp (weighted plus bonus) the profile would have after setting a score with the given pp.
+        Both arguments can be arrays to evaluate many hypothetical scores at once. Each score is
+        evaluated on its own (they're not cumulative); use :func:`insert` for that.
+
+        Finding the rank of the new score is a binary search and the new total is
+        calculated from prefix sums, so each hypothetical score costs O(log n).
+
+        **Parameters**
+
+        pp: Union[float, Sequence[float]]
+            pp of the hypothetical score(s).
+
+        beatmap_id: Optional[Union[int, Sequence[int]]]
+            Beatmap of the hypothetical score(s). If the profile has a score on the beatmap, it's
+            replaced when the new score has more pp (and nothing changes otherwise).
+
+        **Returns**
+
+        Union[float, :class:`numpy.ndarray`]
+            float if `pp` and `beatmap_id` are scalars.
+        """
+        pp = numpy.asarray(pp, dtype=numpy.float64)
+        shape = numpy.broadcast_shapes(pp.shape, numpy.shape(beatmap_id) if beatmap_id is not None else ())
+        pp = numpy.broadcast_to(pp, shape)
+        replaced = self._replaced_indices(beatmap_id, shape)
+
+        sums = self._weighted_sums
+        top_count = len(sums) - 1
+        rank = numpy.searchsorted(self._negated_pp, -pp, side="right")
+        clipped_rank = numpy.minimum(rank, top_count)
+        new_weight = pp * numpy.power(0.95, rank)
+
+        # scores below the new one move down a rank and the last counted score drops out
+        inserted = sums[clipped_rank] + new_weight + 0.95 * (sums[min(top_count, self.limit - 1)] - sums[clipped_rank])
+        # scores between the new one and the replaced one move down a rank
+        replace_index = numpy.clip(replaced, 0, max(top_count - 1, 0))
+        replaced_total = (
+            sums[clipped_rank]
+            + new_weight
+            + 0.95 * (sums[replace_index] - sums[clipped_rank])
+            + sums[-1]
+            - sums[numpy.minimum(replace_index + 1, top_count)]
+        )
+
+        is_replace = replaced >= 0
+        if len(self.pp) > 0:
+            improved = ~is_replace | (pp > self.pp[numpy.maximum(replaced, 0)])
+        else:
+            improved = numpy.ones(shape, dtype=bool)
+        weighted = numpy.where(
+            ~improved | (rank >= self.limit),
+            sums[-1],
+            numpy.where(is_replace & (replaced < top_count), replaced_total, inserted),
+        )
+        bonus = numpy.where(is_replace, self.bonus_pp, self.calculate_bonus_pp(self.score_count + 1))
+        total = weighted + bonus
+        return float(total) if total.ndim == 0 else total
+
+    def insert(self, pp: float, beatmap_id: Optional[int] = None):
+        """
+        Add a score to the profile, replacing the score on the same beatmap if it has less pp.
+
+        Unlike :func:`what_if`, this modifies the profile and costs O(n): every score below the
+        new one moves down a rank, which changes its weight, so the prefix sums are rebuilt.
+        A tree of partial sums (e.g. a Fenwick tree) wouldn't help, since the weights of all
+        of those scores change and not just one. Profiles have at most a couple hundred best
+        scores, so this is cheap, but use :func:`what_if` for evaluating many scores.
+        """
+        index = self._beatmap_index.get(beatmap_id, -1) if beatmap_id is not None else -1
+        if index >= 0 and pp <= self.pp[index]:
+            return
+
+        pp_array = self.pp
+        beatmap_ids = self.beatmap_ids
+        if index >= 0:
+            pp_array = numpy.delete(pp_array, index)
+            beatmap_ids = numpy.delete(beatmap_ids, index)
+        else:
+            self.score_count += 1
+
+        rank = int(numpy.searchsorted(-pp_array, -pp, side="right"))
+        self.pp = numpy.insert(pp_array, rank, pp)
+        if beatmap_ids is not None:
+            self.beatmap_ids = numpy.insert(beatmap_ids, rank, -1 if beatmap_id is None else beatmap_id)
+        self._build()
+
+    def __repr__(self):
+        return prettify(self, "weighted_pp", "bonus_pp", "score_count")
+
+
+def estimate_osu_star_rating(aim_difficulty, speed_difficulty, flashlight_difficulty=0.0) -> "numpy.ndarray":
+    """
+    Estimate the osu!standard star rating from its difficulty components.
+    The inputs can be arrays, e.g. the components of many beatmaps or mod combinations.
+
+    Requires numpy.
+
+    **Parameters**
+
+    aim_difficulty: Union[float, :class:`numpy.ndarray`]
+
+    speed_difficulty: Union[float, :class:`numpy.ndarray`]
+
+    flashlight_difficulty: Union[float, :class:`numpy.ndarray`]
+        Only relevant with the flashlight mod.
+
+    **Returns**
+
+    :class:`numpy.ndarray`
+    """
+    _require_numpy()
+
+    aim = _difficulty_to_performance(numpy.asarray(aim_difficulty, dtype=numpy.float64))
+    speed = _difficulty_to_performance(numpy.asarray(speed_difficulty, dtype=numpy.float64))
+    flashlight = 25 * numpy.power(numpy.asarray(flashlight_difficulty, dtype=numpy.float64), 2)
+    base = numpy.power(numpy.power(aim, 1.1) + numpy.power(speed, 1.1) + numpy.power(flashlight, 1.1), 1.0 / 1.1)
+    return numpy.where(
+        base > 0.00001,
+        numpy.cbrt(PERFORMANCE_BASE_MULTIPLIER) * 0.027 * (numpy.cbrt(100000 / 2 ** (1 / 1.1) * base) + 4),
+        0.0,
+    )
@@ -0,0 +1,236 @@
+from math import ceil
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .objects import User, UserCompact
+
+
+__all__ = ("USER_ENDPOINT_FIELDS", "UserFetchPlan", "plan_user_fetch")
+
+
+# attributes every endpoint returning users includes
+_BASE_FIELDS = frozenset(
+    (
+        "avatar_url",
+        "country_code",
+        "default_group",
+        "id",
+        "is_active",
+        "is_bot",
+        "is_deleted",
+        "is_online",
+        "is_supporter",
+        "last_visit",
+        "pm_friends_only",
+        "profile_colour",
+        "username",
+    )
+)
+
+USER_ENDPOINT_FIELDS: Dict[str, FrozenSet[str]] = {
+    "get_users": _BASE_FIELDS | {"country", "cover", "groups", "statistics_rulesets"},
+    "lookup_users": _BASE_FIELDS | {"global_rank"},
+    "get_user": _BASE_FIELDS
+    | frozenset(User.__slots__)
+    | {
+        "account_history",
+        "active_tournament_banner",
+        "active_tournament_banners",
+        "badges",
+        "beatmap_playcounts_count",
+        "comments_count",
+        "country",
+        "cover",
+        "daily_challenge_user_stats",
+        "favourite_beatmapset_count",
+        "follower_count",
+        "graveyard_beatmapset_count",
+        "groups",
+        "guest_beatmapset_count",
+        "loved_beatmapset_count",
+        "mapping_follower_count",
+        "monthly_playcounts",
+        "nominated_beatmapset_count",
+        "page",
+        "pending_beatmapset_count",
+        "previous_usernames",
+        "rank_highest",
+        "rank_history",
+        "ranked_beatmapset_count",
+        "replays_watched_counts",
+        "scores_best_count",
+        "scores_first_count",
+        "scores_pinned_count",
+        "scores_recent_count",
+        "statistics",
+        "support_level",
+        "team",
+        "user_achievements",
+    },
+}
+
+# most users the bulk endpoints accept per request
+BULK_LIMIT = 50
+
+# order results are merged in: the first endpoint used gives the returned object
+_MERGE_ORDER = ("get_user", "get_users", "lookup_users")
+
+
+def _request_count(endpoint: str, count: int) -> int:
+    return count if endpoint == "get_user" else ceil(count / BULK_LIMIT)
+
+
+def _chunks(users: Sequence, size: int = BULK_LIMIT) -> List[Sequence]:
+    return [users[i : i + size] for i in range(0, len(users), size)]
+
+
+class UserFetchPlan:
+    """
+    Endpoints chosen by :func:`plan_user_fetch` to get the requested attributes of some users.
+
+    **Attributes**
+
+    endpoints: Tuple[str, ...]
+        Names of the client methods to call: ``get_users``, ``lookup_users``, and/or ``get_user``.
+        The returned objects come from the first one, and the others fill in the attributes it doesn't have.
+
+    fields: FrozenSet[str]
+        The requested attributes.
+
+    requests: int
+        Number of requests the plan makes.
+    """
+
+    __slots__ = ("endpoints", "fields", "requests", "_users", "_coverage")
+
+    def __init__(
+        self,
+        endpoints: Tuple[str, ...],
+        fields: FrozenSet[str],
+        users: Sequence[Union[int, str]],
+        coverage: Dict[str, FrozenSet[str]],
+    ):
+        self.endpoints: Tuple[str, ...] = endpoints
+        self.fields: FrozenSet[str] = fields
+        self.requests: int = sum(_request_count(endpoint, len(users)) for endpoint in endpoints)
+        self._users: Sequence[Union[int, str]] = users
+        self._coverage: Dict[str, FrozenSet[str]] = coverage
+
+    def chunks(self, endpoint: str) -> List[Sequence[Union[int, str]]]:
+        """
+        The users to request in each call of `endpoint`. Each user on their own for ``get_user``.
+        """
+        if endpoint == "get_user":
+            return [[user] for user in self._users]
+        return _chunks(self._users)
+
+    def merge(self, results: Dict[str, Iterable[UserCompact]]) -> List[Optional[Union[User, UserCompact]]]:
+        """
+        Combine the users returned by each endpoint into one object per requested user, in the same order.
+        Users that weren't returned are None.
+
+        **Parameters**
+
+        results: Dict[str, Iterable[:class:`UserCompact`]]
+            All users returned by each endpoint of the plan.
+        """
+        found = {endpoint: _index(users) for endpoint, users in results.items()}
+        primary, others = self.endpoints[0], self.endpoints[1:]
+        covered = self._coverage[primary]
+
+        merged = []
+        for user in self._users:
+            obj = _find(found[primary], user)
+            if obj is not None:
+                for endpoint in others:
+                    other = _find(found[endpoint], user)
+                    for field in (self.fields & self._coverage[endpoint]) - covered:
+                        setattr(obj, field, getattr(other, field, None))
+            merged.append(obj)
+        return merged
+
+    def __repr__(self):
+        return f"UserFetchPlan(endpoints={self.endpoints}, requests={self.requests})"
+
+
+def _index(users: Iterable[UserCompact]) -> Tuple[Dict[int, UserCompact], Dict[str, UserCompact]]:
+    users = list(users)
+    return {user.id: user for user in users}, {user.username.lower(): user for user in users}
+
+
+def _find(index: Tuple[Dict[int, UserCompact], Dict[str, UserCompact]], user: Union[int, str]):
+    by_id, by_name = index
+    if isinstance(user, int):
+        return by_id.get(user)
+    return by_name.get(user.lstrip("@").lower())
+
+
+def plan_user_fetch(
+    users: Sequence[Union[int, str]], fields: Iterable[str], mode: Optional[str] = None
+) -> UserFetchPlan:
+    """
+    Choose the endpoints that return the requested attributes of the users with the fewest requests.
+    Used by :func:`osu.Client.fetch_users`.
+
+    - ``get_users`` returns 50 users per request with country, cover, groups, and statistics_rulesets,
+      but only takes ids.
+    - ``lookup_users`` returns 50 users per request, takes ids and usernames, and has global_rank
+      when a mode is given.
+    - ``get_user`` returns one full :class:`osu.User` per request, so it's only used for the attributes
+      the others don't have.
+
+    Endpoints are combined when no single one has every attribute.
+
+    **Parameters**
+
+    users: Sequence[Union[int, str]]
+        Ids and usernames. Usernames should be prefixed with "@".
+
+    fields: Iterable[str]
+        Attributes of :class:`osu.User` that are needed. Attributes every endpoint includes,
+        like username, don't need to be listed.
+
+    mode: Optional[str]
+        Game mode the statistics and global_rank are for.
+
+    **Returns**
+
+    :class:`UserFetchPlan`
+
+    **Raises**
+
+    ValueError
+        If no combination of the endpoints returns every attribute, such as global_rank without a mode.
+    """
+    users = list(users)
+    fields = frozenset(fields)
+    unknown = fields - set(UserCompact.__slots__) - set(User.__slots__)
+    if unknown:
+        raise ValueError(f"Users don't have the attributes: {', '.join(sorted(unknown))}")
+
+    coverage = dict(USER_ENDPOINT_FIELDS)
+    if mode is None:
+        # global_rank is only included for a mode
+        coverage["lookup_users"] = _BASE_FIELDS
+
+    # bulk endpoints first, so they're preferred when the number of requests is the same
+    candidates = ["get_users", "lookup_users", "get_user"]
+    if any(not isinstance(user, int) for user in users):
+        candidates.remove("get_users")
+
+    best = None
+    for mask in range(1, 1 << len(candidates)):
+        endpoints = tuple(
+            sorted((endpoint for i, endpoint in enumerate(candidates) if mask & (1 << i)), key=_MERGE_ORDER.index)
+        )
+        if not fields <= frozenset().union(*(coverage[endpoint] for endpoint in endpoints)):
+            continue
+        plan = UserFetchPlan(endpoints, fields, users, coverage)
+        if best is None or (plan.requests, len(plan.endpoints)) < (best.requests, len(best.endpoints)):
+            best = plan
+
+    if best is None:
+        available = frozenset().union(*(coverage[endpoint] for endpoint in candidates))
+        missing = ", ".join(sorted(fields - available))
+        hint = " (global_rank requires a mode)" if "global_rank" in fields and mode is None else ""
+        raise ValueError(f"No endpoint returns the attributes: {missing}{hint}")
+    return best
@@ -0,0 +1,370 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:
+    aiohttp = web = None
+
+if TYPE_CHECKING:
+    from .asyncio import AsynchronousClient
+
+
+__all__ = ("ProxyServer",)
+
+
+# headers passed on to the api and back, the rest (like Authorization) are set by the proxy
+_REQUEST_HEADERS = ("Accept", "Content-Type", "x-api-version")
+_RESPONSE_HEADERS = ("Content-Type", "Retry-After")
+
+_CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], str]
+
+
+class _ProxyResponse:
+    __slots__ = ("status", "body", "headers", "expires")
+
+    def __init__(self, status: int, body: bytes, headers: Dict[str, str], expires: float = 0.0):
+        self.status: int = status
+        self.body: bytes = body
+        self.headers: Dict[str, str] = headers
+        self.expires: float = expires
+
+    def to_response(self, cache: str) -> "web.Response":
+        return web.Response(status=self.status, body=self.body, headers={**self.headers, "X-Proxy-Cache": cache})
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # so it isn't logged when every client waiting on the request disconnected
+    if not task.cancelled():
+        task.exception()
+
+
+class ProxyServer:
+    """
+    Local http server which mirrors ``/api/v2/...`` for programs sharing one set of credentials,
+    whatever language they're written in. Requests are sent to the api by an :class:`osu.AsynchronousClient`,
+    so they share its token and rate limit. Identical GET requests that arrive while one is in progress
+    wait for its response instead of being sent again, and successful GET responses are cached
+    for `cache_ttl` seconds.
+
+    .. code:: py
+
+        client = AsynchronousClient.from_credentials(client_id, client_secret, None, request_wait_time=0)
+        async with ProxyServer(client, port=8080):
+            ...  # requests to http://127.0.0.1:8080/api/v2/users/2 are answered
+
+    Programs should send requests without authorization, since the proxy adds it.
+    ``POST /oauth/token`` is answered with a placeholder token, so clients that insist on authenticating
+    (like osu.py's) work when pointed at the proxy. Every response has an ``X-Proxy-Cache`` header of
+    ``HIT``, ``MISS``, ``COALESCED`` (waited on an identical request), or ``BYPASS`` (not a GET,
+    or the request had ``Cache-Control: no-cache``).
+
+    ``python -m osu.proxy`` runs one from the command line; ``python -m osu.proxy --help`` lists the options.
+
+    **Init Parameters**
+
+    client: :class:`osu.AsynchronousClient`
+
+    cache_ttl: float
+        Seconds to serve a cached response for. 0 disables the cache. Defaults to 60.
+
+    max_cache_entries: int
+        Most responses to cache. The least recently used ones are removed first. Defaults to 1024.
+
+    host: str
+        Defaults to 127.0.0.1
+
+    port: int
+        0 picks a free port, which is available as the `port` attribute after starting. Defaults to 0.
+
+    **Attributes**
+
+    requests: int
+        Number of requests received.
+
+    forwarded: int
+        Number of requests sent to the api.
+
+    cache_hits: int
+        Number of requests answered from the cache.
+
+    coalesced: int
+        Number of requests answered with the response to an identical request in progress.
+    """
+
+    __slots__ = (
+        "client",
+        "cache_ttl",
+        "max_cache_entries",
+        "host",
+        "port",
+        "requests",
+        "forwarded",
+        "cache_hits",
+        "coalesced",
+        "_cache",
+        "_in_flight",
+        "_session",
+        "_runner",
+        "_loop",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        client: "AsynchronousClient",
+        cache_ttl: float = 60.0,
+        max_cache_entries: int = 1024,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if web is None:
+            raise RuntimeError(
+                "Missing aiohttp package, which is required for ProxyServer. "
+                'Install osu.py with the async feature: "pip install osu.py[async]"'
+            )
+        if cache_ttl < 0:
+            raise ValueError("cache_ttl cannot be negative")
+        if max_cache_entries <= 0:
+            raise ValueError("max_cache_entries must be greater than 0")
+
+        self.client: "AsynchronousClient" = client
+        self.cache_ttl: float = cache_ttl
+        self.max_cache_entries: int = max_cache_entries
+        self.host: str = host
+        self.port: int = port
+
+        self.requests: int = 0
+        self.forwarded: int = 0
+        self.cache_hits: int = 0
+        self.coalesced: int = 0
+
+        self._cache: "OrderedDict[_CacheKey, _ProxyResponse]" = OrderedDict()
+        self._in_flight: Dict[_CacheKey, asyncio.Task] = {}
+        # made by start if the client has no session, and closed by close
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._runner: Optional["web.AppRunner"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def domain(self) -> str:
+        """
+        Domain to pass to :func:`osu.Client.set_domain`, available once the server started.
+        """
+        if self._runner is None:
+            raise RuntimeError("The server hasn't been started")
+        return f"http://{self.host}:{self.port}"
+
+    def make_app(self) -> "web.Application":
+        """
+        Returns the :class:`aiohttp.web.Application` of the server, for running it some other way.
+        """
+        app = web.Application()
+        app.router.add_post("/oauth/token", self._handle_token)
+        app.router.add_post("/oauth/token/", self._handle_token)
+        app.router.add_route("*", "/api/v2/{tail:.*}", self._handle_request)
+        return app
+
+    def clear_cache(self) -> None:
+        """
+        Remove every cached response.
+        """
+        self._cache.clear()
+
+    async def start(self) -> None:
+        """
+        Start serving on the current event loop.
+        """
+        http = self.client.http
+        if hasattr(http, "session") and http.session is None:
+            # so requests reuse connections
+            self._session = http.session = aiohttp.ClientSession()
+
+        runner = web.AppRunner(self.make_app())
+        await runner.setup()
+        await web.TCPSite(runner, self.host, self.port).start()
+        self.port = runner.addresses[0][1]
+        self._runner = runner
+
+    async def close(self) -> None:
+        """
+        Stop serving, and close the session made by :func:`start`.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        if self._session is not None:
+            self.client.http.session = None
+            await self._session.close()
+            self._session = None
+
+    def start_in_thread(self) -> None:
+        """
+        Start serving on an event loop in a background thread.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="osu.py proxy", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+
+    def close_in_thread(self) -> None:
+        """
+        Stop serving and stop the thread started by :func:`start_in_thread`.
+        """
+        if self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    @staticmethod
+    async def _handle_token(request: "web.Request") -> "web.Response":
+        return web.json_response({"token_type": "Bearer", "expires_in": 86400, "access_token": "proxy"})
+
+    async def _handle_request(self, request: "web.Request") -> "web.Response":
+        self.requests += 1
+        tail = request.match_info["tail"]
+        if request.method != "GET" or "no-cache" in request.headers.get("Cache-Control", ""):
+            response = await self._forward(request, tail)
+            return response.to_response("BYPASS")
+
+        key = (
+            tail,
+            tuple(sorted(request.query.items())),
+            request.headers.get("x-api-version", self.client.http.api_version),
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached.expires > time.monotonic():
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached.to_response("HIT")
+            del self._cache[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            # shielded, so a client disconnecting doesn't cancel the request for the others waiting on it
+            response = await asyncio.shield(task)
+            return response.to_response("COALESCED")
+
+        # the request is made in its own task, so it also isn't cancelled if this client disconnects
+        task = self._in_flight[key] = asyncio.ensure_future(self._forward_and_store(key, request, tail))
+        task.add_done_callback(_retrieve_exception)
+        response = await asyncio.shield(task)
+        return response.to_response("MISS")
+
+    async def _forward_and_store(self, key: _CacheKey, request: "web.Request", tail: str) -> _ProxyResponse:
+        try:
+            response = await self._forward(request, tail)
+        finally:
+            del self._in_flight[key]
+        self._store(key, response)
+        return response
+
+    def _store(self, key: _CacheKey, response: _ProxyResponse):
+        if self.cache_ttl <= 0 or response.status != 200:
+            return
+        response.expires = time.monotonic() + self.cache_ttl
+        self._cache[key] = response
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    async def _forward(self, request: "web.Request", tail: str) -> _ProxyResponse:
+        http = self.client.http
+        headers = {name: request.headers[name] for name in _REQUEST_HEADERS if name in request.headers}
+        headers.setdefault("x-api-version", http.api_version)
+        headers.setdefault("Accept", "application/json")
+        body = await request.read() if request.can_read_body else None
+
+        try:
+            token = await http.auth.get_token()
+            headers["Authorization"] = f"Bearer {token}"
+            await http.rate_limit.wait()
+            self.forwarded += 1
+            async with http._get_session() as session:
+                async with session.request(
+                    request.method, http.base_url + tail, params=request.query, data=body, headers=headers
+                ) as resp:
+                    body = await resp.read()
+                    response_headers = {name: resp.headers[name] for name in _RESPONSE_HEADERS if name in resp.headers}
+                    return _ProxyResponse(resp.status, body, response_headers)
+        except aiohttp.ClientError as exc:
+            body = json.dumps({"error": f"Couldn't reach the api: {type(exc).__name__}"}).encode()
+            return _ProxyResponse(502, body, {"Content-Type": "application/json"})
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __enter__(self):
+        self.start_in_thread()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_in_thread()
+
+
+async def _serve(args) -> None:
+    from .asyncio import AsynchronousClient
+
+    client = AsynchronousClient.from_credentials(
+        args.client_id,
+        args.client_secret,
+        None,
+        request_wait_time=args.request_wait_time,
+        limit_per_minute=args.limit_per_minute,
+    )
+    if args.domain is not None:
+        client.set_domain(args.domain)
+
+    async with ProxyServer(client, args.cache_ttl, args.max_cache_entries, args.host, args.port) as proxy:
+        print(f"Proxying {client.http.base_url} at {proxy.domain}/api/v2/", flush=True)
+        await asyncio.Event().wait()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m osu.proxy",
+        description="Serve the osu! api locally with one shared token, rate limit, and response cache.",
+    )
+    parser.add_argument("--client-id", type=int, default=os.getenv("osu_client_id"))
+    parser.add_argument("--client-secret", default=os.getenv("osu_client_secret"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cache-ttl", type=float, default=60.0, help="seconds to cache responses for, 0 disables")
+    parser.add_argument("--max-cache-entries", type=int, default=1024)
+    parser.add_argument("--request-wait-time", type=float, default=1.0)
+    parser.add_argument("--limit-per-minute", type=int, default=60)
+    parser.add_argument("--domain", help="domain of the api, such as a stand-in server")
+
+    args = parser.parse_args(argv)
+    if args.client_id is None or args.client_secret is None:
+        parser.error("--client-id and --client-secret (or osu_client_id and osu_client_secret) are required")
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -87,6 +87,11 @@ class ResultBase:
             return self.__slots__[item], getattr(self, self.__slots__[item], None)
         raise AttributeError(f"Could not fetch attribute of {self.__class__.__name__} " f"from item value {item!r}")
 
+    # The dataclasses are frozen, so unpickling has to bypass __setattr__
+    def __setstate__(self, state):
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class SearchInfo(ResultBase):
@@ -0,0 +1,431 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .enums import Mod, Mods, ScoreRank
+from .objects import SoloScore, ScoreDataStatistics
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = ("ScoreTable", "ScoreRow")
+
+
+_legacy_mod_bits = {name.lower(): member.value for name, member in Mods.__members__.items()}
+# lazer mod acronym -> legacy bit. Mods without a legacy bit are not represented in the bitmask.
+MOD_BITS: Dict[str, int] = {
+    mod.value: _legacy_mod_bits[mod.name.lower()] for mod in Mod if mod.name.lower() in _legacy_mod_bits
+}
+# as in legacy scores, nightcore and perfect also set the bits of the mods they imply
+MOD_BITS[Mod.Nightcore.value] |= MOD_BITS[Mod.DoubleTime.value]
+MOD_BITS[Mod.Perfect.value] |= MOD_BITS[Mod.SuddenDeath.value]
+RANKS: Tuple[ScoreRank, ...] = tuple(ScoreRank)
+RANK_CODES: Dict[str, int] = {rank.value: i for i, rank in enumerate(RANKS)}
+STATISTICS: Tuple[str, ...] = ScoreDataStatistics.__slots__
+
+# name -> numpy dtype name
+SCORE_COLUMNS: Dict[str, str] = {
+    "id": "int64",
+    "user_id": "int64",
+    "beatmap_id": "int64",
+    "ruleset_id": "int8",
+    "total_score": "int64",
+    "accuracy": "float64",
+    "pp": "float64",
+    "rank": "uint8",
+    "mods": "int64",
+    "max_combo": "int32",
+    "passed": "bool",
+    "ended_at": "datetime64[s]",
+    **{statistic: "int32" for statistic in STATISTICS},
+}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise RuntimeError(
+            "Missing numpy package, which is required to use ScoreTable. "
+            'Install osu.py with the numpy feature: "pip install osu.py[numpy]"'
+        )
+
+
+def _descending_key(values: "numpy.ndarray") -> "numpy.ndarray":
+    # a key which sorts in descending order of values, with nan and NaT still last
+    if values.dtype.kind in "fc":
+        return -values
+    # negating ints could overflow, and other types can't be negated, so their ranks are negated
+    key = -numpy.unique(values, return_inverse=True)[1].reshape(-1).astype(numpy.int64)
+    if values.dtype.kind in "mM":
+        key[numpy.isnat(values)] = 1
+    return key
+
+
+def _isnan(values: "numpy.ndarray") -> "numpy.ndarray":
+    if values.dtype.kind in "fc":
+        return numpy.isnan(values)
+    return numpy.zeros(len(values), bool)
+
+
+def _zero_nan(values: "numpy.ndarray") -> "numpy.ndarray":
+    if values.dtype.kind in "fc":
+        return numpy.where(numpy.isnan(values), 0, values)
+    return values
+
+
+def _mods_bitmask(mods: Iterable[Any]) -> int:
+    value = 0
+    for mod in mods:
+        if isinstance(mod, dict):
+            mod = mod["acronym"]
+        elif not isinstance(mod, str):
+            # LazerMod
+            mod = mod.mod.value
+        value |= MOD_BITS.get(mod, 0)
+    return value
+
+
+def _timestamp(value: Optional[Union[str, datetime]]) -> "numpy.datetime64":
+    if value is None:
+        return numpy.datetime64("NaT", "s")
+    if isinstance(value, str):
+        # datetime64 doesn't accept the trailing Z
+        return numpy.datetime64(value.rstrip("Z")[:19], "s")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return numpy.datetime64(value, "s")
+
+
+def _json_row(score: dict) -> tuple:
+    statistics = score["statistics"]
+    pp = score.get("pp")
+    return (
+        score["id"],
+        score["user_id"],
+        score["beatmap_id"],
+        score["ruleset_id"],
+        score["total_score"],
+        score["accuracy"],
+        numpy.nan if pp is None else pp,
+        RANK_CODES.get(score["rank"], 255),
+        _mods_bitmask(score["mods"]),
+        score["max_combo"],
+        score["passed"],
+        _timestamp(score["ended_at"]),
+        *(statistics.get(statistic) or 0 for statistic in STATISTICS),
+    )
+
+
+def _score_row(score: SoloScore) -> tuple:
+    statistics = score.statistics
+    return (
+        score.id,
+        score.user_id,
+        score.beatmap_id,
+        score.ruleset_id,
+        score.total_score,
+        score.accuracy,
+        numpy.nan if score.pp is None else score.pp,
+        RANK_CODES.get(score.rank.value, 255),
+        _mods_bitmask(score.mods),
+        score.max_combo,
+        score.passed,
+        _timestamp(score.ended_at),
+        *(getattr(statistics, statistic) or 0 for statistic in STATISTICS),
+    )
+
+
+class ScoreRow:
+    """
+    View of a single row of a :class:`ScoreTable`. Values are read from the
+    table's columns on access, so creating a row is cheap.
+
+    Has an attribute for each column of the table. `rank` is returned as a :class:`ScoreRank`,
+    `mods` as :class:`Mods`, `pp` as None when missing and `ended_at` as a :py:class:`datetime.datetime`.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ScoreTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, item):
+        if item in self.__slots__:
+            raise AttributeError(item)
+        try:
+            column = self._table.columns[item]
+        except KeyError:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute {item!r}") from None
+
+        value = column[self._index].item()
+        if item == "rank":
+            return RANKS[value] if value < len(RANKS) else None
+        if item == "mods":
+            return Mods(value) if value else None
+        if item == "pp":
+            return None if value != value else value
+        if item == "ended_at":
+            return None if value is None else value.replace(tzinfo=timezone.utc)
+        return value
+
+    def json(self) -> Dict[str, Any]:
+        """Returns the values of every column."""
+        return {name: getattr(self, name) for name in self._table.columns}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(id={self.id!r}, user_id={self.user_id!r}, pp={self.pp!r})"
+
+
+class ScoreTable:
+    """
+    Columnar container for large amounts of scores in the lazer format (:class:`SoloScore`).
+    Every column is a numpy array, taking a fixed number of bytes per score.
+
+    Requires numpy, which can be installed with ``pip install osu.py[numpy]``.
+
+    Can be built from the raw json of endpoints returning scores (:func:`from_json`)
+    or from already parsed scores (:func:`from_scores`).
+
+    Indexing with an int returns a :class:`ScoreRow`, indexing with a slice returns a
+    table sharing memory with this one, and indexing with a boolean mask or an
+    array of indices returns a new table. Indexing with a str returns a column.
+
+    **Columns**
+
+    id, user_id, beatmap_id, ruleset_id, total_score, accuracy, pp (nan when missing),
+    rank (index into :class:`ScoreRank`), mods (legacy :class:`Mods` bitmask), max_combo, passed,
+    ended_at (`datetime64[s]` in UTC), and one column per :class:`ScoreDataStatistics` attribute.
+
+    **Attributes**
+
+    columns: Dict[str, :class:`numpy.ndarray`]
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Dict[str, "numpy.ndarray"]):
+        _require_numpy()
+
+        lengths = set(map(len, columns.values()))
+        if len(lengths) > 1:
+            raise ValueError("All columns of a ScoreTable must have the same length")
+
+        self.columns: Dict[str, numpy.ndarray] = columns
+
+    @classmethod
+    def _from_rows(cls, rows: Iterable[tuple]) -> "ScoreTable":
+        _require_numpy()
+        dtype = numpy.dtype(list(SCORE_COLUMNS.items()))
+        records = numpy.array(list(rows), dtype=dtype)
+        # split into separate contiguous columns
+        return cls({name: numpy.ascontiguousarray(records[name]) for name in SCORE_COLUMNS})
+
+    @classmethod
+    def empty(cls) -> "ScoreTable":
+        _require_numpy()
+        return cls({name: numpy.empty(0, dtype=dtype) for name, dtype in SCORE_COLUMNS.items()})
+
+    @classmethod
+    def from_json(cls, data: Union[dict, List[dict]]) -> "ScoreTable":
+        """
+        Create a table from raw json returned by the api, without creating any score objects.
+        Accepts either a list of scores (e.g. `get_user_scores`) or a dict with a
+        `scores` key (e.g. `get_all_scores` and `get_beatmap_scores`).
+
+        .. code:: py
+
+            data = client.http.make_request(Path.get_all_scores(), ruleset="osu")
+            table = ScoreTable.from_json(data)
+
+        **Parameters**
+
+        data: Union[dict, List[dict]]
+
+        **Returns**
+
+        :class:`ScoreTable`
+        """
+        if isinstance(data, dict):
+            data = data["scores"]
+        return cls._from_rows(map(_json_row, data))
+
+    @classmethod
+    def from_scores(cls, scores: Union[Iterable[SoloScore], Any]) -> "ScoreTable":
+        """
+        Create a table from :class:`SoloScore` objects. Also accepts results that have
+        a `scores` attribute, like :class:`GetAllScoresResult` and :class:`BeatmapScores`.
+
+        **Parameters**
+
+        scores: Union[Iterable[:class:`SoloScore`], :class:`GetAllScoresResult`, :class:`BeatmapScores`]
+
+        **Returns**
+
+        :class:`ScoreTable`
+        """
+        scores = getattr(scores, "scores", scores)
+        return cls._from_rows(map(_score_row, scores))
+
+    @classmethod
+    def concat(cls, tables: Sequence["ScoreTable"]) -> "ScoreTable":
+        """
+        Join multiple tables into one, e.g. the pages of :func:`osu.Client.get_all_scores`.
+        """
+        if len(tables) == 0:
+            return cls.empty()
+        return cls({name: numpy.concatenate([table.columns[name] for table in tables]) for name in tables[0].columns})
+
+    def __len__(self):
+        return len(self.columns["id"])
+
+    def __iter__(self) -> Iterator[ScoreRow]:
+        return map(self.row, range(len(self)))
+
+    def __getattr__(self, item):
+        if item == "columns":
+            raise AttributeError(item)
+        try:
+            return self.columns[item]
+        except KeyError:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute {item!r}") from None
+
+    def __getitem__(self, item):
+        if isinstance(item, str):
+            return self.columns[item]
+        if isinstance(item, (int, numpy.integer)):
+            return self.row(item)
+        return self.__class__({name: column[item] for name, column in self.columns.items()})
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rows={len(self)})"
+
+    def row(self, index: int) -> ScoreRow:
+        """
+        Returns a view of the row at `index`.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ScoreTable index out of range")
+        return ScoreRow(self, index)
+
+    def filter(self, mask: Union["numpy.ndarray", Callable[["ScoreTable"], "numpy.ndarray"]]) -> "ScoreTable":
+        """
+        Returns a new table with the rows where `mask` is true.
+
+        .. code:: py
+
+            hidden = table.filter((table.mods & Mods.Hidden) != 0)
+            good = table.filter(lambda t: (t.accuracy > 0.98) & (t.pp > 300))
+
+        **Parameters**
+
+        mask: Union[:class:`numpy.ndarray`, Callable[[:class:`ScoreTable`], :class:`numpy.ndarray`]]
+            Boolean array or a function that takes this table and returns one.
+
+        **Returns**
+
+        :class:`ScoreTable`
+        """
+        if callable(mask):
+            mask = mask(self)
+        return self[numpy.asarray(mask, dtype=bool)]
+
+    def sort(self, column: Union[str, Sequence[str]], descending: bool = False) -> "ScoreTable":
+        """
+        Returns a new table sorted by one or more columns (the first column being the primary key).
+        The sort is stable, also when descending, and nan values are last.
+
+        **Parameters**
+
+        column: Union[str, Sequence[str]]
+
+        descending: bool
+
+        **Returns**
+
+        :class:`ScoreTable`
+        """
+        columns = [column] if isinstance(column, str) else list(column)
+        keys = [self.columns[name] for name in reversed(columns)]
+        if descending:
+            # rather than reversing the order, which would also reverse ties and put nan first
+            keys = list(map(_descending_key, keys))
+        return self[numpy.lexsort(keys)]
+
+    def groups(self, column: str) -> Iterator[Tuple[Any, "ScoreTable"]]:
+        """
+        Iterate over (key, table) pairs for each unique value of `column`.
+        The tables of the groups are slices of one sorted copy, so no extra copy is made per group.
+
+        **Parameters**
+
+        column: str
+
+        **Returns**
+
+        Iterator[Tuple[Any, :class:`ScoreTable`]]
+        """
+        table, keys, starts = self._group_bounds(column)
+        ends = numpy.append(starts[1:], len(table))
+        for key, start, end in zip(keys.tolist(), starts.tolist(), ends.tolist()):
+            yield key, table[start:end]
+
+    def group_by(self, column: str, **aggregations: str) -> Dict[str, "numpy.ndarray"]:
+        """
+        Vectorized group-by. Returns a dict of columns with the unique keys
+        under the name of `column` and one column per aggregation.
+
+        Supported aggregations are `sum`, `min`, `max`, `mean`, `count`, and `first`
+        (first row of each group in the current order). `sum`, `min`, `max`, and `mean` ignore nan values,
+        and are nan for groups with only nan values (0 for `sum`). `count` is the number of rows.
+
+        .. code:: py
+
+            per_user = table.group_by("user_id", pp="max", total_score="sum", id="count")
+
+        **Parameters**
+
+        column: str
+            Column to group by.
+
+        aggregations: str
+            Column name to aggregation name.
+
+        **Returns**
+
+        Dict[str, :class:`numpy.ndarray`]
+        """
+        table, keys, starts = self._group_bounds(column)
+        counts = numpy.diff(numpy.append(starts, len(table)))
+        result = {column: keys}
+        for name, aggregation in aggregations.items():
+            values = table.columns[name]
+            if len(table) == 0:
+                result[name] = values[:0]
+            elif aggregation == "sum":
+                result[name] = numpy.add.reduceat(_zero_nan(values), starts)
+            elif aggregation == "min":
+                result[name] = numpy.fmin.reduceat(values, starts)
+            elif aggregation == "max":
+                result[name] = numpy.fmax.reduceat(values, starts)
+            elif aggregation == "mean":
+                present = numpy.add.reduceat(~_isnan(values), starts)
+                with numpy.errstate(invalid="ignore", divide="ignore"):
+                    result[name] = numpy.add.reduceat(_zero_nan(values).astype(numpy.float64), starts) / present
+            elif aggregation == "count":
+                result[name] = counts
+            elif aggregation == "first":
+                result[name] = values[starts]
+            else:
+                raise ValueError(f"Unsupported aggregation: {aggregation!r}")
+        return result
+
+    def _group_bounds(self, column: str):
+        keys = self.columns[column]
+        order = numpy.argsort(keys, kind="stable")
+        table = self[order]
+        unique, starts = numpy.unique(table.columns[column], return_index=True)
+        return table, unique, starts
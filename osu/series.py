@@ -0,0 +1,333 @@
+from array import array
+from collections.abc import Sequence as _Sequence
+from datetime import date, datetime
+from operator import index as _index
+from pickle import PickleBuffer
+from typing import Iterable, List, Optional, Sequence, Type, Union
+
+# imported on first use by _require_numpy, since this module is imported with osu.objects
+numpy = None
+
+
+__all__ = (
+    "IntSeries",
+    "DatedCountSeries",
+    "stack_series",
+    "sum_series",
+    "percentile_series",
+    "diff_series",
+)
+
+
+def _require_numpy():
+    global numpy
+    if numpy is not None:
+        return
+
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError(
+            "Missing numpy package, which is required for vectorized series operations. "
+            'Install osu.py with the numpy feature: "pip install osu.py[numpy]"'
+        ) from None
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    # linear interpolation, same as numpy's default method
+    if len(values) == 0:
+        raise ValueError("Cannot compute percentile of an empty series")
+    if not 0 <= q <= 100:
+        raise ValueError("Percentile must be in the range [0, 100]")
+
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+def _series_from_buffer(cls, typecode: str, buffer) -> "IntSeries":
+    series = cls(typecode)
+    series.frombytes(memoryview(buffer).cast("B"))
+    return series
+
+
+class IntSeries(array):
+    """
+    Compact sequence of integers backed by :py:class:`array.array`.
+    Behaves like a list of ints (indexing, slicing, iteration, comparison with lists)
+    while storing the values unboxed.
+
+    Used for attributes like :class:`RankHistory`.data and :class:`Failtimes`.exit/fail.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_list(cls, values: Iterable[int]) -> "IntSeries":
+        """
+        Create a series from a list of ints. Values that don't fit in
+        32 bits are stored as 64-bit integers instead.
+        """
+        # an iterator would be partly consumed by the first attempt
+        values = list(values)
+        try:
+            return cls("i", values)
+        except OverflowError:
+            return cls("q", values)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.__class__(self.typecode, array.__getitem__(self, item))
+        return array.__getitem__(self, item)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return array.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.tolist()!r})"
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            # lets pickle protocol 5 transfer the data out-of-band
+            return _series_from_buffer, (self.__class__, self.typecode, PickleBuffer(self))
+        return self.__class__, (self.typecode, self.tobytes())
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """
+        Returns a numpy array sharing memory with this series (no copy is made).
+        """
+        _require_numpy()
+        return numpy.frombuffer(self, dtype=numpy.int32 if self.typecode == "i" else numpy.int64)
+
+    def sum(self) -> int:
+        """Sum of all values."""
+        return sum(self)
+
+    def percentile(self, q: float) -> float:
+        """
+        q-th percentile of the values (0-100), using linear interpolation.
+        """
+        return _percentile(self, q)
+
+    def diff(self) -> "IntSeries":
+        """
+        Differences between consecutive values. The result is one item shorter than the series.
+        """
+        return self.__class__(self.typecode, (b - a for a, b in zip(self, self[1:])))
+
+
+def _same_month(a, b) -> bool:
+    try:
+        return a.start_date == b.start_date and a.count == b.count
+    except AttributeError:
+        return False
+
+
+class DatedCountSeries(_Sequence):
+    """
+    Compact, read-only sequence of monthly counts.
+    Start dates and counts are stored in arrays and items are created on access.
+    It's a :py:class:`collections.abc.Sequence`, and since items are created on access, membership
+    tests, :func:`index` and :func:`count` compare items by their start date and count.
+
+    Used for :class:`UserCompact`.monthly_playcounts and :class:`UserCompact`.replays_watched_counts.
+    Items are instances of the class given on creation, which must have
+    ``start_date`` and ``count`` slots.
+
+    **Attributes**
+
+    counts: :class:`IntSeries`
+        Count for each month, from oldest to newest.
+    """
+
+    __slots__ = ("_item_cls", "_as_datetime", "_ordinals", "counts")
+
+    def __init__(self, item_cls: Type, ordinals: array, counts: IntSeries, as_datetime: bool = False):
+        self._item_cls = item_cls
+        self._as_datetime: bool = as_datetime
+        self._ordinals: array = ordinals
+        self.counts: IntSeries = counts
+
+    @classmethod
+    def from_data(cls, data: List[dict], item_cls: Type, as_datetime: bool = False) -> "DatedCountSeries":
+        ordinals = array("i", (date.fromisoformat(item["start_date"][:10]).toordinal() for item in data))
+        counts = IntSeries.from_list([item["count"] for item in data])
+        return cls(item_cls, ordinals, counts, as_datetime)
+
+    @property
+    def start_dates(self) -> List[Union[date, datetime]]:
+        """Start date of each month."""
+        return list(map(self._get_date, self._ordinals))
+
+    def _get_date(self, ordinal: int) -> Union[date, datetime]:
+        return datetime.fromordinal(ordinal) if self._as_datetime else date.fromordinal(ordinal)
+
+    def _get_item(self, index: int):
+        item = self._item_cls.__new__(self._item_cls)
+        item.start_date = self._get_date(self._ordinals[index])
+        item.count = self.counts[index]
+        return item
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.__class__(self._item_cls, self._ordinals[item], self.counts[item], self._as_datetime)
+        item = _index(item)
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("series index out of range")
+        return self._get_item(item)
+
+    def __iter__(self):
+        return map(self._get_item, range(len(self)))
+
+    def __reversed__(self):
+        return map(self._get_item, reversed(range(len(self))))
+
+    def __contains__(self, value):
+        return any(_same_month(item, value) for item in self)
+
+    def index(self, value, start: int = 0, stop: Optional[int] = None) -> int:
+        """Index of the first item with the same start date and count as `value`."""
+        for i in range(*slice(start, stop).indices(len(self))):
+            if _same_month(self._get_item(i), value):
+                return i
+        raise ValueError(f"{value!r} is not in series")
+
+    def count(self, value) -> int:
+        """Number of items with the same start date and count as `value`."""
+        return sum(1 for item in self if _same_month(item, value))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, DatedCountSeries)):
+            return len(self) == len(other) and all(map(_same_month, self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def sum(self) -> int:
+        """Sum of all counts."""
+        return self.counts.sum()
+
+    def percentile(self, q: float) -> float:
+        """q-th percentile of the counts (0-100)."""
+        return self.counts.percentile(q)
+
+    def diff(self) -> IntSeries:
+        """Differences between consecutive counts."""
+        return self.counts.diff()
+
+
+def _as_int_series(series) -> Optional[IntSeries]:
+    if series is None:
+        return None
+    if isinstance(series, DatedCountSeries):
+        return series.counts
+    return series
+
+
+def stack_series(
+    series: Sequence[Optional[Union[IntSeries, DatedCountSeries, Sequence[int]]]], fill: float = float("nan")
+) -> "numpy.ndarray":
+    """
+    Stack many series into a 2d float array with one row per series.
+    Series of different lengths are aligned by their last (newest) value and
+    padded at the start with `fill`. `None` becomes a row of `fill`.
+
+    Requires numpy.
+
+    **Parameters**
+
+    series: Sequence[Optional[Union[:class:`IntSeries`, :class:`DatedCountSeries`, Sequence[int]]]]
+
+    fill: float
+        Value used for padding. Defaults to nan, which the other aggregate functions ignore.
+
+    **Returns**
+
+    :class:`numpy.ndarray`
+    """
+    _require_numpy()
+
+    series = list(map(_as_int_series, series))
+    width = max((len(s) for s in series if s is not None), default=0)
+    out = numpy.full((len(series), width), fill, dtype=numpy.float64)
+    for i, s in enumerate(series):
+        if s is None or len(s) == 0:
+            continue
+        out[i, width - len(s) :] = s.to_numpy() if isinstance(s, IntSeries) else s
+    return out
+
+
+def sum_series(series, axis: int = 1) -> "numpy.ndarray":
+    """
+    Sum many series at once, ignoring padding. Requires numpy.
+
+    **Parameters**
+
+    series: Sequence[Optional[Union[:class:`IntSeries`, :class:`DatedCountSeries`, Sequence[int]]]]
+
+    axis: int
+        1 for the sum of each series (e.g. total playcount per user) or 0 for the
+        element-wise sum across series (e.g. combined failtimes of many beatmaps).
+
+    **Returns**
+
+    :class:`numpy.ndarray`
+    """
+    stacked = stack_series(series)
+    return numpy.nansum(stacked, axis=axis)
+
+
+def percentile_series(series, q: Union[float, Sequence[float]], axis: int = 1) -> "numpy.ndarray":
+    """
+    Percentile(s) of many series at once, ignoring padding. Requires numpy.
+
+    **Parameters**
+
+    series: Sequence[Optional[Union[:class:`IntSeries`, :class:`DatedCountSeries`, Sequence[int]]]]
+
+    q: Union[float, Sequence[float]]
+        Percentile(s) in the range [0, 100].
+
+    axis: int
+        1 for percentiles of each series or 0 for element-wise percentiles across series.
+
+    **Returns**
+
+    :class:`numpy.ndarray`
+    """
+    stacked = stack_series(series)
+    return numpy.nanpercentile(stacked, q, axis=axis)
+
+
+def diff_series(series) -> "numpy.ndarray":
+    """
+    Differences between consecutive values of many series at once. Requires numpy.
+    Returns a 2d array with one row per series, where padding yields nan.
+
+    **Parameters**
+
+    series: Sequence[Optional[Union[:class:`IntSeries`, :class:`DatedCountSeries`, Sequence[int]]]]
+
+    **Returns**
+
+    :class:`numpy.ndarray`
+    """
+    stacked = stack_series(series)
+    return numpy.diff(stacked, axis=1)
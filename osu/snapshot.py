@@ -0,0 +1,257 @@
+import importlib
+import pkgutil
+from array import array
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Tuple, Type, TypeVar
+
+from . import objects, results, enums
+from .enums import PartialEnum
+from .series import IntSeries, DatedCountSeries
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+__all__ = (
+    "to_state",
+    "from_state",
+    "dump_snapshot",
+    "load_snapshot",
+)
+
+
+_T = TypeVar("_T")
+
+EXT_UNSET = 0
+EXT_MODEL = 1
+EXT_ENUM = 2
+EXT_PARTIAL_ENUM = 3
+EXT_DATETIME = 4
+EXT_DATE = 5
+EXT_NAMEDTUPLE = 6
+EXT_INT_SERIES = 7
+EXT_DATED_SERIES = 8
+
+_UNSET_EXT = None
+_slot_cache: Dict[type, Tuple[str, ...]] = {}
+_classes: Dict[str, type] = {}
+
+
+def _require_msgpack():
+    if msgpack is None:
+        raise RuntimeError(
+            "Missing msgpack package, which is required for snapshots. "
+            'Install osu.py with the snapshot feature: "pip install osu.py[snapshot]"'
+        )
+
+
+def _get_classes() -> Dict[str, type]:
+    # every class defined in osu.objects, osu.results, and osu.enums by name (names are unique)
+    if not _classes:
+        modules = [results, enums]
+        for info in pkgutil.iter_modules(objects.__path__):
+            modules.append(importlib.import_module(f"{objects.__name__}.{info.name}"))
+        for module in modules:
+            for value in vars(module).values():
+                if isinstance(value, type) and value.__module__ == module.__name__:
+                    _classes[value.__name__] = value
+    return _classes
+
+
+def _get_slots(cls: type) -> Tuple[str, ...]:
+    try:
+        return _slot_cache[cls]
+    except KeyError:
+        pass
+
+    slots = []
+    for base in reversed(cls.__mro__):
+        base_slots = base.__dict__.get("__slots__", ())
+        if isinstance(base_slots, str):
+            base_slots = (base_slots,)
+        slots.extend(slot for slot in base_slots if slot not in slots and slot != "__weakref__")
+    _slot_cache[cls] = slots = tuple(slots)
+    return slots
+
+
+def to_state(obj: Any) -> Dict[str, Any]:
+    """
+    Get the state of a model from :mod:`osu.objects` or :mod:`osu.results` as a dict of its attributes.
+    The state is shallow, meaning nested models are not converted.
+
+    **Parameters**
+
+    obj: Any
+        Model object
+
+    **Returns**
+
+    Dict[str, Any]
+    """
+    state = {}
+    for slot in _get_slots(type(obj)):
+        try:
+            state[slot] = getattr(obj, slot)
+        except AttributeError:
+            pass
+    return state
+
+
+def from_state(cls: Type[_T], state: Dict[str, Any]) -> _T:
+    """
+    Restore a model from a state returned by :func:`to_state`.
+    The attributes are assigned directly, so no parsing happens.
+
+    **Parameters**
+
+    cls: type
+        Class of the model
+
+    state: Dict[str, Any]
+
+    **Returns**
+
+    An object of type `cls`
+    """
+    obj = cls.__new__(cls)
+    for name, value in state.items():
+        # bypasses __setattr__ of the frozen result dataclasses
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+def _default(obj):
+    if isinstance(obj, Enum):
+        return msgpack.ExtType(EXT_ENUM, _packb([type(obj).__name__, obj.value]))
+    if isinstance(obj, PartialEnum):
+        return msgpack.ExtType(EXT_PARTIAL_ENUM, _packb(obj.value))
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(EXT_DATE, _packb(obj.toordinal()))
+    if isinstance(obj, IntSeries):
+        return msgpack.ExtType(EXT_INT_SERIES, obj.typecode.encode() + obj.tobytes())
+    if isinstance(obj, DatedCountSeries):
+        return msgpack.ExtType(
+            EXT_DATED_SERIES,
+            _packb(
+                [
+                    obj._item_cls.__name__,
+                    obj._as_datetime,
+                    obj._ordinals.tobytes(),
+                    obj.counts.typecode,
+                    obj.counts.tobytes(),
+                ]
+            ),
+        )
+    if isinstance(obj, tuple):
+        if hasattr(obj, "_fields"):
+            return msgpack.ExtType(EXT_NAMEDTUPLE, _packb([type(obj).__name__, *obj]))
+        return list(obj)
+
+    cls = type(obj)
+    if _get_classes().get(cls.__name__) is not cls:
+        raise TypeError(f"Cannot serialize object of type {cls.__name__}")
+    values = [cls.__name__]
+    for slot in _get_slots(cls):
+        values.append(getattr(obj, slot, _UNSET_EXT))
+    return msgpack.ExtType(EXT_MODEL, _packb(values))
+
+
+def _namedtuples() -> Dict[str, type]:
+    from .objects.user import GradeCounts, Level
+
+    return {"GradeCounts": GradeCounts, "Level": Level}
+
+
+def _ext_hook(code: int, data: bytes):
+    if code == EXT_UNSET:
+        return _UNSET_EXT
+    if code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == EXT_INT_SERIES:
+        series = IntSeries(chr(data[0]))
+        series.frombytes(data[1:])
+        return series
+
+    value = _unpackb(data)
+    if code == EXT_MODEL:
+        cls = _get_classes()[value[0]]
+        obj = cls.__new__(cls)
+        for slot, slot_value in zip(_get_slots(cls), value[1:]):
+            if slot_value is not _UNSET_EXT:
+                object.__setattr__(obj, slot, slot_value)
+        return obj
+    if code == EXT_ENUM:
+        return _get_classes()[value[0]](value[1])
+    if code == EXT_PARTIAL_ENUM:
+        return PartialEnum(value)
+    if code == EXT_DATE:
+        return date.fromordinal(value)
+    if code == EXT_NAMEDTUPLE:
+        return _namedtuples()[value[0]](*value[1:])
+    if code == EXT_DATED_SERIES:
+        item_cls, as_datetime, ordinals, typecode, counts = value
+        series = IntSeries(typecode)
+        series.frombytes(counts)
+        ordinal_array = array("i")
+        ordinal_array.frombytes(ordinals)
+        return DatedCountSeries(_get_classes()[item_cls], ordinal_array, series, as_datetime)
+    return msgpack.ExtType(code, data)
+
+
+def _packb(obj) -> bytes:
+    return msgpack.packb(obj, default=_default, strict_types=True, use_bin_type=True)
+
+
+def _unpackb(data: bytes):
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+
+
+def dump_snapshot(obj: Any) -> bytes:
+    """
+    Serialize models (or lists/dicts of them) into a compact msgpack snapshot.
+    Enums, :class:`PartialEnum`, datetimes, and the series types are preserved.
+
+    Requires msgpack, which can be installed with ``pip install osu.py[snapshot]``.
+
+    .. note::
+
+        Snapshots store the models by class name and attribute order,
+        so they should be loaded with the same version of osu.py they were made with.
+
+    **Parameters**
+
+    obj: Any
+
+    **Returns**
+
+    bytes
+    """
+    _require_msgpack()
+    return _packb(obj)
+
+
+def load_snapshot(data: bytes) -> Any:
+    """
+    Load a snapshot made with :func:`dump_snapshot`. Models are restored without running their parsing code.
+
+    Requires msgpack, which can be installed with ``pip install osu.py[snapshot]``.
+
+    **Parameters**
+
+    data: bytes
+
+    **Returns**
+
+    Any
+    """
+    _require_msgpack()
+    return _unpackb(data)
+
+
+if msgpack is not None:
+    _UNSET_EXT = msgpack.ExtType(EXT_UNSET, b"")
@@ -0,0 +1,199 @@
+import codecs
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+__all__ = ("JSONStreamParser",)
+
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+# states. a closing bracket is only allowed first, not after a comma
+_START = 0
+_FIRST_KEY = 1
+_KEY = 2
+_COLON = 3
+_VALUE = 4
+_AFTER_VALUE = 5
+_FIRST_ELEMENT = 6
+_ELEMENT = 7
+_AFTER_ELEMENT = 8
+_END = 9
+
+
+class JSONStreamParser:
+    """
+    Incrementally parses a json object or array as its bytes arrive, so the elements of its top-level
+    arrays are available before the whole body is received. Only one element (or other top-level value)
+    is held in memory at a time, rather than the whole body.
+
+    Each top-level value is returned as a ``(key, value)`` tuple, where the elements of an array are
+    returned one at a time with the array's key. If the body itself is an array, the key is None.
+
+    .. code:: py
+
+        parser = JSONStreamParser({"users": UserCompact})
+        for chunk in chunks:
+            for key, value in parser.feed(chunk):
+                ...
+        parser.close()
+
+    **Init Parameters**
+
+    parsers: Optional[Dict[Optional[str], Callable[[Any], Any]]]
+        Functions applied to the values of each key (or each element, for arrays).
+        Values of other keys are returned as decoded.
+    """
+
+    __slots__ = ("parsers", "_decoder", "_text_decoder", "_buffer", "_pos", "_state", "_is_array", "_key", "_retry_at")
+
+    def __init__(self, parsers: Optional[Dict[Optional[str], Callable[[Any], Any]]] = None):
+        self.parsers: Dict[Optional[str], Callable[[Any], Any]] = {} if parsers is None else parsers
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._state: int = _START
+        self._is_array: bool = False
+        self._key: Optional[str] = None
+        # buffer length needed before trying to decode an incomplete value again,
+        # so large values aren't re-decoded for every small chunk
+        self._retry_at: int = 0
+
+    def feed(self, data: bytes) -> List[Tuple[Optional[str], Any]]:
+        """
+        Add the next chunk of the body and return the values completed by it.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(data)
+        self._retry_at -= self._pos
+        self._pos = 0
+        return self._parse(False)
+
+    def close(self) -> List[Tuple[Optional[str], Any]]:
+        """
+        Signal the end of the body and return any remaining values.
+
+        **Raises**
+
+        ValueError
+            If the body is incomplete or isn't a json object or array.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(b"", final=True)
+        self._pos = 0
+        self._retry_at = 0
+        items = self._parse(True)
+        if self._state != _END:
+            raise ValueError("Incomplete json body")
+        if self._buffer[self._pos :].strip(_WHITESPACE):
+            raise ValueError("Extra data after json body")
+        return items
+
+    def _skip_whitespace(self) -> bool:
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode_value(self, final: bool):
+        """returns (True, value) if a whole value is buffered, otherwise (False, None)"""
+        if not final and len(self._buffer) < self._retry_at:
+            return False, None
+
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise ValueError("Invalid or incomplete json body") from None
+            self._retry_at = self._pos + 2 * (len(self._buffer) - self._pos)
+            return False, None
+
+        # a number at the end of the buffer may continue in the next chunk, and
+        # raw_decode stops a number early if it ends in a partial fraction or exponent ("1." or "1e")
+        if not final and (
+            end == len(self._buffer) or (type(value) in (int, float) and self._buffer[end] in _NUMBER_CHARS)
+        ):
+            return False, None
+
+        self._pos = end
+        self._retry_at = 0
+        return True, value
+
+    def _parse(self, final: bool) -> List[Tuple[Optional[str], Any]]:
+        items = []
+        while self._state != _END and self._skip_whitespace():
+            char = self._buffer[self._pos]
+
+            if self._state == _START:
+                if char not in "{[":
+                    raise ValueError("Expected a json object or array")
+                self._is_array = char == "["
+                self._state = _FIRST_ELEMENT if self._is_array else _FIRST_KEY
+                self._pos += 1
+
+            elif self._state == _FIRST_KEY or self._state == _KEY:
+                if char == "}" and self._state == _FIRST_KEY:
+                    self._pos += 1
+                    self._state = _END
+                    continue
+                if char != '"':
+                    raise ValueError(f"Expected a key but got {char!r}")
+                complete, self._key = self._decode_value(final)
+                if not complete:
+                    break
+                self._state = _COLON
+
+            elif self._state == _COLON:
+                if char != ":":
+                    raise ValueError(f"Expected ':' but got {char!r}")
+                self._pos += 1
+                self._state = _VALUE
+
+            elif self._state == _VALUE:
+                if char == "[":
+                    self._pos += 1
+                    self._state = _FIRST_ELEMENT
+                    continue
+                if char in ",]}":
+                    raise ValueError(f"Expected a value but got {char!r}")
+                complete, value = self._decode_value(final)
+                if not complete:
+                    break
+                items.append(self._make_item(value))
+                self._state = _AFTER_VALUE
+
+            elif self._state == _AFTER_VALUE:
+                if char not in ",}":
+                    raise ValueError(f"Expected ',' or '}}' but got {char!r}")
+                self._pos += 1
+                self._state = _KEY if char == "," else _END
+
+            elif self._state == _FIRST_ELEMENT or self._state == _ELEMENT:
+                if char == "]" and self._state == _FIRST_ELEMENT:
+                    self._pos += 1
+                    self._state = _END if self._is_array else _AFTER_VALUE
+                    continue
+                if char in ",]}":
+                    raise ValueError(f"Expected a value but got {char!r}")
+                complete, value = self._decode_value(final)
+                if not complete:
+                    break
+                items.append(self._make_item(value))
+                self._state = _AFTER_ELEMENT
+
+            elif self._state == _AFTER_ELEMENT:
+                if char not in ",]":
+                    raise ValueError(f"Expected ',' or ']' but got {char!r}")
+                self._pos += 1
+                if char == ",":
+                    self._state = _ELEMENT
+                else:
+                    self._state = _END if self._is_array else _AFTER_VALUE
+
+        return items
+
+    def _make_item(self, value) -> Tuple[Optional[str], Any]:
+        parse = self.parsers.get(self._key)
+        return self._key, value if parse is None else parse(value)
@@ -0,0 +1,2 @@
+from .server import *
+from .payloads import *
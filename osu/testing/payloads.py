@@ -0,0 +1,135 @@
+from typing import Dict, Any
+
+
+__all__ = ("make_user", "make_beatmap", "make_beatmapset")
+
+
+# Synthetic responses shaped like the api's, for the endpoints used most.
+# Every required attribute of the models is filled in, so they can be parsed normally.
+
+_TIMESTAMP = "2020-01-01T00:00:00+00:00"
+
+
+def make_user(user_id: int) -> Dict[str, Any]:
+    """
+    Returns a response of users/{user}/{mode} for a made-up user, which can be parsed by :class:`osu.User`.
+    """
+    return {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "avatar_url": f"https://a.ppy.sh/{user_id}",
+        "country_code": "US",
+        "default_group": "default",
+        "is_active": True,
+        "is_bot": False,
+        "is_deleted": False,
+        "is_online": False,
+        "is_supporter": False,
+        "last_visit": _TIMESTAMP,
+        "pm_friends_only": False,
+        "profile_colour": None,
+        "cover_url": "",
+        "discord": None,
+        "has_supported": False,
+        "interests": None,
+        "join_date": _TIMESTAMP,
+        "kudosu": {"available": 0, "total": 0},
+        "location": None,
+        "max_blocks": 50,
+        "max_friends": 250,
+        "occupation": None,
+        "playmode": "osu",
+        "playstyle": ["keyboard", "mouse"],
+        "post_count": 0,
+        "profile_hue": None,
+        "profile_order": ["me", "recent_activity", "top_ranks", "medals", "historical", "beatmaps", "kudosu"],
+        "title": None,
+        "title_url": None,
+        "twitter": None,
+        "website": None,
+    }
+
+
+def make_beatmapset(beatmapset_id: int) -> Dict[str, Any]:
+    """
+    Returns a response of beatmapsets/{beatmapset} for a made-up beatmapset,
+    which can be parsed by :class:`osu.Beatmapset`.
+    """
+    covers = {
+        key: f"https://assets.ppy.sh/beatmaps/{beatmapset_id}/covers/{key}.jpg"
+        for key in ("cover", "cover@2x", "card", "card@2x", "list", "list@2x", "slimcover", "slimcover@2x")
+    }
+    return {
+        "artist": "artist",
+        "artist_unicode": "artist",
+        "covers": covers,
+        "creator": "mapper",
+        "favourite_count": 0,
+        "hype": None,
+        "id": beatmapset_id,
+        "nsfw": False,
+        "offset": 0,
+        "play_count": 0,
+        "preview_url": f"//b.ppy.sh/preview/{beatmapset_id}.mp3",
+        "source": "",
+        "spotlight": False,
+        "status": "ranked",
+        "title": f"beatmapset {beatmapset_id}",
+        "title_unicode": f"beatmapset {beatmapset_id}",
+        "track_id": None,
+        "user_id": 2,
+        "video": False,
+        "availability": {"download_disabled": False, "more_information": None},
+        "bpm": 180.0,
+        "can_be_hyped": False,
+        "deleted_at": None,
+        "discussion_locked": False,
+        "is_scoreable": True,
+        "last_updated": _TIMESTAMP,
+        "legacy_thread_url": None,
+        "nominations_summary": {"current": 2, "required": 2},
+        "ranked": 1,
+        "ranked_date": _TIMESTAMP,
+        "storyboard": False,
+        "submitted_date": _TIMESTAMP,
+        "tags": "",
+    }
+
+
+def make_beatmap(beatmap_id: int) -> Dict[str, Any]:
+    """
+    Returns a response of beatmaps/{beatmap} for a made-up beatmap, which can be parsed by :class:`osu.Beatmap`.
+    """
+    return {
+        "beatmapset_id": beatmap_id,
+        "difficulty_rating": 5.0,
+        "id": beatmap_id,
+        "mode": "osu",
+        "status": "ranked",
+        "total_length": 120,
+        "user_id": 2,
+        "version": "Insane",
+        "checksum": f"{beatmap_id:032x}",
+        "max_combo": 500,
+        "accuracy": 8.0,
+        "ar": 9.0,
+        "bpm": 180.0,
+        "convert": False,
+        "count_circles": 300,
+        "count_sliders": 100,
+        "count_spinners": 1,
+        "cs": 4.0,
+        "deleted_at": None,
+        "drain": 6.0,
+        "hit_length": 110,
+        "is_scoreable": True,
+        "last_updated": _TIMESTAMP,
+        "mode_int": 0,
+        "passcount": 0,
+        "playcount": 0,
+        "ranked": 1,
+        "url": f"https://osu.ppy.sh/beatmaps/{beatmap_id}",
+        "beatmapset": make_beatmapset(beatmap_id),
+        "failtimes": {"fail": [0] * 100, "exit": [0] * 100},
+        "owners": [{"id": 2, "username": "mapper"}],
+    }
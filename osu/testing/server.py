@@ -0,0 +1,387 @@
+import asyncio
+import inspect
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+from ..path import Path
+from .payloads import make_user, make_beatmap, make_beatmapset
+
+
+__all__ = ("StandInServer", "DEFAULT_FIXTURES")
+
+
+def _to_id(value: str) -> int:
+    # users can be looked up by username (e.g. @peppy), which gets a made-up id
+    try:
+        return int(value)
+    except ValueError:
+        return 1
+
+
+def _query_ids(request) -> List[int]:
+    return [int(value) for value in request.query.getall("ids[]", [])]
+
+
+DEFAULT_FIXTURES: Dict[str, Any] = {
+    "GET users/{user}/{mode}": lambda request, params: make_user(_to_id(params["user"])),
+    "GET me/{mode}": lambda request, params: make_user(2),
+    "GET users": lambda request, params: {"users": list(map(make_user, _query_ids(request)))},
+    "GET beatmaps/{beatmap}": lambda request, params: make_beatmap(_to_id(params["beatmap"])),
+    "GET beatmaps": lambda request, params: {"beatmaps": list(map(make_beatmap, _query_ids(request)))},
+    "GET beatmapsets/{beatmapset}": lambda request, params: make_beatmapset(_to_id(params["beatmapset"])),
+}
+
+
+_Route = Tuple[str, str, Pattern]
+
+
+def _build_routes() -> List[_Route]:
+    routes = {}
+    for name, value in vars(Path).items():
+        if not isinstance(value, classmethod):
+            continue
+
+        params = list(inspect.signature(value.__func__).parameters)[1:]
+        path = getattr(Path, name)(*("{%s}" % param for param in params))
+        parts = re.split(r"{(\w+)}", path.template)
+        pattern = "".join(re.escape(part) if i % 2 == 0 else f"(?P<{part}>[^/]*)" for i, part in enumerate(parts))
+        routes[(path.method.upper(), path.template)] = re.compile(pattern + "/?")
+
+    # more specific templates first, so scores/{score}/download isn't taken for scores/{mode}/{score}
+    return sorted(
+        ((method, template, pattern) for (method, template), pattern in routes.items()),
+        key=lambda route: (-len(re.sub(r"{\w+}", "", route[1])), -route[1].count("/")),
+    )
+
+
+class StandInServer:
+    """
+    Local stand-in for the osu! api, for testing and benchmarking without credentials or a network connection.
+    It serves every endpoint in :class:`osu.Path` from fixtures, issues tokens, and can add latency and
+    inject rate limit (429) and server (5xx) errors. Point a client at it with :func:`osu.Client.set_domain`.
+
+    .. code:: py
+
+        async with StandInServer(latency=0.05, jitter=0.02) as server:
+            client = AsynchronousClient.from_credentials(1, "secret", None, request_wait_time=0)
+            client.set_domain(server.domain)
+            user = await client.get_user(2)
+
+        # or for synchronous code, running the server in a background thread
+        with StandInServer() as server:
+            client = Client.from_credentials(1, "secret", None, request_wait_time=0)
+            client.set_domain(server.domain)
+
+    Fixtures are keyed by the path template of an endpoint, optionally prefixed with the http method
+    (e.g. ``"GET users/{user}/{mode}"``), which is the same as :attr:`osu.Path.template`. A fixture is either the json
+    body to respond with, bytes, or a function taking the :class:`aiohttp.web.Request` and a dict of the path
+    parameters, and returning one of those or an :class:`aiohttp.web.Response`. Functions can be coroutine functions.
+    Requests to endpoints without a fixture get a 404 response. :data:`DEFAULT_FIXTURES` has made-up users
+    and beatmaps.
+
+    Requires aiohttp, which can be installed with ``pip install osu.py[async]``.
+
+    **Init Parameters**
+
+    fixtures: Optional[Dict[str, Any]]
+        Defaults to :data:`DEFAULT_FIXTURES`.
+
+    latency: float
+        Seconds to wait before responding. Defaults to 0.
+
+    jitter: Union[float, Callable[[:class:`random.Random`], float]]
+        Scale of the random delay added to `latency`, or a function returning the delay in seconds. Defaults to 0.
+
+    jitter_distribution: str
+        Distribution of the random delay when `jitter` is a number: ``uniform`` (between 0 and `jitter`),
+        ``normal`` (absolute value, with `jitter` as the standard deviation), or ``exponential``
+        (with `jitter` as the mean). Defaults to ``uniform``.
+
+    error_rate: float
+        Fraction of requests answered with a status from `error_statuses`. Defaults to 0.
+
+    error_statuses: Sequence[int]
+        Defaults to 500, 502, and 503. 503 responses have a Retry-After header.
+
+    throttle_rate: float
+        Fraction of requests answered with 429 and a Retry-After header. Defaults to 0.
+
+    retry_after: float
+        Seconds in the Retry-After header of injected errors. Defaults to 1.
+
+    limit_per_minute: Optional[int]
+        Answer with 429 once this many requests were made in the last minute, like the api does.
+        Retry-After is the seconds until a request can be made again. Defaults to no limit.
+
+    require_auth: bool
+        Answer requests without an Authorization header with 401. Defaults to true.
+
+    seed: Optional[int]
+        Seed of the random delays and errors, for reproducible runs.
+
+    host: str
+        Defaults to 127.0.0.1.
+
+    port: int
+        Defaults to 0, which picks a free port.
+
+    **Attributes**
+
+    requests: :class:`collections.Counter`
+        Number of requests to each endpoint, keyed by method and template (e.g. ``GET users/{user}/{mode}``).
+
+    tokens_issued: int
+
+    throttled: int
+        Number of 429 responses.
+
+    errors: int
+        Number of injected 5xx responses.
+    """
+
+    __slots__ = (
+        "fixtures",
+        "latency",
+        "jitter",
+        "jitter_distribution",
+        "error_rate",
+        "error_statuses",
+        "throttle_rate",
+        "retry_after",
+        "limit_per_minute",
+        "require_auth",
+        "host",
+        "port",
+        "requests",
+        "tokens_issued",
+        "throttled",
+        "errors",
+        "_random",
+        "_routes",
+        "_sent",
+        "_runner",
+        "_loop",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        fixtures: Optional[Dict[str, Any]] = None,
+        latency: float = 0.0,
+        jitter: Union[float, Callable[[random.Random], float]] = 0.0,
+        jitter_distribution: str = "uniform",
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503),
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        limit_per_minute: Optional[int] = None,
+        require_auth: bool = True,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if web is None:
+            raise RuntimeError(
+                "Missing aiohttp package, which is required for StandInServer. "
+                'Install osu.py with the async feature: "pip install osu.py[async]"'
+            )
+        if jitter_distribution not in ("uniform", "normal", "exponential"):
+            raise ValueError("jitter_distribution must be uniform, normal, or exponential")
+
+        self.fixtures: Dict[str, Any] = dict(DEFAULT_FIXTURES if fixtures is None else fixtures)
+        self.latency: float = latency
+        self.jitter: Union[float, Callable[[random.Random], float]] = jitter
+        self.jitter_distribution: str = jitter_distribution
+        self.error_rate: float = error_rate
+        self.error_statuses: Sequence[int] = error_statuses
+        self.throttle_rate: float = throttle_rate
+        self.retry_after: float = retry_after
+        self.limit_per_minute: Optional[int] = limit_per_minute
+        self.require_auth: bool = require_auth
+        self.host: str = host
+        self.port: int = port
+
+        self.requests: Counter = Counter()
+        self.tokens_issued: int = 0
+        self.throttled: int = 0
+        self.errors: int = 0
+
+        self._random: random.Random = random.Random(seed)
+        self._routes: List[_Route] = _build_routes()
+        self._sent: Deque[float] = deque()
+        self._runner: Optional["web.AppRunner"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def domain(self) -> str:
+        """
+        Domain to pass to :func:`osu.Client.set_domain`, available once the server started.
+        """
+        if self._runner is None:
+            raise RuntimeError("The server hasn't been started")
+        return f"http://{self.host}:{self.port}"
+
+    def make_app(self) -> "web.Application":
+        """
+        Returns the :class:`aiohttp.web.Application` of the server, for running it some other way.
+        """
+        app = web.Application()
+        app.router.add_post("/oauth/token", self._handle_token)
+        app.router.add_post("/oauth/token/", self._handle_token)
+        app.router.add_route("*", "/api/v2/{tail:.*}", self._handle_request)
+        return app
+
+    async def start(self) -> None:
+        """
+        Start serving on the current event loop.
+        """
+        runner = web.AppRunner(self.make_app())
+        await runner.setup()
+        await web.TCPSite(runner, self.host, self.port).start()
+        self.port = runner.addresses[0][1]
+        self._runner = runner
+
+    async def close(self) -> None:
+        """
+        Stop serving.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self) -> None:
+        """
+        Start serving on an event loop in a background thread, for use with synchronous clients.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="osu.py stand-in server", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+
+    def close_in_thread(self) -> None:
+        """
+        Stop serving and stop the thread started by :func:`start_in_thread`.
+        """
+        if self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def _get_delay(self) -> float:
+        jitter = self.jitter
+        if callable(jitter):
+            return self.latency + jitter(self._random)
+        if jitter <= 0:
+            return self.latency
+        if self.jitter_distribution == "normal":
+            return self.latency + abs(self._random.gauss(0, jitter))
+        if self.jitter_distribution == "exponential":
+            return self.latency + self._random.expovariate(1 / jitter)
+        return self.latency + self._random.uniform(0, jitter)
+
+    def _get_throttle_wait(self) -> Optional[float]:
+        """returns seconds until another request is allowed if the limit was reached"""
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] >= 60:
+            self._sent.popleft()
+
+        if len(self._sent) >= self.limit_per_minute:
+            return 60 - (now - self._sent[0])
+        self._sent.append(now)
+
+    def _match(self, method: str, tail: str) -> List[Tuple[str, Dict[str, str]]]:
+        return [
+            (template, match.groupdict())
+            for route_method, template, pattern in self._routes
+            if route_method == method and (match := pattern.fullmatch(tail)) is not None
+        ]
+
+    async def _handle_token(self, request: "web.Request") -> "web.Response":
+        if request.content_type == "application/json":
+            data = await request.json()
+        else:
+            data = await request.post()
+
+        await asyncio.sleep(self._get_delay())
+
+        self.tokens_issued += 1
+        body = {"token_type": "Bearer", "expires_in": 86400, "access_token": f"stand-in-{self.tokens_issued}"}
+        if data.get("grant_type") in ("authorization_code", "refresh_token"):
+            body["refresh_token"] = f"stand-in-refresh-{self.tokens_issued}"
+        return web.json_response(body)
+
+    async def _handle_request(self, request: "web.Request") -> "web.StreamResponse":
+        method = request.method.upper()
+        matches = self._match(method, request.match_info["tail"])
+        if not matches:
+            return web.json_response({"error": None}, status=404)
+        self.requests[f"{method} {matches[0][0]}"] += 1
+
+        if self.require_auth and "Authorization" not in request.headers:
+            return web.json_response({"authentication": "basic"}, status=401)
+
+        await asyncio.sleep(self._get_delay())
+
+        if self.limit_per_minute is not None and (wait := self._get_throttle_wait()) is not None:
+            return self._throttle(wait)
+        if self.throttle_rate > 0 and self._random.random() < self.throttle_rate:
+            return self._throttle(self.retry_after)
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            self.errors += 1
+            status = self._random.choice(self.error_statuses)
+            headers = {"Retry-After": str(math.ceil(self.retry_after))} if status == 503 else None
+            return web.json_response({"error": None}, status=status, headers=headers)
+
+        for template, params in matches:
+            fixture = self.fixtures.get(f"{method} {template}", self.fixtures.get(template))
+            if fixture is not None:
+                return await self._respond(fixture, request, params)
+
+        return web.json_response({"error": f"No fixture for {method} {matches[0][0]}"}, status=404)
+
+    def _throttle(self, wait: float) -> "web.Response":
+        self.throttled += 1
+        return web.json_response({"error": None}, status=429, headers={"Retry-After": str(max(1, math.ceil(wait)))})
+
+    @staticmethod
+    async def _respond(fixture, request, params) -> "web.StreamResponse":
+        body = fixture(request, params) if callable(fixture) else fixture
+        if inspect.isawaitable(body):
+            body = await body
+
+        if isinstance(body, web.StreamResponse):
+            return body
+        if isinstance(body, bytes):
+            return web.Response(body=body, content_type="application/octet-stream")
+        if body is None:
+            return web.Response(status=204)
+        return web.json_response(body)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __enter__(self):
+        self.start_in_thread()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_in_thread()
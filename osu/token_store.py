@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+__all__ = ("BaseTokenStore", "JSONTokenStore", "SQLiteTokenStore")
+
+
+def _key_lock_path(path: str, key: str) -> str:
+    # a lock file per key, so refreshing one token doesn't wait on others.
+    # hash() is randomized per process, so it can't be used for a name every process agrees on
+    return f"{path}.{hashlib.sha256(key.encode()).hexdigest()[:16]}.lock"
+
+
+class FileLock:
+    """
+    Exclusive lock held on a file, which works across processes.
+    Not reentrant, so it must not be acquired twice by the same process.
+
+    **Init Parameters**
+
+    path: str
+        Path of the lock file. It's created if it doesn't exist.
+    """
+
+    __slots__ = ("path", "_file")
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self._file = None
+
+    def acquire(self):
+        self._file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            return
+
+        while True:
+            try:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(0.05)
+
+    def release(self):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class BaseTokenStore:
+    """
+    An abstract class for storing access tokens where multiple processes can read them.
+    Set a store on an auth handler with :func:`AuthUtil.set_token_store`.
+
+    Stored tokens are dicts with the keys `access_token`, `refresh_token`, and `expires_at`
+    (unix timestamp of when the access token expires).
+    """
+
+    __slots__ = ()
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        Returns the token stored under key or None.
+        """
+        raise NotImplementedError()
+
+    def save(self, key: str, token: dict) -> None:
+        """
+        Store a token under key, replacing the previous one.
+        """
+        raise NotImplementedError()
+
+    def lock(self, key: str):
+        """
+        Returns a context manager which is held while refreshing the token stored under key,
+        so that only one process refreshes it at a time.
+        """
+        raise NotImplementedError()
+
+
+class JSONTokenStore(BaseTokenStore):
+    """
+    Stores tokens in a json file. Writes replace the file atomically, so reads never see
+    a partially written file, and locking is done with a separate `.lock` file per key.
+
+    **Init Parameters**
+
+    path: str
+        Path of the json file. It's created when the first token is saved.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path: str = os.path.abspath(path)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def load(self, key: str) -> Optional[dict]:
+        return self._read().get(key)
+
+    def save(self, key: str, token: dict) -> None:
+        with FileLock(self.path + ".write.lock"):
+            tokens = self._read()
+            tokens[key] = token
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(tokens, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+    def lock(self, key: str) -> FileLock:
+        return FileLock(_key_lock_path(self.path, key))
+
+
+class SQLiteTokenStore(BaseTokenStore):
+    """
+    Stores tokens in a sqlite database. Locking is done with a separate `.lock` file per key.
+
+    **Init Parameters**
+
+    path: str
+        Path of the database file. It's created if it doesn't exist.
+
+    table: str
+        Name of the table the tokens are stored in. Defaults to `osu_tokens`.
+    """
+
+    __slots__ = ("path", "table")
+
+    def __init__(self, path: str, table: str = "osu_tokens"):
+        self.path: str = os.path.abspath(path)
+        self.table: str = table
+
+        with self._connect() as connection:
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, token TEXT NOT NULL)")
+        connection.close()
+
+    def _connect(self):
+        import sqlite3
+
+        return sqlite3.connect(self.path, timeout=30)
+
+    def load(self, key: str) -> Optional[dict]:
+        connection = self._connect()
+        try:
+            row = connection.execute(f"SELECT token FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        finally:
+            connection.close()
+        return json.loads(row[0]) if row is not None else None
+
+    def save(self, key: str, token: dict) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, token) VALUES (?, ?)", (key, json.dumps(token))
+                )
+        finally:
+            connection.close()
+
+    def lock(self, key: str) -> FileLock:
+        return FileLock(_key_lock_path(self.path, key))
@@ -0,0 +1,359 @@
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+# imported on first use, since this module is imported by osu.http
+otel_trace = None
+prometheus_client = None
+
+if TYPE_CHECKING:
+    from .path import Path
+
+
+__all__ = (
+    "RequestTrace",
+    "RequestHook",
+    "OpenTelemetryHook",
+    "PrometheusHook",
+)
+
+
+PHASES = ("auth", "rate_limit", "network", "decode", "construct")
+
+
+def _require_opentelemetry():
+    global otel_trace
+    if otel_trace is not None:
+        return
+
+    try:
+        from opentelemetry import trace as otel_trace
+    except ImportError:
+        raise RuntimeError(
+            "Missing opentelemetry-api package, which is required for OpenTelemetryHook. "
+            'Install osu.py with the opentelemetry feature: "pip install osu.py[opentelemetry]"'
+        ) from None
+
+
+def _require_prometheus_client():
+    global prometheus_client
+    if prometheus_client is not None:
+        return
+
+    try:
+        import prometheus_client
+    except ImportError:
+        raise RuntimeError(
+            "Missing prometheus-client package, which is required for PrometheusHook. "
+            'Install osu.py with the prometheus feature: "pip install osu.py[prometheus]"'
+        ) from None
+
+
+# traces of requests made by a client method that's still running, so the time spent
+# constructing objects from the response can be added before the hooks are called
+_pending_traces: ContextVar[Optional[List["RequestTrace"]]] = ContextVar("osu_pending_traces", default=None)
+
+
+class RequestTrace:
+    """
+    Timings of a single request, passed to the hooks added with :func:`osu.http.BaseHTTPHandler.add_hook`.
+
+    A request goes through these phases, in order:
+
+    - auth: getting an access token, which includes requesting a new one if it expired
+    - rate_limit: waiting in the rate limiter
+    - network: sending the request and receiving the response
+    - decode: decoding the json
+    - construct: creating objects from the json, which is only measured for requests made with
+      ``make_request_and_parse``, such as by the client methods for endpoints with large responses
+
+    **Attributes**
+
+    path: :class:`osu.Path`
+
+    template: str
+        Path template of the endpoint (e.g. users/{user}/{mode}), for grouping requests.
+
+    method: str
+
+    start: float
+        :func:`time.perf_counter` value when the request started.
+
+    start_time: float
+        Unix timestamp of when the request started.
+
+    end: Optional[float]
+        :func:`time.perf_counter` value when the request finished.
+
+    status: Optional[int]
+        Status code of the response, or None if no response was received.
+
+    error: Optional[BaseException]
+        Exception raised while making the request or constructing the objects, if any.
+
+    phases: List[Tuple[str, float, float]]
+        Name, start, and end (:func:`time.perf_counter` values) of each phase that happened.
+
+    data: Dict[str, Any]
+        Free for hooks to store state between :func:`RequestHook.before_request` and :func:`RequestHook.after_request`.
+    """
+
+    __slots__ = (
+        "path",
+        "template",
+        "method",
+        "start",
+        "start_time",
+        "end",
+        "status",
+        "error",
+        "phases",
+        "data",
+        "_hooks",
+        "_last",
+    )
+
+    def __init__(self, path: "Path", hooks: Sequence["RequestHook"]):
+        self.path: "Path" = path
+        self.template: str = path.template
+        self.method: str = path.method
+        self.start_time: float = time.time()
+        self.start: float = time.perf_counter()
+        self._last: float = self.start
+        self.end: Optional[float] = None
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.phases: List[Tuple[str, float, float]] = []
+        self.data: Dict[str, Any] = {}
+        self._hooks: Sequence[RequestHook] = hooks
+
+        for hook in hooks:
+            hook.before_request(self)
+
+    def mark(self, phase: str) -> None:
+        """
+        Record that a phase ended now, having started when the previous one ended.
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, self._last, now))
+        self._last = now
+
+    def duration(self, phase: str) -> Optional[float]:
+        """
+        Returns the seconds spent in a phase, or None if it didn't happen.
+        """
+        durations = [end - start for name, start, end in self.phases if name == phase]
+        return sum(durations) if durations else None
+
+    @property
+    def auth(self) -> Optional[float]:
+        return self.duration("auth")
+
+    @property
+    def rate_limit(self) -> Optional[float]:
+        return self.duration("rate_limit")
+
+    @property
+    def network(self) -> Optional[float]:
+        return self.duration("network")
+
+    @property
+    def decode(self) -> Optional[float]:
+        return self.duration("decode")
+
+    @property
+    def construct(self) -> Optional[float]:
+        return self.duration("construct")
+
+    @property
+    def total(self) -> Optional[float]:
+        """
+        Seconds from start to end, or None if the request hasn't finished.
+        """
+        return None if self.end is None else self.end - self.start
+
+    def to_unix(self, perf_time: float) -> float:
+        """
+        Convert a :func:`time.perf_counter` value of this trace to a unix timestamp.
+        """
+        return self.start_time + (perf_time - self.start)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """
+        End the trace and call the hooks. Done by the http handler.
+        """
+        if error is not None:
+            self.error = error
+        self.end = self._last if error is None else time.perf_counter()
+        for hook in self._hooks:
+            hook.after_request(self)
+
+    def finish_or_defer(self) -> None:
+        """
+        End the trace, unless the request was made by ``make_request_and_parse``, in which case
+        it's ended once the json is parsed so the construct phase can be measured.
+        """
+        pending = _pending_traces.get()
+        if pending is None:
+            self.finish()
+        else:
+            pending.append(self)
+
+    def __repr__(self):
+        phases = ", ".join(f"{phase}={self.duration(phase) * 1000:.1f}ms" for phase in PHASES if self.duration(phase))
+        return f"RequestTrace({self.method.upper()} {self.template}, status={self.status}, {phases})"
+
+
+@contextlib.contextmanager
+def _collect_traces():
+    pending = []
+    token = _pending_traces.set(pending)
+    error = None
+    try:
+        yield
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        _pending_traces.reset(token)
+        for trace in pending:
+            trace.mark("construct")
+            trace.finish(error)
+
+
+class RequestHook:
+    """
+    Base class for request hooks. Add them to a client with :func:`osu.Client.add_hook`.
+    Hooks are called synchronously in the thread (or event loop) making the request,
+    so they should be quick.
+    """
+
+    __slots__ = ()
+
+    def before_request(self, trace: RequestTrace) -> None:
+        """
+        Called when a request starts, before any phase.
+        """
+
+    def after_request(self, trace: RequestTrace) -> None:
+        """
+        Called when a request finished, successfully or not. All the phases are recorded.
+        """
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Emits an OpenTelemetry span for each request, with a child span for each phase.
+    Spans are named after the method and path template (e.g. ``GET users/{user}/{mode}``).
+
+    Requires opentelemetry-api, which can be installed with ``pip install osu.py[opentelemetry]``.
+    Spans are only exported if an OpenTelemetry SDK is configured.
+
+    **Init Parameters**
+
+    tracer: Optional[:class:`opentelemetry.trace.Tracer`]
+        Defaults to the tracer of the global tracer provider.
+    """
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, tracer=None):
+        _require_opentelemetry()
+        self.tracer = otel_trace.get_tracer("osu.py") if tracer is None else tracer
+
+    @staticmethod
+    def _ns(trace: RequestTrace, perf_time: float) -> int:
+        return int(trace.to_unix(perf_time) * 1e9)
+
+    def before_request(self, trace: RequestTrace) -> None:
+        trace.data["otel_span"] = self.tracer.start_span(
+            f"{trace.method.upper()} {trace.template}",
+            kind=otel_trace.SpanKind.CLIENT,
+            start_time=self._ns(trace, trace.start),
+            attributes={
+                "http.request.method": trace.method.upper(),
+                "url.template": trace.template,
+                "url.path": trace.path.path,
+            },
+        )
+
+    def after_request(self, trace: RequestTrace) -> None:
+        span = trace.data.pop("otel_span", None)
+        if span is None:
+            return
+
+        context = otel_trace.set_span_in_context(span)
+        for phase, start, end in trace.phases:
+            self.tracer.start_span(phase, context=context, start_time=self._ns(trace, start)).end(
+                end_time=self._ns(trace, end)
+            )
+
+        if trace.status is not None:
+            span.set_attribute("http.response.status_code", trace.status)
+        if trace.error is not None:
+            span.record_exception(trace.error)
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(trace.error)))
+        span.end(end_time=self._ns(trace, trace.end))
+
+
+class PrometheusHook(RequestHook):
+    """
+    Records Prometheus histograms of request and phase durations, labeled by path template.
+
+    - ``{namespace}_request_duration_seconds`` with labels template, method, and status
+    - ``{namespace}_request_phase_duration_seconds`` with labels template and phase
+    - ``{namespace}_request_errors_total`` with labels template and error (the exception's type name)
+
+    Requires prometheus-client, which can be installed with ``pip install osu.py[prometheus]``.
+
+    **Init Parameters**
+
+    registry: Optional[:class:`prometheus_client.CollectorRegistry`]
+        Defaults to the global registry. Only one hook can be created per registry and namespace.
+
+    namespace: str
+        Prefix of the metric names. Defaults to ``osu``.
+
+    buckets: Optional[Sequence[float]]
+        Histogram buckets in seconds. Defaults to prometheus-client's default buckets.
+    """
+
+    __slots__ = ("duration", "phase_duration", "errors")
+
+    def __init__(self, registry=None, namespace: str = "osu", buckets: Optional[Sequence[float]] = None):
+        _require_prometheus_client()
+
+        kwargs = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+        histogram_kwargs = dict(kwargs)
+        if buckets is not None:
+            histogram_kwargs["buckets"] = buckets
+
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "Duration of osu! api requests",
+            ["template", "method", "status"],
+            **histogram_kwargs,
+        )
+        self.phase_duration = prometheus_client.Histogram(
+            "request_phase_duration_seconds",
+            "Duration of each phase of osu! api requests",
+            ["template", "phase"],
+            **histogram_kwargs,
+        )
+        self.errors = prometheus_client.Counter(
+            "request_errors",
+            "Number of osu! api requests that failed",
+            ["template", "error"],
+            **kwargs,
+        )
+
+    def after_request(self, trace: RequestTrace) -> None:
+        status = "none" if trace.status is None else str(trace.status)
+        self.duration.labels(trace.template, trace.method.upper(), status).observe(trace.total)
+        for phase, start, end in trace.phases:
+            self.phase_duration.labels(trace.template, phase).observe(end - start)
+        if trace.error is not None:
+            self.errors.labels(trace.template, type(trace.error).__name__).inc()
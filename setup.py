@@ -35,6 +35,11 @@ extra_require = {
     "async": ["aiohttp>=3.9.2,<4"],
     "replay": ["osrparse>=7.0.1,<8"],
     "notifications": ["websockets>=13.1,<14"],
+    "numpy": ["numpy>=1.21,<3"],
+    "snapshot": ["msgpack>=1.0,<2"],
+    "opentelemetry": ["opentelemetry-api>=1.20,<2"],
+    "prometheus": ["prometheus-client>=0.17,<1"],
+    "parquet": ["pyarrow>=12,<27"],
     "tests": [
         "pytest>=8.3.3,<9",
         "pytest-asyncio>=0.24.0,<1",
@@ -46,6 +51,7 @@ packages = [
     'osu',
     'osu.asyncio',
     'osu.objects',
+    'osu.testing',
 ]
 
 setuptools.setup(
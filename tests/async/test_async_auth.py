@@ -0,0 +1,35 @@
+import threading
+
+import pytest
+
+from osu import AsynchronousAuthHandler, JSONTokenStore
+
+from tests.constants import CLIENT_ID, CLIENT_SECRET
+
+
+class TestAsynchronousAuth:
+    @pytest.mark.asyncio
+    async def test_token_store(self, tmp_path, stand_in_server):
+        threads = set()
+
+        class Store(JSONTokenStore):
+            def load(self, key):
+                threads.add(threading.get_ident())
+                return super().load(key)
+
+            def save(self, key, token):
+                threads.add(threading.get_ident())
+                super().save(key, token)
+
+        store = Store(str(tmp_path / "tokens.json"))
+        auths = [AsynchronousAuthHandler(CLIENT_ID, CLIENT_SECRET, None) for _ in range(2)]
+        for auth in auths:
+            auth.http.set_domain(stand_in_server.domain)
+            auth.set_token_store(store)
+            await auth.get_auth_token()
+
+        # the second handler used the token saved by the first
+        assert stand_in_server.tokens_issued == 1
+        assert await auths[0].get_token() == await auths[1].get_token()
+        # the store's io doesn't block the event loop
+        assert threads and threading.get_ident() not in threads
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from osu.testing import make_beatmapset
+
+
+_cursors = {None: "2", "2": "3", "3": "4", "4": None}
+
+
+def score_pages(request, params):
+    return {"scores": [], "cursor_string": _cursors[request.query.get("cursor_string")]}
+
+
+def user_beatmapsets(request, params):
+    offset, limit = int(request.query["offset"]), int(request.query["limit"])
+    return [make_beatmapset(i) for i in range(offset + 1, min(offset + limit, 130) + 1)]
+
+
+class TestAsynchronousPagination:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stand_in_server", [{"fixtures": {"GET scores": score_pages}}], indirect=True)
+    async def test_iter_pages_closed_early(self, async_stand_in_client):
+        client = async_stand_in_client
+        client.http.set_ratelimit(request_wait_time=0.5)
+
+        pages = client.iter_pages(client.get_all_scores, prefetch=2)
+        async for page in pages:
+            assert page.cursor == "2"
+            break
+        # cancels the read-ahead while it waits in the rate limiter
+        await pages.aclose()
+
+        assert (await asyncio.wait_for(client.get_user(2), 5)).id == 2
+        assert client.http.rate_limit.waiters == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "stand_in_server", [{"fixtures": {"GET users/{user}/beatmapsets/{type}": user_beatmapsets}}], indirect=True
+    )
+    async def test_fetch_all_pages(self, async_stand_in_client):
+        client = async_stand_in_client
+        client.http.set_ratelimit(request_wait_time=0.2)
+
+        # requests for the pages past 130 are cancelled while they wait in the rate limiter
+        beatmapsets = await client.fetch_all_pages(
+            client.get_user_beatmaps, 2, "ranked", page_size=20, max_concurrency=6
+        )
+        assert [beatmapset.id for beatmapset in beatmapsets] == list(range(1, 131))
+
+        assert client.http.rate_limit.waiters == 0
+        assert (await asyncio.wait_for(client.get_user(2), 5)).id == 2
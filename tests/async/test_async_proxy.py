@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from osu import ProxyServer
+
+
+class TestAsynchronousProxy:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stand_in_server", [{"latency": 0.3}], indirect=True)
+    async def test_first_client_disconnects(self, stand_in_server, async_stand_in_client):
+        def request():
+            return make_mocked_request("GET", "/api/v2/users/2/", match_info={"tail": "users/2/"})
+
+        async with ProxyServer(async_stand_in_client) as proxy:
+            first = asyncio.ensure_future(proxy._handle_request(request()))
+            await asyncio.sleep(0.1)
+            second = asyncio.ensure_future(proxy._handle_request(request()))
+            await asyncio.sleep(0.05)
+            # the client that started the request disconnects, which cancels its handler
+            first.cancel()
+
+            response = await second
+            assert response.status == 200
+            assert response.headers["X-Proxy-Cache"] == "COALESCED"
+            assert proxy.forwarded == 1
+
+        assert stand_in_server.requests["GET users/{user}/{mode}"] == 1
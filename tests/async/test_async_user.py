@@ -1,6 +1,6 @@
 import pytest
 
-from osu import KudosuHistory, Event, LegacyScore, UserBeatmapType, SoloScore, GameModeInt
+from osu import KudosuHistory, Event, LegacyScore, UserBeatmapType, SoloScore, GameModeInt, LoopLagMonitor
 
 from tests.util import as_async
 
@@ -32,6 +32,17 @@ class TestAsynchronousUser:
             assert user.id == sample_user["id"]
             assert user.username == sample_user["username"]
 
+    @pytest.mark.asyncio
+    async def test_offload(self, client, sample_users):
+        async_client = as_async(client)
+        # offload every response
+        async_client.http.set_offload(0)
+        sample_users = sorted(sample_users, key=lambda u: u["id"])
+        async with LoopLagMonitor() as monitor:
+            users = await async_client.get_users([user["id"] for user in sample_users])
+        assert [user.id for user in users] == [user["id"] for user in sample_users]
+        assert not monitor.running and len(monitor.samples) == monitor.stats()["count"]
+
     @pytest.mark.asyncio
     async def test_lookup_users(self, client, sample_users):
         async_client = as_async(client)
@@ -45,6 +56,16 @@ class TestAsynchronousUser:
             assert user.id == sample_user["id"]
             assert user.username == sample_user["username"]
 
+    @pytest.mark.asyncio
+    async def test_fetch_users(self, client, sample_users):
+        async_client = as_async(client)
+        user_ids = [user["id"] for user in sample_users]
+        users = await async_client.fetch_users(user_ids, ["statistics_rulesets", "country"])
+        for user, sample_user in zip(users, sample_users):
+            assert user
+            assert user.id == sample_user["id"]
+            assert user.statistics_rulesets is not None
+
     @pytest.mark.asyncio
     async def test_get_user_kudosu(self, client):
         async_client = as_async(client)
@@ -3,7 +3,8 @@ import asyncio
 import json
 import os
 
-from osu import Client, AuthHandler
+from osu import Client, AuthHandler, AsynchronousClient
+from osu.testing import StandInServer, DEFAULT_FIXTURES
 from tests.constants import CLIENT_SECRET, REDIRECT_URI, CLIENT_ID
 
 
@@ -17,6 +18,29 @@ def client() -> Client:
     return Client.from_credentials(client_id=CLIENT_ID, client_secret=CLIENT_SECRET, redirect_url=REDIRECT_URI)
 
 
+@fixture
+def stand_in_server(request):
+    # parametrize indirectly with keyword arguments of StandInServer, whose fixtures are added to the defaults
+    kwargs = dict(getattr(request, "param", {}))
+    kwargs["fixtures"] = {**DEFAULT_FIXTURES, **kwargs.get("fixtures", {})}
+    with StandInServer(**kwargs) as server:
+        yield server
+
+
+@fixture
+def stand_in_client(stand_in_server) -> Client:
+    client = Client.from_credentials(CLIENT_ID, CLIENT_SECRET, None, request_wait_time=0)
+    client.set_domain(stand_in_server.domain)
+    return client
+
+
+@fixture
+def async_stand_in_client(stand_in_server) -> AsynchronousClient:
+    client = AsynchronousClient.from_credentials(CLIENT_ID, CLIENT_SECRET, None, request_wait_time=0)
+    client.set_domain(stand_in_server.domain)
+    return client
+
+
 def get_user_client(dev=False) -> Client:
     file = "auth.json" if not dev else "dev-auth.json"
 
@@ -0,0 +1,54 @@
+from osu import AuthHandler, JSONTokenStore, AuthPool
+from tests.constants import CLIENT_ID, CLIENT_SECRET
+import pytest
+import time
+
+
+class TestAuth:
+    def test_background_refresh(self):
+        auth = AuthHandler(CLIENT_ID, CLIENT_SECRET, None)
+        refreshed = []
+        auth.set_refresh_callback(refreshed.append, lambda _, exc: pytest.fail(str(exc)))
+        token = auth.get_token()
+
+        # pretend the token is short-lived so the refresh happens right away
+        auth._data.expires_in = 1
+        auth.start_background_refresh(fraction=0.5, jitter=0)
+        time.sleep(3)
+        auth.stop_background_refresh()
+
+        assert refreshed
+        assert auth.get_token() != token
+
+    @pytest.mark.parametrize("stand_in_server", [{"latency": 0.5}], indirect=True)
+    def test_auth_pool_refresh(self, tmp_path, stand_in_server):
+        store = JSONTokenStore(str(tmp_path / "tokens.json"))
+        for i in range(4):
+            store.save(f"user:{i}", {"access_token": "old", "refresh_token": f"refresh-{i}", "expires_at": 0})
+
+        pool = AuthPool(CLIENT_ID, CLIENT_SECRET, None, store, request_wait_time=0)
+        pool.http.set_domain(stand_in_server.domain)
+        for i in range(4):
+            pool.get(f"user:{i}")
+
+        start = time.monotonic()
+        assert sorted(pool.refresh_expiring(max_workers=4)) == [f"user:{i}" for i in range(4)]
+        # each token has its own store lock, so the refreshes overlap
+        assert time.monotonic() - start < 1.5
+
+        assert stand_in_server.tokens_issued == 4
+        assert store.load("user:0")["access_token"] != "old"
+
+    def test_token_store(self, tmp_path):
+        store = JSONTokenStore(str(tmp_path / "tokens.json"))
+        # each key has its own lock file, which every process agrees on
+        assert store.lock("a").path != store.lock("b").path
+        assert store.lock("a").path == JSONTokenStore(store.path).lock("a").path
+
+        auths = [AuthHandler(CLIENT_ID, CLIENT_SECRET, None) for _ in range(2)]
+        for auth in auths:
+            auth.set_token_store(store)
+
+        auths[0].get_auth_token()
+        auths[1].get_auth_token()
+        assert auths[0].get_token() == auths[1].get_token()
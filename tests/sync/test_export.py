@@ -0,0 +1,69 @@
+from osu.export import export
+import pytest
+import gzip
+import json
+
+
+def beatmaps_with_changing_types(request, params):
+    # bpm is an int in the first chunk and a float later, and some beatmaps have a key the first ones don't
+    return {
+        "beatmaps": [
+            {
+                "id": int(beatmap_id),
+                "bpm": 120 if int(beatmap_id) <= 50 else 120.5,
+                **({"extra": [1]} if int(beatmap_id) > 100 else {}),
+            }
+            for beatmap_id in request.query.getall("ids[]")
+        ]
+    }
+
+
+class TestExport:
+    def test_export(self, tmp_path, stand_in_client):
+        output = str(tmp_path / "users.jsonl.gz")
+        stats = export(stand_in_client, "users", output, range(1, 121), checkpoint_interval=0)
+        assert stats.records == 120 and stats.requests == 3
+        # resuming skips the ids that were exported
+        stats = export(stand_in_client, "users", output, range(1, 201), resume=True)
+        assert stats.records == 200 and stats.requests == 2
+
+        with gzip.open(output) as f:
+            assert [json.loads(line)["id"] for line in f] == list(range(1, 201))
+
+    def test_export_crash_and_resume(self, tmp_path, stand_in_client):
+        output = str(tmp_path / "users.jsonl")
+
+        def crashing_ids():
+            yield from range(1, 51)
+            raise RuntimeError("crash")
+
+        export(stand_in_client, "users", output, range(1, 301), checkpoint_interval=0)
+        # a new export crashes before its first checkpoint, so the previous one's mustn't be resumed from
+        with pytest.raises(RuntimeError):
+            export(stand_in_client, "users", output, crashing_ids(), checkpoint_interval=3600)
+        stats = export(stand_in_client, "users", output, range(1, 301), resume=True)
+        assert stats.records == 300
+
+        with open(output, "rb") as f:
+            assert [json.loads(line)["id"] for line in f] == list(range(1, 301))
+
+        # a checkpoint past the end of the output can't be resumed from
+        with open(output, "r+b") as f:
+            f.truncate(10)
+        with pytest.raises(ValueError):
+            export(stand_in_client, "users", output, range(1, 301), resume=True)
+
+    @pytest.mark.parametrize(
+        "stand_in_server", [{"fixtures": {"GET beatmaps": beatmaps_with_changing_types}}], indirect=True
+    )
+    def test_export_parquet(self, tmp_path, stand_in_client):
+        parquet = pytest.importorskip("pyarrow.parquet")
+
+        output = str(tmp_path / "beatmaps.parquet")
+        export(stand_in_client, "beatmaps", output, range(1, 101), checkpoint_interval=0)
+        export(stand_in_client, "beatmaps", output, range(1, 151), resume=True)
+
+        table = parquet.read_table(output)
+        assert table.column("id").to_pylist() == list(range(1, 151))
+        assert table.column("bpm").to_pylist()[49:51] == [120.0, 120.5]
+        assert table.column("_extra").to_pylist()[-1] == '{"extra":[1]}'
@@ -0,0 +1,116 @@
+from osu import RequestHook, Client, Cassette, ProxyServer
+from osu.http import HTTPHandler, RateLimitHandler
+from osu.bench import profile_response
+from tests.constants import CLIENT_ID, CLIENT_SECRET
+from requests import HTTPError
+import pytest
+
+
+class TestHTTP:
+    def test_request_hook(self, client):
+        traces = []
+
+        class Hook(RequestHook):
+            def after_request(self, trace):
+                traces.append(trace)
+
+        hook = Hook()
+        client.add_hook(hook)
+        try:
+            client.get_user(2)
+        finally:
+            client.remove_hook(hook)
+
+        assert len(traces) == 1
+        assert traces[0].template == "users/{user}/{mode}"
+        assert traces[0].status == 200
+        assert [phase for phase, _, _ in traces[0].phases] == ["auth", "rate_limit", "network", "decode", "construct"]
+
+    def test_bind_shares_settings(self):
+        http = HTTPHandler(None)
+        bound = http.bind(None)
+        # settings changed after binding apply to both handlers
+        http.set_domain("http://127.0.0.1:8080")
+        bound.set_api_version("20220704")
+        bound.add_hook(RequestHook())
+        assert bound.base_url == http.base_url == "http://127.0.0.1:8080/api/v2/"
+        assert http.api_version == "20220704"
+        assert http.hooks == bound.hooks and len(http.hooks) == 1
+        assert bound.rate_limit is http.rate_limit
+
+    def test_rate_limit_stats(self):
+        rate_limit = RateLimitHandler(0, 2)
+        slow_waits = []
+        rate_limit.set_slow_wait_callback(lambda waited, _: slow_waits.append(waited), 0)
+
+        rate_limit.wait()
+        rate_limit.wait()
+        stats = rate_limit.stats()
+        assert stats["used"] == 2
+        assert stats["remaining"] == 0
+        assert stats["waiters"] == 0
+        assert stats["count"] == 2
+        assert 59 < stats["next_request_in"] <= 60
+        assert 119 < rate_limit.forecast(3) <= 120
+        assert len(slow_waits) == 2
+
+    def test_thread_sessions(self, stand_in_client):
+        client = stand_in_client
+        assert client.get_user(2).id == 2
+        for _ in range(10):
+            assert [user.id for user in client.map(client.get_user, [2, 2], max_workers=2)] == [2, 2]
+        # the sessions of the map threads are closed when they exit, leaving the one of this thread
+        assert len(client.http._all_sessions) == 1
+
+    @pytest.mark.parametrize("stand_in_server", [{"limit_per_minute": 2}], indirect=True)
+    def test_stand_in_server(self, stand_in_server, stand_in_client):
+        assert stand_in_client.get_user(2).id == 2
+        assert [beatmap.id for beatmap in stand_in_client.get_beatmaps([1, 2])] == [1, 2]
+        with pytest.raises(HTTPError):
+            stand_in_client.get_user(3)
+
+        assert stand_in_server.tokens_issued == 1
+        assert stand_in_server.throttled == 1
+        assert stand_in_server.requests["GET users/{user}/{mode}"] == 2
+
+    def test_cassette(self, tmp_path, stand_in_server, stand_in_client):
+        path = str(tmp_path / "cassette.jsonl.gz")
+        domain = stand_in_server.domain
+        with Cassette(path, "record") as cassette:
+            stand_in_client.http.set_cassette(cassette)
+            users = stand_in_client.get_users([1, 2])
+        stand_in_server.close_in_thread()
+
+        # the server is closed, so the responses can only come from the cassette
+        client = Client.from_credentials(CLIENT_ID, CLIENT_SECRET, None, request_wait_time=0)
+        client.set_domain(domain)
+        client.http.set_cassette(Cassette(path))
+        assert [user.id for user in client.get_users([1, 2])] == [user.id for user in users]
+        assert client.http.cassette.rate_limit_stats()["count"] == 1
+
+    def test_profile_response(self, tmp_path, stand_in_client):
+        path = str(tmp_path / "cassette.jsonl.gz")
+        with Cassette(path, "record") as cassette:
+            stand_in_client.http.set_cassette(cassette)
+            stand_in_client.get_user(2)
+            stand_in_client.get_user(3)
+
+        report = profile_response(path, "User", "users/{user}/{mode}", repeat=2)
+        assert report.requests == 4
+        assert report.phases["construct"] > 0
+        assert any(name == "User" for name, _, _ in report.allocations)
+        assert "user.py" in report.format()
+
+    @pytest.mark.parametrize("stand_in_server", [{"latency": 0.1}], indirect=True)
+    def test_proxy_server(self, stand_in_server, async_stand_in_client):
+        with ProxyServer(async_stand_in_client) as proxy:
+            client = Client.from_credentials(CLIENT_ID, CLIENT_SECRET, None, request_wait_time=0)
+            client.set_domain(proxy.domain)
+
+            users = client.map(client.get_user, [2, 2, 2], max_workers=3)
+            assert [user.id for user in users] == [2, 2, 2]
+            assert client.get_user(2).id == 2
+            assert proxy.requests == 4 and proxy.forwarded == 1
+            assert proxy.coalesced == 2 and proxy.cache_hits == 1
+
+        assert stand_in_server.requests["GET users/{user}/{mode}"] == 1
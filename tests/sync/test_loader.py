@@ -0,0 +1,33 @@
+from osu import BatchLoader
+from osu.testing import make_user
+import pytest
+
+
+def users_without_restricted(request, params):
+    # user 3 is left out of bulk responses, like a restricted user
+    return {"users": [make_user(int(user_id)) for user_id in request.query.getall("ids[]") if user_id != "3"]}
+
+
+class TestLoader:
+    @pytest.mark.parametrize("stand_in_server", [{"fixtures": {"GET users": users_without_restricted}}], indirect=True)
+    def test_batch_loader(self, stand_in_server, stand_in_client):
+        client = stand_in_client
+        loader = BatchLoader(client, window=0.05)
+
+        futures = [loader.submit_get_user(user_id) for user_id in (1, 2, 3, 2)]
+        assert [future.result().id for future in futures] == [1, 2, 3, 2]
+        assert loader.batches == 1 and loader.fallbacks == 1
+
+        for user_id in range(10, 40):
+            assert loader.get_user(user_id).id == user_id
+        # batches are sent by the loader's threads, which keep one session each
+        assert len(client.http._all_sessions) <= 4
+
+        # cancelling one lookup doesn't affect the others in its batch
+        futures = [loader.submit_get_user(user_id) for user_id in (50, 51)]
+        assert futures[0].cancel()
+        assert futures[1].result(timeout=5).id == 51
+        loader.close()
+
+        assert stand_in_server.requests["GET users"] == 32
+        assert stand_in_server.requests["GET users/{user}/{mode}"] == 1
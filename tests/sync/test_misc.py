@@ -1,4 +1,13 @@
-from osu import WikiSearchMode, GameModeStr, RankingType
+from osu import (
+    WikiSearchMode,
+    GameModeStr,
+    RankingType,
+    BlockingClient,
+)
+from tests.constants import CLIENT_ID, CLIENT_SECRET
+import subprocess
+import sys
+import os
 
 
 class TestMisc:
@@ -77,6 +86,14 @@ class TestMisc:
         assert len(match.events) <= 5
         assert all((evt.id < before_id for evt in match.events))
 
+    def test_stream_match(self, client, sample_match):
+        match = client.get_match(sample_match["id"])
+        items = list(client.stream_match(sample_match["id"]))
+        assert [(key, obj.id) for key, obj in items if key == "match"] == [("match", match.id)]
+        assert [obj.id for key, obj in items if key == "events"] == [evt.id for evt in match.events]
+        assert [obj.id for key, obj in items if key == "users"] == [user.id for user in match.users]
+        assert dict(items)["latest_event_id"] == match.latest_event_id
+
     def test_get_seasonal_backgrounds(self, client):
         backgrounds = client.get_seasonal_backgrounds()
         assert backgrounds
@@ -88,3 +105,23 @@ class TestMisc:
         assert client.get_replay_data(None, 1267337687, False)
         assert client.get_replay_data_by_id_only(1267337687)
         assert client.get_replay_data_by_id_only(1267337687, False)
+
+    def test_blocking_client(self):
+        with BlockingClient.from_credentials(CLIENT_ID, CLIENT_SECRET, None, request_wait_time=0) as client:
+            assert client.get_user(2).id == 2
+
+            futures = [client.submit_get_beatmap(beatmap_id) for beatmap_id in (2063622, 1031991)]
+            assert [future.result().id for future in futures] == [2063622, 1031991]
+        assert client.loop.is_closed()
+
+    def test_lazy_imports(self):
+        code = (
+            "import sys, osu\n"
+            "assert 'osu.asyncio' not in sys.modules and 'osu.token_store' not in sys.modules\n"
+            "assert osu.asyncio.AsynchronousClient is osu.AsynchronousClient\n"
+            "assert osu.JSONTokenStore.__module__ == 'osu.token_store'\n"
+            "assert not hasattr(osu, 'missing')\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code], cwd=os.path.join(os.path.dirname(__file__), "..", ".."), check=True
+        )
@@ -0,0 +1,39 @@
+from osu.testing import make_beatmapset
+import pytest
+
+
+_cursors = {None: "2", "2": "3", "3": None}
+
+
+def score_pages(request, params):
+    return {"scores": [], "cursor_string": _cursors[request.query.get("cursor_string")]}
+
+
+def user_beatmapsets(request, params):
+    offset, limit = int(request.query["offset"]), int(request.query["limit"])
+    return [make_beatmapset(i) for i in range(offset + 1, min(offset + limit, 237) + 1)]
+
+
+class TestPagination:
+    @pytest.mark.parametrize("stand_in_server", [{"fixtures": {"GET scores": score_pages}}], indirect=True)
+    def test_iter_pages(self, stand_in_server, stand_in_client):
+        client = stand_in_client
+        for prefetch in (0, 1, 3):
+            pages = list(client.iter_pages(client.get_all_scores, prefetch=prefetch))
+            assert [page.cursor for page in pages] == ["2", "3", None]
+        pages = client.iter_pages("get_all_scores", cursor="2", max_pages=1)
+        assert [page.cursor for page in pages] == ["3"]
+
+        assert stand_in_server.requests["GET scores"] == 10
+
+    @pytest.mark.parametrize(
+        "stand_in_server", [{"fixtures": {"GET users/{user}/beatmapsets/{type}": user_beatmapsets}}], indirect=True
+    )
+    def test_fetch_all_pages(self, stand_in_client):
+        client = stand_in_client
+        beatmapsets = client.fetch_all_pages(client.get_user_beatmaps, 2, "ranked", page_size=20, max_concurrency=4)
+        assert [beatmapset.id for beatmapset in beatmapsets] == list(range(1, 238))
+        beatmapsets = client.fetch_all_pages("get_user_beatmaps", 2, "ranked", max_results=150)
+        assert len(beatmapsets) == 150
+        with pytest.raises(ValueError):
+            client.fetch_all_pages(client.get_user, 2)
@@ -1,4 +1,5 @@
-from osu import SoloScore, LegacyScore, Mods
+from osu import SoloScore, LegacyScore, Mods, ScoreTable, Path, OsuPerformanceCalculator, BeatmapScores
+import pytest
 import time
 
 
@@ -54,3 +55,115 @@ class TestScore:
         new_ret = client.get_all_scores(cursor=ret.cursor)
         assert new_ret
         assert new_ret.scores[0].id != ret.scores[0].id
+
+    def test_score_table(self, client):
+        pytest.importorskip("numpy")
+
+        data = client.http.make_request(Path.get_all_scores())
+        table = ScoreTable.from_json(data)
+        assert len(table) == len(data["scores"])
+
+        scores = ScoreTable.from_scores([SoloScore(score) for score in data["scores"]])
+        assert (scores.id == table.id).all()
+        assert (scores.mods == table.mods).all()
+
+        row = table[0]
+        assert row.id == data["scores"][0]["id"]
+        assert row.rank.value == data["scores"][0]["rank"]
+
+        view = table[10:20]
+        assert view.id.base is not None
+        assert len(table.filter(table.passed)) == len(table)
+        total_scores = table.sort("total_score", descending=True).total_score
+        assert (total_scores[:-1] >= total_scores[1:]).all()
+        grouped = table.group_by("user_id", id="count")
+        assert grouped["id"].sum() == len(table)
+
+    def test_score_table_sort(self):
+        numpy = pytest.importorskip("numpy")
+
+        table = ScoreTable(
+            {
+                "id": numpy.arange(5),
+                "pp": numpy.array([100.0, numpy.nan, 200.0, 100.0, 50.0]),
+                "ended_at": numpy.array(["2024-01-02", "NaT", "2024-01-03", "2024-01-02", "2024-01-01"], "M8[s]"),
+            }
+        )
+        # ties keep their order and nan is last, in both directions
+        assert list(table.sort("pp").id) == [4, 0, 3, 2, 1]
+        assert list(table.sort("pp", descending=True).id) == [2, 0, 3, 4, 1]
+        assert list(table.sort("ended_at", descending=True).id) == [2, 0, 3, 4, 1]
+        assert list(table.sort(["ended_at", "id"], descending=True).id) == [2, 3, 0, 4, 1]
+
+    def test_beatmap_user_score(self):
+        score = {
+            "accuracy": 0.98,
+            "beatmap_id": 1,
+            "best_id": None,
+            "build_id": 7000,
+            "classic_total_score": 50000000,
+            "ended_at": "2024-01-02T03:04:05+00:00",
+            "has_replay": True,
+            "id": 1,
+            "is_perfect_combo": False,
+            "legacy_perfect": False,
+            "legacy_score_id": None,
+            "legacy_total_score": 0,
+            "max_combo": 1000,
+            "maximum_statistics": {"great": 800},
+            "mods": [{"acronym": "HD"}],
+            "passed": True,
+            "pp": 500.0,
+            "preserve": True,
+            "processed": True,
+            "rank": "S",
+            "ranked": True,
+            "replay": True,
+            "ruleset_id": 0,
+            "started_at": "2024-01-02T03:04:05+00:00",
+            "statistics": {"great": 780, "ok": 20},
+            "total_score": 1000000,
+            "type": "solo_score",
+            "user_id": 2,
+        }
+        scores = BeatmapScores({"scores": [score], "user_score": {"position": 1, "score": score}}, "20240529")
+        assert scores.user_score.position == 1
+        assert isinstance(scores.user_score.score, SoloScore)
+        assert scores.user_score.score.id == scores.scores[0].id
+
+    def test_score_table_group_by(self):
+        numpy = pytest.importorskip("numpy")
+
+        table = ScoreTable(
+            {
+                "id": numpy.arange(5),
+                "user_id": numpy.array([1, 1, 2, 2, 3]),
+                "pp": numpy.array([100.0, numpy.nan, numpy.nan, numpy.nan, 50.0]),
+            }
+        )
+        grouped = table.group_by("user_id", pp="sum")
+        assert list(grouped["pp"]) == [100.0, 0.0, 50.0]
+        means = table.group_by("user_id", pp="mean")["pp"]
+        assert means[0] == 100.0 and numpy.isnan(means[1]) and means[2] == 50.0
+        maxes = table.group_by("user_id", pp="max")["pp"]
+        assert maxes[0] == 100.0 and numpy.isnan(maxes[1])
+
+    def test_mod_bits(self):
+        from osu.score_table import MOD_BITS
+
+        # mods imply the bits of the mods they include, as in legacy scores
+        assert MOD_BITS["NC"] == Mods.Nightcore.value | Mods.DoubleTime.value
+        assert MOD_BITS["PF"] == Mods.Perfect.value | Mods.SuddenDeath.value
+
+    def test_performance_calculator(self, client, sample_beatmap_scores):
+        pytest.importorskip("numpy")
+
+        beatmap = client.get_beatmap(sample_beatmap_scores["beatmap_id"])
+        scores = client.get_beatmap_scores(sample_beatmap_scores["beatmap_id"])
+        for score in scores[:5]:
+            if score.pp is None or any(mod.settings for mod in score.mods):
+                continue
+            mods = [mod.mod.value for mod in score.mods if mod.mod.value != "CL"]
+            attributes = client.get_beatmap_attributes(beatmap.id, mods=mods)
+            pp = OsuPerformanceCalculator(attributes, beatmap, score.mods).calculate_score(score).pp
+            assert abs(pp - score.pp) / score.pp < 0.05
@@ -0,0 +1,67 @@
+from osu import JSONStreamParser
+import pytest
+import json
+
+
+BODY = {
+    "users": [{"id": 1, "username": "Łukasz"}, {"id": 2, "username": "日本語"}, {"id": 3, "username": "🎵"}],
+    "scores": [12345, -0.25, 1.5e10, 7],
+    "cursor_string": "ö",
+    "total": 123456789,
+    "empty": [],
+}
+EXPECTED = [
+    ("users", {"id": 1, "username": "Łukasz"}),
+    ("users", {"id": 2, "username": "日本語"}),
+    ("users", {"id": 3, "username": "🎵"}),
+    ("scores", 12345),
+    ("scores", -0.25),
+    ("scores", 1.5e10),
+    ("scores", 7),
+    ("cursor_string", "ö"),
+    ("total", 123456789),
+]
+
+
+def parse_chunks(chunks, parsers=None):
+    parser = JSONStreamParser(parsers)
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items
+
+
+class TestStreaming:
+    def test_split_at_every_byte(self):
+        body = json.dumps(BODY, ensure_ascii=False).encode()
+        # splits inside multi-byte characters and numbers are joined again
+        for i in range(len(body) + 1):
+            assert parse_chunks([body[:i], body[i:]]) == EXPECTED
+
+    def test_byte_at_a_time(self):
+        body = json.dumps(BODY, ensure_ascii=False).encode()
+        assert parse_chunks([body[i : i + 1] for i in range(len(body))]) == EXPECTED
+
+    def test_top_level_array(self):
+        body = b"[1, 23, 4.5e6, -7]"
+        for i in range(len(body) + 1):
+            assert parse_chunks([body[:i], body[i:]]) == [(None, 1), (None, 23), (None, 4.5e6), (None, -7)]
+        assert parse_chunks([b"[]"]) == []
+        assert parse_chunks([b"{}"]) == []
+
+    def test_parsers(self):
+        body = json.dumps(BODY).encode()
+        items = parse_chunks([body], {"users": lambda user: user["id"]})
+        assert [value for key, value in items if key == "users"] == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "body",
+        [b'{"a": 1,}', b"[1,]", b'{"a": [1,]}', b'{"a": [],}', b"[,1]", b'{"a": ,}', b"[1,,2]", b'{"a": 1', b"[1] 2"],
+    )
+    def test_invalid(self, body):
+        with pytest.raises(ValueError):
+            parse_chunks([body])
+        # also when the brackets arrive separately
+        with pytest.raises(ValueError):
+            parse_chunks([body[i : i + 1] for i in range(len(body))])
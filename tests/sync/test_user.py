@@ -1,4 +1,22 @@
-from osu import KudosuHistory, Event, LegacyScore, UserBeatmapType, SoloScore, GameModeInt
+from osu import (
+    KudosuHistory,
+    Event,
+    LegacyScore,
+    UserBeatmapType,
+    SoloScore,
+    GameModeInt,
+    IntSeries,
+    DatedCountSeries,
+    UserMonthlyPlaycount,
+    ProfilePerformance,
+    to_state,
+    dump_snapshot,
+    load_snapshot,
+    User,
+)
+from collections.abc import Sequence
+import pickle
+import pytest
 
 
 class TestUser:
@@ -15,6 +33,56 @@ class TestUser:
         # deprecated usage
         check_user(client.get_user(sample_user["username"], key="username"))
 
+    def test_user_snapshot(self, client, sample_user):
+        user = client.get_user(sample_user["id"])
+        state = to_state(user)
+
+        restored = pickle.loads(pickle.dumps(user, protocol=5))
+        assert to_state(restored).keys() == state.keys()
+        assert restored.statistics.grade_counts == user.statistics.grade_counts
+
+        pytest.importorskip("msgpack")
+        restored = load_snapshot(dump_snapshot(user))
+        assert restored.id == user.id
+        assert restored.join_date == user.join_date
+        assert restored.playmode == user.playmode
+        assert restored.monthly_playcounts == user.monthly_playcounts
+
+    def test_get_user_series(self, client, sample_user):
+        user = client.get_user(sample_user["id"])
+        assert isinstance(user.rank_history.data, IntSeries)
+        assert user.rank_history.data == list(user.rank_history.data)
+        assert user.monthly_playcounts
+        assert user.monthly_playcounts.sum() == sum(playcount.count for playcount in user.monthly_playcounts)
+        assert user.monthly_playcounts[-1].start_date == user.monthly_playcounts.start_dates[-1]
+
+    def test_series_large_counts(self):
+        data = [
+            {"start_date": "2024-01-01", "count": 3},
+            {"start_date": "2024-02-01", "count": 2**40},
+            {"start_date": "2024-03-01", "count": 5},
+        ]
+        series = DatedCountSeries.from_data(data, UserMonthlyPlaycount)
+        assert series.counts == [3, 2**40, 5]
+        assert len(series.start_dates) == 3
+        assert IntSeries.from_list(iter([1, 2**40])) == [1, 2**40]
+
+    def test_series_sequence(self):
+        data = [
+            {"start_date": "2024-01-01", "count": 3},
+            {"start_date": "2024-02-01", "count": 4},
+            {"start_date": "2024-03-01", "count": 3},
+        ]
+        series = DatedCountSeries.from_data(data, UserMonthlyPlaycount)
+        first, second, third = series
+        assert isinstance(series, Sequence)
+        assert [item.count for item in reversed(series)] == [3, 4, 3]
+        assert series[1] in series and 3 not in series
+        assert series.index(series[2]) == 2 and series.index(second, 1) == 1
+        with pytest.raises(ValueError):
+            series.index(first, 1)
+        assert series.count(third) == 1
+
     def test_get_users(self, client, sample_users):
         user_ids = [user["id"] for user in sample_users]
         users = sorted(client.get_users(user_ids), key=lambda u: user_ids.index(u.id))
@@ -23,6 +91,16 @@ class TestUser:
             assert user.id == sample_user["id"]
             assert user.username == sample_user["username"]
 
+    def test_map_users(self, client, sample_users):
+        user_ids = [user["id"] for user in sample_users]
+        users = client.map(client.get_user, user_ids, max_workers=4)
+        assert [user.id for user in users] == user_ids
+
+        with client.batch(max_workers=2) as batch:
+            for user_id in user_ids:
+                batch.get_user(user_id)
+        assert [user.id for user in batch.results()] == user_ids
+
     def test_lookup_users(self, client, sample_users):
         users = [sample_users[0]["id"], "@" + sample_users[1]["username"]]
         users = sorted(
@@ -34,6 +112,15 @@ class TestUser:
             assert user.username == sample_user["username"]
             assert user.global_rank is not None
 
+    def test_fetch_users(self, client, sample_users):
+        users = [sample_users[0]["id"], "@" + sample_users[1]["username"]]
+        fetched = client.fetch_users(users, ["global_rank", "badges"], mode="mania")
+        for user, sample_user in zip(fetched, sample_users[:2]):
+            assert isinstance(user, User)
+            assert user.id == sample_user["id"]
+            assert user.global_rank is not None
+            assert user.badges is not None
+
     def test_get_user_kudosu(self, client):
         kudosu_list = client.get_user_kudosu(user=2)
         assert kudosu_list
@@ -56,6 +143,28 @@ class TestUser:
             assert score.user_id == sample_user["id"]
             assert score.accuracy
 
+    def test_profile_performance(self, client, sample_user):
+        pytest.importorskip("numpy")
+
+        scores = client.get_user_scores(user=sample_user["id"], type="best", limit=100)
+        profile = ProfilePerformance.from_scores(scores)
+        assert round(profile.weighted_pp, 2) == round(sum(score.weight.pp for score in scores), 2)
+        best = scores[0]
+        assert profile.what_if(best.pp - 1, beatmap_id=best.beatmap_id) == profile.total_pp
+        assert profile.what_if(best.pp + 100) > profile.total_pp
+
+    def test_profile_performance_insert(self):
+        pytest.importorskip("numpy")
+
+        profile = ProfilePerformance([300, 250, 200, 150, 100], [1, 2, 3, 4, 5], limit=4)
+        for pp, beatmap_id in [(260, 4), (120, None), (50, 1), (400, 1), (90, 6)]:
+            expected = profile.what_if(pp, beatmap_id=beatmap_id)
+            profile.insert(pp, beatmap_id)
+            assert profile.total_pp == pytest.approx(expected)
+        assert profile.pp.tolist() == [400, 260, 250, 200, 120, 100, 90]
+        assert profile.beatmap_ids.tolist() == [1, 4, 2, 3, -1, 5, 6]
+        assert profile.score_count == 7
+
     def test_get_user_beatmaps(self, client, sample_user_beatmaps):
         beatmaps = client.get_user_beatmaps(
             user=sample_user_beatmaps["user_id"],